@@ -0,0 +1,208 @@
+"""Almacén de resultados de comparación para vistas tabulares.
+
+Guarda cada periodo comparado como una fila plana (FilaResultado) y mantiene
+una vista filtrada y ordenada expresada como lista de índices, de modo que la
+UI pueda pedir solo el tramo de filas visible sin volver a recorrer ni
+formatear todo el lote.
+"""
+
+from dataclasses import dataclass
+from datetime import date
+from typing import Callable, Dict, List, Optional
+
+
+@dataclass
+class FilaResultado:
+    """Resultado de un periodo comparado, aplanado para mostrar en tabla."""
+
+    hotel: str
+    habitacion_excel: str
+    habitacion_web: str
+    periodo_id: int
+    nombre_periodo: str
+    fecha_inicio: date
+    fecha_fin: date
+    precio_excel: float | str
+    precio_web: float
+    diferencia: float
+    coincide: bool
+
+
+def _clave_precio_excel(fila: FilaResultado):
+    # Numéricos primero (por valor), leyendas/errores después (alfabético)
+    if isinstance(fila.precio_excel, (int, float)):
+        return (0, float(fila.precio_excel), "")
+    return (1, 0.0, str(fila.precio_excel))
+
+
+# Columna -> función clave para ordenar
+CLAVES_ORDEN: Dict[str, Callable[[FilaResultado], object]] = {
+    "hotel": lambda f: f.hotel.lower(),
+    "habitacion": lambda f: f.habitacion_excel.lower(),
+    "periodo": lambda f: (f.fecha_inicio, f.fecha_fin),
+    "excel": _clave_precio_excel,
+    "web": lambda f: f.precio_web,
+    "diferencia": lambda f: f.diferencia,
+    "estado": lambda f: f.coincide,
+}
+
+
+class AlmacenResultados:
+    """Almacén de filas de resultado con filtro y orden.
+
+    Las filas se guardan una sola vez; filtrar u ordenar solo recalcula la
+    lista de índices de la vista. La vista se recalcula de forma perezosa la
+    próxima vez que se consulta, así que agregar miles de filas seguidas no
+    tiene costo extra.
+
+    Ejemplo de uso:
+        almacen = AlmacenResultados()
+        almacen.agregar_resultado_multiperiodo("Alvear Palace", resultado)
+        almacen.filtrar(hotel="alvear", diferencia_minima=5)
+        almacen.ordenar("diferencia", descendente=True)
+        visibles = almacen.filas(0, 20)
+    """
+
+    def __init__(self):
+        """Inicializa un almacén vacío sin filtros ni orden."""
+        self._filas: List[FilaResultado] = []
+        self._vista: Optional[List[int]] = None
+
+        # Filtros activos
+        self._filtro_hotel: str = ""
+        self._filtro_periodo: str = ""
+        self._diferencia_minima: Optional[float] = None
+        self._solo_discrepancias: bool = False
+
+        # Orden activo
+        self._orden_columna: Optional[str] = None
+        self._orden_descendente: bool = False
+
+    # ===== Carga =====
+
+    def agregar(self, fila: FilaResultado) -> None:
+        """Agrega una fila al almacén."""
+        self._filas.append(fila)
+        self._vista = None
+
+    def agregar_resultado_multiperiodo(self, hotel: str, resultado) -> None:
+        """Agrega una fila por cada periodo de un ResultadoComparacionMultiperiodo.
+
+        Args:
+            hotel: Nombre del hotel comparado
+            resultado: ResultadoComparacionMultiperiodo
+        """
+        habitacion_web = resultado.habitacion_web_matcheada.nombre if resultado.habitacion_web_matcheada else ""
+
+        for res_periodo in resultado.periodos:
+            periodo = res_periodo.periodo
+            self._filas.append(FilaResultado(
+                hotel=hotel,
+                habitacion_excel=resultado.habitacion_excel_nombre,
+                habitacion_web=habitacion_web,
+                periodo_id=periodo.id,
+                nombre_periodo=periodo.nombresito or f"Periodo {periodo.id}",
+                fecha_inicio=periodo.fecha_inicio,
+                fecha_fin=periodo.fecha_fin,
+                precio_excel=res_periodo.precio_excel,
+                precio_web=res_periodo.precio_web,
+                diferencia=res_periodo.diferencia,
+                coincide=res_periodo.coincide
+            ))
+        self._vista = None
+
+    def limpiar(self) -> None:
+        """Elimina todas las filas (conserva filtros y orden)."""
+        self._filas = []
+        self._vista = None
+
+    # ===== Filtro y orden =====
+
+    def filtrar(self, hotel: str = "", periodo: str = "",
+                diferencia_minima: Optional[float] = None,
+                solo_discrepancias: bool = False) -> None:
+        """Establece los filtros de la vista.
+
+        Args:
+            hotel: Texto que debe contener el nombre del hotel (sin distinguir mayúsculas)
+            periodo: Texto que debe contener el nombre o las fechas (DD/MM/AAAA) del periodo
+            diferencia_minima: Diferencia absoluta mínima; None para no filtrar
+            solo_discrepancias: Si True, solo filas que no coinciden
+        """
+        self._filtro_hotel = (hotel or "").strip().lower()
+        self._filtro_periodo = (periodo or "").strip().lower()
+        self._diferencia_minima = diferencia_minima
+        self._solo_discrepancias = solo_discrepancias
+        self._vista = None
+
+    def ordenar(self, columna: Optional[str], descendente: bool = False) -> None:
+        """Establece el orden de la vista.
+
+        Args:
+            columna: Clave de CLAVES_ORDEN, o None para el orden de llegada
+            descendente: True para orden descendente
+
+        Raises:
+            ValueError: Si la columna no es ordenable
+        """
+        if columna is not None and columna not in CLAVES_ORDEN:
+            raise ValueError(f"Columna no ordenable: '{columna}'. Opciones: {list(CLAVES_ORDEN)}")
+        self._orden_columna = columna
+        self._orden_descendente = descendente
+        self._vista = None
+
+    @property
+    def orden(self) -> tuple[Optional[str], bool]:
+        """Orden activo como (columna, descendente)."""
+        return self._orden_columna, self._orden_descendente
+
+    # ===== Consulta =====
+
+    def __len__(self) -> int:
+        """Cantidad de filas en la vista (después de filtrar)."""
+        return len(self._obtener_vista())
+
+    @property
+    def total(self) -> int:
+        """Cantidad total de filas almacenadas (sin filtrar)."""
+        return len(self._filas)
+
+    def filas(self, inicio: int, fin: int) -> List[FilaResultado]:
+        """Devuelve el tramo [inicio, fin) de la vista filtrada y ordenada."""
+        vista = self._obtener_vista()
+        return [self._filas[i] for i in vista[inicio:fin]]
+
+    def _obtener_vista(self) -> List[int]:
+        if self._vista is None:
+            self._vista = self._calcular_vista()
+        return self._vista
+
+    def _calcular_vista(self) -> List[int]:
+        filas = self._filas
+        indices = [i for i, fila in enumerate(filas) if self._pasa_filtros(fila)]
+
+        if self._orden_columna is not None:
+            clave = CLAVES_ORDEN[self._orden_columna]
+            indices.sort(key=lambda i: clave(filas[i]), reverse=self._orden_descendente)
+
+        return indices
+
+    def _pasa_filtros(self, fila: FilaResultado) -> bool:
+        if self._solo_discrepancias and fila.coincide:
+            return False
+
+        if self._diferencia_minima is not None and fila.diferencia < self._diferencia_minima:
+            return False
+
+        if self._filtro_hotel and self._filtro_hotel not in fila.hotel.lower():
+            return False
+
+        if self._filtro_periodo:
+            texto_periodo = (
+                f"{fila.nombre_periodo} "
+                f"{fila.fecha_inicio.strftime('%d/%m/%Y')} {fila.fecha_fin.strftime('%d/%m/%Y')}"
+            ).lower()
+            if self._filtro_periodo not in texto_periodo:
+                return False
+
+        return True
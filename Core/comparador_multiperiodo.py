@@ -1,13 +1,22 @@
-"""Comparador multi-periodo con scraping secuencial."""
+"""Comparador multi-periodo con scraping secuencial.
+
+Dos modos, elegidos con la variable de entorno COMPARACION_MODO:
+- "periodos" (default): un scraping por cada periodo que cae en la estadía.
+- "estadia": un solo scraping de la estadía completa, comparado contra el
+  precio del contrato prorrateado por noches en cada periodo.
+"""
 
 import asyncio
-from typing import List
+import os
+from typing import Dict, List, Optional
 from datetime import date
 from Models.hotelExcel import Periodo, HotelExcel
 from Models.hotelWeb import HabitacionWeb
-from Core.servicio_habitaciones import inferir_periodos_desde_fechas
+from Core.servicio_habitaciones import calcular_dias_por_periodo, inferir_periodos_desde_fechas
 from Core.comparador import obtener_mejor_match_con_breakfast
+from Core.planificador_scraping import planificar_tramos
 from Core.controller import dar_hotel_web
+from ScrawlingChinese.telemetria_llm import telemetria_corrida
 
 
 class ResultadoPeriodo:
@@ -37,6 +46,92 @@ class ResultadoComparacionMultiperiodo:
         self.mensaje_match = mensaje_match
 
 
+class ResultadoComparacionEstadia(ResultadoComparacionMultiperiodo):
+    """Resultado de comparar la estadía completa con un solo scraping.
+
+    `periodos` conserva una fila por periodo (precio del contrato y noches),
+    pero el precio web es el promedio por noche de toda la estadía, así que
+    todas las filas comparten el veredicto global (`coincide`) y la diferencia
+    por noche de la estadía (`diferencia_promedio`), no la de su periodo.
+
+    Raises:
+        ValueError: Si las noches de los periodos no son exactamente las
+            `noches_estadia` (noches sin periodo o contadas dos veces): los
+            promedios no serían comparables
+    """
+
+    def __init__(self, habitacion_excel_nombre: str,
+                 habitacion_web_matcheada: HabitacionWeb,
+                 periodos: List[ResultadoPeriodo],
+                 noches_por_periodo: Dict[int, int],
+                 noches_estadia: int,
+                 precio_esperado_total: float,
+                 precio_web_promedio: float,
+                 mensaje_match: str = None):
+        self.noches_por_periodo = noches_por_periodo
+        self.noches_totales = sum(noches_por_periodo.values())
+        if self.noches_totales != noches_estadia:
+            raise ValueError(f"Los periodos cubren {self.noches_totales} noches de una estadía de "
+                             f"{noches_estadia}: no se puede comparar el promedio por noche")
+        self.precio_esperado_total = precio_esperado_total
+        self.precio_esperado_promedio = precio_esperado_total / self.noches_totales
+        self.precio_web_promedio = precio_web_promedio
+        self.precio_web_total = precio_web_promedio * self.noches_totales
+        self.diferencia_total = abs(self.precio_esperado_total - self.precio_web_total)
+        self.diferencia_promedio = abs(self.precio_esperado_promedio - precio_web_promedio)
+        # Misma tolerancia que por periodo: menos de $1 por noche
+        self.coincide = self.diferencia_promedio < 1.0
+
+        super().__init__(
+            habitacion_excel_nombre=habitacion_excel_nombre,
+            habitacion_web_matcheada=habitacion_web_matcheada,
+            periodos=periodos,
+            tiene_discrepancias=not self.coincide,
+            mensaje_match=mensaje_match
+        )
+
+
+def _resultado_error(periodo: Periodo) -> ResultadoPeriodo:
+    """ResultadoPeriodo de un periodo que no se pudo comparar."""
+    return ResultadoPeriodo(
+        periodo=periodo,
+        precio_excel="Error",
+        precio_web=0.0,
+        diferencia=0.0,
+        coincide=False
+    )
+
+
+def _comparar_periodo(habitacion_unificada, periodo: Periodo, precio_web: float) -> ResultadoPeriodo:
+    """Compara el precio Excel de un periodo con el precio web de su tramo."""
+    precio_excel = habitacion_unificada.precio_para_periodo(periodo.id)
+
+    if precio_excel is None:
+        print(f"⚠️ ERROR: No se encontró precio Excel para periodo ID {periodo.id}")
+        return _resultado_error(periodo)
+
+    print(f"→ Periodo {periodo.id} - Precio Excel: {precio_excel}")
+
+    # Comparar precios (solo si Excel tiene precio numérico)
+    if isinstance(precio_excel, (int, float)):
+        diferencia = abs(float(precio_excel) - precio_web)
+        coincide = diferencia < 1.0  # Diferencia menor a $1 = coincide
+        print(f"→ Diferencia: ${diferencia:.2f} ({'COINCIDE' if coincide else 'DISCREPANCIA'})")
+    else:
+        # Precio Excel es leyenda (e.g., "closing agreement")
+        diferencia = 0.0
+        coincide = True  # No comparamos leyendas
+        print(f"→ Precio Excel es leyenda: {precio_excel}")
+
+    return ResultadoPeriodo(
+        periodo=periodo,
+        precio_excel=precio_excel,
+        precio_web=precio_web,
+        diferencia=diferencia,
+        coincide=coincide
+    )
+
+
 async def comparar_multiperiodo(
     habitacion_unificada,  # HabitacionUnificada
     fecha_entrada: date,
@@ -49,13 +144,13 @@ async def comparar_multiperiodo(
 
     Flujo:
     1. Inferir periodos aplicables al rango de fechas
-    2. Para cada periodo (SECUENCIAL):
-        - Calcular rango de fechas específico del periodo
-        - Scrape web con esas fechas (force_fresh=True)
-        - Si primer periodo: fuzzy matching → guardar habitación matcheada
-        - Si periodo subsiguiente: reutilizar habitación matcheada
+    2. Agrupar periodos contiguos con el mismo precio Excel en tramos
+       (planificar_tramos); para cada tramo (SECUENCIAL):
+        - Scrape web una vez con las fechas del tramo (force_fresh=False)
+        - Si primer tramo: fuzzy matching → guardar habitación matcheada
+        - Si tramo subsiguiente: reutilizar habitación matcheada
         - Extraer precio_web del combo[0]
-        - Comparar con precio_excel
+        - Comparar con precio_excel de cada periodo del tramo
     3. Construir resultado consolidado
 
     Args:
@@ -87,25 +182,21 @@ async def comparar_multiperiodo(
     habitacion_web_matcheada = None
     mensaje_match = None
 
-    # Paso 2: Loop secuencial por cada periodo
-    for idx, periodo in enumerate(periodos_aplicables, start=1):
-        print(f"\n--- PERIODO {idx}/{len(periodos_aplicables)} ---")
-
-        try:
-            # Calcular fechas específicas para scraping (overlap entre reserva y periodo)
-            fecha_scrape_inicio = max(fecha_entrada, periodo.fecha_inicio)
-            fecha_scrape_fin = min(fecha_salida, periodo.fecha_fin)
+    tramos = planificar_tramos(habitacion_unificada, periodos_aplicables, fecha_entrada, fecha_salida)
+    print(f"Scrapings planificados: {len(tramos)} (para {len(periodos_aplicables)} periodos)")
 
-            # Convertir a formato DD-MM-YYYY
-            fecha_inicio_str = fecha_scrape_inicio.strftime("%d-%m-%Y")
-            fecha_fin_str = fecha_scrape_fin.strftime("%d-%m-%Y")
+    # Paso 2: Loop secuencial por cada tramo
+    for idx, tramo in enumerate(tramos, start=1):
+        ids_tramo = ", ".join(str(p.id) for p in tramo.periodos)
+        print(f"\n--- TRAMO {idx}/{len(tramos)} (periodos: {ids_tramo}) ---")
 
-            print(f"Scraping con fechas: {fecha_inicio_str} a {fecha_fin_str}")
+        try:
+            print(f"Scraping con fechas: {tramo.fecha_inicio_str} a {tramo.fecha_fin_str}")
 
             # Scrape web (TESTING: usar force_pickle para tests rápidos)
             hotel_web = await dar_hotel_web(
-                fecha_inicio_str,
-                fecha_fin_str,
+                tramo.fecha_inicio_str,
+                tramo.fecha_fin_str,
                 adultos,
                 ninos,
                 force_fresh=False,     # Cambia a True para scraping fresco
@@ -114,11 +205,11 @@ async def comparar_multiperiodo(
             )
 
             if not hotel_web or not hotel_web.habitacion:
-                raise ValueError(f"Error scrapeando periodo {idx}")
+                raise ValueError(f"Error scrapeando tramo {idx}")
 
-            # Fuzzy matching SOLO en primer periodo
-            if idx == 1:
-                print("→ Realizando fuzzy matching (primer periodo)...")
+            # Fuzzy matching SOLO en el primer scraping exitoso
+            if habitacion_web_matcheada is None:
+                print("→ Realizando fuzzy matching (primer tramo)...")
                 habitacion_web_matcheada, mensaje_match = obtener_mejor_match_con_breakfast(
                     habitacion_unificada.nombre,
                     hotel_web.habitacion
@@ -140,10 +231,10 @@ async def comparar_multiperiodo(
 
                 if not habitacion_actual:
                     raise ValueError(
-                        f"Habitación '{habitacion_web_matcheada.nombre}' no encontrada en periodo {idx}"
+                        f"Habitación '{habitacion_web_matcheada.nombre}' no encontrada en tramo {idx}"
                     )
 
-                # Actualizar con datos frescos (combos pueden cambiar por periodo)
+                # Actualizar con datos frescos (combos pueden cambiar por tramo)
                 habitacion_web_matcheada = habitacion_actual
 
             # Extraer precio web del primer combo
@@ -153,53 +244,25 @@ async def comparar_multiperiodo(
             precio_web = habitacion_web_matcheada.combos[0].precio
             print(f"→ Precio web: ${precio_web:.2f}")
 
-            # Obtener precio Excel para este periodo
-            precio_excel = habitacion_unificada.precio_para_periodo(periodo.id)
-
-            if precio_excel is None:
-                raise ValueError(f"No se encontró precio Excel para periodo {idx} (ID: {periodo.id})")
-
-            print(f"→ Precio Excel: {precio_excel}")
-
-            # Comparar precios (solo si Excel tiene precio numérico)
-            if isinstance(precio_excel, (int, float)):
-                diferencia = abs(float(precio_excel) - precio_web)
-                coincide = diferencia < 1.0  # Diferencia menor a $1 = coincide
-                print(f"→ Diferencia: ${diferencia:.2f} ({'COINCIDE' if coincide else 'DISCREPANCIA'})")
-            else:
-                # Precio Excel es leyenda (e.g., "closing agreement")
-                diferencia = 0.0
-                coincide = True  # No comparamos leyendas
-                print(f"→ Precio Excel es leyenda: {precio_excel}")
-
-            # Guardar resultado del periodo
-            resultados_periodos.append(ResultadoPeriodo(
-                periodo=periodo,
-                precio_excel=precio_excel,
-                precio_web=precio_web,
-                diferencia=diferencia,
-                coincide=coincide
-            ))
-
         except Exception as e:
-            # Error en periodo individual - continuar con los demás
-            print(f"⚠️ ERROR en periodo {idx}: {str(e)}")
-            print("→ Continuando con siguiente periodo...")
-
-            # Agregar resultado con error
-            resultados_periodos.append(ResultadoPeriodo(
-                periodo=periodo,
-                precio_excel="Error",
-                precio_web=0.0,
-                diferencia=0.0,
-                coincide=False
-            ))
-
-        # Delay entre requests para evitar IP ban (excepto en último periodo)
-        if idx < len(periodos_aplicables):
-            import os
+            # Error en el scraping del tramo - marcar sus periodos y continuar
+            print(f"⚠️ ERROR en tramo {idx}: {str(e)}")
+            print("→ Continuando con siguiente tramo...")
+            for periodo in tramo.periodos:
+                resultados_periodos.append(_resultado_error(periodo))
+            precio_web = None
+
+        # Repartir el scraping del tramo a cada uno de sus periodos
+        if precio_web is not None:
+            for periodo in tramo.periodos:
+                resultados_periodos.append(
+                    _comparar_periodo(habitacion_unificada, periodo, precio_web)
+                )
+
+        # Delay entre requests para evitar IP ban (excepto en último tramo)
+        if idx < len(tramos):
             delay_seconds = int(os.getenv("SCRAPING_DELAY_SECONDS", "2"))
-            print(f"→ Esperando {delay_seconds}s antes del siguiente periodo...")
+            print(f"→ Esperando {delay_seconds}s antes del siguiente tramo...")
             await asyncio.sleep(delay_seconds)
 
     # Paso 3: Determinar si hay discrepancias globales
@@ -217,3 +280,190 @@ async def comparar_multiperiodo(
         tiene_discrepancias=tiene_discrepancias,
         mensaje_match=mensaje_match
     )
+
+
+def calcular_precio_esperado(
+    habitacion_unificada,  # HabitacionUnificada
+    periodos: List[Periodo],
+    noches_por_periodo: Dict[int, int]
+) -> Optional[Dict[int, float]]:
+    """Precio del contrato de cada periodo con noches en la estadía.
+
+    Args:
+        habitacion_unificada: HabitacionUnificada con variantes
+        periodos: Periodos aplicables de la habitación (inferir_periodos_desde_fechas,
+            filtrados por habitacion_unificada.todos_los_periodos())
+        noches_por_periodo: {periodo_id: noches} (calcular_dias_por_periodo)
+
+    Returns:
+        {periodo_id: precio por noche}, o None si algún periodo con noches no
+        tiene precio numérico (leyenda o sin precio) y no se puede prorratear
+    """
+    precios = {}
+    for periodo in periodos:
+        if periodo.id not in noches_por_periodo:
+            continue
+        precio = habitacion_unificada.precio_para_periodo(periodo.id)
+        if not isinstance(precio, (int, float)):
+            return None
+        precios[periodo.id] = float(precio)
+    return precios
+
+
+async def comparar_estadia(
+    habitacion_unificada,  # HabitacionUnificada
+    fecha_entrada: date,
+    fecha_salida: date,
+    adultos: int,
+    ninos: int,
+    hotel: HotelExcel
+) -> ResultadoComparacionMultiperiodo:
+    """Compara la estadía completa con un solo scraping.
+
+    Flujo:
+    1. Inferir periodos aplicables de la habitación y noches de la estadía en
+       cada uno (los periodos del hotel son de todos los grupos; solo cuentan
+       los que tienen precio para esta habitación)
+    2. Precio esperado = suma de (precio Excel del periodo x noches)
+    3. Scrape web UNA vez con las fechas de la estadía
+    4. Comparar el promedio por noche esperado con el precio web por noche
+
+    Si algún periodo tiene una leyenda en lugar de precio, o si las noches de
+    los periodos no son exactamente las de la estadía (noches sin periodo de
+    la habitación o con periodos de precios distintos), no hay total que
+    prorratear y se compara periodo por periodo con comparar_multiperiodo.
+
+    Args:
+        habitacion_unificada: HabitacionUnificada con variantes
+        fecha_entrada: Fecha entrada de reserva
+        fecha_salida: Fecha salida de reserva
+        adultos: Número de adultos
+        ninos: Número de niños
+        hotel: Hotel actual (para buscar periodos)
+
+    Returns:
+        ResultadoComparacionEstadia (o ResultadoComparacionMultiperiodo si hubo que
+        comparar por periodo)
+
+    Raises:
+        ValueError: Si el hotel no tiene periodos aplicables, si la estadía no
+            tiene noches o si no hay match web
+    """
+    periodos_hotel = inferir_periodos_desde_fechas(fecha_entrada, fecha_salida, hotel)
+    if not periodos_hotel:
+        raise ValueError(f"No se encontraron periodos aplicables para {fecha_entrada} a {fecha_salida}")
+
+    noches_estadia = (fecha_salida - fecha_entrada).days
+    if noches_estadia <= 0:
+        raise ValueError(f"La estadía {fecha_entrada} a {fecha_salida} no tiene noches")
+
+    # Los periodos del hotel son los de todos los grupos: solo cuentan los de esta habitación
+    periodos_habitacion = habitacion_unificada.todos_los_periodos()
+    periodos_aplicables = [p for p in periodos_hotel if p.id in periodos_habitacion]
+    noches_por_periodo = calcular_dias_por_periodo(
+        fecha_entrada, fecha_salida, periodos_aplicables, habitacion_unificada
+    )
+    if sum(noches_por_periodo.values()) != noches_estadia:
+        print(f"→ Los periodos de la habitación suman {sum(noches_por_periodo.values())} noches "
+              f"para una estadía de {noches_estadia} (noches sin periodo o con precios distintos): "
+              f"se compara periodo por periodo")
+        return await comparar_multiperiodo(
+            habitacion_unificada, fecha_entrada, fecha_salida, adultos, ninos, hotel
+        )
+
+    precios = calcular_precio_esperado(habitacion_unificada, periodos_aplicables, noches_por_periodo)
+    if precios is None:
+        print("→ Hay periodos con leyenda o sin precio: se compara periodo por periodo")
+        return await comparar_multiperiodo(
+            habitacion_unificada, fecha_entrada, fecha_salida, adultos, ninos, hotel
+        )
+
+    precio_esperado_total = sum(precios[pid] * noches for pid, noches in noches_por_periodo.items())
+
+    print(f"\n{'='*60}")
+    print(f"COMPARACIÓN POR ESTADÍA: {habitacion_unificada.nombre}")
+    print(f"Periodos: {len(noches_por_periodo)} | Noches: {sum(noches_por_periodo.values())}")
+    print(f"{'='*60}\n")
+
+    fecha_inicio_str = fecha_entrada.strftime("%d-%m-%Y")
+    fecha_fin_str = fecha_salida.strftime("%d-%m-%Y")
+    print(f"Scraping con fechas: {fecha_inicio_str} a {fecha_fin_str}")
+
+    hotel_web = await dar_hotel_web(
+        fecha_inicio_str,
+        fecha_fin_str,
+        adultos,
+        ninos,
+        force_fresh=False,
+        use_pickle=False,
+        force_pickle=False
+    )
+
+    if not hotel_web or not hotel_web.habitacion:
+        raise ValueError("Error scrapeando la estadía")
+
+    habitacion_web_matcheada, mensaje_match = obtener_mejor_match_con_breakfast(
+        habitacion_unificada.nombre,
+        hotel_web.habitacion
+    )
+    if not habitacion_web_matcheada:
+        raise ValueError(f"No se encontró match para '{habitacion_unificada.nombre}'")
+    if not habitacion_web_matcheada.combos:
+        raise ValueError(f"Habitación '{habitacion_web_matcheada.nombre}' no tiene combos")
+
+    # El scraper extrae el precio por noche (promedio de la estadía)
+    precio_web = habitacion_web_matcheada.combos[0].precio
+
+    resultado = ResultadoComparacionEstadia(
+        habitacion_excel_nombre=habitacion_unificada.nombre,
+        habitacion_web_matcheada=habitacion_web_matcheada,
+        periodos=[],
+        noches_por_periodo=noches_por_periodo,
+        noches_estadia=noches_estadia,
+        precio_esperado_total=precio_esperado_total,
+        precio_web_promedio=precio_web,
+        mensaje_match=mensaje_match
+    )
+
+    for periodo in periodos_aplicables:
+        if periodo.id not in noches_por_periodo:
+            continue
+        resultado.periodos.append(ResultadoPeriodo(
+            periodo=periodo,
+            precio_excel=precios[periodo.id],
+            precio_web=precio_web,
+            diferencia=resultado.diferencia_promedio,
+            coincide=resultado.coincide
+        ))
+
+    print(f"→ Esperado: ${resultado.precio_esperado_total:.2f} "
+          f"(${resultado.precio_esperado_promedio:.2f}/noche)")
+    print(f"→ Web: ${resultado.precio_web_total:.2f} (${precio_web:.2f}/noche)")
+    print(f"RESULTADO: {'DISCREPANCIAS' if resultado.tiene_discrepancias else 'TODO COINCIDE'}")
+
+    return resultado
+
+
+async def comparar_segun_modo(
+    habitacion_unificada,  # HabitacionUnificada
+    fecha_entrada: date,
+    fecha_salida: date,
+    adultos: int,
+    ninos: int,
+    hotel: HotelExcel
+) -> ResultadoComparacionMultiperiodo:
+    """Compara con el modo configurado en COMPARACION_MODO ("periodos" o "estadia").
+
+    Las llamadas LLM de los scrapings quedan etiquetadas con la comparación y
+    se imprime su consumo (tokens, llamadas, segundos) al terminar.
+    """
+    modo = os.getenv("COMPARACION_MODO", "periodos").strip().lower()
+    comparar = comparar_estadia if modo == "estadia" else comparar_multiperiodo
+
+    telemetria = telemetria_corrida()
+    etiqueta = f"{habitacion_unificada.nombre} {fecha_entrada.isoformat()}/{fecha_salida.isoformat()} ({modo})"
+    with telemetria.comparacion(etiqueta):
+        resultado = await comparar(habitacion_unificada, fecha_entrada, fecha_salida, adultos, ninos, hotel)
+    print(telemetria.resumen(etiqueta))
+    telemetria.exportar()
+    return resultado
@@ -157,6 +157,13 @@ def generar_texto_email_multiperiodo(hotel, resultado_multiperiodo):
 
     texto += "=" * 80 + "\n\n"
 
+    # Totales de la comparación por estadía (precio prorrateado por noches)
+    if hasattr(resultado_multiperiodo, 'noches_por_periodo'):
+        texto += f"Estadía completa ({resultado_multiperiodo.noches_totales} noches):\n"
+        texto += f"- Total esperado según contrato: ${resultado_multiperiodo.precio_esperado_total:.2f}\n"
+        texto += f"- Total en web: ${resultado_multiperiodo.precio_web_total:.2f}\n"
+        texto += f"- Diferencia: ${resultado_multiperiodo.diferencia_total:.2f}\n\n"
+
     # Footer
     texto += "Agradecería si pudieran revisar estas diferencias.\n\n"
     texto += "Saludos cordiales,\nGermán Lucero"
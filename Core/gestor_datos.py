@@ -1,4 +1,6 @@
 from ExtractorDatos.extractor import *
+from ExtractorDatos.cache_excel import cargar_excel_cacheado
+from ExtractorDatos.extractor_multihoja import hojas_desde_entorno
 from ScrawlingChinese.crawler import *
 from Models.hotelExcel import *
 from Models.hotelWeb import *
@@ -14,7 +16,8 @@ class GestorDatos:
 
     def __init__(self,path_excel):
         self.__path = path_excel
-        self.__datos_excel = cargar_excel(self.__path) 
+        # EXCEL_HOJAS="*" (o nombres separados por coma) carga varias hojas; default la activa
+        self.__datos_excel = cargar_excel_cacheado(self.__path, hojas=hojas_desde_entorno(self.__path))
         self.__hotel_web : Optional[HotelWeb] = None
         self.__habitaciones_web : Optional[List[HabitacionWeb]] = None
         self.mejor_habitacion_web : HabitacionWeb | None
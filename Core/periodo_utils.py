@@ -1,8 +1,31 @@
-from Models.hotelExcel import HotelExcel, HabitacionExcel
-from typing import Dict, List
+from Models.hotelExcel import HotelExcel, HabitacionExcel, Periodo
+from typing import Dict, List, Tuple
 from datetime import date
 
 
+def indexar_periodos(hotel: HotelExcel) -> Dict[int, Tuple[Periodo, str]]:
+    """
+    Construye un índice {periodo_id: (periodo, nombre_grupo)} para un hotel.
+
+    Reemplaza las búsquedas lineales `hotel.periodo_por_id(pid)` seguidas de
+    `periodo in grupo.periodos` (igualdad profunda de pydantic) por un único
+    recorrido de los grupos. Si un periodo aparece en más de un grupo se
+    conserva el primero, igual que el `break` de las búsquedas originales.
+
+    Args:
+        hotel: Objeto HotelExcel con periodos_group
+
+    Returns:
+        Diccionario con periodo_id como clave y (Periodo, nombre del grupo) como valor
+    """
+    indice: Dict[int, Tuple[Periodo, str]] = {}
+    for grupo in hotel.periodos_group:
+        for periodo in grupo.periodos:
+            if periodo.id not in indice:
+                indice[periodo.id] = (periodo, grupo.nombre)
+    return indice
+
+
 def formatear_periodos_habitacion(hotel: HotelExcel, habitacion: HabitacionExcel) -> str:
     """
     Formatea los periodos de una habitación agrupados por nombre de grupo.
@@ -27,16 +50,11 @@ def formatear_periodos_habitacion(hotel: HotelExcel, habitacion: HabitacionExcel
 
     # Agrupar los periodos por nombre de grupo
     grupos_periodos: Dict[str, List[str]] = {}
+    indice = indexar_periodos(hotel)
 
     for pid in habitacion.periodo_ids:
-        periodo = hotel.periodo_por_id(pid)
-        if periodo:
-            # Buscar a qué grupo pertenece este periodo
-            nombre_grupo = None
-            for grupo in hotel.periodos_group:
-                if periodo in grupo.periodos:
-                    nombre_grupo = grupo.nombre
-                    break
+        if pid in indice:
+            periodo, nombre_grupo = indice[pid]
 
             if nombre_grupo:
                 # Formatear la fecha
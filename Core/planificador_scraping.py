@@ -0,0 +1,104 @@
+"""Planificador de scrapings para la comparación multi-periodo.
+
+Los grupos de periodos del Excel a veces se separan solo por nombre: dos
+periodos consecutivos con el mismo precio para la habitación generaban dos
+scrapings con el mismo resultado esperado. El planificador une los periodos
+contiguos con igual precio (o igual leyenda) en un tramo, que se scrapea una
+sola vez; el resultado se reparte después a cada periodo del tramo.
+
+Ejemplo de uso:
+    tramos = planificar_tramos(habitacion_unificada, periodos, fecha_entrada, fecha_salida)
+    for tramo in tramos:
+        hotel_web = await dar_hotel_web(tramo.fecha_inicio_str, tramo.fecha_fin_str, ...)
+        for periodo in tramo.periodos:
+            ...
+"""
+
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import List, Optional
+
+from Models.hotelExcel import Periodo
+
+
+@dataclass
+class TramoScraping:
+    """Rango de fechas que se scrapea una vez para uno o más periodos contiguos."""
+    fecha_inicio: date
+    fecha_fin: date
+    precio_excel: Optional[float | str]
+    periodos: List[Periodo] = field(default_factory=list)
+
+    @property
+    def fecha_inicio_str(self) -> str:
+        """Fecha de inicio en formato DD-MM-YYYY (el que usa dar_hotel_web)."""
+        return self.fecha_inicio.strftime("%d-%m-%Y")
+
+    @property
+    def fecha_fin_str(self) -> str:
+        """Fecha de fin en formato DD-MM-YYYY (el que usa dar_hotel_web)."""
+        return self.fecha_fin.strftime("%d-%m-%Y")
+
+
+def _mismo_precio(a: Optional[float | str], b: Optional[float | str]) -> bool:
+    """Igualdad de precios del Excel: numéricos por valor, leyendas por texto.
+
+    Un periodo sin precio (None) nunca se une: su comparación termina en error
+    y no debe arrastrar a los periodos vecinos.
+    """
+    if a is None or b is None:
+        return False
+    if isinstance(a, (int, float)) and isinstance(b, (int, float)):
+        return float(a) == float(b)
+    if isinstance(a, str) and isinstance(b, str):
+        return a.strip().lower() == b.strip().lower()
+    return False
+
+
+def planificar_tramos(
+    habitacion_unificada,  # HabitacionUnificada
+    periodos: List[Periodo],
+    fecha_entrada: date,
+    fecha_salida: date
+) -> List[TramoScraping]:
+    """Agrupa los periodos aplicables en tramos a scrapear.
+
+    Dos periodos consecutivos (ordenados por fecha de inicio) van al mismo
+    tramo si el segundo empieza el día siguiente al fin del primero (o antes,
+    si se superponen) y la habitación tiene el mismo precio en ambos. Las
+    fechas de cada tramo son el overlap entre la reserva y la unión de sus
+    periodos, igual que el rango que se scrapeaba por periodo.
+
+    Args:
+        habitacion_unificada: HabitacionUnificada con variantes
+        periodos: Periodos aplicables (inferir_periodos_desde_fechas)
+        fecha_entrada: Fecha entrada de reserva
+        fecha_salida: Fecha salida de reserva
+
+    Returns:
+        Lista de TramoScraping en orden de fechas; cada periodo aparece en un solo tramo
+    """
+    tramos: List[TramoScraping] = []
+    fin_tramo: Optional[date] = None
+
+    for periodo in sorted(periodos, key=lambda p: p.fecha_inicio):
+        precio = habitacion_unificada.precio_para_periodo(periodo.id)
+        actual = tramos[-1] if tramos else None
+
+        if (actual is not None
+                and periodo.fecha_inicio <= fin_tramo + timedelta(days=1)
+                and _mismo_precio(actual.precio_excel, precio)):
+            actual.periodos.append(periodo)
+            fin_tramo = max(fin_tramo, periodo.fecha_fin)
+            actual.fecha_fin = min(fecha_salida, fin_tramo)
+            continue
+
+        fin_tramo = periodo.fecha_fin
+        tramos.append(TramoScraping(
+            fecha_inicio=max(fecha_entrada, periodo.fecha_inicio),
+            fecha_fin=min(fecha_salida, periodo.fecha_fin),
+            precio_excel=precio,
+            periodos=[periodo]
+        ))
+
+    return tramos
@@ -0,0 +1,148 @@
+"""Repositorio con índices por nombre sobre los hoteles del Excel.
+
+Los controladores buscaban el hotel recorriendo la lista y comparando
+`nombre.lower() + " (a)"`, y volvían a unificar las habitaciones en cada
+selección. RepositorioHoteles construye una vez los índices normalizados
+(hotel, edificio) y guarda en caché las habitaciones unificadas por
+(hotel, edificio), de modo que cada búsqueda de la UI es un acceso a dict.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+from Models.hotelExcel import HotelExcel, HabitacionExcel, TipoHabitacionExcel
+from Models.habitacion_unificada import HabitacionUnificada
+from Core.servicio_habitaciones import unificar_habitaciones
+
+
+def normalizar_nombre_hotel(nombre: str) -> str:
+    """Normaliza un nombre de hotel para búsquedas.
+
+    Acepta el nombre del Excel ("Alvear Palace (A)") o el que muestra la UI
+    ("Alvear Palace", "alvear palace"): minúsculas, sin sufijo "(a)" y con
+    espacios simples.
+    """
+    nombre = " ".join(str(nombre).lower().split())
+    if nombre.endswith("(a)"):
+        nombre = nombre[:-3].rstrip()
+    return nombre
+
+
+def normalizar_nombre_edificio(nombre: Optional[str]) -> Optional[str]:
+    """Normaliza un nombre de edificio ("SUITES - Low Season" -> "suites")."""
+    if not nombre:
+        return None
+    base = nombre.split(' - ')[0] if ' - ' in nombre else nombre
+    return " ".join(base.lower().split())
+
+
+class RepositorioHoteles:
+    """Índices por nombre de hoteles, edificios y habitaciones unificadas.
+
+    Ejemplo de uso:
+        repo = RepositorioHoteles(datos_excel.hoteles)
+        hotel = repo.obtener_hotel("alvear palace")
+        edificios = repo.edificios("Alvear Palace")
+        unificadas = repo.habitaciones_unificadas("Alvear Palace", "SUITES")
+        hab = repo.habitacion_unificada("Alvear Palace", "SUITES", "dbl superior")
+    """
+
+    def __init__(self, hoteles: Optional[List[HotelExcel]] = None):
+        """Inicializa el repositorio.
+
+        Args:
+            hoteles: Lista de HotelExcel (default: vacío, cargar después con cargar())
+        """
+        self.cargar(hoteles or [])
+
+    def cargar(self, hoteles: List[HotelExcel]) -> None:
+        """Reemplaza los hoteles y reconstruye los índices (vacía las cachés)."""
+        self._hoteles: List[HotelExcel] = list(hoteles)
+        self._por_nombre: Dict[str, HotelExcel] = {}
+        self._tipos: Dict[str, Dict[str, List[TipoHabitacionExcel]]] = {}
+
+        for hotel in self._hoteles:
+            clave = normalizar_nombre_hotel(hotel.nombre)
+            # Ante nombres repetidos gana el primero, como la búsqueda lineal anterior
+            if clave in self._por_nombre:
+                continue
+            self._por_nombre[clave] = hotel
+
+            tipos: Dict[str, List[TipoHabitacionExcel]] = {}
+            for tipo in hotel.tipos:
+                # Un mismo edificio puede aparecer varias veces (distintos periodos)
+                tipos.setdefault(normalizar_nombre_edificio(tipo.nombre), []).append(tipo)
+            self._tipos[clave] = tipos
+
+        # (hotel, edificio) -> (habitaciones, unificadas, {nombre: unificada})
+        self._cache_habitaciones: Dict[
+            Tuple[str, Optional[str]],
+            Tuple[List[HabitacionExcel], List[HabitacionUnificada], Dict[str, HabitacionUnificada]]
+        ] = {}
+
+    @property
+    def hoteles(self) -> List[HotelExcel]:
+        """Hoteles en el orden del Excel."""
+        return self._hoteles
+
+    def nombres_visibles(self) -> List[str]:
+        """Nombres de hoteles para la UI (sin sufijo '(A)')."""
+        return [h.nombre.replace("(A)", "").replace("(a)", "").strip() for h in self._hoteles]
+
+    def obtener_hotel(self, nombre: str) -> Optional[HotelExcel]:
+        """Busca un hotel por nombre (con o sin '(A)', sin distinguir mayúsculas)."""
+        if not nombre:
+            return None
+        return self._por_nombre.get(normalizar_nombre_hotel(nombre))
+
+    def edificios(self, nombre_hotel: str) -> List[str]:
+        """Nombres de los edificios (tipos) de un hotel, sin duplicados y ordenados."""
+        hotel = self.obtener_hotel(nombre_hotel)
+        if hotel is None:
+            return []
+        return sorted({tipo.nombre for tipo in hotel.tipos})
+
+    def habitaciones(self, nombre_hotel: str, edificio: Optional[str] = None) -> List[HabitacionExcel]:
+        """Habitaciones de un hotel: directas si no se indica edificio, o las de
+        todos los tipos con ese nombre de edificio."""
+        return self._entrada_cache(nombre_hotel, edificio)[0]
+
+    def habitaciones_unificadas(self, nombre_hotel: str, edificio: Optional[str] = None) -> List[HabitacionUnificada]:
+        """Habitaciones unificadas por nombre (calculadas una vez por hotel y edificio)."""
+        return self._entrada_cache(nombre_hotel, edificio)[1]
+
+    def habitaciones_unificadas_por_nombre(self, nombre_hotel: str,
+                                           edificio: Optional[str] = None) -> Dict[str, HabitacionUnificada]:
+        """Índice {nombre normalizado: HabitacionUnificada} de un hotel/edificio."""
+        return self._entrada_cache(nombre_hotel, edificio)[2]
+
+    def habitacion_unificada(self, nombre_hotel: str, edificio: Optional[str],
+                             nombre_habitacion: str) -> Optional[HabitacionUnificada]:
+        """Busca una habitación unificada por nombre dentro de un hotel/edificio."""
+        if not nombre_habitacion:
+            return None
+        return self._entrada_cache(nombre_hotel, edificio)[2].get(nombre_habitacion.lower().strip())
+
+    def _entrada_cache(self, nombre_hotel: str, edificio: Optional[str]):
+        clave_hotel = normalizar_nombre_hotel(nombre_hotel) if nombre_hotel else ""
+        clave_edificio = normalizar_nombre_edificio(edificio)
+        clave = (clave_hotel, clave_edificio)
+
+        entrada = self._cache_habitaciones.get(clave)
+        if entrada is not None:
+            return entrada
+
+        hotel = self._por_nombre.get(clave_hotel)
+        if hotel is None:
+            return [], [], {}
+
+        if clave_edificio is None:
+            habitaciones = list(hotel.habitaciones_directas)
+        else:
+            habitaciones = []
+            for tipo in self._tipos[clave_hotel].get(clave_edificio, []):
+                habitaciones.extend(tipo.habitaciones)
+
+        unificadas = unificar_habitaciones(habitaciones)
+        entrada = (habitaciones, unificadas, {u.nombre: u for u in unificadas})
+        self._cache_habitaciones[clave] = entrada
+        return entrada
@@ -2,8 +2,8 @@
 
 from Models.habitacion_unificada import HabitacionUnificada
 from Models.hotelExcel import HabitacionExcel, HotelExcel, Periodo
-from typing import List, Dict
-from datetime import date
+from typing import List, Dict, Optional
+from datetime import date, timedelta
 
 
 def unificar_habitaciones(habitaciones: List[HabitacionExcel]) -> List[HabitacionUnificada]:
@@ -104,38 +104,49 @@ def inferir_periodos_desde_fechas(
 def calcular_dias_por_periodo(
     fecha_entrada: date,
     fecha_salida: date,
-    periodos: List[Periodo]
+    periodos: List[Periodo],
+    habitacion_unificada: Optional[HabitacionUnificada] = None
 ) -> Dict[int, int]:
-    """Calcula cuántos días de la estadía corresponden a cada periodo.
+    """Calcula cuántas noches de la estadía corresponden a cada periodo.
 
-    Esta función es útil para cálculos de precio prorrateado en el futuro,
-    permitiendo saber exactamente cuántas noches de la reserva caen en cada periodo.
+    Las noches son las de [fecha_entrada, fecha_salida): la noche del check-out
+    no se cobra, así que un periodo que empieza el día de salida no suma noches
+    (aunque inferir_periodos_desde_fechas lo considere aplicable).
+
+    Con `habitacion_unificada`, cada noche va a un solo periodo si todos los
+    que la cubren tienen el mismo precio para la habitación (hay grupos que
+    repiten las mismas fechas con otro id). Si los precios son distintos, la
+    noche cuenta en todos y el total ya no es el de la estadía. Se usa para
+    prorratear el precio del contrato en la comparación por estadía.
 
     Args:
         fecha_entrada: Fecha de check-in
         fecha_salida: Fecha de check-out
         periodos: Lista de periodos a analizar
+        habitacion_unificada: Habitación cuyos precios deciden si los periodos
+            que cubren una misma noche son equivalentes (opcional)
 
     Returns:
-        Diccionario {periodo_id: días} con la cantidad de días en cada periodo
+        Diccionario {periodo_id: noches} solo con los periodos que tienen al menos una noche
 
     Ejemplo:
         Rango: 28-05-2025 a 05-06-2025 (8 noches)
-        P1: 01-01 a 31-05 (LOW SEASON)  -> 3 días (28, 29, 30 mayo)
-        P2: 01-06 a 30-06 (HIGH SEASON) -> 5 días (1, 2, 3, 4, 5 junio)
+        P1: 01-01 a 31-05 (LOW SEASON)  -> 4 noches (28, 29, 30, 31 mayo)
+        P2: 01-06 a 30-06 (HIGH SEASON) -> 4 noches (1, 2, 3, 4 junio)
 
-        Retorna: {1: 3, 2: 5}
+        Retorna: {1: 4, 2: 4}
     """
     resultado = {}
-
-    for periodo in periodos:
-        # Encontrar overlap real entre el rango de reserva y el periodo
-        inicio_overlap = max(fecha_entrada, periodo.fecha_inicio)
-        fin_overlap = min(fecha_salida, periodo.fecha_fin)
-
-        # Si hay overlap válido, calcular días
-        if inicio_overlap <= fin_overlap:
-            dias = (fin_overlap - inicio_overlap).days + 1
-            resultado[periodo.id] = dias
+    noche = fecha_entrada
+
+    while noche < fecha_salida:
+        cubren = [p for p in periodos if p.fecha_inicio <= noche <= p.fecha_fin]
+        if habitacion_unificada is not None:
+            precios = {habitacion_unificada.precio_para_periodo(p.id) for p in cubren}
+            if len(precios) == 1:
+                cubren = cubren[:1]
+        for periodo in cubren:
+            resultado[periodo.id] = resultado.get(periodo.id, 0) + 1
+        noche += timedelta(days=1)
 
     return resultado
@@ -0,0 +1,206 @@
+"""Representación columnar del tarifario para consultas vectorizadas.
+
+DatosExcel es una estructura anidada (hotel → tipos → habitaciones → ids de
+periodo), cómoda para la UI pero lenta para reportes sobre todos los hoteles.
+TarifarioColumnar la aplana en arrays de NumPy con una fila por
+(habitación, periodo), de modo que preguntas como "qué habitaciones tienen un
+precio de contrato para el 15/01/2026 que difiere más de 5% del último precio
+web" se resuelven con máscaras booleanas en lugar de bucles anidados.
+
+Columnas (todas de largo igual a la cantidad de filas):
+    hotel_idx     int32           índice en `hoteles`
+    habitacion_idx int32          índice en `habitaciones` (nombre normalizado)
+    tipo_idx      int32           índice en `tipos` ("" = habitación directa)
+    periodo_id    int64
+    inicio, fin   datetime64[D]   fechas del periodo (ambas inclusive)
+    precio        float64         NaN si el precio es una leyenda o falta
+    es_leyenda    bool            True si el precio es una leyenda ("closing agreement", ...)
+    row_idx       int32           fila del Excel
+
+Ejemplo de uso:
+    tarifario = TarifarioColumnar.desde_datos_excel(datos)
+    filas = tarifario.en_fecha(date(2026, 1, 15))
+    discrepancias = tarifario.discrepancias(date(2026, 1, 15), precios_web, umbral_relativo=0.05)
+    for fila in tarifario.filas(discrepancias):
+        print(fila["hotel"], fila["habitacion"], fila["precio"])
+"""
+
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from Models.hotelExcel import DatosExcel
+
+# date.toordinal() de 1970-01-01, origen de datetime64
+_ORDINAL_EPOCH = date(1970, 1, 1).toordinal()
+
+
+class TarifarioColumnar:
+    """Tarifario aplanado en arrays de NumPy (una fila por habitación y periodo)."""
+
+    def __init__(self, hoteles: List[str], habitaciones: List[str], tipos: List[str],
+                 hotel_idx, habitacion_idx, tipo_idx, periodo_id, inicio, fin,
+                 precio, es_leyenda, row_idx):
+        """Inicializa el tarifario a partir de vocabularios y columnas ya armadas.
+
+        Normalmente se construye con TarifarioColumnar.desde_datos_excel().
+        """
+        self.hoteles = hoteles
+        self.habitaciones = habitaciones
+        self.tipos = tipos
+        self._indice_hoteles = {nombre: i for i, nombre in enumerate(hoteles)}
+        self._indice_habitaciones = {nombre: i for i, nombre in enumerate(habitaciones)}
+
+        self.hotel_idx = np.asarray(hotel_idx, dtype=np.int32)
+        self.habitacion_idx = np.asarray(habitacion_idx, dtype=np.int32)
+        self.tipo_idx = np.asarray(tipo_idx, dtype=np.int32)
+        self.periodo_id = np.asarray(periodo_id, dtype=np.int64)
+        self.inicio = np.asarray(inicio, dtype="datetime64[D]")
+        self.fin = np.asarray(fin, dtype="datetime64[D]")
+        self.precio = np.asarray(precio, dtype=np.float64)
+        self.es_leyenda = np.asarray(es_leyenda, dtype=bool)
+        self.row_idx = np.asarray(row_idx, dtype=np.int32)
+
+    # ===== Construcción =====
+
+    @classmethod
+    def desde_datos_excel(cls, datos: DatosExcel) -> "TarifarioColumnar":
+        """Aplana un DatosExcel en columnas.
+
+        Cada habitación genera una fila por cada periodo de periodo_ids que
+        exista en su hotel; las habitaciones sin periodos no generan filas.
+        """
+        hoteles: List[str] = []
+        habitaciones: Dict[str, int] = {}
+        tipos: Dict[str, int] = {"": 0}
+
+        columnas = {c: [] for c in ("hotel_idx", "habitacion_idx", "tipo_idx", "periodo_id",
+                                    "inicio", "fin", "precio", "es_leyenda", "row_idx")}
+
+        for h_idx, hotel in enumerate(datos.hoteles):
+            hoteles.append(hotel.nombre)
+            # Fechas como ordinales: convertir enteros a datetime64 es mucho más
+            # barato que convertir una lista de objetos date
+            periodos = {
+                p.id: (p.fecha_inicio.toordinal(), p.fecha_fin.toordinal())
+                for grupo in hotel.periodos_group for p in grupo.periodos
+            }
+
+            grupos_habitaciones = [("", hotel.habitaciones_directas)]
+            grupos_habitaciones.extend((tipo.nombre, tipo.habitaciones) for tipo in hotel.tipos)
+
+            for nombre_tipo, lista in grupos_habitaciones:
+                t_idx = tipos.setdefault(nombre_tipo, len(tipos))
+                for hab in lista:
+                    hab_idx = habitaciones.setdefault(hab.nombre, len(habitaciones))
+                    precio = float(hab.precio) if isinstance(hab.precio, (int, float)) else np.nan
+                    es_leyenda = hab.precio_string is not None
+                    for pid in sorted(hab.periodo_ids):
+                        periodo = periodos.get(pid)
+                        if periodo is None:
+                            continue
+                        columnas["hotel_idx"].append(h_idx)
+                        columnas["habitacion_idx"].append(hab_idx)
+                        columnas["tipo_idx"].append(t_idx)
+                        columnas["periodo_id"].append(pid)
+                        columnas["inicio"].append(periodo[0])
+                        columnas["fin"].append(periodo[1])
+                        columnas["precio"].append(precio)
+                        columnas["es_leyenda"].append(es_leyenda)
+                        columnas["row_idx"].append(hab.row_idx)
+
+        for c in ("inicio", "fin"):
+            columnas[c] = (np.array(columnas[c], dtype=np.int64) - _ORDINAL_EPOCH).astype("datetime64[D]")
+
+        return cls(hoteles, list(habitaciones), list(tipos), **columnas)
+
+    def __len__(self) -> int:
+        return len(self.periodo_id)
+
+    # ===== Máscaras =====
+
+    def mascara_hotel(self, hotel: str) -> np.ndarray:
+        """Máscara de las filas de un hotel (todas False si no existe)."""
+        h_idx = self._indice_hoteles.get(hotel)
+        if h_idx is None:
+            return np.zeros(len(self), dtype=bool)
+        return self.hotel_idx == h_idx
+
+    def mascara_fecha(self, fecha: date) -> np.ndarray:
+        """Máscara de las filas cuyo periodo contiene `fecha` (inicio <= fecha <= fin)."""
+        dia = np.datetime64(fecha, "D")
+        return (self.inicio <= dia) & (dia <= self.fin)
+
+    def mascara_rango(self, desde: date, hasta: date) -> np.ndarray:
+        """Máscara de las filas cuyo periodo se superpone con [desde, hasta].
+
+        Usa la misma regla de overlap que inferir_periodos_desde_fechas.
+        """
+        return (self.inicio <= np.datetime64(hasta, "D")) & (self.fin >= np.datetime64(desde, "D"))
+
+    # ===== Consultas =====
+
+    def en_fecha(self, fecha: date, hotel: Optional[str] = None) -> np.ndarray:
+        """Índices de las filas vigentes en `fecha`, opcionalmente de un solo hotel."""
+        mascara = self.mascara_fecha(fecha)
+        if hotel is not None:
+            mascara &= self.mascara_hotel(hotel)
+        return np.flatnonzero(mascara)
+
+    def en_rango(self, desde: date, hasta: date, hotel: Optional[str] = None) -> np.ndarray:
+        """Índices de las filas cuyo periodo se superpone con [desde, hasta]."""
+        mascara = self.mascara_rango(desde, hasta)
+        if hotel is not None:
+            mascara &= self.mascara_hotel(hotel)
+        return np.flatnonzero(mascara)
+
+    def precios_web_alineados(self, precios_web: Dict[Tuple[str, str], float]) -> np.ndarray:
+        """Array de precios web alineado con las filas (NaN si no hay precio web).
+
+        Args:
+            precios_web: {(hotel, habitacion_excel): último precio web}
+        """
+        ancho = max(len(self.habitaciones), 1)
+        tabla = np.full(len(self.hoteles) * ancho, np.nan)
+        for (hotel, habitacion), precio in precios_web.items():
+            h_idx = self._indice_hoteles.get(hotel)
+            hab_idx = self._indice_habitaciones.get(habitacion.strip().lower())
+            if h_idx is not None and hab_idx is not None:
+                tabla[h_idx * ancho + hab_idx] = precio
+        return tabla[self.hotel_idx.astype(np.int64) * ancho + self.habitacion_idx]
+
+    def discrepancias(self, fecha: date, precios_web: Dict[Tuple[str, str], float],
+                      umbral_relativo: float = 0.05) -> np.ndarray:
+        """Índices de las filas vigentes en `fecha` cuyo precio de contrato
+        difiere del precio web en más de `umbral_relativo` (0.05 = 5%).
+
+        Las filas con leyenda o sin precio web no se consideran.
+        """
+        web = self.precios_web_alineados(precios_web)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            diferencia_relativa = np.abs(web - self.precio) / self.precio
+        mascara = self.mascara_fecha(fecha) & (diferencia_relativa > umbral_relativo)
+        return np.flatnonzero(mascara)
+
+    def conteo_por_hotel(self, indices: np.ndarray) -> Dict[str, int]:
+        """Cantidad de filas de `indices` por hotel (para dashboards)."""
+        conteos = np.bincount(self.hotel_idx[indices], minlength=len(self.hoteles))
+        return {self.hoteles[i]: int(c) for i, c in enumerate(conteos) if c}
+
+    def filas(self, indices: np.ndarray) -> List[dict]:
+        """Materializa las filas de `indices` como dicts (para mostrar o exportar)."""
+        return [
+            {
+                "hotel": self.hoteles[self.hotel_idx[i]],
+                "habitacion": self.habitaciones[self.habitacion_idx[i]],
+                "tipo": self.tipos[self.tipo_idx[i]],
+                "periodo_id": int(self.periodo_id[i]),
+                "fecha_inicio": self.inicio[i].astype(date),
+                "fecha_fin": self.fin[i].astype(date),
+                "precio": None if np.isnan(self.precio[i]) else float(self.precio[i]),
+                "es_leyenda": bool(self.es_leyenda[i]),
+                "row_idx": int(self.row_idx[i]),
+            }
+            for i in indices
+        ]
@@ -0,0 +1,216 @@
+"""Extracción incremental del Excel por bloques de hotel.
+
+La hoja se divide en bloques que empiezan en cada fila de hotel (las mismas
+filas "... (A)" que detecta ContextoExtraccion._procesar_hotel). Cada bloque
+se identifica por el hash de su contenido (valores de las filas y celdas
+fusionadas, relativos a la primera fila del bloque) más el estado que recibe
+del bloque anterior. Al recargar un workbook editado solo se vuelven a
+procesar los bloques cuyo hash cambió; el resto se toma del snapshot previo.
+
+Ejemplo de uso:
+    datos, bloques = cargar_excel_por_bloques(path_excel)
+    # ...el usuario edita un hotel...
+    datos, bloques = cargar_excel_por_bloques(path_excel, bloques_previos=bloques)
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from openpyxl import load_workbook
+from openpyxl.utils import range_boundaries
+
+from Models.hotelExcel import DatosExcel, HotelExcel
+from ExtractorDatos.contexto_extraccion import ContextoExtraccion
+from ExtractorDatos.extractor import EXCLUSIONES
+from ExtractorDatos.utils import parece_periodo
+
+
+@dataclass
+class BloqueExtraido:
+    """Resultado de procesar un bloque de filas.
+
+    Atributos:
+        hash: Hash del contenido del bloque y de su estado de entrada
+        fila_inicio: Índice (0-based) de la primera fila del bloque
+        hoteles: Hoteles creados dentro del bloque (0 para el preámbulo)
+        estado_salida: Estado del contexto al terminar el bloque
+    """
+
+    hash: str
+    fila_inicio: int
+    hoteles: List[HotelExcel] = field(default_factory=list)
+    estado_salida: dict = field(default_factory=dict)
+
+    def a_indice(self) -> dict:
+        """Datos del bloque para el snapshot (los hoteles van en DatosExcel)."""
+        return {
+            "hash": self.hash,
+            "fila_inicio": self.fila_inicio,
+            "cantidad_hoteles": len(self.hoteles),
+            "estado_salida": self.estado_salida,
+        }
+
+
+def es_fila_hotel(row) -> bool:
+    """Indica si una fila abre un bloque de hotel.
+
+    Solo se cortan bloques en filas donde ContextoExtraccion crearía el hotel
+    sin procesar antes un periodo de la columna B; si una fila de hotel no
+    cumple eso queda dentro del bloque anterior, que simplemente contendrá
+    dos hoteles.
+    """
+    if not row or row[0] is None:
+        return False
+    nombre = str(row[0]).strip()
+    if not nombre.endswith("(A)"):
+        return False
+    if any(nombre.lower().startswith(excl) for excl in EXCLUSIONES):
+        return False
+    return len(row) < 2 or row[1] is None or not parece_periodo(row[1])
+
+
+def segmentar_bloques(filas) -> List[Tuple[int, int]]:
+    """Divide las filas en rangos [inicio, fin) que empiezan en cada hotel.
+
+    El primer rango es el preámbulo anterior al primer hotel (se omite si
+    está vacío).
+    """
+    cortes = [i for i, row in enumerate(filas) if es_fila_hotel(row)]
+    if not cortes or cortes[0] != 0:
+        cortes.insert(0, 0)
+    cortes.append(len(filas))
+    return [(inicio, fin) for inicio, fin in zip(cortes, cortes[1:]) if fin > inicio]
+
+
+def _rangos_fusionados(ws) -> List[Tuple[int, int, int, int, object]]:
+    """Rangos fusionados como (min_fila, max_fila, min_col, max_col, valor) 0-based."""
+    if ws is None:
+        return []
+    rangos = []
+    for merged_range in ws.merged_cells.ranges:
+        min_col, min_row, max_col, max_row = range_boundaries(str(merged_range))
+        valor = ws.cell(row=min_row, column=min_col).value
+        rangos.append((min_row - 1, max_row - 1, min_col - 1, max_col - 1, valor))
+    return rangos
+
+
+def hash_bloque(filas, inicio: int, fin: int, rangos_fusionados, estado_entrada: Optional[dict]) -> str:
+    """Hash del bloque [inicio, fin) independiente de su posición en la hoja.
+
+    Incluye los valores de las filas, los rangos fusionados que las tocan
+    (con coordenadas relativas y el valor de la celda principal) y el estado
+    de entrada, de modo que un cambio en un bloque que altere lo que hereda
+    el siguiente también invalida al siguiente.
+    """
+    h = hashlib.sha256()
+    h.update(json.dumps(estado_entrada, sort_keys=True, default=str).encode("utf-8"))
+    for i in range(inicio, fin):
+        h.update(repr(filas[i]).encode("utf-8"))
+        h.update(b"\n")
+    for min_fila, max_fila, min_col, max_col, valor in rangos_fusionados:
+        if min_fila < fin and max_fila >= inicio:
+            h.update(repr((min_fila - inicio, max_fila - inicio, min_col, max_col, valor)).encode("utf-8"))
+    return h.hexdigest()
+
+
+def extraer_bloque(ws, filas, inicio: int, fin: int, estado_entrada: Optional[dict]) -> Tuple[List[HotelExcel], dict]:
+    """Procesa las filas [inicio, fin) continuando desde estado_entrada.
+
+    Returns:
+        tuple: (hoteles creados en el bloque, estado de salida)
+    """
+    ctx = ContextoExtraccion.desde_estado(ws, estado_entrada)
+    for i in range(inicio, fin):
+        ctx.procesar_fila(filas[i], i)
+    return ctx.hoteles, ctx.exportar_estado()
+
+
+def _desplazar_filas(hoteles: List[HotelExcel], estado: dict, delta: int) -> None:
+    """Corrige row_idx de un bloque reutilizado que cambió de posición."""
+    if delta == 0:
+        return
+    for hotel in hoteles:
+        habitaciones = list(hotel.habitaciones_directas)
+        for tipo in hotel.tipos:
+            habitaciones.extend(tipo.habitaciones)
+        for habitacion in habitaciones:
+            habitacion.row_idx += delta
+    for pendiente in estado.get("pendientes", []):
+        pendiente["row_idx"] += delta
+
+
+def cargar_excel_por_bloques(path_excel, max_row=300,
+                             bloques_previos: Optional[List[BloqueExtraido]] = None
+                             ) -> Tuple[DatosExcel, List[BloqueExtraido]]:
+    """Carga el Excel reutilizando los bloques de hotel que no cambiaron.
+
+    Args:
+        path_excel: Ruta al archivo Excel
+        max_row: Número máximo de filas a procesar (default: 300)
+        bloques_previos: Bloques de una extracción anterior del mismo workbook
+
+    Returns:
+        tuple: (DatosExcel idéntico al de cargar_excel, bloques de esta extracción)
+
+    Los bloques previos se consumen: sus hoteles pasan a formar parte del
+    resultado nuevo y no deben reutilizarse.
+    """
+    wb = load_workbook(path_excel)
+    ws = wb.active
+    filas = list(ws.iter_rows(values_only=True, max_row=max_row))
+    rangos = _rangos_fusionados(ws)
+
+    # hash -> bloques previos disponibles (puede haber bloques idénticos repetidos)
+    disponibles: Dict[str, List[BloqueExtraido]] = {}
+    for bloque in bloques_previos or []:
+        disponibles.setdefault(bloque.hash, []).append(bloque)
+
+    bloques: List[BloqueExtraido] = []
+    estado: Optional[dict] = None
+    reextraidos = 0
+
+    for inicio, fin in segmentar_bloques(filas):
+        clave = hash_bloque(filas, inicio, fin, rangos, estado)
+        candidatos = disponibles.get(clave)
+
+        if candidatos:
+            previo = candidatos.pop(0)
+            hoteles, estado_salida = previo.hoteles, previo.estado_salida
+            _desplazar_filas(hoteles, estado_salida, inicio - previo.fila_inicio)
+        else:
+            hoteles, estado_salida = extraer_bloque(ws, filas, inicio, fin, estado)
+            reextraidos += 1
+
+        bloques.append(BloqueExtraido(clave, inicio, hoteles, estado_salida))
+        estado = estado_salida
+
+    if bloques_previos:
+        print(f"Re-extraídos {reextraidos} de {len(bloques)} bloques de {path_excel}")
+
+    hoteles = [hotel for bloque in bloques for hotel in bloque.hoteles]
+    return DatosExcel(hoteles=hoteles), bloques
+
+
+def bloques_desde_indice(datos: DatosExcel, indice: List[dict]) -> List[BloqueExtraido]:
+    """Reconstruye los bloques a partir del índice del snapshot y sus hoteles.
+
+    Raises:
+        ValueError: Si el índice no corresponde a la cantidad de hoteles
+    """
+    if sum(b["cantidad_hoteles"] for b in indice) != len(datos.hoteles):
+        raise ValueError("El índice de bloques no corresponde a los hoteles del snapshot")
+
+    bloques = []
+    pos = 0
+    for b in indice:
+        cantidad = b["cantidad_hoteles"]
+        bloques.append(BloqueExtraido(
+            hash=b["hash"],
+            fila_inicio=b["fila_inicio"],
+            hoteles=datos.hoteles[pos:pos + cantidad],
+            estado_salida=b["estado_salida"],
+        ))
+        pos += cantidad
+    return bloques
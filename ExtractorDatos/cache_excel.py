@@ -0,0 +1,171 @@
+"""Caché de snapshots de DatosExcel por contenido del workbook.
+
+Cada extracción se guarda en disco como JSON junto con el hash SHA-256 del
+archivo Excel, la versión del extractor, el max_row y las hojas usadas.
+Mientras esos datos coincidan, la siguiente carga valida el JSON directamente
+con pydantic-core y evita abrir el workbook con openpyxl.
+
+Si el workbook cambió, el snapshot anterior igual sirve: se re-procesan solo
+los bloques de hotel cuyo contenido cambió (ver ExtractorDatos.bloques_excel).
+Con varias hojas (ExtractorDatos.extractor_multihoja) no hay bloques: un
+cambio en el archivo re-extrae todas las hojas.
+
+Formato del snapshot (tres líneas):
+    1. Cabecera JSON: {"version_extractor", "hash", "max_row", "hojas"}
+    2. DatosExcel serializado con model_dump_json()
+    3. Índice JSON de bloques de hotel (hash, fila_inicio, cantidad_hoteles, estado_salida);
+       vacío con varias hojas
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import List, Optional
+
+from Models.hotelExcel import DatosExcel
+from ExtractorDatos.extractor import VERSION_EXTRACTOR
+from ExtractorDatos.bloques_excel import BloqueExtraido, cargar_excel_por_bloques, bloques_desde_indice
+from ExtractorDatos.extractor_multihoja import cargar_excel_multihoja
+
+DIRECTORIO_CACHE = Path(__file__).parent.parent / ".cache" / "datos_excel"
+
+
+def hash_archivo(path, tam_bloque: int = 1 << 20) -> str:
+    """Calcula el SHA-256 del contenido de un archivo.
+
+    Args:
+        path: Ruta al archivo
+        tam_bloque: Tamaño de lectura en bytes
+
+    Returns:
+        Hash hexadecimal del contenido
+    """
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for bloque in iter(lambda: f.read(tam_bloque), b""):
+            h.update(bloque)
+    return h.hexdigest()
+
+
+def ruta_snapshot(path_excel, directorio_cache: Optional[Path] = None) -> Path:
+    """Devuelve la ruta del snapshot asociado a un workbook.
+
+    Hay un snapshot por workbook (se sobrescribe al cambiar el archivo), con
+    un sufijo del hash de la ruta para no mezclar archivos homónimos.
+    """
+    directorio = Path(directorio_cache) if directorio_cache else DIRECTORIO_CACHE
+    path_excel = Path(path_excel).resolve()
+    sufijo = hashlib.sha1(str(path_excel).encode("utf-8")).hexdigest()[:8]
+    return directorio / f"{path_excel.stem}-{sufijo}.json"
+
+
+def leer_snapshot(path_snapshot: Path, hash_excel: str, max_row: int,
+                  hojas: Optional[List[str]] = None) -> Optional[DatosExcel]:
+    """Lee un snapshot si existe y corresponde al workbook y extractor actuales.
+
+    Returns:
+        DatosExcel del snapshot, o None si no existe, está desactualizado o es ilegible
+    """
+    if not path_snapshot.exists():
+        return None
+
+    try:
+        with open(path_snapshot, "rb") as f:
+            cabecera = json.loads(f.readline())
+            if (cabecera.get("version_extractor") != VERSION_EXTRACTOR or
+                    cabecera.get("hash") != hash_excel or
+                    cabecera.get("max_row") != max_row or
+                    cabecera.get("hojas") != hojas):
+                return None
+            return DatosExcel.model_validate_json(f.readline())
+    except Exception as e:
+        print(f"[WARNING] Snapshot ilegible en {path_snapshot}, se re-extrae: {e}")
+        return None
+
+
+def leer_bloques_snapshot(path_snapshot: Path, max_row: int) -> List[BloqueExtraido]:
+    """Lee los bloques de hotel de un snapshot desactualizado para reutilizarlos.
+
+    Solo sirven si el snapshot es de la misma versión del extractor y max_row,
+    y de la hoja activa (los snapshots de varias hojas no tienen bloques).
+
+    Returns:
+        Lista de bloques, vacía si no hay snapshot reutilizable
+    """
+    if not path_snapshot.exists():
+        return []
+
+    try:
+        with open(path_snapshot, "rb") as f:
+            cabecera = json.loads(f.readline())
+            if (cabecera.get("version_extractor") != VERSION_EXTRACTOR or
+                    cabecera.get("max_row") != max_row or
+                    cabecera.get("hojas") is not None):
+                return []
+            datos = DatosExcel.model_validate_json(f.readline())
+            indice = f.readline()
+            if not indice:
+                return []
+            return bloques_desde_indice(datos, json.loads(indice))
+    except Exception as e:
+        print(f"[WARNING] Bloques ilegibles en {path_snapshot}, se re-extrae todo: {e}")
+        return []
+
+
+def escribir_snapshot(path_snapshot: Path, datos: DatosExcel, hash_excel: str, max_row: int,
+                      bloques: Optional[List[BloqueExtraido]] = None,
+                      hojas: Optional[List[str]] = None) -> None:
+    """Escribe el snapshot de forma atómica (archivo temporal + os.replace)."""
+    path_snapshot.parent.mkdir(parents=True, exist_ok=True)
+    cabecera = {
+        "version_extractor": VERSION_EXTRACTOR,
+        "hash": hash_excel,
+        "max_row": max_row,
+        "hojas": hojas,
+    }
+    temporal = path_snapshot.with_suffix(".tmp")
+    with open(temporal, "wb") as f:
+        f.write(json.dumps(cabecera).encode("utf-8") + b"\n")
+        f.write(datos.model_dump_json().encode("utf-8") + b"\n")
+        f.write(json.dumps([b.a_indice() for b in bloques or []]).encode("utf-8"))
+    os.replace(temporal, path_snapshot)
+
+
+def cargar_excel_cacheado(path_excel, max_row=300, directorio_cache: Optional[Path] = None,
+                          hojas: Optional[List[str]] = None) -> DatosExcel:
+    """Carga DatosExcel usando el snapshot en disco si sigue siendo válido.
+
+    Args:
+        path_excel: Ruta al archivo Excel
+        max_row: Número máximo de filas a procesar (default: 300)
+        directorio_cache: Directorio de snapshots (default: .cache/datos_excel en la raíz)
+        hojas: Hojas a extraer con cargar_excel_multihoja (default: None, solo la hoja activa)
+
+    Returns:
+        DatosExcel idéntico al que devolvería cargar_excel(path_excel, max_row)
+        (o cargar_excel_multihoja(path_excel, hojas, max_row) con `hojas`)
+
+    Si el archivo cambió se re-procesan solo los bloques de hotel modificados
+    (con `hojas`, todas las hojas) y se reescribe el snapshot. Si cambió
+    VERSION_EXTRACTOR, max_row o las hojas, o el snapshot no se puede leer,
+    se re-extrae todo.
+    """
+    hash_excel = hash_archivo(path_excel)
+    path_snapshot = ruta_snapshot(path_excel, directorio_cache)
+
+    datos = leer_snapshot(path_snapshot, hash_excel, max_row, hojas)
+    if datos is not None:
+        print(f"Usando snapshot de {path_excel} desde {path_snapshot}")
+        return datos
+
+    if hojas is None:
+        bloques_previos = leer_bloques_snapshot(path_snapshot, max_row)
+        datos, bloques = cargar_excel_por_bloques(path_excel, max_row=max_row, bloques_previos=bloques_previos)
+    else:
+        datos, bloques = cargar_excel_multihoja(path_excel, hojas, max_row=max_row), []
+    try:
+        escribir_snapshot(path_snapshot, datos, hash_excel, max_row, bloques, hojas)
+    except OSError as e:
+        print(f"[WARNING] No se pudo guardar el snapshot en {path_snapshot}: {e}")
+    return datos
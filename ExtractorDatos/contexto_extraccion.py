@@ -50,6 +50,43 @@ class ContextoExtraccion:
     # Worksheet para acceso a celdas merged
     ws: Optional[Worksheet] = None
 
+    def exportar_estado(self) -> dict:
+        """Exporta el estado que se arrastra de una fila de hotel a la siguiente.
+
+        Al empezar un hotel se resetean hotel_actual y tipo_actual, pero la
+        herencia de precio, el flag de nombre de periodo y las habitaciones
+        pendientes de una fila vacía pasan al hotel siguiente. Este estado
+        (serializable a JSON) permite procesar cada bloque de hotel por separado
+        obteniendo el mismo resultado que una pasada completa.
+
+        Returns:
+            dict con nombre_periodo, hubo_nombre_periodo, precio_str y pendientes
+        """
+        return {
+            "nombre_periodo": self.nombre_periodo,
+            "hubo_nombre_periodo": self.hubo_nombre_periodo,
+            "precio_str": self.precio_str,
+            "pendientes": [h.model_dump(mode="json") for h in self.habitaciones_sin_periodos],
+        }
+
+    @classmethod
+    def desde_estado(cls, ws: Optional[Worksheet], estado: Optional[dict]) -> "ContextoExtraccion":
+        """Crea un contexto que continúa desde un estado exportado.
+
+        Args:
+            ws: Worksheet de openpyxl
+            estado: Resultado de exportar_estado(), o None para un contexto nuevo
+        """
+        ctx = cls(ws=ws)
+        if estado:
+            ctx.nombre_periodo = estado["nombre_periodo"]
+            ctx.hubo_nombre_periodo = estado["hubo_nombre_periodo"]
+            ctx.precio_str = estado["precio_str"]
+            ctx.habitaciones_sin_periodos = [
+                HabitacionExcel.model_validate(h) for h in estado["pendientes"]
+            ]
+        return ctx
+
     def procesar_fila(self, row, i: int) -> None:
         """Procesa una fila del Excel aplicando los procesadores en orden.
 
@@ -13,6 +13,11 @@ EXCLUSIONES = [
 
 LEYENDAS_AGREEMENT = ["closing agreement"]
 
+# Versión de la lógica de extracción. Incrementarla cuando un cambio en el
+# extractor o en los modelos altere el DatosExcel resultante, para invalidar
+# los snapshots guardados por ExtractorDatos.cache_excel.
+VERSION_EXTRACTOR = "2"
+
 def cargar_excel(path_excel, max_row=300) -> DatosExcel:
     """Carga datos de hoteles, habitaciones y periodos desde Excel.
 
@@ -79,8 +84,9 @@ def detectar_y_agregar_periodo(hotel_actual: HotelExcel, periodo_raw, hubo_nombr
             # IMPORTANTE: Iterar sobre TODOS los periodos encontrados
             for fecha_inicio, fecha_fin in fechas_con_parentesis:
                 nombre_periodo_a_usar = "SIN NOMBRE DE GRUPO"
-                # Construir el periodo
-                periodo = construir_periodo(fecha_inicio, fecha_fin)
+                # Construir el periodo (id derivado del grupo al que se agrega)
+                nombre_grupo = hotel_actual.periodos_group[-1].nombre if hubo_nombre_periodo else nombre_periodo_a_usar
+                periodo = construir_periodo(fecha_inicio, fecha_fin, hotel=hotel_actual, nombre_grupo=nombre_grupo)
 
                 # Agregarlo al hotel
 
@@ -132,7 +138,10 @@ def detectar_y_agregar_periodo(hotel_actual: HotelExcel, periodo_raw, hubo_nombr
             fecha_inicio, fecha_fin = fechas_sin_parentesis
 
 
-            periodo = construir_periodo(fecha_inicio, fecha_fin, nombre_periodo_extraido)
+            periodo = construir_periodo(
+                fecha_inicio, fecha_fin, nombre_periodo_extraido,
+                hotel=hotel_actual, nombre_grupo=hotel_actual.periodos_group[-1].nombre
+            )
             hotel_actual.periodos_group[-1].periodos.append(periodo)
 
             return (False, None)
@@ -0,0 +1,218 @@
+"""Extracción de todas las hojas de un workbook en paralelo.
+
+Cada hoja se procesa con su propio ContextoExtraccion en un proceso del pool
+y los hoteles se unen en el orden de las hojas del workbook. Los ids de
+periodo son deterministas (ver Models.periodo.generar_id_periodo), así que el
+resultado no depende de qué proceso extrajo cada hoja.
+
+Cada proceso parsea solo las hojas de su grupo (LectorHojas): la carga del
+workbook completo no se repite en todos los procesos. LectorHojas usa la API
+interna de openpyxl (ExcelReader), por eso requirements.txt fija su versión;
+si esa API cambia, cargar_hojas vuelve a cargar el workbook completo. Una hoja que no se
+puede extraer (p. ej. las hojas de resumen de un extracto, que no tienen la
+estructura del tarifario) queda con su error en el ResultadoHoja y no frena
+al resto.
+
+GestorDatos lo usa a través de cargar_excel_cacheado cuando EXCEL_HOJAS
+pide más de la hoja activa.
+
+Variables de entorno:
+    EXCEL_HOJAS     "*" para todas las hojas o nombres separados por coma
+                    (default: solo la hoja activa, sin pasar por este módulo)
+
+Ejemplo de uso:
+    datos = cargar_excel_multihoja("Data/Tarifario.xlsx")
+    datos = cargar_excel_multihoja("Data/Tarifario.xlsx", hojas=["Bariloche", "Mendoza"])
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+import openpyxl
+from openpyxl import load_workbook
+from openpyxl.reader.excel import ExcelReader
+
+from Models.hotelExcel import DatosExcel, HotelExcel
+
+
+@dataclass
+class ResultadoHoja:
+    """Hoteles extraídos de una hoja, el tiempo que llevó y el error si falló."""
+
+    hoja: str
+    hoteles: List[HotelExcel] = field(default_factory=list)
+    segundos: float = 0.0
+    error: Optional[str] = None
+
+
+class LectorHojas(ExcelReader):
+    """ExcelReader que parsea solo las hojas pedidas.
+
+    Las demás hojas no se leen (no aparecen en wb.sheetnames). Las hojas
+    cargadas son worksheets completas, con sus celdas combinadas, a
+    diferencia de read_only=True (ContextoExtraccion necesita las celdas
+    combinadas). Depende de ExcelReader.read_worksheets y de
+    parser.find_sheets de openpyxl 3.1.5 (fijado en requirements.txt).
+    """
+
+    def __init__(self, path_excel, hojas: List[str]):
+        super().__init__(path_excel)
+        self.hojas = set(hojas)
+
+    def read_worksheets(self):
+        find_sheets = self.parser.find_sheets
+        self.parser.find_sheets = lambda: ((hoja, rel) for hoja, rel in find_sheets() if hoja.name in self.hojas)
+        super().read_worksheets()
+
+
+def cargar_hojas(path_excel, hojas: List[str]):
+    """Workbook con solo las hojas `hojas` cargadas.
+
+    Si la API interna de openpyxl no es la esperada, carga el workbook
+    completo (más lento, mismo resultado para las hojas pedidas).
+    """
+    try:
+        lector = LectorHojas(path_excel, hojas)
+        lector.read()
+        return lector.wb
+    except AttributeError as e:
+        print(f"[WARNING] openpyxl {openpyxl.__version__} no permite cargar solo algunas hojas ({e}): "
+              f"se carga el workbook completo")
+        return load_workbook(path_excel)
+
+
+def hojas_del_libro(path_excel) -> List[str]:
+    """Nombres de las hojas del workbook, sin cargarlas."""
+    wb = load_workbook(path_excel, read_only=True)
+    hojas = wb.sheetnames
+    wb.close()
+    return hojas
+
+
+def hojas_desde_entorno(path_excel) -> Optional[List[str]]:
+    """Hojas pedidas con EXCEL_HOJAS, o None para la hoja activa.
+
+    Raises:
+        ValueError: Si EXCEL_HOJAS nombra hojas que no existen
+    """
+    valor = os.getenv("EXCEL_HOJAS", "").strip()
+    if not valor:
+        return None
+    disponibles = hojas_del_libro(path_excel)
+    if valor == "*":
+        return disponibles
+    hojas = [h.strip() for h in valor.split(",") if h.strip()]
+    faltantes = [h for h in hojas if h not in disponibles]
+    if faltantes:
+        raise ValueError(f"EXCEL_HOJAS nombra hojas inexistentes en {path_excel}: {faltantes}")
+    return hojas
+
+
+def _procesar_hoja(ws, hoja: str, max_row) -> ResultadoHoja:
+    """Procesa una worksheet ya cargada con un ContextoExtraccion propio.
+
+    Un error de la extracción queda en ResultadoHoja.error (sin hoteles) en
+    lugar de propagarse, para no perder las otras hojas del grupo.
+    """
+    from ExtractorDatos.contexto_extraccion import ContextoExtraccion
+
+    inicio = time.perf_counter()
+    try:
+        ctx = ContextoExtraccion(ws=ws)
+        for i, row in enumerate(ws.iter_rows(values_only=True, max_row=max_row)):  # type: ignore
+            ctx.procesar_fila(row, i)
+    except Exception as e:
+        return ResultadoHoja(hoja=hoja, segundos=time.perf_counter() - inicio,
+                             error=f"{type(e).__name__}: {e}")
+
+    return ResultadoHoja(hoja=hoja, hoteles=ctx.hoteles, segundos=time.perf_counter() - inicio)
+
+
+def extraer_grupo_hojas(path_excel, hojas: List[str], max_row=300) -> List[ResultadoHoja]:
+    """Extrae un grupo de hojas abriendo el workbook una sola vez.
+
+    Se ejecuta dentro de los procesos del pool, por eso abre el workbook por
+    su cuenta (los objetos de openpyxl no se pueden pasar entre procesos).
+    Solo parsea las hojas del grupo: el costo de carga se reparte entre los
+    procesos en lugar de repetirse en cada uno.
+
+    Args:
+        path_excel: Ruta al archivo Excel
+        hojas: Nombres de las hojas del grupo
+        max_row: Número máximo de filas a procesar por hoja
+
+    Returns:
+        Un ResultadoHoja por hoja, en el orden de `hojas`
+    """
+    wb = cargar_hojas(path_excel, hojas)
+    return [_procesar_hoja(wb[hoja], hoja, max_row) for hoja in hojas]
+
+
+def extraer_hojas(path_excel, hojas: Optional[List[str]] = None, max_row=300,
+                  max_workers: Optional[int] = None) -> List[ResultadoHoja]:
+    """Extrae varias hojas en un pool de procesos.
+
+    Args:
+        path_excel: Ruta al archivo Excel
+        hojas: Nombres de las hojas a procesar (default: todas)
+        max_row: Número máximo de filas a procesar por hoja
+        max_workers: Procesos del pool (default: uno por hoja, hasta la cantidad de CPUs)
+
+    Returns:
+        Un ResultadoHoja por hoja, en el orden de `hojas`
+
+    Raises:
+        ValueError: Si alguna hoja pedida no existe en el workbook
+    """
+    disponibles = hojas_del_libro(path_excel)
+    if hojas is None:
+        hojas = disponibles
+    faltantes = [h for h in hojas if h not in disponibles]
+    if faltantes:
+        raise ValueError(f"Hojas inexistentes en {path_excel}: {faltantes}. Disponibles: {disponibles}")
+
+    if max_workers is None:
+        max_workers = min(len(hojas), os.cpu_count() or 1)
+
+    # Con una sola hoja o un solo proceso no vale la pena levantar el pool
+    if len(hojas) <= 1 or max_workers <= 1:
+        return extraer_grupo_hojas(path_excel, hojas, max_row)
+
+    # Reparto round-robin: hoja k va al grupo k % max_workers
+    grupos = [hojas[k::max_workers] for k in range(max_workers)]
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futuros = [pool.submit(extraer_grupo_hojas, path_excel, grupo, max_row) for grupo in grupos]
+        por_hoja = {r.hoja: r for f in futuros for r in f.result()}
+    return [por_hoja[hoja] for hoja in hojas]
+
+
+def cargar_excel_multihoja(path_excel, hojas: Optional[List[str]] = None, max_row=300,
+                           max_workers: Optional[int] = None) -> DatosExcel:
+    """Carga hoteles de todas las hojas (o de `hojas`) de un workbook.
+
+    Args:
+        path_excel: Ruta al archivo Excel
+        hojas: Nombres de las hojas a procesar (default: todas)
+        max_row: Número máximo de filas a procesar por hoja
+        max_workers: Procesos del pool (default: uno por hoja, hasta la cantidad de CPUs)
+
+    Returns:
+        DatosExcel con los hoteles de las hojas que se pudieron extraer, en
+        orden de hoja (las hojas con error se informan y se omiten)
+    """
+    inicio = time.perf_counter()
+    resultados = extraer_hojas(path_excel, hojas, max_row, max_workers)
+
+    for r in resultados:
+        if r.error:
+            print(f"  Hoja '{r.hoja}': error en {r.segundos * 1000:.0f} ms: {r.error}")
+        else:
+            print(f"  Hoja '{r.hoja}': {len(r.hoteles)} hoteles en {r.segundos * 1000:.0f} ms")
+    errores = sum(r.error is not None for r in resultados)
+    print(f"Extraídas {len(resultados) - errores} de {len(resultados)} hojas de {path_excel} "
+          f"en {(time.perf_counter() - inicio) * 1000:.0f} ms")
+
+    return DatosExcel(hoteles=[hotel for r in resultados for hotel in r.hoteles])
@@ -3,6 +3,7 @@ from datetime import date
 import re
 from typing import Optional
 from Models.hotelExcel import Periodo, HotelExcel, PeriodoGroup
+from Models.periodo import generar_id_periodo, siguiente_id_libre
 from openpyxl.utils import range_boundaries
 
 
@@ -236,9 +237,20 @@ def agregar_nombre_group(hotel: HotelExcel, nombre: str):
     
 
 
-def construir_periodo(fecha_inicio : date, fecha_fin : date , nombre: Optional[str] = None) -> Periodo:
-    periodo = Periodo.crear(fecha_inicio, fecha_fin, nombre)
-    return periodo
+def construir_periodo(fecha_inicio : date, fecha_fin : date , nombre: Optional[str] = None,
+                      hotel: Optional[HotelExcel] = None, nombre_grupo: Optional[str] = None) -> Periodo:
+    """
+    Construye un Periodo. Si se indica el hotel, el id se deriva de
+    (hotel, grupo, fechas, nombre) y es único dentro del hotel; sin hotel se
+    usa el contador autoincremental de Periodo.
+    """
+    if hotel is None:
+        return Periodo.crear(fecha_inicio, fecha_fin, nombre)
+
+    ids_usados = {p.id for grupo in hotel.periodos_group for p in grupo.periodos}
+    id_periodo = generar_id_periodo(hotel.nombre, nombre_grupo, fecha_inicio, fecha_fin, nombre)
+    id_periodo = siguiente_id_libre(id_periodo, ids_usados)
+    return Periodo.crear(fecha_inicio, fecha_fin, nombre, id=id_periodo)
 
 def agregar_periodos_a_habitaciones(hotel : HotelExcel):
     if not hotel.tipos :
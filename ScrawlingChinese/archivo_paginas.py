@@ -0,0 +1,255 @@
+"""Archivo comprimido de páginas obtenidas, para grabar y reproducir scrapings.
+
+Los pickles de la raíz solo guardan el HotelWeb final: no hay forma de volver
+a extraer o comparar sin pedirle la página otra vez a SynXis. ArchivoPaginas
+guarda cada página obtenida (HTML crudo, markdown limpio, parámetros de la
+búsqueda, tiempo de carga) y permite servir crawler.arun desde el archivo:
+
+- Contenido direccionado por hash: el HTML y el markdown se guardan
+  comprimidos (gzip) en objetos/<sha[:2]>/<sha>.gz; una página idéntica a
+  otra ya archivada no ocupa lugar de nuevo.
+- indice.jsonl: un registro por página obtenida (se agrega al grabar). La
+  clave de búsqueda es la URL con los parámetros ordenados; al reproducir se
+  usa el último registro de esa URL.
+- CrawlerGrabador envuelve un AsyncWebCrawler y archiva cada resultado
+  exitoso; CrawlerReproductor responde arun desde el archivo sin navegador
+  ni red.
+
+Variables de entorno:
+    ARCHIVO_PAGINAS=grabar        archiva cada página obtenida
+    ARCHIVO_PAGINAS=reproducir    sirve las páginas desde el archivo (sin red)
+    ARCHIVO_PAGINAS_DIR           directorio del archivo (default: .cache/archivo_paginas)
+
+Ejemplo de uso:
+    archivo = ArchivoPaginas()
+    async with CrawlerReproductor(archivo) as crawler:
+        result = await crawler.arun(url=url, config=config)
+"""
+
+import asyncio
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, asdict, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+DIRECTORIO_ARCHIVO = Path(__file__).parent.parent / ".cache" / "archivo_paginas"
+
+
+def modo_archivo() -> str:
+    """"grabar", "reproducir" o "" (ARCHIVO_PAGINAS)."""
+    modo = os.getenv("ARCHIVO_PAGINAS", "").strip().lower()
+    return modo if modo in ("grabar", "reproducir") else ""
+
+
+def ruta_objeto(directorio: Path, sha: str) -> Path:
+    """Ruta del objeto comprimido `sha` dentro del archivo en `directorio`."""
+    return Path(directorio) / "objetos" / sha[:2] / f"{sha}.gz"
+
+
+def leer_objeto(directorio: Path, sha: str) -> str:
+    """Contenido descomprimido de un objeto, sin cargar el índice (para otros procesos)."""
+    return gzip.decompress(ruta_objeto(directorio, sha).read_bytes()).decode("utf-8")
+
+
+def clave_solicitud(url: str) -> str:
+    """URL con los parámetros de la query ordenados (mismo pedido = misma clave)."""
+    partes = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(partes.query, keep_blank_values=True)))
+    return f"{partes.scheme}://{partes.netloc}{partes.path}?{query}"
+
+
+@dataclass
+class RegistroPagina:
+    """Una página obtenida: de dónde salió y qué objetos tiene su contenido."""
+    clave: str
+    url: str
+    params: Dict[str, str]
+    html: str  # sha256 del HTML
+    markdown: str  # sha256 del markdown
+    segundos_fetch: float
+    status_code: Optional[int] = None
+    momento: str = field(default_factory=lambda: datetime.now().isoformat(timespec="seconds"))
+
+
+class ArchivoPaginas:
+    """Archivo de páginas direccionado por contenido. Thread-safe."""
+
+    def __init__(self, directorio: Optional[Path] = None, nivel_compresion: int = 6):
+        """Abre (o crea al grabar) el archivo.
+
+        Args:
+            directorio: Directorio del archivo (default: ARCHIVO_PAGINAS_DIR o .cache/archivo_paginas)
+            nivel_compresion: Nivel de gzip (1 rápido ... 9 más chico)
+        """
+        self.directorio = Path(directorio or os.getenv("ARCHIVO_PAGINAS_DIR") or DIRECTORIO_ARCHIVO)
+        self.nivel_compresion = nivel_compresion
+        self._lock = threading.Lock()
+        self._por_clave: Dict[str, RegistroPagina] = {}
+        self.bytes_originales = 0
+        self.bytes_comprimidos = 0
+        self.objetos_reusados = 0
+        self._cargar_indice()
+
+    @property
+    def ruta_indice(self) -> Path:
+        return self.directorio / "indice.jsonl"
+
+    def _cargar_indice(self) -> None:
+        if not self.ruta_indice.exists():
+            return
+        with open(self.ruta_indice, encoding="utf-8") as f:
+            for numero, linea in enumerate(f, start=1):
+                try:
+                    registro = RegistroPagina(**json.loads(linea))
+                except (ValueError, TypeError) as e:
+                    print(f"[WARNING] Línea {numero} de {self.ruta_indice} ilegible, se ignora: {e}")
+                    continue
+                self._por_clave[registro.clave] = registro
+
+    def _guardar_objeto(self, contenido: str) -> str:
+        datos = contenido.encode("utf-8")
+        sha = hashlib.sha256(datos).hexdigest()
+        ruta = ruta_objeto(self.directorio, sha)
+        if ruta.exists():
+            self.objetos_reusados += 1
+            return sha
+        comprimido = gzip.compress(datos, compresslevel=self.nivel_compresion, mtime=0)
+        ruta.parent.mkdir(parents=True, exist_ok=True)
+        temporal = ruta.with_suffix(f".{threading.get_ident()}.tmp")
+        temporal.write_bytes(comprimido)
+        os.replace(temporal, ruta)
+        self.bytes_originales += len(datos)
+        self.bytes_comprimidos += len(comprimido)
+        return sha
+
+    def leer_objeto(self, sha: str) -> str:
+        """Contenido descomprimido de un objeto."""
+        return leer_objeto(self.directorio, sha)
+
+    def grabar(self, url: str, html: str, markdown: str, segundos_fetch: float,
+               params: Optional[dict] = None, status_code: Optional[int] = None) -> RegistroPagina:
+        """Archiva una página obtenida y devuelve su registro."""
+        if params is None:
+            params = dict(parse_qsl(urlsplit(url).query, keep_blank_values=True))
+        with self._lock:
+            registro = RegistroPagina(
+                clave=clave_solicitud(url), url=url, params={k: str(v) for k, v in params.items()},
+                html=self._guardar_objeto(html), markdown=self._guardar_objeto(markdown),
+                segundos_fetch=round(segundos_fetch, 3), status_code=status_code,
+            )
+            with open(self.ruta_indice, "a", encoding="utf-8") as f:
+                f.write(json.dumps(asdict(registro), ensure_ascii=False) + "\n")
+            self._por_clave[registro.clave] = registro
+        return registro
+
+    def buscar(self, url: str) -> Optional[RegistroPagina]:
+        """Último registro archivado para esta URL (sin importar el orden de los parámetros)."""
+        return self._por_clave.get(clave_solicitud(url))
+
+    def registros(self) -> Iterator[RegistroPagina]:
+        """Último registro de cada solicitud archivada."""
+        return iter(list(self._por_clave.values()))
+
+    def __len__(self) -> int:
+        return len(self._por_clave)
+
+    def resumen(self) -> str:
+        """Resumen legible de lo grabado por esta instancia."""
+        ratio = self.bytes_originales / self.bytes_comprimidos if self.bytes_comprimidos else 0.0
+        return (f"Archivo de páginas {self.directorio}: {len(self)} solicitudes, "
+                f"{self.bytes_originales / 1e6:.1f} MB -> {self.bytes_comprimidos / 1e6:.2f} MB "
+                f"(x{ratio:.1f}), {self.objetos_reusados} objetos ya archivados")
+
+
+def texto_markdown(result) -> str:
+    """Markdown crudo de un CrawlResult (str o MarkdownGenerationResult)."""
+    markdown = result.markdown or result.markdown_v2
+    if markdown is None:
+        return ""
+    return getattr(markdown, "raw_markdown", markdown) or ""
+
+
+class CrawlerGrabador:
+    """Envuelve un AsyncWebCrawler y archiva cada resultado exitoso de arun."""
+
+    def __init__(self, crawler, archivo: ArchivoPaginas):
+        self.crawler = crawler
+        self.archivo = archivo
+
+    async def __aenter__(self):
+        await self.crawler.__aenter__()
+        return self
+
+    async def __aexit__(self, *exc):
+        print(self.archivo.resumen())
+        return await self.crawler.__aexit__(*exc)
+
+    async def arun(self, url: str, config=None, **kwargs):
+        inicio = time.perf_counter()
+        result = await self.crawler.arun(url=url, config=config, **kwargs)
+        segundos = time.perf_counter() - inicio
+        if result.success:
+            self.archivo.grabar(url, result.html or "", texto_markdown(result), segundos,
+                                status_code=result.status_code)
+        return result
+
+
+class CrawlerReproductor:
+    """Responde crawler.arun desde el archivo, sin navegador ni red.
+
+    Devuelve CrawlResult con el HTML y el markdown archivados; una URL que no
+    está en el archivo da un resultado con success=False. Con una extracción
+    en el config, la corre sobre el markdown archivado como lo haría arun.
+    """
+
+    def __init__(self, archivo: ArchivoPaginas, simular_demora: bool = False):
+        """Inicializa el reproductor.
+
+        Args:
+            archivo: Archivo de donde salen las páginas
+            simular_demora: Esperar el tiempo de carga grabado (para benchmarks)
+        """
+        self.archivo = archivo
+        self.simular_demora = simular_demora
+        self.aciertos = 0
+        self.faltantes = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        print(f"Reproducción: {self.aciertos} páginas desde el archivo, {self.faltantes} faltantes")
+        return False
+
+    async def arun(self, url: str, config=None, **kwargs):
+        from crawl4ai.models import CrawlResult
+
+        registro = self.archivo.buscar(url)
+        if registro is None:
+            self.faltantes += 1
+            return CrawlResult(url=url, html="", success=False,
+                               error_message=f"La página no está en el archivo: {url}")
+
+        self.aciertos += 1
+        if self.simular_demora:
+            await asyncio.sleep(registro.segundos_fetch)
+        html = self.archivo.leer_objeto(registro.html)
+        markdown = self.archivo.leer_objeto(registro.markdown)
+
+        extracted_content = None
+        estrategia = getattr(config, "extraction_strategy", None)
+        if estrategia is not None:
+            from crawl4ai import RegexChunking
+            bloques = await asyncio.to_thread(estrategia.run, url, RegexChunking().chunk(markdown))
+            extracted_content = json.dumps(bloques, ensure_ascii=False)
+
+        return CrawlResult(url=url, html=html, success=True, markdown=markdown,
+                           extracted_content=extracted_content, status_code=registro.status_code,
+                           session_id=getattr(config, "session_id", None))
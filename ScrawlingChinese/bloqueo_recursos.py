@@ -0,0 +1,241 @@
+"""Bloqueo de recursos no esenciales en las páginas del crawler.
+
+El navegador descargaba todo lo que pide la página de SynXis (imágenes de
+las habitaciones, fuentes, tag manager, analytics, píxeles de publicidad)
+antes de que networkidle diera la página por cargada, aunque la extracción
+solo usa el texto de las tarjetas. BloqueadorRecursos intercepta las
+solicitudes de cada contexto del navegador (hook on_page_context_created de
+crawl4ai + context.route de Playwright) y aborta las que la política marca:
+
+1. Dominio en la lista de bloqueados (trackers y publicidad por defecto).
+2. Con lista de permitidos: dominio fuera de ella (salvo documentos).
+3. Tipo de recurso bloqueado (image, media, font por defecto).
+
+Además mide cada página: solicitudes, bloqueadas por motivo, bytes
+transferidos y tiempo de carga (goto), para que el ahorro se vea en el
+resumen de la corrida.
+
+Variables de entorno:
+    BLOQUEO_RECURSOS=0               no bloquea nada (solo mide las cargas)
+    RECURSOS_TIPOS_BLOQUEADOS        tipos de Playwright separados por coma
+                                     (default: image,media,font)
+    RECURSOS_DOMINIOS_BLOQUEADOS     dominios a bloquear, además de los trackers conocidos
+    RECURSOS_DOMINIOS_PERMITIDOS     si se indica, solo se cargan estos dominios (y subdominios)
+
+Ejemplo de uso:
+    bloqueador = bloqueador_desde_entorno()
+    async with crear_crawler(bloqueador) as crawler:
+        ...
+    print(bloqueador.resumen())
+"""
+
+import functools
+import os
+import time
+import weakref
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Set
+from urllib.parse import urlsplit
+
+TIPOS_BLOQUEADOS_DEFAULT = {"image", "media", "font"}
+
+# Analytics, tag managers, publicidad y grabación de sesiones que carga el motor de reservas
+DOMINIOS_TRACKERS = [
+    "googletagmanager.com", "google-analytics.com", "analytics.google.com", "doubleclick.net",
+    "googleadservices.com", "googlesyndication.com", "facebook.net", "facebook.com", "connect.facebook.net",
+    "hotjar.com", "hotjar.io", "clarity.ms", "bing.com", "bat.bing.com", "criteo.com", "criteo.net",
+    "adnxs.com", "quantserve.com", "scorecardresearch.com", "tiktok.com", "snapchat.com",
+    "linkedin.com", "licdn.com", "twitter.com", "ads-twitter.com", "newrelic.com", "nr-data.net",
+    "optimizely.com", "onetrust.com", "cookielaw.org", "trustarc.com",
+]
+
+
+def _lista_entorno(variable: str) -> List[str]:
+    return [v.strip().lower() for v in os.getenv(variable, "").split(",") if v.strip()]
+
+
+def dominio_en(host: str, dominios: List[str]) -> bool:
+    """True si `host` es alguno de `dominios` o un subdominio suyo."""
+    host = host.lower()
+    return any(host == d or host.endswith("." + d) for d in dominios)
+
+
+@dataclass
+class PoliticaRecursos:
+    """Qué solicitudes del navegador se abortan."""
+    tipos_bloqueados: Set[str] = field(default_factory=lambda: set(TIPOS_BLOQUEADOS_DEFAULT))
+    dominios_bloqueados: List[str] = field(default_factory=lambda: list(DOMINIOS_TRACKERS))
+    dominios_permitidos: List[str] = field(default_factory=list)  # vacía: todos menos los bloqueados
+
+    def motivo_bloqueo(self, url: str, tipo: str) -> Optional[str]:
+        """Motivo por el que se bloquea la solicitud ("dominio", "fuera de permitidos", "tipo"), o None."""
+        host = urlsplit(url).hostname or ""
+        if host and dominio_en(host, self.dominios_bloqueados):
+            return "dominio"
+        if self.dominios_permitidos and host and tipo != "document" \
+                and not dominio_en(host, self.dominios_permitidos):
+            return "fuera de permitidos"
+        if tipo in self.tipos_bloqueados:
+            return "tipo"
+        return None
+
+
+def politica_desde_entorno() -> Optional[PoliticaRecursos]:
+    """Política según las variables RECURSOS_*; None con BLOQUEO_RECURSOS=0."""
+    if os.getenv("BLOQUEO_RECURSOS", "1") == "0":
+        return None
+    tipos = _lista_entorno("RECURSOS_TIPOS_BLOQUEADOS")
+    return PoliticaRecursos(
+        tipos_bloqueados=set(tipos) if tipos else set(TIPOS_BLOQUEADOS_DEFAULT),
+        dominios_bloqueados=DOMINIOS_TRACKERS + _lista_entorno("RECURSOS_DOMINIOS_BLOQUEADOS"),
+        dominios_permitidos=_lista_entorno("RECURSOS_DOMINIOS_PERMITIDOS"),
+    )
+
+
+@dataclass
+class MetricasCarga:
+    """Lo que pidió y descargó el navegador para una página."""
+    url: str
+    solicitudes: int = 0
+    bloqueadas: Counter = field(default_factory=Counter)  # por motivo
+    tipos_bloqueados: Counter = field(default_factory=Counter)
+    bytes: int = 0
+    segundos_carga: float = 0.0
+    _inicio: float = field(default_factory=time.perf_counter, repr=False)
+
+    @property
+    def total_bloqueadas(self) -> int:
+        return sum(self.bloqueadas.values())
+
+
+def encadenar_hook(estrategia, tipo: str, hook: Callable) -> None:
+    """Agrega `hook` a la estrategia de crawl4ai sin pisar el que ya estaba.
+
+    crawl4ai admite un solo hook por tipo: el nuevo llama primero al anterior.
+    Los hooks reciben (page, context=..., **kwargs).
+    """
+    anterior = estrategia.hooks.get(tipo)
+
+    async def encadenado(page, *args, **kwargs):
+        if anterior is not None:
+            resultado = anterior(page, *args, **kwargs)
+            if hasattr(resultado, "__await__"):
+                await resultado
+        await hook(page, *args, **kwargs)
+        return page
+
+    estrategia.set_hook(tipo, encadenado)
+
+
+class BloqueadorRecursos:
+    """Aplica una PoliticaRecursos a los contextos del navegador y mide cada carga."""
+
+    def __init__(self, politica: Optional[PoliticaRecursos] = None):
+        """Inicializa el bloqueador.
+
+        Args:
+            politica: Qué bloquear; None solo mide las cargas
+        """
+        self.politica = politica
+        self.paginas: List[MetricasCarga] = []
+        self._contextos = weakref.WeakSet()
+        self._paginas_escuchadas = weakref.WeakSet()
+        self._actual: Dict[int, MetricasCarga] = {}  # id(page) -> página que está cargando
+
+    def instalar(self, crawler) -> "BloqueadorRecursos":
+        """Registra los hooks en el AsyncWebCrawler (antes de usarlo)."""
+        estrategia = crawler.crawler_strategy
+        encadenar_hook(estrategia, "on_page_context_created", self._al_crear_contexto)
+        encadenar_hook(estrategia, "before_goto", self._antes_de_goto)
+        encadenar_hook(estrategia, "after_goto", self._despues_de_goto)
+        return self
+
+    # -- hooks de crawl4ai -------------------------------------------------
+
+    async def _al_crear_contexto(self, page, context=None, **kwargs):
+        # Con sesiones, crawl4ai reusa la página y el contexto en cada arun:
+        # la ruta y los listeners se registran una sola vez
+        if self.politica is not None and context is not None and context not in self._contextos:
+            self._contextos.add(context)
+            await context.route("**/*", self._enrutar)
+        if page not in self._paginas_escuchadas:
+            self._paginas_escuchadas.add(page)
+            page.on("requestfinished", functools.partial(self._terminada, page))
+
+    async def _antes_de_goto(self, page, url=None, **kwargs):
+        metricas = MetricasCarga(url=url or "")
+        self._actual[id(page)] = metricas
+        self.paginas.append(metricas)
+
+    async def _despues_de_goto(self, page, **kwargs):
+        metricas = self._actual.get(id(page))
+        if metricas is not None:
+            metricas.segundos_carga = time.perf_counter() - metricas._inicio
+
+    # -- eventos de Playwright ---------------------------------------------
+
+    def _metricas_de(self, frame_o_pagina) -> Optional[MetricasCarga]:
+        pagina = getattr(frame_o_pagina, "page", frame_o_pagina)
+        return self._actual.get(id(pagina))
+
+    async def _enrutar(self, route, request=None):
+        request = request or route.request
+        motivo = self.politica.motivo_bloqueo(request.url, request.resource_type)
+        try:
+            metricas = self._metricas_de(request.frame)
+        except Exception:  # solicitudes de service workers no tienen frame
+            metricas = None
+        if metricas is not None:
+            metricas.solicitudes += 1
+            if motivo:
+                metricas.bloqueadas[motivo] += 1
+                metricas.tipos_bloqueados[request.resource_type] += 1
+        if motivo:
+            await route.abort("blockedbyclient")
+        else:
+            await route.continue_()
+
+    async def _terminada(self, page, request):
+        metricas = self._actual.get(id(page))
+        if metricas is None:
+            return
+        if self.politica is None:
+            metricas.solicitudes += 1
+        try:
+            tamaños = await request.sizes()
+            metricas.bytes += tamaños.get("responseBodySize", 0) + tamaños.get("responseHeadersSize", 0)
+        except Exception:
+            pass
+
+    # -- resumen -----------------------------------------------------------
+
+    def metricas(self) -> dict:
+        """Totales y promedios por página de las cargas medidas."""
+        n = len(self.paginas)
+        bloqueadas, tipos = Counter(), Counter()
+        for p in self.paginas:
+            bloqueadas.update(p.bloqueadas)
+            tipos.update(p.tipos_bloqueados)
+        return {
+            "paginas": n,
+            "solicitudes": sum(p.solicitudes for p in self.paginas),
+            "bloqueadas": dict(bloqueadas),
+            "tipos_bloqueados": dict(tipos),
+            "bytes_por_pagina": sum(p.bytes for p in self.paginas) / n if n else 0.0,
+            "segundos_carga_promedio": sum(p.segundos_carga for p in self.paginas) / n if n else 0.0,
+            "segundos_carga_max": max((p.segundos_carga for p in self.paginas), default=0.0),
+        }
+
+    def resumen(self) -> str:
+        m = self.metricas()
+        politica = "sin bloqueo" if self.politica is None else f"{sum(m['bloqueadas'].values())} bloqueadas"
+        return (f"Carga de páginas: {m['paginas']} páginas, {m['solicitudes']} solicitudes ({politica}), "
+                f"{m['bytes_por_pagina'] / 1e6:.2f} MB/página, carga promedio "
+                f"{m['segundos_carga_promedio']:.2f}s (máx {m['segundos_carga_max']:.2f}s); "
+                f"bloqueadas por tipo: {m['tipos_bloqueados']}")
+
+
+def bloqueador_desde_entorno() -> BloqueadorRecursos:
+    """Bloqueador con la política de politica_desde_entorno (con BLOQUEO_RECURSOS=0 solo mide)."""
+    return BloqueadorRecursos(politica_desde_entorno())
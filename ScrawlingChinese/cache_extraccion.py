@@ -0,0 +1,165 @@
+"""Caché en disco de extracciones LLM por contenido de la página.
+
+El mismo markdown (tarifas iguales para rangos de fechas vecinos, reintentos
+de una misma búsqueda) se mandaba al LLM cada vez. CacheExtraccion guarda las
+habitaciones ya validadas bajo una clave que combina el hash del markdown
+limpio con la versión de la extracción (hash de la instrucción y del schema):
+si el contenido y el prompt no cambiaron, se devuelven las HabitacionWeb
+guardadas sin llamar al LLM.
+
+- Un archivo JSON por entrada en .cache/extraccion_llm (escritura atómica).
+- Desalojo LRU: al superar max_entradas se borran las de acceso más antiguo
+  (cada acierto actualiza la fecha de modificación del archivo).
+- Cambiar la instrucción o el schema cambia la versión e invalida todo.
+
+Variables de entorno:
+    CACHE_EXTRACCION=0            desactiva la caché
+    CACHE_EXTRACCION_MAX=2000     entradas máximas en disco
+
+Ejemplo de uso:
+    cache = CacheExtraccion(version_extraccion(instruccion, schema))
+    habitaciones = cache.obtener(markdown)
+    if habitaciones is None:
+        habitaciones = ...  # llamada al LLM
+        cache.guardar(markdown, habitaciones)
+    print(cache.resumen())
+"""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from Models.hotelWeb import HabitacionWeb, ADAPTADOR_HABITACIONES_WEB
+
+DIRECTORIO_CACHE = Path(__file__).parent.parent / ".cache" / "extraccion_llm"
+
+
+def version_extraccion(instruccion: Optional[str], schema: Optional[dict]) -> str:
+    """Hash corto de la instrucción y el schema que definen la extracción."""
+    h = hashlib.sha256()
+    h.update((instruccion or "").encode("utf-8"))
+    h.update(b"\0")
+    h.update(json.dumps(schema or {}, sort_keys=True).encode("utf-8"))
+    return h.hexdigest()[:16]
+
+
+def clave_contenido(markdown: str, version: str) -> str:
+    """Clave de caché: hash del markdown y de la versión de la extracción."""
+    h = hashlib.sha256()
+    h.update(version.encode("utf-8"))
+    h.update(b"\0")
+    h.update(markdown.encode("utf-8"))
+    return h.hexdigest()
+
+
+def cache_habilitada() -> bool:
+    """True salvo que CACHE_EXTRACCION=0."""
+    return os.getenv("CACHE_EXTRACCION", "1") != "0"
+
+
+class CacheExtraccion:
+    """Caché LRU en disco de List[HabitacionWeb] por contenido de página.
+
+    Es segura para usar desde los hilos de los extractores del pipeline.
+    Las estadísticas (aciertos, fallos) son de esta instancia: crear una por
+    corrida para reportar la tasa de aciertos de esa corrida.
+    """
+
+    def __init__(self, version: str, directorio: Optional[Path] = None,
+                 max_entradas: Optional[int] = None):
+        """Inicializa la caché.
+
+        Args:
+            version: Versión de la extracción (version_extraccion())
+            directorio: Directorio de la caché (default: .cache/extraccion_llm en la raíz)
+            max_entradas: Entradas máximas en disco (default: CACHE_EXTRACCION_MAX o 2000)
+        """
+        self.version = version
+        self.directorio = Path(directorio) if directorio else DIRECTORIO_CACHE
+        self.max_entradas = max_entradas or int(os.getenv("CACHE_EXTRACCION_MAX", "2000"))
+        self.aciertos = 0
+        self.fallos = 0
+        self.desalojadas = 0
+        self._lock = threading.Lock()
+        self._entradas = len(list(self.directorio.glob("*.json"))) if self.directorio.exists() else 0
+
+    def _ruta(self, markdown: str) -> Path:
+        return self.directorio / f"{clave_contenido(markdown, self.version)}.json"
+
+    def obtener(self, markdown: str) -> Optional[List[HabitacionWeb]]:
+        """Habitaciones guardadas para este markdown, o None si no hay entrada."""
+        ruta = self._ruta(markdown)
+        try:
+            contenido = ruta.read_bytes()
+            habitaciones = ADAPTADOR_HABITACIONES_WEB.validate_json(contenido)
+            os.utime(ruta)  # marca de acceso para el desalojo LRU
+        except FileNotFoundError:
+            with self._lock:
+                self.fallos += 1
+            return None
+        except Exception as e:
+            print(f"[WARNING] Entrada de caché ilegible en {ruta}, se ignora: {e}")
+            with self._lock:
+                self.fallos += 1
+            return None
+
+        with self._lock:
+            self.aciertos += 1
+        return habitaciones
+
+    def guardar(self, markdown: str, habitaciones: List[HabitacionWeb]) -> None:
+        """Guarda las habitaciones extraídas de este markdown (escritura atómica)."""
+        ruta = self._ruta(markdown)
+        try:
+            self.directorio.mkdir(parents=True, exist_ok=True)
+            nueva = not ruta.exists()
+            temporal = ruta.with_suffix(f".{threading.get_ident()}.tmp")
+            temporal.write_bytes(ADAPTADOR_HABITACIONES_WEB.dump_json(habitaciones))
+            os.replace(temporal, ruta)
+        except OSError as e:
+            print(f"[WARNING] No se pudo guardar la extracción en {ruta}: {e}")
+            return
+
+        with self._lock:
+            if nueva:
+                self._entradas += 1
+            if self._entradas > self.max_entradas:
+                self._desalojar()
+
+    def _desalojar(self) -> None:
+        """Borra las entradas de acceso más antiguo hasta quedar en el 90% del máximo."""
+        archivos = sorted(self.directorio.glob("*.json"), key=lambda p: p.stat().st_mtime)
+        objetivo = int(self.max_entradas * 0.9)
+        sobrantes = archivos[:max(len(archivos) - objetivo, 0)]
+        for archivo in sobrantes:
+            try:
+                archivo.unlink()
+                self.desalojadas += 1
+            except OSError:
+                pass
+        self._entradas = len(archivos) - len(sobrantes)
+
+    @property
+    def tasa_aciertos(self) -> float:
+        total = self.aciertos + self.fallos
+        return self.aciertos / total if total else 0.0
+
+    def estadisticas(self) -> Dict[str, float]:
+        """Estadísticas de esta instancia (cada acierto es una llamada LLM ahorrada)."""
+        return {
+            "aciertos": self.aciertos,
+            "fallos": self.fallos,
+            "tasa_aciertos": round(self.tasa_aciertos, 4),
+            "llamadas_llm_ahorradas": self.aciertos,
+            "desalojadas": self.desalojadas,
+            "entradas": self._entradas,
+        }
+
+    def resumen(self) -> str:
+        """Resumen legible para el final de una corrida."""
+        return (f"Caché de extracción: {self.aciertos} aciertos / {self.aciertos + self.fallos} consultas "
+                f"({100 * self.tasa_aciertos:.1f}%), {self.aciertos} llamadas LLM ahorradas, "
+                f"{self._entradas} entradas en disco")
@@ -1,6 +1,8 @@
 # config.py
+import os
 
-BASE_URL = "https://be.synxis.com/"
+# SYNXIS_BASE_URL permite apuntar el crawler al servidor local (servidor_local.py)
+BASE_URL = os.getenv("SYNXIS_BASE_URL", "https://be.synxis.com/")
 # CSS_SELECTOR = "div.app_col-sm-12.app_col-md-8.app_col-lg-8"
 CSS_SELECTOR= ".thumb-cards_products .app_col-sm-12.app_col-md-8.app_col-lg-8"
 # thumb-cards_products 
@@ -1,26 +1,28 @@
 import asyncio
-from crawl4ai import AsyncWebCrawler
+import os
 from dotenv import load_dotenv
 from .config import BASE_URL, CSS_SELECTOR
 from Models.hotelExcel import *
 from Models.hotelWeb import HotelWeb
 
+from .espera_pagina import MedidorEspera
+from .perfiles_crawler import perfil_activo
+from .pipeline import PipelineScraping, ResultadoPipeline
+from .telemetria_llm import TelemetriaLLM, telemetria_corrida
 from .utils.scraper_utils import (
-    fetch_and_process_page,
-    get_browser_config,
+    crear_cache_extraccion,
+    crear_crawler,
+    extraer_hotel_web,
     get_llm_strategy,
+    obtener_pagina,
 )
 
 load_dotenv()
 
 
-async def crawl_alvear(fecha_ingreso,fecha_egreso,adultos,niños) -> Optional[HotelWeb] :
-    browser_config = get_browser_config()
-    llm_strategy = get_llm_strategy()
-    session_id = "venue_crawl_session"
-
-    # Initialize state variables
-    params_busqueda = {
+def construir_params_busqueda(fecha_ingreso, fecha_egreso, adultos, niños) -> dict:
+    """Query string de SynXis para una búsqueda (fechas en formato YYYY-MM-DD)."""
+    return {
         "adult": adultos,
         "child": niños,
         "arrive": fecha_ingreso,
@@ -35,22 +37,79 @@ async def crawl_alvear(fecha_ingreso,fecha_egreso,adultos,niños) -> Optional[Ho
         "src": 30,
     }
 
-    # Start the web crawler context
-    # https://docs.crawl4ai.com/api/async-webcrawler/#asyncwebcrawler
-    async with AsyncWebCrawler(config=browser_config) as crawler:
-    
-        # Fetch and process data from the current page
-        hotel = await fetch_and_process_page(
-            crawler,
-            BASE_URL,
-            params_busqueda,
-            CSS_SELECTOR,
-            llm_strategy,
-            session_id,
-        )
-        #llm_strategy.show_usage()
-    return hotel
 
+async def crawl_alvear(fecha_ingreso,fecha_egreso,adultos,niños) -> Optional[HotelWeb] :
+    """Scrapea una búsqueda (fechas YYYY-MM-DD).
+
+    Carga la página y extrae por separado (ver crawl_alvear_lote), de modo que
+    un markdown ya extraído se resuelve desde la caché de extracción sin LLM.
+
+    Raises:
+        Exception: Si fallan todos los intentos
+    """
+    resultado, = await crawl_alvear_lote([(fecha_ingreso, fecha_egreso, adultos, niños)],
+                                         navegadores=1, extractores=1)
+    if resultado.hotel is None:
+        raise Exception(f"Fallaron todos los intentos de extracción: {resultado.error}")
+    return resultado.hotel
+
+
+async def crawl_alvear_lote(solicitudes, navegadores=None, extractores=None,
+                            capacidad_cola=None) -> List[ResultadoPipeline]:
+    """Scrapea varias búsquedas con el pipeline de obtención y extracción.
+
+    Los navegadores solo cargan páginas y las dejan en una cola acotada; los
+    extractores llaman al LLM en paralelo, sin tener un navegador ocupado.
+
+    Args:
+        solicitudes: Lista de (fecha_ingreso, fecha_egreso, adultos, niños), fechas YYYY-MM-DD
+        navegadores: Páginas cargando a la vez (default: SCRAPING_NAVEGADORES o 1)
+        extractores: Extracciones LLM a la vez (default: SCRAPING_EXTRACTORES o 2)
+        capacidad_cola: Páginas esperando extracción (default: SCRAPING_COLA_PAGINAS o 4)
+
+    El navegador, los timeouts, la espera y la caché salen del perfil
+    PERFIL_CRAWLER (ver perfiles_crawler.py).
+
+    Returns:
+        Lista de ResultadoPipeline en el orden de `solicitudes`
+    """
+    navegadores = navegadores or int(os.getenv("SCRAPING_NAVEGADORES", "1"))
+    extractores = extractores or int(os.getenv("SCRAPING_EXTRACTORES", "2"))
+    capacidad_cola = capacidad_cola or int(os.getenv("SCRAPING_COLA_PAGINAS", "4"))
+
+    llm_strategy = get_llm_strategy()
+    cache = crear_cache_extraccion(llm_strategy)
+    params_lote = [construir_params_busqueda(*s) for s in solicitudes]
+
+    perfil = perfil_activo()
+    print(f"Perfil del crawler: {perfil.nombre}")
+    bloqueador = perfil.bloqueador()
+    medidor_espera = MedidorEspera(perfil.estrategia_espera().nombre)
+    async with crear_crawler(bloqueador, medidor_espera, perfil=perfil) as crawler:
+        async def obtener(params, id_navegador):
+            # Una sesión (pestaña) por navegador del pipeline
+            return await obtener_pagina(crawler, BASE_URL, params, CSS_SELECTOR,
+                                        f"venue_crawl_session_{id_navegador}", perfil=perfil)
 
+        def extraer(pagina):
+            with TelemetriaLLM.intento(pagina.intento):
+                return extraer_hotel_web(llm_strategy, pagina.url, pagina.markdown, cache)
 
+        pipeline = PipelineScraping(obtener, extraer, navegadores=navegadores,
+                                    extractores=extractores, capacidad_cola=capacidad_cola)
+        resultados = await pipeline.ejecutar(params_lote)
 
+    print(pipeline.resumen())
+    if bloqueador.paginas:
+        print(bloqueador.resumen())
+    if medidor_espera.paginas:
+        print(medidor_espera.resumen())
+    if cache is not None:
+        print(cache.resumen())
+    print(llm_strategy.despachador.resumen())
+    telemetria = telemetria_corrida()
+    print(telemetria.resumen())
+    ruta = telemetria.exportar()
+    if ruta:
+        print(f"Métricas LLM en {ruta}")
+    return resultados
@@ -0,0 +1,300 @@
+"""Despachador de llamadas LLM con límite de concurrencia y failover.
+
+Todas las extracciones iban a un único proveedor y key, sin límite de
+llamadas simultáneas: con varios extractores en paralelo el proveedor
+responde 429 (rate limit) y la página se pierde. DespachadorLLM reparte las
+llamadas entre una lista ordenada de proveedores (modelo + key):
+
+- Cada proveedor tiene un cupo de llamadas simultáneas (max_concurrencia);
+  las llamadas que no encuentran cupo esperan en cola.
+- Se usa el primer proveedor de la lista con cupo libre; si está lleno, la
+  llamada desborda al siguiente.
+- Un 429 enfría al proveedor (backoff exponencial con jitter, o Retry-After
+  si viene en la respuesta): mientras tanto las llamadas pasan a los
+  siguientes proveedores o esperan a que termine el enfriamiento.
+- Tras max_reintentos 429 seguidos, u otro error, la llamada deja de usar ese
+  proveedor y sigue con los demás; si no queda ninguno, ErrorDespachoLLM.
+
+Es bloqueante y thread-safe: lo usan los hilos de extracción.
+
+Variables de entorno:
+    LLM_PROVEEDORES     Proveedores en orden, separados por coma, cada uno
+                        modelo|VARIABLE_CON_LA_KEY|concurrencia|base_url
+                        (concurrencia y base_url opcionales). Ejemplo:
+                        groq/openai/gpt-oss-20b|GROQ_API_KEY|4,groq/openai/gpt-oss-20b|GROQ_API_KEY_2|4
+                        Default: groq/openai/gpt-oss-20b con GROQ_API_KEY
+    LLM_CONCURRENCIA=2  concurrencia de los proveedores que no la indican
+    LLM_MAX_REINTENTOS=3  429 tolerados por proveedor en cada llamada
+
+Ejemplo de uso:
+    despachador = DespachadorLLM(proveedores_desde_entorno())
+    despacho = despachador.completar(prompt)
+    contenido = despacho.respuesta.choices[0].message.content
+    print(despachador.resumen())
+"""
+
+import os
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Set
+
+PROVEEDOR_DEFAULT = "groq/openai/gpt-oss-20b"
+
+
+class ErrorDespachoLLM(Exception):
+    """Ningún proveedor pudo completar la llamada."""
+
+
+@dataclass
+class ProveedorLLM:
+    """Un modelo con su key y su cupo de llamadas simultáneas."""
+    modelo: str
+    api_key: Optional[str] = None
+    base_url: Optional[str] = None
+    max_concurrencia: int = 2
+    nombre: Optional[str] = None  # para métricas (default: modelo)
+
+    # Estado compartido entre llamadas (protegido por el lock del despachador)
+    en_curso: int = field(default=0, init=False)
+    enfriado_hasta: float = field(default=0.0, init=False)
+    llamadas: int = field(default=0, init=False)
+    limites_tasa: int = field(default=0, init=False)
+    errores: int = field(default=0, init=False)
+    max_en_curso: int = field(default=0, init=False)
+
+    def __post_init__(self):
+        self.nombre = self.nombre or self.modelo
+
+
+@dataclass
+class RespuestaDespacho:
+    """Respuesta del proveedor y cómo se obtuvo."""
+    respuesta: Any
+    proveedor: ProveedorLLM
+    reintentos: int
+    segundos_espera: float
+
+
+CompletarLLM = Callable[[ProveedorLLM, str], Any]
+
+
+def completar_litellm(proveedor: ProveedorLLM, prompt: str, **extra) -> Any:
+    """Llamada al proveedor con litellm, sin reintentos propios (los maneja el despachador)."""
+    from litellm import completion
+
+    argumentos = {"temperature": 0.01, **extra}
+    return completion(
+        model=proveedor.modelo,
+        messages=[{"role": "user", "content": prompt}],
+        api_key=proveedor.api_key,
+        base_url=proveedor.base_url,
+        num_retries=0,
+        max_retries=0,
+        **argumentos,
+    )
+
+
+def es_limite_tasa(error: Exception) -> bool:
+    """True si el error es un 429 del proveedor."""
+    return getattr(error, "status_code", None) == 429 or type(error).__name__ == "RateLimitError"
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    try:
+        return float(headers.get("retry-after")) if headers else None
+    except (TypeError, ValueError):
+        return None
+
+
+def proveedores_desde_entorno() -> List[ProveedorLLM]:
+    """Proveedores configurados en LLM_PROVEEDORES (o el default con GROQ_API_KEY)."""
+    concurrencia = int(os.getenv("LLM_CONCURRENCIA", "2"))
+    configuracion = os.getenv("LLM_PROVEEDORES", "").strip()
+    if not configuracion:
+        return [ProveedorLLM(PROVEEDOR_DEFAULT, os.getenv("GROQ_API_KEY"), max_concurrencia=concurrencia)]
+
+    proveedores = []
+    for entrada in (p.strip() for p in configuracion.split(",") if p.strip()):
+        campos = entrada.split("|")
+        variable_key = campos[1] if len(campos) > 1 and campos[1] else None
+        proveedores.append(ProveedorLLM(
+            modelo=campos[0],
+            api_key=os.getenv(variable_key) if variable_key else None,
+            max_concurrencia=int(campos[2]) if len(campos) > 2 and campos[2] else concurrencia,
+            base_url=campos[3] if len(campos) > 3 and campos[3] else None,
+            nombre=f"{campos[0]} ({variable_key or 'sin key'})" if variable_key else campos[0],
+        ))
+    return proveedores
+
+
+class DespachadorLLM:
+    """Reparte llamadas LLM entre proveedores con cupos, cola, backoff en 429 y failover."""
+
+    def __init__(self, proveedores: List[ProveedorLLM], completar: Optional[CompletarLLM] = None,
+                 max_reintentos: Optional[int] = None, espera_base: float = 1.0,
+                 espera_max: float = 30.0):
+        """Inicializa el despachador.
+
+        Args:
+            proveedores: Proveedores en orden de preferencia
+            completar: Función (proveedor, prompt, **extra) -> respuesta (default: litellm)
+            max_reintentos: 429 tolerados por proveedor en cada llamada antes de
+                dejarlo (default: LLM_MAX_REINTENTOS o 3)
+            espera_base: Enfriamiento tras el primer 429 (se duplica en cada 429 seguido)
+            espera_max: Enfriamiento máximo
+        """
+        if not proveedores:
+            raise ValueError("DespachadorLLM necesita al menos un proveedor")
+        self.proveedores = proveedores
+        self._completar = completar or completar_litellm
+        self.max_reintentos = max_reintentos if max_reintentos is not None else int(
+            os.getenv("LLM_MAX_REINTENTOS", "3"))
+        self.espera_base = espera_base
+        self.espera_max = espera_max
+        self._condicion = threading.Condition()
+        self.en_cola = 0
+        self.max_en_cola = 0
+        self.segundos_en_cola = 0.0
+        self.fallidas = 0
+
+    @property
+    def capacidad(self) -> int:
+        """Llamadas simultáneas que admiten todos los proveedores juntos."""
+        return sum(p.max_concurrencia for p in self.proveedores)
+
+    def _tomar_cupo(self, excluidos: Set[int]) -> Optional[int]:
+        """Espera un cupo en el primer proveedor disponible; None si no queda ninguno."""
+        with self._condicion:
+            self.en_cola += 1
+            self.max_en_cola = max(self.max_en_cola, self.en_cola)
+            try:
+                while True:
+                    candidatos = [i for i in range(len(self.proveedores)) if i not in excluidos]
+                    if not candidatos:
+                        return None
+                    ahora = time.monotonic()
+                    for i in candidatos:
+                        p = self.proveedores[i]
+                        if p.enfriado_hasta <= ahora and p.en_curso < p.max_concurrencia:
+                            p.en_curso += 1
+                            p.max_en_curso = max(p.max_en_curso, p.en_curso)
+                            return i
+                    # Sin cupo: esperar a que termine una llamada o un enfriamiento
+                    enfriamientos = [self.proveedores[i].enfriado_hasta for i in candidatos
+                                     if self.proveedores[i].enfriado_hasta > ahora]
+                    self._condicion.wait(timeout=min(enfriamientos) - ahora if enfriamientos else None)
+            finally:
+                self.en_cola -= 1
+
+    def _liberar(self, indice: int, enfriar: float = 0.0) -> None:
+        with self._condicion:
+            p = self.proveedores[indice]
+            p.en_curso -= 1
+            if enfriar:
+                p.enfriado_hasta = max(p.enfriado_hasta, time.monotonic() + enfriar)
+            self._condicion.notify_all()
+
+    def _espera(self, numero_429: int, error: Exception) -> float:
+        espera = _retry_after(error)
+        if espera is None:
+            espera = self.espera_base * 2 ** (numero_429 - 1) * (0.5 + random.random() / 2)
+        return min(espera, self.espera_max)
+
+    def completar(self, prompt: str, **extra) -> RespuestaDespacho:
+        """Completa `prompt` con el primer proveedor que lo logre.
+
+        Raises:
+            ErrorDespachoLLM: Si todos los proveedores fallaron o agotaron sus reintentos
+        """
+        excluidos: Set[int] = set()
+        limites_por_proveedor: Dict[int, int] = {}
+        reintentos = 0
+        segundos_espera = 0.0
+        ultimo_error: Optional[Exception] = None
+
+        while True:
+            inicio_espera = time.perf_counter()
+            indice = self._tomar_cupo(excluidos)
+            espera = time.perf_counter() - inicio_espera
+            segundos_espera += espera
+            with self._condicion:
+                self.segundos_en_cola += espera
+            if indice is None:
+                with self._condicion:
+                    self.fallidas += 1
+                raise ErrorDespachoLLM(
+                    f"Ningún proveedor completó la llamada ({reintentos} reintentos): {ultimo_error}"
+                ) from ultimo_error
+
+            proveedor = self.proveedores[indice]
+            try:
+                respuesta = self._completar(proveedor, prompt, **extra)
+            except Exception as e:
+                ultimo_error = e
+                if es_limite_tasa(e):
+                    reintentos += 1
+                    limites_por_proveedor[indice] = limites_por_proveedor.get(indice, 0) + 1
+                    enfriamiento = self._espera(limites_por_proveedor[indice], e)
+                    print(f"[LLM] 429 de {proveedor.nombre}; enfriando {enfriamiento:.2f}s")
+                    with self._condicion:
+                        proveedor.limites_tasa += 1
+                    self._liberar(indice, enfriar=enfriamiento)
+                    if limites_por_proveedor[indice] > self.max_reintentos:
+                        excluidos.add(indice)
+                else:
+                    print(f"[LLM] Error de {proveedor.nombre}: {e}; probando el siguiente proveedor")
+                    with self._condicion:
+                        proveedor.errores += 1
+                    self._liberar(indice)
+                    excluidos.add(indice)
+                continue
+
+            with self._condicion:
+                proveedor.llamadas += 1
+            self._liberar(indice)
+            return RespuestaDespacho(respuesta, proveedor, reintentos, segundos_espera)
+
+    def metricas(self) -> Dict[str, Any]:
+        """Llamadas, 429, errores y concurrencia máxima por proveedor, y uso de la cola."""
+        with self._condicion:
+            return {
+                "proveedores": {
+                    p.nombre: {
+                        "llamadas": p.llamadas,
+                        "limites_tasa": p.limites_tasa,
+                        "errores": p.errores,
+                        "max_concurrencia": p.max_concurrencia,
+                        "max_en_curso": p.max_en_curso,
+                    }
+                    for p in self.proveedores
+                },
+                "max_en_cola": self.max_en_cola,
+                "segundos_en_cola": round(self.segundos_en_cola, 3),
+                "fallidas": self.fallidas,
+            }
+
+    def resumen(self) -> str:
+        """Resumen legible para el final de una corrida."""
+        m = self.metricas()
+        lineas = [f"Despachador LLM: cola máx {m['max_en_cola']}, {m['segundos_en_cola']:.1f}s en cola, "
+                  f"{m['fallidas']} llamadas fallidas"]
+        for nombre, p in m["proveedores"].items():
+            lineas.append(f"  {nombre}: {p['llamadas']} llamadas, {p['limites_tasa']} x 429, "
+                          f"{p['errores']} errores, {p['max_en_curso']}/{p['max_concurrencia']} simultáneas")
+        return "\n".join(lineas)
+
+
+_despachador: Optional[DespachadorLLM] = None
+_lock_despachador = threading.Lock()
+
+
+def despachador_compartido() -> DespachadorLLM:
+    """Despachador del proceso (los cupos valen para todas las estrategias)."""
+    global _despachador
+    with _lock_despachador:
+        if _despachador is None:
+            _despachador = DespachadorLLM(proveedores_desde_entorno())
+        return _despachador
@@ -0,0 +1,161 @@
+"""Cuándo se da por lista la página de resultados.
+
+get_run_config esperaba networkidle (ninguna conexión durante 500 ms, con
+analytics y tag managers eso tarda) y después scrolleaba la página entera
+(scan_full_page) aunque las tarjetas de tarifas ya estuvieran renderizadas.
+EstrategiaEspera "selector" espera solo lo que la extracción necesita:
+
+- La navegación termina en domcontentloaded.
+- Un wait_for JS de crawl4ai cuenta las tarjetas (.thumb-cards_card) cada
+  100 ms y da la página por lista cuando hay al menos `min_tarjetas` y la
+  cantidad no cambió durante `estable_ms` (SynXis las agrega de a una).
+- Si eso no pasa en `timeout_ms`, sigue igual (fallback): la página sin
+  tarjetas la rechaza obtener_pagina como antes.
+
+El default sigue siendo "networkidle": .thumb-cards_card es la clase de la
+plantilla del servidor local (servidor_local.py) y no se confirmó en una
+página real de SynXis. Si la clase no existe en el sitio, "selector" espera
+`timeout_ms` en cada página y la lee sin scrollear. Activarlo (ESPERA_PAGINA
+o el perfil) después de validar ESPERA_SELECTOR contra una página grabada.
+
+MedidorEspera registra, por página, el tiempo hasta estar lista (desde el
+inicio de la navegación, performance.now()), las tarjetas vistas y si se
+llegó por timeout; con "networkidle" mide lo mismo para comparar.
+
+Variables de entorno:
+    ESPERA_PAGINA=networkidle     "networkidle" (default) o "selector"
+    ESPERA_SELECTOR=.thumb-cards_card
+    ESPERA_ESTABLE_MS=500         la cantidad de tarjetas no cambia durante este tiempo
+    ESPERA_TIMEOUT_MS=15000       espera máxima por las tarjetas antes de seguir
+
+Ejemplo de uso:
+    espera = espera_desde_entorno()
+    config = CrawlerRunConfig(css_selector=..., **espera.opciones_run_config())
+"""
+
+import json
+import os
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from .bloqueo_recursos import encadenar_hook
+
+# Clase de las tarjetas en la plantilla del servidor local; sin confirmar en SynXis
+SELECTOR_TARJETAS = ".thumb-cards_card"
+
+
+@dataclass
+class EstrategiaEspera:
+    """Condición de página lista para CrawlerRunConfig."""
+    nombre: str = "networkidle"  # "networkidle" | "selector"
+    selector: str = SELECTOR_TARJETAS
+    min_tarjetas: int = 1
+    estable_ms: int = 500
+    timeout_ms: int = 15000
+
+    def js_lista(self) -> str:
+        """Condición wait_for ("js:...") con estado: tarjetas presentes y cantidad estable."""
+        return f"""js:(() => {{
+    const inicio = performance.now();
+    let cantidad = -1, desde = inicio;
+    return () => {{
+        const ahora = performance.now();
+        const n = document.querySelectorAll({json.dumps(self.selector)}).length;
+        if (n !== cantidad) {{ cantidad = n; desde = ahora; }}
+        const estable = n >= {self.min_tarjetas} && ahora - desde >= {self.estable_ms};
+        const vencido = ahora - inicio >= {self.timeout_ms};
+        if (estable || vencido) {{
+            window.__esperaPagina = {{lista_ms: ahora, tarjetas: n, por_timeout: !estable}};
+            return true;
+        }}
+        return false;
+    }};
+}})()"""
+
+    def opciones_run_config(self) -> dict:
+        """Argumentos de CrawlerRunConfig que implementan la espera."""
+        if self.nombre == "networkidle":
+            return {"wait_until": "networkidle", "scan_full_page": True}
+        return {"wait_until": "domcontentloaded", "scan_full_page": False, "wait_for": self.js_lista()}
+
+
+def espera_desde_entorno(base: Optional[EstrategiaEspera] = None) -> EstrategiaEspera:
+    """EstrategiaEspera según las variables ESPERA_*, que pisan los valores de `base`.
+
+    Args:
+        base: Espera de partida, p. ej. la del perfil del crawler (default: EstrategiaEspera())
+    """
+    base = base or EstrategiaEspera()
+    nombre = os.getenv("ESPERA_PAGINA", base.nombre).strip().lower()
+    if nombre not in ("selector", "networkidle"):
+        raise ValueError(f"ESPERA_PAGINA debe ser 'selector' o 'networkidle', no {nombre!r}")
+    return EstrategiaEspera(
+        nombre=nombre,
+        selector=os.getenv("ESPERA_SELECTOR", base.selector),
+        min_tarjetas=base.min_tarjetas,
+        estable_ms=int(os.getenv("ESPERA_ESTABLE_MS", base.estable_ms)),
+        timeout_ms=int(os.getenv("ESPERA_TIMEOUT_MS", base.timeout_ms)),
+    )
+
+
+JS_ESTADO_ESPERA = "() => ({espera: window.__esperaPagina || null, ahora: performance.now()})"
+
+
+@dataclass
+class MetricaEspera:
+    """Cuánto tardó una página en estar lista."""
+    url: str
+    segundos_hasta_lista: float
+    tarjetas: Optional[int] = None  # None con networkidle
+    por_timeout: bool = False
+
+
+@dataclass
+class MedidorEspera:
+    """Registra el tiempo hasta página lista de cada carga (hook before_retrieve_html)."""
+    estrategia: str = "networkidle"
+    paginas: List[MetricaEspera] = field(default_factory=list)
+
+    def instalar(self, crawler) -> "MedidorEspera":
+        """Registra el hook en el AsyncWebCrawler (antes de usarlo)."""
+        encadenar_hook(crawler.crawler_strategy, "before_retrieve_html", self._antes_de_leer_html)
+        return self
+
+    async def _antes_de_leer_html(self, page, **kwargs):
+        try:
+            estado = await page.evaluate(JS_ESTADO_ESPERA)
+        except Exception as e:
+            print(f"[WARNING] No se pudo medir la espera de {page.url}: {e}")
+            return
+        self.registrar(page.url, estado)
+
+    def registrar(self, url: str, estado: dict) -> MetricaEspera:
+        """Agrega la medición a partir del estado leído de la página."""
+        espera = estado.get("espera")
+        if espera:
+            metrica = MetricaEspera(url, espera["lista_ms"] / 1000, espera["tarjetas"], bool(espera["por_timeout"]))
+        else:
+            metrica = MetricaEspera(url, estado["ahora"] / 1000)
+        self.paginas.append(metrica)
+        if metrica.por_timeout:
+            print(f"[WARNING] {url}: tarjetas no estables tras el timeout ({metrica.tarjetas} vistas)")
+        return metrica
+
+    def metricas(self) -> dict:
+        tiempos = sorted(p.segundos_hasta_lista for p in self.paginas)
+
+        def percentil(p):
+            return tiempos[min(len(tiempos) - 1, int(p * len(tiempos)))] if tiempos else 0.0
+
+        return {
+            "estrategia": self.estrategia,
+            "paginas": len(tiempos),
+            "lista_p50": percentil(0.5),
+            "lista_p95": percentil(0.95),
+            "por_timeout": sum(p.por_timeout for p in self.paginas),
+        }
+
+    def resumen(self) -> str:
+        m = self.metricas()
+        return (f"Espera '{m['estrategia']}': {m['paginas']} páginas, lista en p50 {m['lista_p50']:.2f}s "
+                f"p95 {m['lista_p95']:.2f}s, {m['por_timeout']} por timeout")
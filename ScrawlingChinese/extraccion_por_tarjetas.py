@@ -0,0 +1,158 @@
+"""Extracción por tarjetas de habitación.
+
+Un hotel con muchas habitaciones genera un markdown largo que el LLM procesa
+en una sola llamada (o en pocos bloques grandes): la latencia crece con el
+total de la página. Cada tarjeta de thumb-cards_products (una habitación con
+sus tarifas) es independiente, así que se puede extraer por separado:
+
+1. dividir_en_tarjetas corta el markdown en el encabezado de cada tarjeta
+   (el título h2 de la habitación; se toma el nivel de encabezado más alto que
+   se repite, así no depende de que sea exactamente "##").
+2. agrupar_tarjetas junta `tarjetas_por_trozo` tarjetas por llamada. Cada
+   llamada repite instrucción y schema (menos trozos = menos tokens de
+   prompt), y más trozos que llamadas simultáneas no bajan la latencia: por
+   defecto se arman tantos trozos como llamadas simultáneas admite el
+   despachador.
+3. Los trozos se extraen en paralelo (el despachador LLM limita la
+   concurrencia real) y fusionar_habitaciones junta los resultados en orden,
+   unificando habitaciones repetidas entre trozos y sus tarifas duplicadas.
+
+Con menos de min_tarjetas tarjetas la página se extrae entera, como antes.
+
+Variables de entorno:
+    EXTRACCION_POR_TARJETAS=0         extrae la página entera
+    EXTRACCION_TARJETAS_POR_TROZO=auto  tarjetas por llamada al LLM (auto: según
+                                      las llamadas simultáneas)
+    EXTRACCION_TARJETAS_MIN=3         tarjetas mínimas para dividir la página
+
+Ejemplo de uso:
+    trozos = agrupar_tarjetas(dividir_en_tarjetas(markdown), tarjetas_por_trozo=2)
+    habitaciones = fusionar_habitaciones([extraer(t) for t in trozos])
+"""
+
+import math
+import os
+import re
+from collections import Counter
+from typing import Dict, List, Optional
+
+RE_ENCABEZADO = re.compile(r"^(#{1,6})\s+\S")
+
+
+def extraccion_por_tarjetas_habilitada() -> bool:
+    """True salvo que EXTRACCION_POR_TARJETAS=0."""
+    return os.getenv("EXTRACCION_POR_TARJETAS", "1") != "0"
+
+
+def nivel_tarjeta(markdown: str) -> Optional[int]:
+    """Nivel de encabezado de las tarjetas: el más alto que aparece al menos dos veces."""
+    niveles = Counter(len(m.group(1)) for m in map(RE_ENCABEZADO.match, markdown.splitlines()) if m)
+    repetidos = [nivel for nivel, cantidad in niveles.items() if cantidad >= 2]
+    return min(repetidos) if repetidos else None
+
+
+def dividir_en_tarjetas(markdown: str) -> List[str]:
+    """Divide el markdown en una sección por tarjeta de habitación.
+
+    Lo que está antes de la primera tarjeta (encabezados de la página, imágenes
+    de la primera tarjeta) se agrega a la primera sección.
+
+    Returns:
+        Secciones en orden; [markdown] si no se reconocen tarjetas
+    """
+    nivel = nivel_tarjeta(markdown)
+    if nivel is None:
+        return [markdown]
+
+    marca = "#" * nivel + " "
+    secciones: List[List[str]] = [[]]
+    con_tarjeta = False  # la sección actual ya tiene su encabezado de tarjeta
+    for linea in markdown.splitlines():
+        if linea.startswith(marca):
+            if con_tarjeta:
+                secciones.append([])
+            con_tarjeta = True
+        secciones[-1].append(linea)
+    return ["\n".join(s) for s in secciones if any(l.strip() for l in s)]
+
+
+def agrupar_tarjetas(tarjetas: List[str], tarjetas_por_trozo: int = 1) -> List[str]:
+    """Junta las tarjetas de a `tarjetas_por_trozo` (un trozo = una llamada al LLM)."""
+    n = max(1, tarjetas_por_trozo)
+    return ["\n\n".join(tarjetas[i:i + n]) for i in range(0, len(tarjetas), n)]
+
+
+def trozos_de_pagina(markdown: str, max_trozos: int, tarjetas_por_trozo: Optional[int] = None,
+                     min_tarjetas: Optional[int] = None) -> List[str]:
+    """Trozos a extraer por separado, o [markdown] si la página no se divide.
+
+    Args:
+        markdown: Markdown (podado) de la página
+        max_trozos: Llamadas simultáneas disponibles; con tarjetas_por_trozo
+            automático se arman a lo sumo estos trozos
+        tarjetas_por_trozo: Default: EXTRACCION_TARJETAS_POR_TROZO o automático
+        min_tarjetas: Default: EXTRACCION_TARJETAS_MIN o 3
+    """
+    if min_tarjetas is None:
+        min_tarjetas = int(os.getenv("EXTRACCION_TARJETAS_MIN", "3"))
+
+    tarjetas = dividir_en_tarjetas(markdown)
+    if len(tarjetas) < min_tarjetas or max_trozos < 2:
+        return [markdown]
+
+    if tarjetas_por_trozo is None:
+        configurado = os.getenv("EXTRACCION_TARJETAS_POR_TROZO", "auto").strip().lower()
+        tarjetas_por_trozo = (math.ceil(len(tarjetas) / max_trozos) if configurado == "auto"
+                              else int(configurado))
+    return agrupar_tarjetas(tarjetas, tarjetas_por_trozo)
+
+
+def _normalizar(texto) -> str:
+    return " ".join(str(texto or "").lower().split())
+
+
+def fusionar_habitaciones(resultados: List[list]) -> list:
+    """Une las habitaciones extraídas de cada trozo, en orden.
+
+    Una habitación que aparece en más de un trozo (mismo nombre normalizado)
+    se unifica: se conserva la primera, se completan los detalles vacíos y se
+    agregan las tarifas que no estaban (mismo título normalizado y precio =
+    tarifa repetida). Los elementos que no son habitaciones (bloques de error
+    del LLM) se conservan tal cual.
+
+    Args:
+        resultados: Lista de listas de dicts, una por trozo
+
+    Returns:
+        Lista de dicts de habitaciones
+    """
+    fusion: list = []
+    por_nombre: Dict[str, dict] = {}
+
+    for bloques in resultados:
+        for bloque in bloques:
+            if not isinstance(bloque, dict) or "nombre" not in bloque:
+                fusion.append(bloque)
+                continue
+
+            clave = _normalizar(bloque["nombre"])
+            existente = por_nombre.get(clave)
+            if existente is None or not isinstance(existente.get("combos"), list):
+                habitacion = dict(bloque)
+                if isinstance(bloque.get("combos"), list):
+                    habitacion["combos"] = list(bloque["combos"])
+                    por_nombre[clave] = habitacion
+                fusion.append(habitacion)
+                continue
+
+            if not existente.get("detalles") and bloque.get("detalles"):
+                existente["detalles"] = bloque["detalles"]
+            vistas = {(_normalizar(c.get("titulo")), c.get("precio"))
+                      for c in existente["combos"] if isinstance(c, dict)}
+            for combo in bloque.get("combos") if isinstance(bloque.get("combos"), list) else []:
+                clave_combo = (_normalizar(combo.get("titulo")), combo.get("precio")) \
+                    if isinstance(combo, dict) else None
+                if clave_combo not in vistas:
+                    existente["combos"].append(combo)
+                    vistas.add(clave_combo)
+    return fusion
@@ -0,0 +1,105 @@
+"""Extractor determinista de habitaciones desde el HTML del servidor local.
+
+Solo reconoce la plantilla de servidor_local.render_habitacion, que imita
+una página de resultados de SynXis con estas clases:
+
+    .thumb-cards_card                una tarjeta por habitación
+      h2.thumb-cards_title           nombre
+      .thumb-cards_description p     detalles (el primer párrafo)
+      .rate-card                     una tarifa
+        .rate-card_title             título
+        .rate-card_description       descripción
+        .rate-card_amount            precio ("1,234" o "1,234.50")
+
+Las clases no se validaron contra una página real de SynXis (del markup
+real solo se conoce CSS_SELECTOR en config.py): en páginas grabadas del
+sitio puede no encontrar ninguna tarjeta. Por eso reextraccion.py usa por
+defecto el LLM sobre el markdown archivado, y este extractor solo si se le
+pasa (pruebas y benchmarks con el servidor local).
+
+extraer_habitaciones_html las lee con lxml (XPath, sin LLM ni red) y
+devuelve los dicts con la forma de HabitacionWeb; extraer_hotel_html los
+valida con decodificar_habitaciones_web como cualquier otra extracción.
+
+Ejemplo de uso:
+    hotel, rechazos = extraer_hotel_html(html, "Alvear Palace Hotel")
+    resumen = reextraer_archivo(archivo, extractor=extraer_habitaciones_html)
+"""
+
+import re
+from typing import List, Optional, Tuple
+
+import lxml.html
+
+from Models.hotelWeb import HotelWeb, RechazoHabitacion, decodificar_habitaciones_web
+
+
+def _clase(nombre: str) -> str:
+    """Condición XPath: el elemento tiene la clase `nombre` (como el selector .nombre)."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {nombre} ')"
+
+
+XPATH_TARJETAS = f"//div[{_clase('thumb-cards_card')}]"
+XPATH_NOMBRE = f".//*[{_clase('thumb-cards_title')}]"
+XPATH_DETALLES = f".//*[{_clase('thumb-cards_description')}]//p"
+XPATH_TARIFAS = f".//*[{_clase('rate-card')}]"
+XPATH_TITULO_TARIFA = f".//*[{_clase('rate-card_title')}]"
+XPATH_DESCRIPCION_TARIFA = f".//*[{_clase('rate-card_description')}]"
+XPATH_PRECIO = f".//*[{_clase('rate-card_amount')}]"
+
+RE_NUMERO = re.compile(r"[\d.,]+")
+
+
+def _texto(elemento, xpath: str) -> str:
+    encontrados = elemento.xpath(xpath)
+    return " ".join(encontrados[0].text_content().split()) if encontrados else ""
+
+
+def parsear_precio(texto: str):
+    """Precio numérico de "USD 1,234.50"; el texto tal cual si no tiene número."""
+    numero = RE_NUMERO.search(texto or "")
+    try:
+        return float(numero.group().replace(",", "")) if numero else texto
+    except ValueError:
+        return texto
+
+
+def extraer_habitaciones_html(html: str) -> List[dict]:
+    """Habitaciones y tarifas de una página con la plantilla del servidor local.
+
+    Returns:
+        Lista de dicts {nombre, detalles, combos: [{titulo, descripcion, precio}]},
+        en el orden de la página; [] si no hay tarjetas
+    """
+    if not html or not html.strip():
+        return []
+    documento = lxml.html.fromstring(html)
+
+    habitaciones = []
+    for tarjeta in documento.xpath(XPATH_TARJETAS):
+        habitaciones.append({
+            "nombre": _texto(tarjeta, XPATH_NOMBRE),
+            "detalles": _texto(tarjeta, XPATH_DETALLES) or None,
+            "combos": [
+                {
+                    "titulo": _texto(tarifa, XPATH_TITULO_TARIFA),
+                    "descripcion": _texto(tarifa, XPATH_DESCRIPCION_TARIFA),
+                    "precio": parsear_precio(_texto(tarifa, XPATH_PRECIO)),
+                }
+                for tarifa in tarjeta.xpath(XPATH_TARIFAS)
+            ],
+        })
+    return habitaciones
+
+
+def extraer_hotel_html(html: str, nombre_hotel: str = "Alvear Palace Hotel"
+                       ) -> Tuple[Optional[HotelWeb], List[RechazoHabitacion]]:
+    """HotelWeb validado desde el HTML, con las tarjetas que no pasaron la validación.
+
+    Returns:
+        (HotelWeb o None si no quedó ninguna habitación válida, rechazos)
+    """
+    habitaciones, rechazos = decodificar_habitaciones_web(extraer_habitaciones_html(html))
+    if not habitaciones:
+        return None, rechazos
+    return HotelWeb(habitacion=habitaciones, detalles=nombre_hotel), rechazos
@@ -0,0 +1,120 @@
+"""Perfiles con nombre para el crawler.
+
+get_browser_config fijaba headless=False y verbose=True, y get_run_config
+fijaba timeouts y modo de caché: no había forma de correr un perfil liviano
+en un servidor sin tocar el código. Un PerfilCrawler reúne esas decisiones:
+
+- Navegador: headless o visible, modo liviano de crawl4ai, logs (verbose).
+- Carga: page_timeout, estrategia de espera (espera_pagina.py), modo de
+  caché de crawl4ai y bloqueo de recursos (bloqueo_recursos.py).
+- Origen: navegador o el archivo de páginas grabadas (archivo_paginas.py).
+
+Los perfiles se leen de perfiles_crawler.json (o de PERFILES_CRAWLER_ARCHIVO):
+interactive-debug (default, el comportamiento anterior), production-headless,
+replay y benchmark. Las variables ARCHIVO_PAGINAS y ESPERA_* siguen pisando
+lo que diga el perfil.
+
+Tests/bench_perfiles_crawler.py mide latencia por página y memoria pico de
+cada perfil contra el servidor SynXis local.
+
+Variables de entorno:
+    PERFIL_CRAWLER=interactive-debug   perfil activo
+    PERFILES_CRAWLER_ARCHIVO           JSON con los perfiles (default: perfiles_crawler.json)
+
+Ejemplo de uso:
+    perfil = perfil_activo()
+    async with crear_crawler(perfil=perfil) as crawler:
+        config = get_run_config(css_selector, session_id, perfil=perfil)
+"""
+
+import json
+import os
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import Dict, Optional
+
+from .bloqueo_recursos import BloqueadorRecursos, politica_desde_entorno
+from .espera_pagina import EstrategiaEspera, espera_desde_entorno
+
+ARCHIVO_PERFILES = Path(__file__).parent / "perfiles_crawler.json"
+PERFIL_DEFAULT = "interactive-debug"
+MODOS_CACHE = ("enabled", "disabled", "read_only", "write_only", "bypass")
+
+
+@dataclass
+class PerfilCrawler:
+    """Modo del navegador, logs, timeouts, espera y caché de un perfil."""
+    nombre: str
+    descripcion: str = ""
+    headless: bool = True
+    verbose: bool = False
+    modo_liviano: bool = False
+    page_timeout_ms: int = 30000
+    espera: str = "networkidle"  # "networkidle" | "selector"
+    espera_estable_ms: int = 500
+    espera_timeout_ms: int = 15000
+    cache: str = "bypass"  # CacheMode de crawl4ai
+    bloqueo_recursos: bool = True
+    archivo: str = ""  # "" | "grabar" | "reproducir"
+
+    def __post_init__(self):
+        if self.cache not in MODOS_CACHE:
+            raise ValueError(f"Perfil {self.nombre}: cache debe ser uno de {MODOS_CACHE}, no {self.cache!r}")
+        if self.espera not in ("selector", "networkidle"):
+            raise ValueError(f"Perfil {self.nombre}: espera debe ser 'selector' o 'networkidle'")
+        if self.archivo not in ("", "grabar", "reproducir"):
+            raise ValueError(f"Perfil {self.nombre}: archivo debe ser '', 'grabar' o 'reproducir'")
+
+    def browser_config(self):
+        """BrowserConfig de crawl4ai para este perfil."""
+        from crawl4ai import BrowserConfig
+
+        return BrowserConfig(browser_type="chromium", headless=self.headless, verbose=self.verbose,
+                             light_mode=self.modo_liviano)
+
+    def cache_mode(self):
+        from crawl4ai import CacheMode
+
+        return CacheMode(self.cache)
+
+    def estrategia_espera(self) -> EstrategiaEspera:
+        """Espera del perfil, con las variables ESPERA_* por encima."""
+        return espera_desde_entorno(EstrategiaEspera(nombre=self.espera, estable_ms=self.espera_estable_ms,
+                                                     timeout_ms=self.espera_timeout_ms))
+
+    def bloqueador(self) -> BloqueadorRecursos:
+        """Bloqueador de recursos del perfil (sin bloqueo, solo mide las cargas)."""
+        return BloqueadorRecursos(politica_desde_entorno() if self.bloqueo_recursos else None)
+
+
+def cargar_perfiles(ruta: Optional[Path] = None) -> Dict[str, PerfilCrawler]:
+    """Perfiles definidos en el JSON, por nombre.
+
+    Raises:
+        ValueError: Si un perfil tiene campos desconocidos o valores inválidos
+    """
+    ruta = Path(ruta or os.getenv("PERFILES_CRAWLER_ARCHIVO") or ARCHIVO_PERFILES)
+    with open(ruta, encoding="utf-8") as f:
+        definiciones = json.load(f)
+
+    campos = {f.name for f in fields(PerfilCrawler)} - {"nombre"}
+    perfiles = {}
+    for nombre, valores in definiciones.items():
+        desconocidos = set(valores) - campos
+        if desconocidos:
+            raise ValueError(f"Perfil {nombre} en {ruta}: campos desconocidos {sorted(desconocidos)}")
+        perfiles[nombre] = PerfilCrawler(nombre=nombre, **valores)
+    return perfiles
+
+
+def perfil_activo(nombre: Optional[str] = None) -> PerfilCrawler:
+    """Perfil `nombre` (default: PERFIL_CRAWLER o interactive-debug).
+
+    Raises:
+        ValueError: Si el perfil no está definido
+    """
+    nombre = nombre or os.getenv("PERFIL_CRAWLER", PERFIL_DEFAULT)
+    perfiles = cargar_perfiles()
+    if nombre not in perfiles:
+        raise ValueError(f"Perfil de crawler desconocido {nombre!r}. Disponibles: {sorted(perfiles)}")
+    return perfiles[nombre]
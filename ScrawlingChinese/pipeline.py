@@ -0,0 +1,283 @@
+"""Pipeline de scraping en dos etapas: obtención de páginas y extracción.
+
+Con la extracción LLM dentro de crawler.arun (como se hacía antes) el
+navegador (el recurso caro) queda ocioso mientras el LLM responde.
+PipelineScraping separa las dos etapas:
+
+    solicitudes -> [navegadores] -> cola acotada de PaginaObtenida -> [extractores] -> HotelWeb
+
+- Los navegadores solo cargan la página y guardan HTML/markdown limpios.
+- Los extractores (workers independientes, la llamada bloqueante corre en un
+  hilo) convierten cada página en HotelWeb.
+- La cola acotada aplica backpressure: si los extractores se atrasan, los
+  navegadores esperan en lugar de acumular páginas en memoria.
+
+Cada etapa escala por separado (cantidad de navegadores y de extractores) y
+se registran métricas de latencia por etapa y profundidad de la cola.
+
+El módulo no depende de crawl4ai: las etapas se inyectan como funciones.
+
+Ejemplo de uso:
+    pipeline = PipelineScraping(obtener, extraer, navegadores=2, extractores=4)
+    resultados = await pipeline.ejecutar([params1, params2, ...])
+    print(pipeline.resumen())
+"""
+
+import asyncio
+import inspect
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from Models.hotelWeb import HotelWeb
+
+
+@dataclass
+class PaginaObtenida:
+    """Página cargada por un navegador, lista para la etapa de extracción."""
+    params: dict
+    url: str
+    html: str
+    markdown: str
+    segundos_fetch: float
+    intento: int = 1
+    indice: int = 0  # posición de la solicitud en la lista original
+
+
+@dataclass
+class ResultadoPipeline:
+    """Resultado de una solicitud: HotelWeb o el error que la hizo fallar."""
+    params: dict
+    hotel: Optional[HotelWeb] = None
+    error: Optional[str] = None
+    intentos: int = 0
+    segundos_fetch: float = 0.0
+    segundos_extraccion: float = 0.0
+
+
+@dataclass
+class MetricasEtapa:
+    """Latencias de una etapa del pipeline."""
+    nombre: str
+    procesados: int = 0
+    errores: int = 0
+    segundos_total: float = 0.0
+    segundos_max: float = 0.0
+
+    def registrar(self, segundos: float, error: bool = False) -> None:
+        self.procesados += 1
+        self.errores += int(error)
+        self.segundos_total += segundos
+        self.segundos_max = max(self.segundos_max, segundos)
+
+    @property
+    def segundos_promedio(self) -> float:
+        return self.segundos_total / self.procesados if self.procesados else 0.0
+
+
+@dataclass
+class MetricasCola:
+    """Profundidad de la cola entre etapas (muestreada en cada put)."""
+    capacidad: int
+    muestras: int = 0
+    suma_profundidad: int = 0
+    profundidad_max: int = 0
+    segundos_bloqueo: float = 0.0  # tiempo que los navegadores esperaron por cola llena
+
+    def registrar(self, profundidad: int) -> None:
+        self.muestras += 1
+        self.suma_profundidad += profundidad
+        self.profundidad_max = max(self.profundidad_max, profundidad)
+
+    @property
+    def profundidad_promedio(self) -> float:
+        return self.suma_profundidad / self.muestras if self.muestras else 0.0
+
+
+@dataclass
+class _Pendiente:
+    params: dict
+    indice: int
+    intento: int = 1
+
+
+ObtenerPagina = Callable[[dict, int], Awaitable[PaginaObtenida]]
+ExtraerHotel = Callable[[PaginaObtenida], Any]
+
+
+class PipelineScraping:
+    """Pipeline de obtención y extracción con etapas independientes.
+
+    Args del constructor:
+        obtener: async (params, id_navegador) -> PaginaObtenida. Carga la página
+            (sin extracción). Una excepción cuenta como intento fallido.
+        extraer: (PaginaObtenida) -> Optional[HotelWeb]. Puede ser una función
+            normal (se ejecuta en un hilo) o una corrutina. None o una
+            excepción cuentan como intento fallido.
+        navegadores: Workers de la etapa de obtención
+        extractores: Workers de la etapa de extracción
+        capacidad_cola: Páginas que pueden esperar extracción
+        max_intentos: Intentos por solicitud; al fallar la extracción se vuelve
+            a cargar la página
+        espera_reintento: Segundos antes de reencolar un intento fallido
+    """
+
+    def __init__(self, obtener: ObtenerPagina, extraer: ExtraerHotel,
+                 navegadores: int = 1, extractores: int = 2, capacidad_cola: int = 4,
+                 max_intentos: int = 3, espera_reintento: float = 5.0):
+        if navegadores < 1 or extractores < 1 or capacidad_cola < 1:
+            raise ValueError("navegadores, extractores y capacidad_cola deben ser >= 1")
+        self.obtener = obtener
+        self.extraer = extraer
+        self.navegadores = navegadores
+        self.extractores = extractores
+        self.capacidad_cola = capacidad_cola
+        self.max_intentos = max_intentos
+        self.espera_reintento = espera_reintento
+
+        self.metricas_fetch = MetricasEtapa("obtención")
+        self.metricas_extraccion = MetricasEtapa("extracción")
+        self.metricas_cola = MetricasCola(capacidad_cola)
+        self.segundos_total = 0.0
+
+    async def ejecutar(self, solicitudes: List[dict]) -> List[ResultadoPipeline]:
+        """Procesa todas las solicitudes y devuelve un resultado por cada una, en orden."""
+        self.metricas_fetch = MetricasEtapa("obtención")
+        self.metricas_extraccion = MetricasEtapa("extracción")
+        self.metricas_cola = MetricasCola(self.capacidad_cola)
+
+        resultados = [ResultadoPipeline(params=p) for p in solicitudes]
+        if not solicitudes:
+            return resultados
+
+        entrada: asyncio.Queue = asyncio.Queue()
+        paginas: asyncio.Queue = asyncio.Queue(maxsize=self.capacidad_cola)
+        restantes = len(solicitudes)
+        terminado = asyncio.Event()
+
+        for indice, params in enumerate(solicitudes):
+            entrada.put_nowait(_Pendiente(params, indice))
+
+        def finalizar(indice: int, hotel: Optional[HotelWeb], error: Optional[str]) -> None:
+            nonlocal restantes
+            resultados[indice].hotel = hotel
+            resultados[indice].error = error
+            restantes -= 1
+            if restantes == 0:
+                terminado.set()
+
+        reintentos = set()
+
+        async def reencolar(pendiente: _Pendiente) -> None:
+            await asyncio.sleep(self.espera_reintento)
+            entrada.put_nowait(pendiente)
+
+        def reintentar_o_fallar(pendiente: _Pendiente, error: str) -> None:
+            if pendiente.intento < self.max_intentos:
+                print(f"[PIPELINE] Solicitud {pendiente.indice} intento {pendiente.intento} falló "
+                      f"({error}); reintentando en {self.espera_reintento}s")
+                # La espera no ocupa al worker: el reintento se reencola en una tarea aparte
+                tarea = asyncio.create_task(reencolar(
+                    _Pendiente(pendiente.params, pendiente.indice, pendiente.intento + 1)))
+                reintentos.add(tarea)
+                tarea.add_done_callback(reintentos.discard)
+            else:
+                finalizar(pendiente.indice, None, error)
+
+        async def navegador(id_navegador: int) -> None:
+            while True:
+                pendiente = await entrada.get()
+                resultados[pendiente.indice].intentos = pendiente.intento
+                inicio = time.perf_counter()
+                try:
+                    pagina = await self.obtener(pendiente.params, id_navegador)
+                except Exception as e:
+                    self.metricas_fetch.registrar(time.perf_counter() - inicio, error=True)
+                    reintentar_o_fallar(pendiente, f"Error obteniendo página: {e}")
+                    continue
+
+                segundos = time.perf_counter() - inicio
+                self.metricas_fetch.registrar(segundos)
+                pagina.intento = pendiente.intento
+                pagina.indice = pendiente.indice
+                resultados[pendiente.indice].segundos_fetch += segundos
+
+                inicio_espera = time.perf_counter()
+                await paginas.put(pagina)
+                self.metricas_cola.segundos_bloqueo += time.perf_counter() - inicio_espera
+                self.metricas_cola.registrar(paginas.qsize())
+
+        async def extractor() -> None:
+            while True:
+                pagina = await paginas.get()
+                pendiente = _Pendiente(pagina.params, pagina.indice, pagina.intento)
+                inicio = time.perf_counter()
+                try:
+                    if inspect.iscoroutinefunction(self.extraer):
+                        hotel = await self.extraer(pagina)
+                    else:
+                        hotel = await asyncio.to_thread(self.extraer, pagina)
+                    error = None if hotel is not None else "Extracción sin habitaciones"
+                except Exception as e:
+                    hotel, error = None, f"Error extrayendo: {e}"
+
+                segundos = time.perf_counter() - inicio
+                self.metricas_extraccion.registrar(segundos, error=error is not None)
+                resultados[pagina.indice].segundos_extraccion += segundos
+
+                if error is None:
+                    finalizar(pagina.indice, hotel, None)
+                else:
+                    reintentar_o_fallar(pendiente, error)
+
+        inicio_total = time.perf_counter()
+        workers = [asyncio.create_task(navegador(i)) for i in range(self.navegadores)]
+        workers += [asyncio.create_task(extractor()) for _ in range(self.extractores)]
+        try:
+            await terminado.wait()
+        finally:
+            pendientes = workers + list(reintentos)
+            for tarea in pendientes:
+                tarea.cancel()
+            await asyncio.gather(*pendientes, return_exceptions=True)
+            self.segundos_total = time.perf_counter() - inicio_total
+
+        return resultados
+
+    def metricas(self) -> Dict[str, Any]:
+        """Métricas de la última ejecución como dict (para exportar)."""
+        def etapa(m: MetricasEtapa) -> Dict[str, Any]:
+            return {
+                "procesados": m.procesados,
+                "errores": m.errores,
+                "segundos_promedio": round(m.segundos_promedio, 4),
+                "segundos_max": round(m.segundos_max, 4),
+                "segundos_total": round(m.segundos_total, 4),
+            }
+        return {
+            "navegadores": self.navegadores,
+            "extractores": self.extractores,
+            "segundos_total": round(self.segundos_total, 4),
+            "obtencion": etapa(self.metricas_fetch),
+            "extraccion": etapa(self.metricas_extraccion),
+            "cola": {
+                "capacidad": self.metricas_cola.capacidad,
+                "profundidad_promedio": round(self.metricas_cola.profundidad_promedio, 2),
+                "profundidad_max": self.metricas_cola.profundidad_max,
+                "segundos_bloqueo": round(self.metricas_cola.segundos_bloqueo, 4),
+            },
+        }
+
+    def resumen(self) -> str:
+        """Resumen legible de la última ejecución."""
+        m = self.metricas()
+        lineas = [f"Pipeline: {m['navegadores']} navegador(es), {m['extractores']} extractor(es), "
+                  f"{m['segundos_total']:.2f}s total"]
+        for clave, nombre in (("obtencion", "Obtención"), ("extraccion", "Extracción")):
+            e = m[clave]
+            lineas.append(f"  {nombre:<11}: {e['procesados']} ({e['errores']} errores) | "
+                          f"prom {e['segundos_promedio']:.2f}s | máx {e['segundos_max']:.2f}s")
+        c = m["cola"]
+        lineas.append(f"  Cola       : prom {c['profundidad_promedio']:.1f} | máx {c['profundidad_max']}/"
+                      f"{c['capacidad']} | navegadores bloqueados {c['segundos_bloqueo']:.2f}s")
+        return "\n".join(lineas)
@@ -0,0 +1,180 @@
+"""Poda del markdown de la página antes de la extracción LLM.
+
+La región CSS_SELECTOR llega al LLM como markdown completo: imágenes, links
+de la UI ("Room Details", "Select"), listas de amenities, políticas de
+cancelación/garantía repetidas en cada tarifa y párrafos de marketing
+idénticos en todas las habitaciones. Nada de eso aporta a la extracción de
+habitaciones, tarifas y precios, pero multiplica los tokens (latencia y costo).
+
+podar_markdown aplica reglas por línea que nunca tocan una línea con precio
+ni los encabezados (nombres de habitación y títulos de tarifa):
+1. Quita imágenes, links de acciones de la UI, contadores de galería y
+   botones; el resto de los links queda como texto.
+2. Quita las secciones que no son tarifas (amenities, políticas, check-in):
+   el encabezado y sus líneas hasta el siguiente encabezado o línea con precio.
+3. Quita líneas de texto fijo repetidas ("Excludes taxes and fees").
+4. Quita párrafos largos que ya aparecieron antes en la página.
+5. Trunca las descripciones largas a max_descripcion caracteres.
+
+Variables de entorno:
+    PODA_CONTENIDO=0              desactiva la poda
+    PODA_MAX_DESCRIPCION=250      largo máximo de una descripción
+    CONTEO_TOKENS=tiktoken        contar tokens con tiktoken en lugar de estimarlos
+
+Ejemplo de uso:
+    poda = podar_markdown(markdown)
+    print(f"{poda.tokens_antes} -> {poda.tokens_despues} tokens")
+    llm_strategy.run(url, RegexChunking().chunk(poda.markdown))
+"""
+
+import os
+import re
+from dataclasses import dataclass
+from typing import Optional
+
+# Tokens por palabra cuando no hay tokenizer (mismo valor que crawl4ai.config.WORD_TOKEN_RATE)
+TOKENS_POR_PALABRA = 1.3
+
+RE_IMAGEN = re.compile(r"!\[[^\]]*\]\([^)]*\)")
+RE_LINK = re.compile(r"\[([^\]]*)\]\([^)]*\)")
+RE_ENCABEZADO = re.compile(r"^(#{1,6})\s+(.*)$")
+RE_PRECIO = re.compile(
+    r"(?:USD|US\$|ARS|EUR|BRL|\$|€)\s?\d[\d.,]*|\d[\d.,]*\s?(?:USD|ARS|EUR|BRL)\b",
+    re.IGNORECASE,
+)
+RE_CONTADOR_GALERIA = re.compile(r"^\d+\s*/\s*\d+$")
+
+# Textos de links/botones de la UI que no aportan a la extracción
+ACCIONES_UI = {
+    "room details", "rate details", "view all rates", "show more", "show less", "select",
+    "book now", "more info", "view details", "hide details", "add room", "modify",
+}
+
+# Encabezados de secciones sin información de tarifas
+# (el encabezado completo debe coincidir, para no confundir tarifas como
+# "Flexible Rate - Free cancellation policy")
+RE_SECCION_NO_TARIFA = re.compile(
+    r"^(?:room |hotel |property )?amenities"
+    r"|^(?:cancellation|guarantee|deposit|pet|child|children|tax|taxes|payment) polic(?:y|ies)"
+    r"|^policies|^check-in(?:\s*/\s*check-out)?|^check-out|^terms(?: and conditions)?|^house rules",
+    re.IGNORECASE,
+)
+
+# Líneas de texto fijo que se repiten en cada tarifa
+TEXTO_FIJO = {
+    "excludes taxes and fees", "includes taxes and fees", "taxes and fees included",
+    "per night", "average nightly rate", "total for stay", "lowest price",
+}
+
+
+@dataclass
+class ResultadoPoda:
+    """Markdown podado y tokens antes/después."""
+    markdown: str
+    tokens_antes: int
+    tokens_despues: int
+
+    @property
+    def reduccion(self) -> float:
+        """Fracción de tokens eliminada (0.75 = 75% menos)."""
+        return 1 - self.tokens_despues / self.tokens_antes if self.tokens_antes else 0.0
+
+
+_codificador = None
+
+
+def contar_tokens(texto: str) -> int:
+    """Cuenta tokens del texto.
+
+    Por defecto estima palabras x TOKENS_POR_PALABRA, como hace crawl4ai al
+    trocear. Con CONTEO_TOKENS=tiktoken usa el tokenizer cl100k_base (requiere
+    tiktoken y su codificación descargada).
+    """
+    global _codificador
+    if os.getenv("CONTEO_TOKENS", "") == "tiktoken":
+        if _codificador is None:
+            import tiktoken
+            _codificador = tiktoken.get_encoding("cl100k_base")
+        return len(_codificador.encode(texto))
+    return int(len(texto.split()) * TOKENS_POR_PALABRA)
+
+
+def poda_habilitada() -> bool:
+    """True salvo que PODA_CONTENIDO=0."""
+    return os.getenv("PODA_CONTENIDO", "1") != "0"
+
+
+def _truncar(texto: str, largo: int) -> str:
+    if len(texto) <= largo:
+        return texto
+    corte = texto.rfind(" ", 0, largo)
+    return texto[:corte if corte > largo // 2 else largo].rstrip(" ,.;:") + "…"
+
+
+def _es_accion_ui(texto: str) -> bool:
+    return texto.strip().lower() in ACCIONES_UI
+
+
+def _limpiar_links(linea: str) -> str:
+    linea = RE_IMAGEN.sub("", linea)
+    return RE_LINK.sub(lambda m: "" if _es_accion_ui(m.group(1)) else m.group(1), linea)
+
+
+def podar_markdown(markdown: str, max_descripcion: Optional[int] = None,
+                   largo_repetido: int = 200) -> ResultadoPoda:
+    """Poda el markdown de la página de resultados.
+
+    Args:
+        markdown: Markdown de la región CSS_SELECTOR
+        max_descripcion: Largo máximo de una línea de descripción (default:
+            PODA_MAX_DESCRIPCION o 250)
+        largo_repetido: Párrafos de al menos este largo que ya aparecieron en la
+            página se eliminan
+
+    Returns:
+        ResultadoPoda con el markdown podado y los tokens antes/después
+    """
+    if max_descripcion is None:
+        max_descripcion = int(os.getenv("PODA_MAX_DESCRIPCION", "250"))
+
+    salida = []
+    vistos = set()
+    en_seccion_no_tarifa = False
+
+    for linea_original in markdown.splitlines():
+        linea = _limpiar_links(linea_original).strip()
+        if not linea:
+            continue
+
+        tiene_precio = bool(RE_PRECIO.search(linea))
+        encabezado = RE_ENCABEZADO.match(linea)
+
+        if encabezado:
+            en_seccion_no_tarifa = bool(RE_SECCION_NO_TARIFA.match(encabezado.group(2).strip()))
+            if not en_seccion_no_tarifa:
+                salida.append(linea)
+            continue
+
+        if tiene_precio:
+            # Una línea con precio cierra cualquier sección sin tarifas y nunca se toca
+            en_seccion_no_tarifa = False
+            salida.append(linea)
+            continue
+
+        if en_seccion_no_tarifa:
+            continue
+
+        texto = linea.lstrip("*-+ ").strip()
+        if (not texto or _es_accion_ui(texto) or RE_CONTADOR_GALERIA.match(texto)
+                or texto.lower() in TEXTO_FIJO):
+            continue
+
+        if len(linea) >= largo_repetido:
+            if linea in vistos:
+                continue
+            vistos.add(linea)
+
+        salida.append(_truncar(linea, max_descripcion))
+
+    podado = "\n".join(salida)
+    return ResultadoPoda(podado, contar_tokens(markdown), contar_tokens(podado))
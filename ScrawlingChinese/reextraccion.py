@@ -0,0 +1,285 @@
+"""Reextracción masiva de las páginas archivadas.
+
+Al cambiar la estrategia de extracción o el schema de HabitacionWeb no había
+forma de regenerar los resultados históricos. reextraer_archivo recorre el
+archivo de páginas (archivo_paginas.py), vuelve a extraer cada página y
+escribe una corrida nueva:
+
+    <salida>/<corrida>/hoteles.jsonl   un HotelWeb por solicitud archivada
+    <salida>/<corrida>/diff.jsonl      cambios respecto de la corrida anterior
+
+- Por defecto vuelve a correr la estrategia LLM sobre el markdown archivado
+  (extraer_hotel_web: poda, caché de extracción y despachador de siempre),
+  en un pool de hilos: funciona con cualquier página que el scraper ya leía.
+- Con `extractor` (p. ej. extractor_html.extraer_habitaciones_html) extrae
+  del HTML sin LLM en un pool de procesos: miles de páginas por minuto, pero
+  extractor_html solo reconoce la plantilla del servidor local. Los procesos
+  leen el HTML comprimido directamente del archivo (solo viajan las claves y
+  los resultados) y reciben las páginas de a lotes.
+- La corrida anterior es la última en <salida> (o la indicada); el diff
+  compara por solicitud: habitaciones y tarifas agregadas o quitadas,
+  precios cambiados y otros campos distintos.
+
+Variables de entorno:
+    REEXTRACCION_PROCESOS   procesos (o hilos, con el LLM) del pool (default: cantidad de CPUs)
+
+Ejemplo de uso:
+    resumen = reextraer_archivo(ArchivoPaginas())
+    print(resumen.resumen())
+
+    python -m ScrawlingChinese.reextraccion [corrida_anterior]
+"""
+
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from Models.hotelWeb import HotelWeb, decodificar_habitaciones_web
+
+from .archivo_paginas import ArchivoPaginas, RegistroPagina, leer_objeto
+
+DIRECTORIO_REEXTRACCION = Path(__file__).parent.parent / ".cache" / "reextraccion"
+
+ExtractorHTML = Callable[[str], list]
+Tarea = Tuple[str, str, dict, str, str]  # clave, url, params, sha del HTML, sha del markdown
+
+
+def _fila(tarea: Tarea) -> dict:
+    clave, url, params, sha_html, _ = tarea
+    return {"clave": clave, "url": url, "params": params, "html": sha_html,
+            "hotel": None, "rechazos": 0, "error": None}
+
+
+def _reextraer_lote(directorio_archivo: Path, tareas: List[Tarea],
+                    extractor: ExtractorHTML, nombre_hotel: str) -> List[dict]:
+    """Extrae un lote de páginas del HTML dentro de un proceso del pool.
+
+    Args:
+        directorio_archivo: Directorio del archivo de páginas
+        tareas: (clave, url, params, sha del HTML, sha del markdown) de cada página
+        extractor: Función HTML -> lista de dicts de habitaciones (de nivel de módulo)
+        nombre_hotel: detalles del HotelWeb
+
+    Returns:
+        Un dict por página {clave, url, params, html, hotel, rechazos, error}
+    """
+    resultados = []
+    for tarea in tareas:
+        fila = _fila(tarea)
+        try:
+            habitaciones, rechazos = decodificar_habitaciones_web(extractor(leer_objeto(directorio_archivo, tarea[3])))
+            fila["rechazos"] = len(rechazos)
+            if habitaciones:
+                fila["hotel"] = HotelWeb(habitacion=habitaciones, detalles=nombre_hotel).model_dump()
+        except Exception as e:
+            fila["error"] = f"{type(e).__name__}: {e}"
+        resultados.append(fila)
+    return resultados
+
+
+def _reextraer_pagina_llm(directorio_archivo: Path, tarea: Tarea, llm_strategy, cache,
+                          nombre_hotel: str) -> dict:
+    """Extrae una página con el LLM desde su markdown archivado, como el scraper.
+
+    Las habitaciones descartadas por la validación no se cuentan en `rechazos`
+    (extraer_hotel_web solo las informa por consola).
+    """
+    from .utils.scraper_utils import extraer_hotel_web
+
+    fila = _fila(tarea)
+    try:
+        hotel = extraer_hotel_web(llm_strategy, tarea[1], leer_objeto(directorio_archivo, tarea[4]),
+                                  cache=cache, nombre_hotel=nombre_hotel)
+        if hotel is not None:
+            fila["hotel"] = hotel.model_dump()
+    except Exception as e:
+        fila["error"] = f"{type(e).__name__}: {e}"
+    return fila
+
+
+def _clave_combo(combo: dict) -> str:
+    return " ".join(str(combo.get("titulo", "")).lower().split())
+
+
+def diferencias_hotel(anterior: Optional[dict], nuevo: Optional[dict]) -> dict:
+    """Cambios entre dos extracciones de la misma solicitud (HotelWeb como dict).
+
+    Las habitaciones se comparan por nombre y las tarifas por título.
+
+    Returns:
+        {} si son iguales; si no, las claves que correspondan entre
+        habitaciones_agregadas, habitaciones_quitadas, combos_agregados,
+        combos_quitados, precios ({habitacion, combo, antes, despues}) y
+        otros_cambios (habitación o tarifa con otros campos distintos)
+    """
+    if anterior == nuevo:
+        return {}
+    habitaciones_antes = {h["nombre"]: h for h in (anterior or {}).get("habitacion", [])}
+    habitaciones_despues = {h["nombre"]: h for h in (nuevo or {}).get("habitacion", [])}
+
+    cambios: Dict[str, list] = {
+        "habitaciones_agregadas": [n for n in habitaciones_despues if n not in habitaciones_antes],
+        "habitaciones_quitadas": [n for n in habitaciones_antes if n not in habitaciones_despues],
+        "combos_agregados": [], "combos_quitados": [], "precios": [], "otros_cambios": [],
+    }
+    for nombre, antes in habitaciones_antes.items():
+        despues = habitaciones_despues.get(nombre)
+        if despues is None or despues == antes:
+            continue
+        if antes.get("detalles") != despues.get("detalles"):
+            cambios["otros_cambios"].append(nombre)
+        combos_antes = {_clave_combo(c): c for c in antes.get("combos", [])}
+        combos_despues = {_clave_combo(c): c for c in despues.get("combos", [])}
+        cambios["combos_agregados"] += [[nombre, c["titulo"]] for k, c in combos_despues.items()
+                                        if k not in combos_antes]
+        cambios["combos_quitados"] += [[nombre, c["titulo"]] for k, c in combos_antes.items()
+                                       if k not in combos_despues]
+        for k, combo in combos_antes.items():
+            otro = combos_despues.get(k)
+            if otro is None or otro == combo:
+                continue
+            if otro.get("precio") != combo.get("precio"):
+                cambios["precios"].append({"habitacion": nombre, "combo": combo["titulo"],
+                                           "antes": combo.get("precio"), "despues": otro.get("precio")})
+            else:
+                cambios["otros_cambios"].append(f"{nombre} / {combo['titulo']}")
+    if anterior is not None and nuevo is not None and anterior.get("detalles") != nuevo.get("detalles"):
+        cambios["otros_cambios"].append("detalles del hotel")
+    return {k: v for k, v in cambios.items() if v}
+
+
+def ultima_corrida(directorio_salida: Path, excluir: Optional[Path] = None) -> Optional[Path]:
+    """Última corrida con hoteles.jsonl en `directorio_salida` (las corridas se nombran por fecha)."""
+    corridas = sorted(p for p in Path(directorio_salida).glob("*/hoteles.jsonl") if p.parent != excluir)
+    return corridas[-1].parent if corridas else None
+
+
+def cargar_corrida(directorio_corrida: Path) -> Dict[str, dict]:
+    """Filas de hoteles.jsonl de una corrida, por clave de solicitud."""
+    filas = {}
+    with open(Path(directorio_corrida) / "hoteles.jsonl", encoding="utf-8") as f:
+        for linea in f:
+            fila = json.loads(linea)
+            filas[fila["clave"]] = fila
+    return filas
+
+
+@dataclass
+class ResumenReextraccion:
+    """Resultado de una corrida de reextracción."""
+    directorio: Path
+    anterior: Optional[Path]
+    paginas: int = 0
+    con_hotel: int = 0
+    rechazos: int = 0
+    errores: int = 0
+    con_cambios: int = 0
+    sin_anterior: int = 0
+    segundos: float = 0.0
+
+    @property
+    def paginas_por_minuto(self) -> float:
+        return self.paginas / self.segundos * 60 if self.segundos else 0.0
+
+    def resumen(self) -> str:
+        anterior = self.anterior.name if self.anterior else "ninguna"
+        return (f"Reextracción {self.directorio.name}: {self.paginas} páginas en {self.segundos:.1f}s "
+                f"({self.paginas_por_minuto:.0f}/min), {self.con_hotel} con habitaciones, "
+                f"{self.rechazos} habitaciones rechazadas, {self.errores} errores; "
+                f"contra {anterior}: {self.con_cambios} con cambios, {self.sin_anterior} nuevas")
+
+
+def reextraer_archivo(archivo: Optional[ArchivoPaginas] = None, directorio_salida: Optional[Path] = None,
+                      anterior: Optional[Path] = None, procesos: Optional[int] = None,
+                      tam_lote: int = 64, extractor: Optional[ExtractorHTML] = None,
+                      llm_strategy=None, nombre_hotel: str = "Alvear Palace Hotel") -> ResumenReextraccion:
+    """Reextrae todas las páginas del archivo y escribe una corrida nueva con su diff.
+
+    Args:
+        archivo: Archivo de páginas (default: ArchivoPaginas())
+        directorio_salida: Donde se crean las corridas (default: .cache/reextraccion)
+        anterior: Corrida contra la que se compara (default: la última en directorio_salida)
+        procesos: Procesos (o hilos, con el LLM) del pool (default: REEXTRACCION_PROCESOS
+            o la cantidad de CPUs)
+        tam_lote: Páginas por tarea del pool de procesos
+        extractor: Función HTML -> lista de dicts de habitaciones, de nivel de
+            módulo (se manda a los procesos). Default None: estrategia LLM
+            sobre el markdown archivado
+        llm_strategy: Estrategia LLM sin `extractor` (default: get_llm_strategy())
+        nombre_hotel: detalles de cada HotelWeb
+
+    Returns:
+        ResumenReextraccion con los conteos y el directorio de la corrida
+    """
+    archivo = archivo or ArchivoPaginas()
+    directorio_salida = Path(directorio_salida or DIRECTORIO_REEXTRACCION)
+    if procesos is None:
+        procesos = int(os.getenv("REEXTRACCION_PROCESOS", "0")) or os.cpu_count() or 1
+
+    directorio = directorio_salida / datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+    directorio.mkdir(parents=True)
+    anterior = anterior or ultima_corrida(directorio_salida, excluir=directorio)
+    filas_anteriores = cargar_corrida(anterior) if anterior else {}
+    resumen = ResumenReextraccion(directorio=directorio, anterior=anterior)
+
+    registros: List[RegistroPagina] = list(archivo.registros())
+    tareas = [(r.clave, r.url, r.params, r.html, r.markdown) for r in registros]
+    lotes = [tareas[i:i + tam_lote] for i in range(0, len(tareas), tam_lote)]
+
+    inicio = time.perf_counter()
+    with open(directorio / "hoteles.jsonl", "w", encoding="utf-8") as salida_hoteles, \
+            open(directorio / "diff.jsonl", "w", encoding="utf-8") as salida_diff:
+
+        def escribir(filas: Iterable[dict]) -> None:
+            for fila in filas:
+                resumen.paginas += 1
+                resumen.con_hotel += fila["hotel"] is not None
+                resumen.rechazos += fila["rechazos"]
+                resumen.errores += fila["error"] is not None
+                salida_hoteles.write(json.dumps(fila, ensure_ascii=False) + "\n")
+
+                previa = filas_anteriores.get(fila["clave"])
+                if previa is None:
+                    resumen.sin_anterior += 1
+                    continue
+                cambios = diferencias_hotel(previa["hotel"], fila["hotel"])
+                if cambios:
+                    resumen.con_cambios += 1
+                    salida_diff.write(json.dumps({"clave": fila["clave"], "mismo_html": previa["html"] == fila["html"],
+                                                  **cambios}, ensure_ascii=False) + "\n")
+
+        if extractor is None:
+            # El LLM espera la red: hilos, con la caché y el despachador compartidos.
+            # Import diferido: el modo HTML (y sus procesos) no necesita crawl4ai
+            from .utils.scraper_utils import crear_cache_extraccion, get_llm_strategy
+
+            llm_strategy = llm_strategy or get_llm_strategy()
+            cache = crear_cache_extraccion(llm_strategy)
+            with ThreadPoolExecutor(max_workers=procesos) as pool:
+                escribir(pool.map(lambda tarea: _reextraer_pagina_llm(
+                    archivo.directorio, tarea, llm_strategy, cache, nombre_hotel), tareas))
+        # Con un solo lote o un solo proceso no vale la pena levantar el pool
+        elif len(lotes) <= 1 or procesos <= 1:
+            for lote in lotes:
+                escribir(_reextraer_lote(archivo.directorio, lote, extractor, nombre_hotel))
+        else:
+            with ProcessPoolExecutor(max_workers=min(procesos, len(lotes))) as pool:
+                futuros = [pool.submit(_reextraer_lote, archivo.directorio, lote, extractor, nombre_hotel)
+                           for lote in lotes]
+                for futuro in futuros:
+                    escribir(futuro.result())
+
+    resumen.segundos = time.perf_counter() - inicio
+    return resumen
+
+
+if __name__ == "__main__":
+    resumen = reextraer_archivo(anterior=Path(sys.argv[1]) if len(sys.argv) > 1 else None)
+    print(resumen.resumen())
+    print(f"Hoteles en {resumen.directorio / 'hoteles.jsonl'}, diff en {resumen.directorio / 'diff.jsonl'}")
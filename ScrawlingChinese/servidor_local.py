@@ -0,0 +1,533 @@
+"""Servidor local que imita el motor de reservas SynXis, para pruebas de carga.
+
+Toda prueba del crawler necesitaba el motor real en BASE_URL (red, límites
+de tasa, precios que cambian). ServidorSynxisLocal sirve páginas de
+resultados con la misma estructura HTML que SynXis (thumb-cards_products,
+thumb-cards_card, rate-card...) para cualquier consulta arrive/depart/
+adult/child, sin red:
+
+- Las habitaciones salen de una FuentePaginas: FuenteFixtures (los .json
+  grabados en un directorio, p. ej. Tests/fixtures/synxis) o FuenteExcel
+  (las tarifas de un DatosExcel vigentes en la fecha de llegada).
+- Los precios llevan ruido determinista por consulta: la misma consulta
+  devuelve siempre la misma página (se puede comparar entre corridas) y
+  consultas distintas dan precios distintos.
+- Latencia configurable (base + jitter), tasa de errores 500 simulados y
+  límite de solicitudes por segundo (token bucket) que responde 429 con
+  Retry-After, como el motor real bajo carga.
+- GET /_metricas devuelve solicitudes, errores, 429 y latencias en JSON.
+
+Con SYNXIS_BASE_URL apuntando al servidor, el crawler, el pipeline y el
+despachador se prueban de punta a punta en una máquina sin red.
+
+Variables de entorno (al ejecutarlo como módulo):
+    SERVIDOR_LOCAL_PUERTO=8765
+    SERVIDOR_LOCAL_FUENTE         directorio de fixtures o ruta de un Excel (obligatoria)
+    SERVIDOR_LOCAL_LATENCIA=0.3   segundos de latencia base
+    SERVIDOR_LOCAL_JITTER=0.2     segundos extra al azar (0..jitter)
+    SERVIDOR_LOCAL_TASA_ERROR=0   fracción de respuestas 500
+    SERVIDOR_LOCAL_MAX_RPS=0      solicitudes por segundo antes de 429 (0: sin límite)
+    SERVIDOR_LOCAL_RUIDO=0.05     variación relativa máxima de los precios
+    SERVIDOR_LOCAL_PROGRESIVO_MS=0  agrega las tarjetas por JS cada estos ms
+    SERVIDOR_LOCAL_LATENCIA_RECURSOS=0  segundos de /static/app.js y app.css
+
+Ejemplo de uso:
+    SERVIDOR_LOCAL_FUENTE=Tests/fixtures/synxis python -m ScrawlingChinese.servidor_local
+    SYNXIS_BASE_URL=http://127.0.0.1:8765/ python main.py
+
+    async with ServidorSynxisLocal(FuenteFixtures(directorio), max_rps=5) as servidor:
+        url = servidor.url
+"""
+
+import asyncio
+import hashlib
+import html as _html
+import json
+import os
+import random
+import time
+from abc import ABC, abstractmethod
+from datetime import date
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from aiohttp import web
+
+from Models.hotelExcel import DatosExcel, HotelExcel
+from Models.hotelWeb import ComboPrecio, HabitacionWeb, HotelWeb
+
+PARAMS_CONSULTA = ("arrive", "depart", "adult", "child")
+
+
+# ---------------------------------------------------------------------------
+# Plantilla HTML de SynXis
+# ---------------------------------------------------------------------------
+
+AMENITIES = [
+    "Air conditioning", "Bathrobe and slippers", "Coffee/Tea maker", "Complimentary bottled water",
+    "Desk", "Flat-screen TV", "Free WiFi", "Hair dryer", "Iron/ironing board", "Minibar",
+    "Non-smoking", "Premium bedding", "Room service 24 hours", "Safe", "Telephone",
+    "Turndown service", "Hermès bath amenities", "Butler service", "Espresso machine", "Soundproofing",
+]
+
+DESCRIPCION_MARKETING = (
+    "Inspired by the French style that defines the Alvear Palace Hotel, this accommodation combines "
+    "classic décor with modern comforts, silk curtains, Limoges porcelain and an elegant marble "
+    "bathroom. Guests enjoy the personalised attention of our butlers, daily newspapers, fresh "
+    "flowers and a welcome amenity upon arrival. Located in the heart of Recoleta, steps away from "
+    "the finest boutiques, museums and restaurants of Buenos Aires."
+)
+
+POLITICA_CANCELACION = (
+    "Reservations must be cancelled 48 hours prior to arrival (3:00 PM local hotel time) to avoid a "
+    "penalty of one night's room rate plus tax. Early departures will be charged the full stay. "
+    "No-shows will be charged the full amount of the reservation. Changes to the reservation dates "
+    "are subject to availability and may result in a different rate."
+)
+
+POLITICA_GARANTIA = (
+    "A valid credit card is required to guarantee the reservation. The hotel may pre-authorise the "
+    "card prior to arrival. The card used to guarantee the reservation must be presented at check-in "
+    "together with a valid photo ID. Foreign guests are exempt from VAT (21%) upon presentation of a "
+    "foreign passport and payment with a foreign credit card."
+)
+
+CHECK_IN = "Check-in time is 3:00 PM. Check-out time is 12:00 PM. Children under 12 stay free with existing bedding."
+
+
+def formatear_precio(precio: float) -> str:
+    """Precio como lo muestra SynXis (1,234 o 1,234.50)."""
+    return f"{precio:,.0f}" if float(precio).is_integer() else f"{precio:,.2f}"
+
+
+def codigo_habitacion(nombre: str) -> str:
+    return "".join(p[0] for p in nombre.split()).upper()[:4]
+
+
+def render_combo(combo: ComboPrecio, indice: int) -> str:
+    e = _html.escape
+    return f"""
+        <div class="rate-card" data-rate-index="{indice}">
+          <h3 class="rate-card_title">{e(combo.titulo)}</h3>
+          <div class="rate-card_description"><p>{e(combo.descripcion)}</p></div>
+          <a href="#rate-details" class="rate-card_detailsLink">Rate Details</a>
+          <div class="rate-card_policies">
+            <h4>Cancellation Policy</h4><p>{POLITICA_CANCELACION}</p>
+            <h4>Guarantee Policy</h4><p>{POLITICA_GARANTIA}</p>
+            <h4>Check-in / Check-out</h4><p>{CHECK_IN}</p>
+          </div>
+          <div class="rate-card_price">
+            <span class="rate-card_currency">USD</span>
+            <span class="rate-card_amount">{formatear_precio(combo.precio)}</span>
+            <span class="rate-card_unit">Per Night</span>
+          </div>
+          <div class="rate-card_taxes">Excludes taxes and fees</div>
+          <button class="rate-card_select" type="button">Select</button>
+        </div>"""
+
+
+def render_habitacion(habitacion: HabitacionWeb) -> str:
+    e = _html.escape
+    codigo = codigo_habitacion(habitacion.nombre)
+    amenities = "".join(f"<li>{a}</li>" for a in AMENITIES)
+    combos = "".join(render_combo(c, i) for i, c in enumerate(habitacion.combos))
+    return f"""
+      <div class="thumb-cards_card" data-room-code="{codigo}">
+        <div class="thumb-cards_imageWrapper">
+          <img src="https://cdn.synxis.com/images/alvear/{codigo}_1.jpg" alt="{e(habitacion.nombre)}">
+          <img src="https://cdn.synxis.com/images/alvear/{codigo}_2.jpg" alt="{e(habitacion.nombre)} bathroom">
+          <button class="thumb-cards_gallery" type="button">1 / 6</button>
+        </div>
+        <div class="thumb-cards_details">
+          <h2 class="thumb-cards_title">{e(habitacion.nombre)}</h2>
+          <div class="thumb-cards_description"><p>{e(habitacion.detalles or "")}</p><p>{DESCRIPCION_MARKETING}</p></div>
+          <a href="#room-details" class="thumb-cards_roomDetailsLink">Room Details</a>
+          <div class="thumb-cards_amenities"><h3>Room Amenities</h3><ul>{amenities}</ul></div>
+        </div>
+        <div class="thumb-cards_rates">{combos}
+          <a href="#all-rates" class="thumb-cards_allRates">View all rates</a>
+        </div>
+      </div>"""
+
+
+JS_TARJETAS_PROGRESIVAS = """  <template id="tarjetas-pendientes">{tarjetas}</template>
+  <script>
+    (function () {{
+      var pendientes = document.getElementById("tarjetas-pendientes").content;
+      var lista = document.querySelector(".thumb-cards_cardList");
+      var timer = setInterval(function () {{
+        var tarjeta = pendientes.querySelector(".thumb-cards_card");
+        if (!tarjeta) {{ clearInterval(timer); return; }}
+        lista.appendChild(tarjeta);
+      }}, {ms});
+    }})();
+  </script>
+"""
+
+
+def render_pagina(hotel: HotelWeb, params: Optional[dict] = None, progresivo_ms: int = 0) -> str:
+    """Página de resultados de SynXis con las habitaciones de `hotel`.
+
+    Args:
+        hotel: Habitaciones y tarifas a mostrar (detalles = nombre del hotel)
+        params: Parámetros de la búsqueda (arrive, depart, adult, child)
+        progresivo_ms: Si es > 0, las tarjetas no vienen en el HTML: un script
+            las agrega de a una cada `progresivo_ms` ms, como la app de SynXis
+    """
+    e = _html.escape
+    params = params or {}
+    habitaciones = "".join(render_habitacion(h) for h in hotel.habitacion)
+    scripts = '  <script src="/static/app.js"></script>'
+    if progresivo_ms:
+        scripts = JS_TARJETAS_PROGRESIVAS.format(tarjetas=habitaciones, ms=progresivo_ms) + scripts
+        habitaciones = ""
+    return f"""<!DOCTYPE html>
+<html lang="en-US">
+<head>
+  <meta charset="utf-8">
+  <title>{e(hotel.detalles)} - Select a Room</title>
+  <script async src="https://www.googletagmanager.com/gtm.js?id=GTM-SYNXIS"></script>
+  <script async src="https://www.google-analytics.com/analytics.js"></script>
+  <link rel="stylesheet" href="https://fonts.googleapis.com/css2?family=Lato:wght@400;700">
+  <link rel="stylesheet" href="/static/app.css">
+</head>
+<body>
+  <header class="app_header">
+    <img class="app_logo" src="https://cdn.synxis.com/images/alvear/logo.png" alt="{e(hotel.detalles)}">
+    <nav><a href="#">Rooms</a> <a href="#">Offers</a> <a href="#">My Reservations</a> <a href="#">English (US)</a> <a href="#">USD</a></nav>
+  </header>
+  <div class="app_row">
+    <div class="search-summary">
+      <span>Arrive {e(str(params.get("arrive", "")))}</span> <span>Depart {e(str(params.get("depart", "")))}</span>
+      <span>{e(str(params.get("adult", 2)))} Adults, {e(str(params.get("child", 0)))} Children</span>
+    </div>
+    <div class="thumb-cards_products">
+      <div class="app_col-sm-12 app_col-md-8 app_col-lg-8">
+        <div class="thumb-cards_cardList">{habitaciones}
+        </div>
+      </div>
+      <div class="app_col-sm-12 app_col-md-4 app_col-lg-4">
+        <div class="cart-summary">Your Stay: no rooms selected</div>
+      </div>
+    </div>
+  </div>
+  <footer class="app_footer">
+    <p>Avenida Alvear 1891, Buenos Aires, Argentina</p>
+    <p>Powered by SynXis Booking Engine. Privacy Policy. Terms of Use. Cookie Preferences.</p>
+  </footer>
+{scripts}
+</body>
+</html>
+"""
+
+
+# ---------------------------------------------------------------------------
+# Fuentes de habitaciones
+# ---------------------------------------------------------------------------
+
+def clave_consulta(params: dict) -> str:
+    """Identidad de una búsqueda: fechas y ocupación (el resto de la query no cambia la página)."""
+    return "|".join(str(params.get(p, "")) for p in PARAMS_CONSULTA)
+
+
+def generador_consulta(params: dict, semilla: int = 0) -> random.Random:
+    """Random determinista para una búsqueda: misma consulta, mismo ruido."""
+    digest = hashlib.blake2b(f"{semilla}|{clave_consulta(params)}".encode("utf-8"), digest_size=8).digest()
+    return random.Random(int.from_bytes(digest, "big"))
+
+
+def con_ruido(hotel: HotelWeb, rng: random.Random, ruido: float) -> HotelWeb:
+    """Copia de `hotel` con cada precio variado hasta ±ruido (relativo)."""
+    if not ruido:
+        return hotel
+    return HotelWeb(detalles=hotel.detalles, habitacion=[
+        HabitacionWeb(nombre=h.nombre, detalles=h.detalles, combos=[
+            ComboPrecio(titulo=c.titulo, descripcion=c.descripcion,
+                        precio=round(c.precio * (1 + rng.uniform(-ruido, ruido)), 2))
+            for c in h.combos
+        ])
+        for h in hotel.habitacion
+    ])
+
+
+class FuentePaginas(ABC):
+    """Origen de las habitaciones que muestra el servidor para una búsqueda."""
+
+    @abstractmethod
+    def hotel_para(self, params: dict) -> HotelWeb:
+        """Hotel (con sus habitaciones) a mostrar para los parámetros de la búsqueda."""
+
+
+class FuenteFixtures(FuentePaginas):
+    """Habitaciones grabadas (los .json de un directorio de fixtures).
+
+    Cada búsqueda muestra uno de los fixtures, elegido de forma determinista
+    por la consulta.
+    """
+
+    def __init__(self, directorio: Path, nombre_hotel: str = "Alvear Palace Hotel"):
+        directorio = Path(directorio)
+        self.hoteles: List[HotelWeb] = [
+            HotelWeb(habitacion=json.loads(ruta.read_text(encoding="utf-8")), detalles=nombre_hotel)
+            for ruta in sorted(directorio.glob("*.json"))
+        ]
+        if not self.hoteles:
+            raise ValueError(f"No hay fixtures .json en {directorio}")
+
+    def hotel_para(self, params: dict) -> HotelWeb:
+        digest = hashlib.blake2b(clave_consulta(params).encode("utf-8"), digest_size=4).digest()
+        return self.hoteles[int.from_bytes(digest, "big") % len(self.hoteles)]
+
+
+class FuenteExcel(FuentePaginas):
+    """Tarifas de un DatosExcel vigentes en la fecha de llegada de la búsqueda.
+
+    Cada habitación del Excel con precio numérico en el periodo que contiene
+    `arrive` es una habitación web con una tarifa (el tipo de habitación va
+    en los detalles); fuera de todo periodo la página no tiene habitaciones.
+    """
+
+    def __init__(self, datos: DatosExcel, nombre_hotel: Optional[str] = None):
+        """Inicializa la fuente.
+
+        Args:
+            datos: Datos extraídos del Excel
+            nombre_hotel: Hotel a servir (default: el primero del Excel)
+        """
+        hoteles = datos.hoteles
+        if nombre_hotel is not None:
+            hoteles = [h for h in hoteles if h.nombre == nombre_hotel]
+        if not hoteles:
+            raise ValueError(f"El Excel no tiene el hotel {nombre_hotel!r}")
+        self.hotel: HotelExcel = hoteles[0]
+
+    def hotel_para(self, params: dict) -> HotelWeb:
+        try:
+            llegada = date.fromisoformat(str(params.get("arrive", "")))
+        except ValueError:
+            llegada = None
+
+        habitaciones: Dict[str, HabitacionWeb] = {}
+        candidatas = [(t.nombre, h) for t in self.hotel.tipos for h in t.habitaciones]
+        candidatas += [(None, h) for h in self.hotel.habitaciones_directas]
+        for tipo, habitacion in candidatas:
+            if not isinstance(habitacion.precio, float) or llegada is None:
+                continue
+            vigente = any(
+                (p := self.hotel.periodo_por_id(pid)) is not None and p.fecha_inicio <= llegada <= p.fecha_fin
+                for pid in habitacion.periodo_ids
+            )
+            if not vigente:
+                continue
+            nombre = habitacion.nombre.title()
+            web = habitaciones.setdefault(nombre, HabitacionWeb(nombre=nombre, detalles=tipo, combos=[]))
+            web.combos.append(ComboPrecio(titulo="Best Available Rate", descripcion="Breakfast included.",
+                                          precio=habitacion.precio))
+        return HotelWeb(habitacion=list(habitaciones.values()), detalles=self.hotel.nombre)
+
+
+# ---------------------------------------------------------------------------
+# Servidor
+# ---------------------------------------------------------------------------
+
+class LimiteTasa:
+    """Token bucket: `por_segundo` solicitudes sostenidas, ráfagas de hasta `rafaga`."""
+
+    def __init__(self, por_segundo: float, rafaga: Optional[int] = None):
+        self.por_segundo = por_segundo
+        self.rafaga = rafaga or max(1, int(por_segundo))
+        self._fichas = float(self.rafaga)
+        self._ultimo = time.monotonic()
+
+    def tomar(self) -> Optional[float]:
+        """Consume una ficha; si no hay, devuelve los segundos hasta la próxima."""
+        ahora = time.monotonic()
+        self._fichas = min(self.rafaga, self._fichas + (ahora - self._ultimo) * self.por_segundo)
+        self._ultimo = ahora
+        if self._fichas >= 1:
+            self._fichas -= 1
+            return None
+        return (1 - self._fichas) / self.por_segundo
+
+
+class ServidorSynxisLocal:
+    """Servidor HTTP (aiohttp) con páginas de resultados estilo SynXis."""
+
+    def __init__(self, fuente: FuentePaginas, host: str = "127.0.0.1", puerto: int = 0,
+                 latencia: float = 0.0, jitter: float = 0.0, tasa_error: float = 0.0,
+                 max_rps: float = 0.0, rafaga: Optional[int] = None, ruido: float = 0.05,
+                 semilla: int = 0, progresivo_ms: int = 0, latencia_recursos: float = 0.0):
+        """Inicializa el servidor (no escucha hasta iniciar()).
+
+        Args:
+            fuente: Origen de las habitaciones
+            host: Interfaz donde escuchar
+            puerto: Puerto (0: uno libre)
+            latencia: Segundos de latencia base por página
+            jitter: Segundos extra al azar por página (0..jitter)
+            tasa_error: Fracción de solicitudes que responden 500
+            max_rps: Solicitudes por segundo antes de responder 429 (0: sin límite)
+            rafaga: Solicitudes seguidas admitidas antes de limitar (default: max_rps)
+            ruido: Variación relativa máxima de los precios por consulta
+            semilla: Semilla del ruido de precios y de los errores
+            progresivo_ms: Agregar las tarjetas por JS de a una cada estos ms (0: en el HTML)
+            latencia_recursos: Segundos que tardan /static/app.js y /static/app.css
+                (mantienen la red ocupada, como los scripts de SynXis)
+        """
+        self.fuente = fuente
+        self.host = host
+        self.puerto = puerto
+        self.latencia = latencia
+        self.jitter = jitter
+        self.tasa_error = tasa_error
+        self.limite = LimiteTasa(max_rps, rafaga) if max_rps else None
+        self.ruido = ruido
+        self.semilla = semilla
+        self.progresivo_ms = progresivo_ms
+        self.latencia_recursos = latencia_recursos
+        self._azar = random.Random(semilla)
+        self._runner: Optional[web.AppRunner] = None
+
+        self.solicitudes = 0
+        self.servidas = 0
+        self.errores = 0
+        self.limitadas = 0
+        self.invalidas = 0
+        self.latencias: List[float] = []
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.puerto}/"
+
+    def _aplicacion(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get("/_metricas", self._metricas)
+        app.router.add_get("/static/{archivo}", self._estatico)
+        app.router.add_get("/{ruta:.*}", self._pagina)
+        return app
+
+    async def iniciar(self) -> str:
+        """Empieza a escuchar y devuelve la URL base."""
+        self._runner = web.AppRunner(self._aplicacion(), access_log=None)
+        await self._runner.setup()
+        sitio = web.TCPSite(self._runner, self.host, self.puerto)
+        await sitio.start()
+        self.puerto = self._runner.addresses[0][1]
+        return self.url
+
+    async def detener(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self):
+        await self.iniciar()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.detener()
+        return False
+
+    async def _pagina(self, request: web.Request) -> web.Response:
+        self.solicitudes += 1
+        if self.limite is not None:
+            espera = self.limite.tomar()
+            if espera is not None:
+                self.limitadas += 1
+                return web.Response(status=429, text="Too Many Requests",
+                                    headers={"Retry-After": f"{max(1, round(espera))}"})
+
+        params = dict(request.query)
+        if not all(params.get(p) for p in ("arrive", "depart")):
+            self.invalidas += 1
+            return web.Response(status=400, text="arrive y depart son obligatorios")
+
+        inicio = time.perf_counter()
+        demora = self.latencia + (self._azar.uniform(0, self.jitter) if self.jitter else 0.0)
+        if demora:
+            await asyncio.sleep(demora)
+        if self.tasa_error and self._azar.random() < self.tasa_error:
+            self.errores += 1
+            return web.Response(status=500, text="Internal Server Error")
+
+        hotel = con_ruido(self.fuente.hotel_para(params), generador_consulta(params, self.semilla), self.ruido)
+        cuerpo = render_pagina(hotel, params, self.progresivo_ms)
+        self.servidas += 1
+        self.latencias.append(time.perf_counter() - inicio)
+        return web.Response(text=cuerpo, content_type="text/html")
+
+    async def _estatico(self, request: web.Request) -> web.Response:
+        if self.latencia_recursos:
+            await asyncio.sleep(self.latencia_recursos)
+        tipo = "text/css" if request.match_info["archivo"].endswith(".css") else "application/javascript"
+        return web.Response(text="", content_type=tipo)
+
+    def metricas(self) -> dict:
+        """Solicitudes atendidas, errores simulados, 429 y latencias de las páginas servidas."""
+        latencias = sorted(self.latencias)
+
+        def percentil(p):
+            return round(latencias[min(len(latencias) - 1, int(p * len(latencias)))], 3) if latencias else 0.0
+
+        return {
+            "solicitudes": self.solicitudes,
+            "servidas": self.servidas,
+            "errores": self.errores,
+            "limitadas": self.limitadas,
+            "invalidas": self.invalidas,
+            "latencia_p50": percentil(0.5),
+            "latencia_p95": percentil(0.95),
+        }
+
+    async def _metricas(self, request: web.Request) -> web.Response:
+        return web.json_response(self.metricas())
+
+    def resumen(self) -> str:
+        m = self.metricas()
+        return (f"Servidor local: {m['solicitudes']} solicitudes, {m['servidas']} páginas, "
+                f"{m['errores']} errores 500, {m['limitadas']} x 429, "
+                f"latencia p50 {m['latencia_p50']:.3f}s p95 {m['latencia_p95']:.3f}s")
+
+
+def fuente_desde_entorno() -> FuentePaginas:
+    """FuenteExcel si SERVIDOR_LOCAL_FUENTE es un Excel; si no, FuenteFixtures.
+
+    Raises:
+        ValueError: Si SERVIDOR_LOCAL_FUENTE no está definida
+    """
+    origen = os.getenv("SERVIDOR_LOCAL_FUENTE", "")
+    if not origen:
+        raise ValueError("SERVIDOR_LOCAL_FUENTE no está definida: debe ser un directorio de fixtures .json "
+                         "o la ruta de un Excel (p. ej. SERVIDOR_LOCAL_FUENTE=Tests/fixtures/synxis)")
+    if origen.lower().endswith((".xlsx", ".xlsm")):
+        from ExtractorDatos.cache_excel import cargar_excel_cacheado
+        return FuenteExcel(cargar_excel_cacheado(origen))
+    return FuenteFixtures(Path(origen))
+
+
+async def _servir():
+    servidor = ServidorSynxisLocal(
+        fuente_desde_entorno(),
+        puerto=int(os.getenv("SERVIDOR_LOCAL_PUERTO", "8765")),
+        latencia=float(os.getenv("SERVIDOR_LOCAL_LATENCIA", "0.3")),
+        jitter=float(os.getenv("SERVIDOR_LOCAL_JITTER", "0.2")),
+        tasa_error=float(os.getenv("SERVIDOR_LOCAL_TASA_ERROR", "0")),
+        max_rps=float(os.getenv("SERVIDOR_LOCAL_MAX_RPS", "0")),
+        ruido=float(os.getenv("SERVIDOR_LOCAL_RUIDO", "0.05")),
+        progresivo_ms=int(os.getenv("SERVIDOR_LOCAL_PROGRESIVO_MS", "0")),
+        latencia_recursos=float(os.getenv("SERVIDOR_LOCAL_LATENCIA_RECURSOS", "0")),
+    )
+    async with servidor:
+        print(f"SynXis local en {servidor.url} (SYNXIS_BASE_URL={servidor.url}); Ctrl+C para terminar")
+        try:
+            while True:
+                await asyncio.sleep(3600)
+        finally:
+            print(servidor.resumen())
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(_servir())
+    except KeyboardInterrupt:
+        pass
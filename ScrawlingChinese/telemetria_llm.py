@@ -0,0 +1,254 @@
+"""Telemetría de las llamadas al LLM de extracción.
+
+Cada llamada al proveedor (un bloque del markdown de una página) se registra
+como una LlamadaLLM: proveedor, tokens de prompt y de respuesta, latencia,
+reintentos y error. Las llamadas se agregan por comparación (etiqueta puesta
+con TelemetriaLLM.comparacion) y por corrida (el proceso), y se exportan a
+.cache/metricas_llm:
+- llamadas_<corrida>.jsonl: una línea por llamada, escrita al registrarla.
+- resumen_<corrida>.json: agregados por corrida y por comparación (exportar()).
+
+La comparación y el intento de la página viajan en contextvars, así llegan a
+los hilos de extracción del pipeline (asyncio.to_thread copia el contexto).
+Los hilos propios de crawl4ai no lo copian: quien reparte el trabajo toma
+contexto_llamadas() y lo pasa a registrar().
+
+Variables de entorno:
+    METRICAS_LLM=0                no escribe los archivos de métricas
+
+Ejemplo de uso:
+    telemetria = telemetria_corrida()
+    with telemetria.comparacion("Palace Classic 2026-01-10/2026-01-15"):
+        hotel = await crawl_alvear(...)
+    print(telemetria.resumen())
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+DIRECTORIO_METRICAS = Path(__file__).parent.parent / ".cache" / "metricas_llm"
+
+_COMPARACION: ContextVar[Optional[str]] = ContextVar("comparacion_llm", default=None)
+_INTENTO: ContextVar[int] = ContextVar("intento_llm", default=1)
+
+
+def contexto_llamadas() -> Tuple[Optional[str], int]:
+    """(comparación, intento de la página) del contexto actual."""
+    return _COMPARACION.get(), _INTENTO.get()
+
+
+@dataclass
+class LlamadaLLM:
+    """Una llamada al proveedor LLM (un bloque de una página)."""
+    proveedor: str
+    url: str
+    bloque: int
+    tokens_prompt: int
+    tokens_completion: int
+    segundos: float
+    reintentos: int = 0
+    error: Optional[str] = None
+    comparacion: Optional[str] = None
+    momento: str = field(default_factory=lambda: datetime.now().isoformat(timespec="seconds"))
+
+    @property
+    def tokens_totales(self) -> int:
+        return self.tokens_prompt + self.tokens_completion
+
+
+def _percentil(valores: List[float], p: float) -> float:
+    if not valores:
+        return 0.0
+    ordenados = sorted(valores)
+    return ordenados[min(int(p * len(ordenados)), len(ordenados) - 1)]
+
+
+@dataclass
+class AgregadoLLM:
+    """Totales de un conjunto de llamadas (una comparación o la corrida)."""
+    llamadas: int = 0
+    errores: int = 0
+    reintentos: int = 0
+    tokens_prompt: int = 0
+    tokens_completion: int = 0
+    segundos: List[float] = field(default_factory=list)
+    proveedores: Dict[str, int] = field(default_factory=dict)
+
+    def agregar(self, llamada: LlamadaLLM) -> None:
+        self.llamadas += 1
+        self.errores += llamada.error is not None
+        self.reintentos += llamada.reintentos
+        self.tokens_prompt += llamada.tokens_prompt
+        self.tokens_completion += llamada.tokens_completion
+        self.segundos.append(llamada.segundos)
+        self.proveedores[llamada.proveedor] = self.proveedores.get(llamada.proveedor, 0) + 1
+
+    @property
+    def tokens_totales(self) -> int:
+        return self.tokens_prompt + self.tokens_completion
+
+    def como_dict(self) -> Dict:
+        return {
+            "llamadas": self.llamadas,
+            "errores": self.errores,
+            "reintentos": self.reintentos,
+            "tokens_prompt": self.tokens_prompt,
+            "tokens_completion": self.tokens_completion,
+            "tokens_totales": self.tokens_totales,
+            "segundos_total": round(sum(self.segundos), 3),
+            "latencia_p50": round(_percentil(self.segundos, 0.50), 3),
+            "latencia_p95": round(_percentil(self.segundos, 0.95), 3),
+            "latencia_max": round(max(self.segundos, default=0.0), 3),
+            "proveedores": dict(self.proveedores),
+        }
+
+    def resumen(self) -> str:
+        d = self.como_dict()
+        return (f"{d['llamadas']} llamadas ({d['errores']} con error, {d['reintentos']} reintentos), "
+                f"{d['tokens_prompt']} tokens prompt + {d['tokens_completion']} respuesta, "
+                f"{d['segundos_total']:.1f}s en LLM (p50 {d['latencia_p50']:.2f}s, p95 {d['latencia_p95']:.2f}s)")
+
+
+class TelemetriaLLM:
+    """Registro thread-safe de llamadas LLM de una corrida."""
+
+    def __init__(self, corrida: Optional[str] = None, directorio: Optional[Path] = None,
+                 exportar: Optional[bool] = None):
+        """Inicializa la telemetría.
+
+        Args:
+            corrida: Identificador de la corrida (default: fecha y hora de inicio)
+            directorio: Directorio de las métricas (default: .cache/metricas_llm en la raíz)
+            exportar: Escribir los archivos de métricas (default: salvo METRICAS_LLM=0)
+        """
+        self.corrida = corrida or datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.directorio = Path(directorio) if directorio else DIRECTORIO_METRICAS
+        self.exportar_archivos = (os.getenv("METRICAS_LLM", "1") != "0") if exportar is None else exportar
+        self.llamadas: List[LlamadaLLM] = []
+        self._lock = threading.Lock()
+        self._inicio = time.perf_counter()
+
+    @property
+    def ruta_llamadas(self) -> Path:
+        return self.directorio / f"llamadas_{self.corrida}.jsonl"
+
+    @property
+    def ruta_resumen(self) -> Path:
+        return self.directorio / f"resumen_{self.corrida}.json"
+
+    @contextmanager
+    def comparacion(self, etiqueta: str):
+        """Etiqueta con `etiqueta` las llamadas hechas dentro del bloque."""
+        token = _COMPARACION.set(etiqueta)
+        try:
+            yield
+        finally:
+            _COMPARACION.reset(token)
+
+    @staticmethod
+    @contextmanager
+    def intento(numero: int):
+        """Marca las llamadas del bloque como del intento `numero` de la página."""
+        token = _INTENTO.set(numero)
+        try:
+            yield
+        finally:
+            _INTENTO.reset(token)
+
+    def registrar(self, proveedor: str, url: str, bloque: int, tokens_prompt: int,
+                  tokens_completion: int, segundos: float, reintentos: int = 0,
+                  error: Optional[str] = None,
+                  contexto: Optional[Tuple[Optional[str], int]] = None) -> LlamadaLLM:
+        """Registra una llamada.
+
+        La comparación y el intento de la página salen de `contexto` (tomado con
+        contexto_llamadas() en el hilo que repartió el trabajo) o del contexto
+        actual. Los reintentos de la llamada se suman a los intentos previos de
+        la página.
+        """
+        comparacion, intento = contexto or contexto_llamadas()
+        llamada = LlamadaLLM(
+            proveedor=proveedor, url=url, bloque=bloque,
+            tokens_prompt=tokens_prompt, tokens_completion=tokens_completion,
+            segundos=round(segundos, 4), reintentos=reintentos + intento - 1,
+            error=error, comparacion=comparacion,
+        )
+        with self._lock:
+            self.llamadas.append(llamada)
+            if self.exportar_archivos:
+                self._escribir_llamada(llamada)
+        return llamada
+
+    def _escribir_llamada(self, llamada: LlamadaLLM) -> None:
+        try:
+            self.directorio.mkdir(parents=True, exist_ok=True)
+            with open(self.ruta_llamadas, "a", encoding="utf-8") as f:
+                f.write(json.dumps(asdict(llamada), ensure_ascii=False) + "\n")
+        except OSError as e:
+            print(f"[WARNING] No se pudo escribir la métrica LLM en {self.ruta_llamadas}: {e}")
+            self.exportar_archivos = False
+
+    def total(self) -> AgregadoLLM:
+        """Agregado de todas las llamadas de la corrida."""
+        agregado = AgregadoLLM()
+        with self._lock:
+            for llamada in self.llamadas:
+                agregado.agregar(llamada)
+        return agregado
+
+    def por_comparacion(self) -> Dict[str, AgregadoLLM]:
+        """Agregados por etiqueta de comparación ("sin comparación" si no hay)."""
+        agregados: Dict[str, AgregadoLLM] = {}
+        with self._lock:
+            for llamada in self.llamadas:
+                etiqueta = llamada.comparacion or "sin comparación"
+                agregados.setdefault(etiqueta, AgregadoLLM()).agregar(llamada)
+        return agregados
+
+    def exportar(self) -> Optional[Path]:
+        """Escribe resumen_<corrida>.json con los agregados; devuelve la ruta."""
+        if not self.exportar_archivos:
+            return None
+        datos = {
+            "corrida": self.corrida,
+            "segundos_corrida": round(time.perf_counter() - self._inicio, 3),
+            "total": self.total().como_dict(),
+            "por_comparacion": {k: v.como_dict() for k, v in self.por_comparacion().items()},
+        }
+        try:
+            self.directorio.mkdir(parents=True, exist_ok=True)
+            temporal = self.ruta_resumen.with_suffix(".tmp")
+            temporal.write_text(json.dumps(datos, ensure_ascii=False, indent=2), encoding="utf-8")
+            os.replace(temporal, self.ruta_resumen)
+        except OSError as e:
+            print(f"[WARNING] No se pudo exportar el resumen LLM en {self.ruta_resumen}: {e}")
+            return None
+        return self.ruta_resumen
+
+    def resumen(self, comparacion: Optional[str] = None) -> str:
+        """Resumen legible de la corrida o de una comparación."""
+        if comparacion is not None:
+            agregado = self.por_comparacion().get(comparacion, AgregadoLLM())
+            return f"LLM [{comparacion}]: {agregado.resumen()}"
+        return f"LLM corrida {self.corrida}: {self.total().resumen()}"
+
+
+_telemetria: Optional[TelemetriaLLM] = None
+_lock_telemetria = threading.Lock()
+
+
+def telemetria_corrida() -> TelemetriaLLM:
+    """Telemetría de la corrida actual (una por proceso)."""
+    global _telemetria
+    with _lock_telemetria:
+        if _telemetria is None:
+            _telemetria = TelemetriaLLM()
+        return _telemetria
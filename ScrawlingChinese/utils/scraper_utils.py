@@ -2,7 +2,8 @@ import json
 import os
 from typing import List, Set, Tuple
 from urllib.parse import urlencode
-import asyncio
+import threading
+import time
 from typing import Optional
 
 from crawl4ai import (
@@ -11,20 +12,61 @@ from crawl4ai import (
     CacheMode,
     CrawlerRunConfig,
     LLMExtractionStrategy,
+    RegexChunking,
 )
+from crawl4ai.models import TokenUsage
+from crawl4ai.prompts import (
+    PROMPT_EXTRACT_BLOCKS,
+    PROMPT_EXTRACT_BLOCKS_WITH_INSTRUCTION,
+    PROMPT_EXTRACT_SCHEMA_WITH_INSTRUCTION,
+)
+from crawl4ai.utils import (
+    escape_json_string,
+    extract_xml_data,
+    sanitize_html,
+    sanitize_input_encode,
+    split_and_parse_json_objects,
+)
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from Models.hotelExcel import *
 from Models.hotelWeb import *
+from ..pipeline import PaginaObtenida
+from ..archivo_paginas import (
+    ArchivoPaginas,
+    CrawlerGrabador,
+    CrawlerReproductor,
+    modo_archivo,
+    texto_markdown,
+)
+from ..bloqueo_recursos import BloqueadorRecursos
+from ..espera_pagina import EstrategiaEspera, MedidorEspera, espera_desde_entorno
+from ..perfiles_crawler import PerfilCrawler
+from ..cache_extraccion import CacheExtraccion, cache_habilitada, version_extraccion
+from ..poda_contenido import podar_markdown, poda_habilitada
+from ..telemetria_llm import TelemetriaLLM, contexto_llamadas, telemetria_corrida
+from ..despachador_llm import DespachadorLLM, ErrorDespachoLLM, despachador_compartido
+from ..extraccion_por_tarjetas import (
+    extraccion_por_tarjetas_habilitada,
+    fusionar_habitaciones,
+    trozos_de_pagina,
+)
 
 
 
-def get_browser_config() -> BrowserConfig:
+def get_browser_config(perfil: Optional[PerfilCrawler] = None) -> BrowserConfig:
     """
     Returns the browser configuration for the crawler.
 
+    Args:
+        perfil: Crawler profile (headless, logging, light mode); None keeps
+            the visible, verbose browser
+
     Returns:
         BrowserConfig: The configuration settings for the browser.
     """
+    if perfil is not None:
+        return perfil.browser_config()
     # https://docs.crawl4ai.com/core/browser-crawler-config/
     return BrowserConfig(
         browser_type="chromium",  # Type of browser to simulate
@@ -33,16 +75,185 @@ def get_browser_config() -> BrowserConfig:
     )
 
 
-def get_llm_strategy() -> LLMExtractionStrategy:
+def crear_crawler(bloqueador: Optional[BloqueadorRecursos] = None,
+                  medidor_espera: Optional[MedidorEspera] = None,
+                  perfil: Optional[PerfilCrawler] = None,
+                  archivo: Optional[ArchivoPaginas] = None):
+    """Crawler según ARCHIVO_PAGINAS (o el perfil): normal, grabando en el archivo o reproduciendo desde él.
+
+    Args:
+        bloqueador: Política de bloqueo de recursos y métricas de carga para
+            las páginas del navegador (no aplica al reproducir)
+        medidor_espera: Registra el tiempo hasta página lista (no aplica al reproducir)
+        perfil: Perfil del crawler (navegador y modo de archivo); ARCHIVO_PAGINAS
+            tiene prioridad sobre perfil.archivo
+        archivo: Archivo de páginas (default: ArchivoPaginas())
+
+    Returns:
+        AsyncWebCrawler, CrawlerGrabador o CrawlerReproductor (los tres se usan
+        con `async with` y `await crawler.arun(url=..., config=...)`)
+    """
+    modo = modo_archivo() or (perfil.archivo if perfil is not None else "")
+    if archivo is None and modo:
+        archivo = ArchivoPaginas()
+    if modo == "reproducir":
+        print("Modo reproducción: páginas desde el archivo, sin navegador")
+        return CrawlerReproductor(archivo)
+    crawler = AsyncWebCrawler(config=get_browser_config(perfil))
+    if bloqueador is not None:
+        bloqueador.instalar(crawler)
+    if medidor_espera is not None:
+        medidor_espera.instalar(crawler)
+    if modo == "grabar":
+        return CrawlerGrabador(crawler, archivo)
+    return crawler
+
+
+class LLMExtractionStrategyMedida(LLMExtractionStrategy):
+    """LLMExtractionStrategy que llama al LLM a través del despachador y registra cada llamada.
+
+    Arma el prompt y parsea la respuesta igual que LLMExtractionStrategy.extract,
+    pero la llamada pasa por DespachadorLLM (cupos por proveedor, 429 con
+    backoff, failover) en lugar de perform_completion_with_backoff. Cada bloque
+    queda en la telemetría: proveedor que respondió, tokens, latencia,
+    reintentos, error y la comparación/intento de quien llamó a run.
+
+    _prompt y _bloques copian LLMExtractionStrategy.extract de crawl4ai 0.4.247
+    (Crawl4AI==0.4.247 en requirements.txt), con sus prompts y helpers. Al
+    actualizar crawl4ai, revisar que sigan iguales: Tests/test_estrategia_llm.py
+    compara ambos con los de la clase base.
+    """
+
+    def __init__(self, *args, telemetria: Optional[TelemetriaLLM] = None,
+                 despachador: Optional[DespachadorLLM] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._lock_usos = threading.Lock()
+        self.telemetria = telemetria or telemetria_corrida()
+        self.despachador = despachador or despachador_compartido()
+
+    def _prompt(self, url: str, html: str) -> str:
+        # Copia del armado del prompt de LLMExtractionStrategy.extract (crawl4ai 0.4.247)
+        valores = {"URL": url, "HTML": escape_json_string(sanitize_html(html))}
+        prompt = PROMPT_EXTRACT_BLOCKS
+        if self.instruction:
+            valores["REQUEST"] = self.instruction
+            prompt = PROMPT_EXTRACT_BLOCKS_WITH_INSTRUCTION
+        if self.extract_type == "schema" and self.schema:
+            valores["SCHEMA"] = json.dumps(self.schema, indent=2)
+            prompt = PROMPT_EXTRACT_SCHEMA_WITH_INSTRUCTION
+        for variable, valor in valores.items():
+            prompt = prompt.replace("{" + variable + "}", valor)
+        return prompt
+
+    def _registrar_uso(self, respuesta) -> TokenUsage:
+        uso = TokenUsage(
+            completion_tokens=respuesta.usage.completion_tokens,
+            prompt_tokens=respuesta.usage.prompt_tokens,
+            total_tokens=respuesta.usage.total_tokens,
+        )
+        with self._lock_usos:
+            self.usages.append(uso)
+            self.total_usage.completion_tokens += uso.completion_tokens
+            self.total_usage.prompt_tokens += uso.prompt_tokens
+            self.total_usage.total_tokens += uso.total_tokens
+        return uso
+
+    @staticmethod
+    def _bloques(contenido: str) -> list:
+        # Copia del parseo de la respuesta de LLMExtractionStrategy.extract (crawl4ai 0.4.247)
+        try:
+            bloques = json.loads(extract_xml_data(["blocks"], contenido)["blocks"])
+            for bloque in bloques:
+                bloque["error"] = False
+        except Exception:
+            bloques, no_parseado = split_and_parse_json_objects(contenido)
+            if no_parseado:
+                bloques.append({"index": 0, "error": True, "tags": ["error"], "content": no_parseado})
+        return bloques
+
+    def extract(self, url: str, ix: int, html: str,
+                contexto: Optional[Tuple[Optional[str], int]] = None) -> list:
+        """Extrae un bloque y lo registra con `contexto` (comparación, intento) o el del hilo actual."""
+        if self.verbose:
+            print(f"[LOG] Call LLM for {url} - block index: {ix}")
+        inicio = time.perf_counter()
+        try:
+            despacho = self.despachador.completar(self._prompt(url, html), **(self.extra_args or {}))
+        except ErrorDespachoLLM as e:
+            self.telemetria.registrar(self.provider, url, ix, 0, 0, time.perf_counter() - inicio,
+                                      error=str(e), contexto=contexto)
+            raise
+        segundos = time.perf_counter() - inicio
+
+        uso = self._registrar_uso(despacho.respuesta)
+        bloques = self._bloques(despacho.respuesta.choices[0].message.content)
+        no_parseado = any(b.get("error") for b in bloques if isinstance(b, dict))
+        self.telemetria.registrar(
+            despacho.proveedor.nombre, url, ix, uso.prompt_tokens, uso.completion_tokens, segundos,
+            reintentos=despacho.reintentos,
+            error="respuesta no parseable" if no_parseado else None,
+            contexto=contexto,
+        )
+        if self.verbose:
+            print("[LOG] Extracted", len(bloques), "blocks from URL:", url, "block index:", ix)
+        return bloques
+
+    def run(self, url: str, sections: List[str]) -> list:
+        """Extrae los bloques en paralelo; el despachador limita la concurrencia real.
+
+        Reemplaza el modo secuencial con pausa de 0.5s que crawl4ai usa para groq:
+        los 429 los absorbe el despachador. Los bloques vuelven en orden.
+        """
+        bloques = self._merge(sections, self.chunk_token_threshold,
+                              overlap=int(self.chunk_token_threshold * self.overlap_rate))
+        return [b for extraido in self.extraer_bloques(url, bloques) for b in extraido]
+
+    def extraer_bloques(self, url: str, bloques: List[str]) -> List[list]:
+        """Extrae cada bloque tal cual (sin volver a trocear), en paralelo.
+
+        Returns:
+            Lista de resultados, uno por bloque y en el mismo orden; un bloque que
+            falla devuelve un bloque de error como en crawl4ai
+        """
+        # Los hilos del executor no copian el contexto de quien llamó: viaja
+        # con cada bloque (dos extracciones de la misma URL no se pisan)
+        contexto = contexto_llamadas()
+        hilos = max(1, min(len(bloques), self.despachador.capacidad))
+        with ThreadPoolExecutor(max_workers=hilos) as executor:
+            futuros = [executor.submit(self.extract, url, ix, sanitize_input_encode(bloque), contexto)
+                       for ix, bloque in enumerate(bloques)]
+            resultados = []
+            for futuro in futuros:
+                try:
+                    resultados.append(futuro.result())
+                except Exception as e:
+                    print(f"Error en la extracción de un bloque de {url}: {e}")
+                    resultados.append([{"index": 0, "error": True, "tags": ["error"], "content": str(e)}])
+        return resultados
+
+
+def get_llm_strategy(
+    telemetria: Optional[TelemetriaLLM] = None,
+    despachador: Optional[DespachadorLLM] = None,
+) -> LLMExtractionStrategy:
     """
     Returns the configuration for the language model extraction strategy.
 
+    The provider and key below are the primary ones; the calls actually go
+    through the dispatcher, configured with LLM_PROVEEDORES.
+
+    Args:
+        telemetria: Where each LLM call is recorded (default: the run's telemetry)
+        despachador: Provider pool for the calls (default: the process-wide one)
+
     Returns:
         LLMExtractionStrategy: The settings for how to extract data using LLM.
     """
     # https://docs.crawl4ai.com/api/strategies/#llmextractionstrategy
     
-    return LLMExtractionStrategy(
+    return LLMExtractionStrategyMedida(
+        telemetria=telemetria,
+        despachador=despachador,
         provider="groq/openai/gpt-oss-20b",  # Name of the LLM provider (OpenAI model via Groq)
         api_token=os.getenv("GROQ_API_KEY"),  # API token for authentication
         schema=HabitacionWeb.model_json_schema(),  # JSON schema of the data model
@@ -66,104 +277,190 @@ def fechas_validas(fecha_entrada: date, fecha_salida: date) -> bool:
         return False
     return True
 
-async def procesar_resultado_scraping(result):
-    if not (result.success and result.extracted_content):
-        print(f"Error: No hay contenido extraído o extracción no exitosa")
-        print(f"Success: {result.success}")
-        print(f"Content: {result.extracted_content}")
-        print(f"Error en la obtención: {result.error_message}")
-        return None
+def _validacion_estricta() -> bool:
+    # SCRAPING_VALIDACION_ESTRICTA=1 descarta habitaciones con tipos coercionados
+    return os.getenv("SCRAPING_VALIDACION_ESTRICTA", "0") == "1"
 
- 
-    try:
-        print("Contenido extraído:", result.extracted_content)  
-        hotel_data = json.loads(result.extracted_content)
-
-        if not hotel_data:
-            print("Error: hotel_data está vacío después de parsear JSON")
-            return None
-            
-        # Verificar si es una lista de habitaciones
-        if isinstance(hotel_data, list):
-            print(f"Procesando {len(hotel_data)} habitaciones")
-            habitaciones = []
-            for h in hotel_data:
-                try:
-                    habitacion = HabitacionWeb(**h)
-                    habitaciones.append(habitacion)
-                except Exception as e:
-                    print(f"Error procesando habitación: {e}")
-                    continue
-            
-            if not habitaciones:
-                print("Error: No se pudo procesar ninguna habitación válida")
-                return None
-                
-            hotel = HotelWeb(
-                detalles="Alvear Palace Hotel",
-                habitacion=habitaciones
-            )
-            return hotel
+
+def decodificar_hotel_web(
+    contenido, nombre_hotel: str = "Alvear Palace Hotel"
+) -> Tuple[Optional[HotelWeb], List[RechazoHabitacion]]:
+    """Decodifica y valida el contenido extraído en una sola pasada.
+
+    Args:
+        contenido: result.extracted_content (JSON) o la lista ya decodificada
+        nombre_hotel: Nombre para HotelWeb.detalles
+
+    Returns:
+        (HotelWeb o None si no quedó ninguna habitación válida, rechazos). Los
+        rechazos son los elementos descartados con sus errores, o uno solo con
+        indice None si el contenido no es JSON o no es una lista.
+    """
+    if not contenido:
+        print("Error: el contenido extraído está vacío")
+        return None, [RechazoHabitacion(indice=None, errores=["contenido vacío"])]
+
+    habitaciones, rechazos = decodificar_habitaciones_web(contenido, estricto=_validacion_estricta())
+    for rechazo in rechazos:
+        if rechazo.indice is None:
+            print(f"Error: contenido extraído inválido: {'; '.join(rechazo.errores)}")
         else:
-            print(f"Error: Formato inesperado de datos. Se esperaba lista, se recibió: {type(hotel_data)}")
-            return None
-    except json.JSONDecodeError as e:
-        print(f"Error decodificando JSON: {e}")
-        print(f"Contenido raw: {result.extracted_content}")
-        return None
-    except Exception as e:
-        print(f"Error inesperado procesando datos: {e}")
-        return None
-    
+            print(f"Habitación {rechazo.indice} descartada ({rechazo.nombre}): {'; '.join(rechazo.errores)}")
+
+    if not habitaciones:
+        print("Error: No se pudo procesar ninguna habitación válida")
+        return None, rechazos
 
+    print(f"{len(habitaciones)} habitaciones válidas, {len(rechazos)} descartadas")
+    return HotelWeb(detalles=nombre_hotel, habitacion=habitaciones), rechazos
 
 
-async def fetch_and_process_page(
+def construir_hotel_web(hotel_data, nombre_hotel: str = "Alvear Palace Hotel") -> Optional[HotelWeb]:
+    """Construye el HotelWeb a partir de la lista de habitaciones extraída.
+
+    Args:
+        hotel_data: Lista de dicts de habitaciones (JSON ya decodificado) o el JSON
+        nombre_hotel: Nombre para HotelWeb.detalles
+
+    Returns:
+        HotelWeb, o None si el contenido está vacío, no es una lista o no tiene
+        ninguna habitación válida
+    """
+    hotel, _ = decodificar_hotel_web(hotel_data, nombre_hotel)
+    return hotel
+
+
+def get_run_config(
+    css_selector: str,
+    session_id: str,
+    extraction_strategy: Optional[LLMExtractionStrategy] = None,
+    espera: Optional[EstrategiaEspera] = None,
+    perfil: Optional[PerfilCrawler] = None,
+) -> CrawlerRunConfig:
+    """
+    Returns the run configuration used to load the results page.
+
+    Args:
+        css_selector: Region of the page that is converted to markdown
+        session_id: Browser session (one per concurrent page)
+        extraction_strategy: LLM strategy; None to only fetch the page
+        espera: When the page counts as loaded (default: the profile's, or espera_desde_entorno())
+        perfil: Crawler profile (cache mode, page timeout, readiness wait);
+            None keeps the bypassed cache and the 30 s timeout
+
+    Returns:
+        CrawlerRunConfig: The settings for crawler.arun.
+    """
+    if perfil is not None:
+        espera = espera or perfil.estrategia_espera()
+    espera = espera or espera_desde_entorno()
+    return CrawlerRunConfig(
+        cache_mode=perfil.cache_mode() if perfil is not None else CacheMode.BYPASS,
+        extraction_strategy=extraction_strategy,
+        css_selector=css_selector,
+        session_id=session_id,
+        page_timeout=perfil.page_timeout_ms if perfil is not None else 30000,  # 30 segundos de timeout
+        **espera.opciones_run_config(),  # tarjetas estables o networkidle + scroll completo
+    )
+
+
+async def obtener_pagina(
     crawler: AsyncWebCrawler,
     base_url: str,
     params: dict,
     css_selector: str,
-    llm_strategy: LLMExtractionStrategy,
     session_id: str,
-    nombre_hotel: str = "Alvear Palace Hotel",
-    max_retries: int = 3,
-    delay_between_retries: int = 5
-) -> Optional[HotelWeb]:
-    
+    perfil: Optional[PerfilCrawler] = None,
+) -> PaginaObtenida:
+    """Carga la página de resultados SIN extracción (etapa 1 del pipeline).
+
+    Args:
+        perfil: Perfil del crawler para el CrawlerRunConfig (ver get_run_config)
+
+    Raises:
+        Exception: Si la carga falla o la región de habitaciones está vacía
+    """
     url_completa = f"{base_url}?{urlencode(params)}"
     print(f"Loading hotel page: {url_completa}...")
 
-    
-    for intento in range(max_retries):
-        try:
-        #ejecuta el crawl
-            result = await crawler.arun(
-                url=url_completa,
-                config=CrawlerRunConfig(
-                    scan_full_page=True,
-                    cache_mode=CacheMode.BYPASS,
-                    extraction_strategy=llm_strategy,
-                    css_selector=css_selector,
-                    session_id=session_id,
-                    page_timeout=30000,  # 30 segundos de timeout
-                    wait_until="networkidle"  # espera hasta que no haya actividad de red
-                ),
-            )
-            # Verifica si los datos están completos
-            if result.success and result.extracted_content:
-                habitaciones_data = json.loads(result.extracted_content)
-                if habitaciones_data and len(habitaciones_data) > 0:
-                    print(f"Datos extraídos exitosamente en el intento {intento + 1}")
-                    return await procesar_resultado_scraping(result)
-            
-            print(f"Intento {intento + 1} falló o datos incompletos. Esperando {delay_between_retries} segundos...")
-            await asyncio.sleep(delay_between_retries)
-
-        except Exception as e:
-            print(f"Error en intento {intento + 1}: {str(e)}")
-            if intento < max_retries - 1:
-                await asyncio.sleep(delay_between_retries)
-            else:
-                raise Exception(f"Fallaron todos los intentos de extracción: {str(e)}")
-
-    raise Exception("No se pudieron obtener datos completos después de todos los reintentos")
+    inicio = time.perf_counter()
+    result = await crawler.arun(url=url_completa, config=get_run_config(css_selector, session_id, perfil=perfil))
+    segundos = time.perf_counter() - inicio
+
+    markdown = texto_markdown(result)
+    if not result.success or not markdown.strip():
+        raise Exception(f"Página sin contenido: {result.error_message}")
+
+    return PaginaObtenida(
+        params=params,
+        url=url_completa,
+        html=result.html or "",
+        markdown=markdown,
+        segundos_fetch=segundos,
+    )
+
+
+def extraer_habitaciones_llm(llm_strategy: LLMExtractionStrategy, url: str, markdown: str) -> list:
+    """Extrae las habitaciones del markdown con el LLM (etapa 2 del pipeline).
+
+    Si la página tiene varias tarjetas de habitación y la estrategia lo permite,
+    extrae cada tarjeta (o grupo de tarjetas) en una llamada aparte, en
+    paralelo, y fusiona los resultados (extraccion_por_tarjetas). Si no,
+    reproduce lo que hace crawler.arun con la estrategia: trocea el markdown
+    con RegexChunking y llama a llm_strategy.run. Es bloqueante (el pipeline
+    la ejecuta en un hilo).
+
+    Returns:
+        Lista de dicts de habitaciones, como result.extracted_content decodificado
+    """
+    if extraccion_por_tarjetas_habilitada() and hasattr(llm_strategy, "extraer_bloques"):
+        trozos = trozos_de_pagina(markdown, max_trozos=llm_strategy.despachador.capacidad)
+        if len(trozos) > 1:
+            print(f"Extracción por tarjetas: {len(trozos)} trozos en paralelo")
+            return fusionar_habitaciones(llm_strategy.extraer_bloques(url, trozos))
+
+    secciones = RegexChunking().chunk(markdown)
+    return llm_strategy.run(url, secciones)
+
+
+def crear_cache_extraccion(llm_strategy: LLMExtractionStrategy) -> Optional[CacheExtraccion]:
+    """Caché de extracciones para la instrucción y schema de `llm_strategy`.
+
+    Returns:
+        CacheExtraccion nueva (estadísticas de esta corrida), o None si CACHE_EXTRACCION=0
+    """
+    if not cache_habilitada():
+        return None
+    return CacheExtraccion(version_extraccion(llm_strategy.instruction, llm_strategy.schema))
+
+
+def extraer_hotel_web(
+    llm_strategy: LLMExtractionStrategy,
+    url: str,
+    markdown: str,
+    cache: Optional[CacheExtraccion] = None,
+    nombre_hotel: str = "Alvear Palace Hotel",
+) -> Optional[HotelWeb]:
+    """Extrae el HotelWeb de una página, consultando antes la caché de extracción.
+
+    El markdown se poda antes (poda_contenido) salvo que PODA_CONTENIDO=0, y
+    la clave de la caché es el markdown podado. Si el mismo markdown ya se
+    extrajo con la misma instrucción y schema, se devuelven las habitaciones
+    guardadas sin llamar al LLM. Las extracciones exitosas se guardan en la caché.
+    """
+    if poda_habilitada():
+        poda = podar_markdown(markdown)
+        print(f"Poda de contenido: {poda.tokens_antes} -> {poda.tokens_despues} tokens "
+              f"({100 * poda.reduccion:.1f}% menos) en {url}")
+        markdown = poda.markdown
+
+    if cache is not None:
+        habitaciones = cache.obtener(markdown)
+        if habitaciones:
+            print(f"Extracción desde caché ({len(habitaciones)} habitaciones)")
+            return HotelWeb(detalles=nombre_hotel, habitacion=habitaciones)
+
+    hotel = construir_hotel_web(extraer_habitaciones_llm(llm_strategy, url, markdown), nombre_hotel)
+    if hotel is not None and cache is not None:
+        cache.guardar(markdown, hotel.habitacion)
+    return hotel
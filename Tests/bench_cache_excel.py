@@ -0,0 +1,45 @@
+"""
+Comparación de tiempos de carga: extracción cruda vs snapshot cacheado
+-----------------------------------------------------------------------
+Mide cargar_excel (openpyxl + validación pydantic) contra cargar_excel_cacheado
+con el snapshot frío (primera carga, escribe el snapshot) y caliente (lee el
+snapshot), y verifica que el resultado sea idéntico.
+
+Ejecutar desde la raíz del proyecto:
+    python -m Tests.bench_cache_excel [ruta_excel]
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from ExtractorDatos.extractor import cargar_excel
+from ExtractorDatos.cache_excel import cargar_excel_cacheado
+
+PATH_EXCEL_DEFECTO = Path(__file__).parent.parent / "Data" / "Extracto_prueba2.xlsx"
+REPETICIONES = 5
+
+
+def medir(funcion, repeticiones=REPETICIONES):
+    """Devuelve (resultado, tiempo promedio en ms) de `funcion()`."""
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        resultado = funcion()
+    return resultado, (time.perf_counter() - inicio) * 1000 / repeticiones
+
+
+if __name__ == "__main__":
+    path_excel = sys.argv[1] if len(sys.argv) > 1 else PATH_EXCEL_DEFECTO
+
+    with tempfile.TemporaryDirectory() as directorio_cache:
+        datos_crudo, t_crudo = medir(lambda: cargar_excel(path_excel))
+        datos_frio, t_frio = medir(lambda: cargar_excel_cacheado(path_excel, directorio_cache=directorio_cache), repeticiones=1)
+        datos_cache, t_caliente = medir(lambda: cargar_excel_cacheado(path_excel, directorio_cache=directorio_cache))
+
+    print(f"\nArchivo: {path_excel}")
+    print(f"  extracción cruda (cargar_excel)      : {t_crudo:9.2f} ms")
+    print(f"  snapshot frío (extrae + escribe)     : {t_frio:9.2f} ms")
+    print(f"  snapshot caliente (lee JSON)         : {t_caliente:9.2f} ms")
+    print(f"  aceleración                          : {t_crudo / t_caliente:9.1f}x")
+    print(f"  resultado idéntico                   : {datos_crudo == datos_frio == datos_cache}")
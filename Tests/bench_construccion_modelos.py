@@ -0,0 +1,78 @@
+"""
+Costo de construcción de modelos pydantic por fila
+--------------------------------------------------
+Compara, por fila y tomando el mejor de varias corridas (sin el calentamiento
+de pydantic-core):
+- HabitacionWeb validada una por una (HabitacionWeb(**h), como antes en
+  procesar_resultado_scraping) contra ADAPTADOR_HABITACIONES_WEB en lote.
+- HabitacionExcel con sus validadores contra model_construct con la misma
+  normalización hecha en Python (el camino "confiable"). Con pydantic 2.x
+  la validación ya es barata y model_construct (Python puro) no cuesta menos,
+  por eso la extracción del Excel sigue usando el constructor validado.
+
+Ejecutar desde la raíz del proyecto:
+    python -m Tests.bench_construccion_modelos [cantidad_filas]
+"""
+
+import sys
+import timeit
+
+from Models.hotelExcel import HabitacionExcel, normalizar_precio_str
+from Models.hotelWeb import HabitacionWeb, ADAPTADOR_HABITACIONES_WEB
+
+CANTIDAD_FILAS = 5000
+CORRIDAS = 5
+
+
+def mejor_por_fila(funcion, cantidad, corridas=CORRIDAS):
+    """Microsegundos por fila de la mejor de `corridas` ejecuciones."""
+    return min(timeit.repeat(funcion, number=1, repeat=corridas)) * 1e6 / cantidad
+
+
+def habitaciones_web(cantidad):
+    return [
+        {
+            "nombre": f"Deluxe Room {i}",
+            "detalles": "King bed, 45 m2",
+            "combos": [
+                {"titulo": "Desayuno incluido", "descripcion": "Cancelación gratuita", "precio": 420.0 + i},
+                {"titulo": "Solo habitación", "descripcion": "No reembolsable", "precio": 380.0 + i},
+            ],
+        }
+        for i in range(cantidad)
+    ]
+
+
+def habitacion_excel_construida(nombre, precio, row_idx):
+    """Camino "confiable": normaliza en Python y arma el modelo sin validar."""
+    return HabitacionExcel.model_construct(
+        nombre=nombre.strip().lower(),
+        precio=normalizar_precio_str(precio),
+        precio_string=None,
+        row_idx=row_idx,
+        periodo_ids=set(),
+    )
+
+
+if __name__ == "__main__":
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else CANTIDAD_FILAS
+
+    datos_web = habitaciones_web(cantidad)
+    individual = mejor_por_fila(lambda: [HabitacionWeb(**h) for h in datos_web], cantidad)
+    en_lote = mejor_por_fila(lambda: ADAPTADOR_HABITACIONES_WEB.validate_python(datos_web), cantidad)
+    iguales = [HabitacionWeb(**h) for h in datos_web] == ADAPTADOR_HABITACIONES_WEB.validate_python(datos_web)
+
+    print(f"\nHabitacionWeb con 2 combos ({cantidad} habitaciones), µs por habitación:")
+    print(f"  una por una         : {individual:8.2f}")
+    print(f"  TypeAdapter en lote : {en_lote:8.2f}   iguales: {iguales}")
+
+    filas = [(f"  DBL Superior {i % 40} ", "1,480.50", i) for i in range(cantidad)]
+    validado = mejor_por_fila(lambda: [
+        HabitacionExcel(nombre=n, precio=p, row_idx=i, periodo_ids=[]) for n, p, i in filas
+    ], cantidad)
+    construido = mejor_por_fila(lambda: [habitacion_excel_construida(n, p, i) for n, p, i in filas], cantidad)
+
+    print(f"\nHabitacionExcel ({cantidad} filas), µs por fila:")
+    print(f"  validadores pydantic        : {validado:8.2f}")
+    print(f"  normalizar + model_construct: {construido:8.2f}")
+
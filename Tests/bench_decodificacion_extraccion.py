@@ -0,0 +1,88 @@
+"""
+Decodificación del contenido extraído: doble parseo vs una pasada
+-----------------------------------------------------------------
+Arma un extracted_content grande a partir de las habitaciones guardadas en
+Tests/fixtures/synxis (repetidas con nombres y precios distintos, con la
+marca "error": false que agrega crawl4ai y un 1% de habitaciones inválidas)
+y compara, tomando el mejor de varias corridas:
+- Antes: json.loads para verificar que hay datos, json.loads de nuevo en
+  procesar_resultado_scraping y HabitacionWeb(**h) una por una con try/except.
+- json.loads + validar_habitaciones_web con la lista ya decodificada.
+- decodificar_habitaciones_web con el JSON: pydantic-core parsea y valida en
+  una sola pasada y junta los rechazos.
+
+Ejecutar desde la raíz del proyecto:
+    python -m Tests.bench_decodificacion_extraccion [cantidad_habitaciones]
+"""
+
+import contextlib
+import io
+import json
+import sys
+import timeit
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from Models.hotelWeb import HabitacionWeb, decodificar_habitaciones_web, validar_habitaciones_web
+
+DIRECTORIO_FIXTURES = Path(__file__).parent / "fixtures" / "synxis"
+CANTIDAD_HABITACIONES = 5000
+CORRIDAS = 5
+
+
+def contenido_extraido(cantidad):
+    base = json.loads((DIRECTORIO_FIXTURES / "alvear_20_habitaciones.json").read_text(encoding="utf-8"))
+    habitaciones = []
+    for i in range(cantidad):
+        h = json.loads(json.dumps(base[i % len(base)]))
+        h["nombre"] = f"{h['nombre']} {i}"
+        h["error"] = False
+        for combo in h["combos"]:
+            combo["precio"] += i % 7
+        if i % 100 == 99:
+            h["combos"][0]["precio"] = "consultar"
+        habitaciones.append(h)
+    return json.dumps(habitaciones, ensure_ascii=False)
+
+
+def antes(contenido):
+    datos = json.loads(contenido)
+    if not datos:
+        return []
+    datos = json.loads(contenido)
+    habitaciones = []
+    for h in datos:
+        try:
+            habitaciones.append(HabitacionWeb(**h))
+        except ValidationError:
+            pass
+    return habitaciones
+
+
+def lista_decodificada(contenido):
+    return validar_habitaciones_web(json.loads(contenido))
+
+
+def una_pasada(contenido):
+    habitaciones, _ = decodificar_habitaciones_web(contenido)
+    return habitaciones
+
+
+if __name__ == "__main__":
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else CANTIDAD_HABITACIONES
+    contenido = contenido_extraido(cantidad)
+    print(f"\n{cantidad} habitaciones, {len(contenido) / 1e6:.1f} MB de JSON")
+
+    referencia = antes(contenido)
+    _, rechazos = decodificar_habitaciones_web(contenido)
+    print(f"  {len(referencia)} válidas, {len(rechazos)} rechazadas (ej.: {rechazos[0].errores[0]})")
+
+    for nombre, funcion in (("antes (2 x json.loads + 1 a 1)", antes),
+                            ("json.loads + lista", lista_decodificada),
+                            ("una pasada (validate_json)", una_pasada)):
+        # validar_habitaciones_web imprime cada rechazo
+        with contextlib.redirect_stdout(io.StringIO()):
+            segundos = min(timeit.repeat(lambda: funcion(contenido), number=1, repeat=CORRIDAS))
+            iguales = funcion(contenido) == referencia
+        print(f"  {nombre:32s}: {segundos * 1000:8.1f} ms  (idéntico: {iguales})")
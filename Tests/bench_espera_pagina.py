@@ -0,0 +1,84 @@
+"""
+Espera networkidle + scroll completo vs tarjetas estables
+---------------------------------------------------------
+Carga búsquedas del servidor SynXis local con crawl4ai (Chromium headless)
+y las dos estrategias de espera de espera_pagina.py:
+- networkidle: la configuración por defecto (wait_until="networkidle" y
+  scan_full_page=True).
+- selector: domcontentloaded + tarjetas presentes y estables. La plantilla
+  del servidor usa la misma clase que espera el selector, así que la
+  ganancia no vale para SynXis hasta confirmar la clase en una página real.
+
+El servidor agrega las tarjetas por JS de a una (PROGRESIVO_MS) y sus
+scripts y estilos tardan LATENCIA_RECURSOS, como los de SynXis. Reporta la
+duración de arun, el tiempo hasta página lista y las tarjetas en el markdown.
+
+Necesita el Chromium de Playwright (playwright install chromium); no usa red
+externa ni LLM.
+
+Ejecutar desde la raíz del proyecto:
+    python -m Tests.bench_espera_pagina [busquedas]
+"""
+
+import asyncio
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from urllib.parse import urlencode
+
+from crawl4ai import AsyncWebCrawler, BrowserConfig
+
+from ScrawlingChinese.bloqueo_recursos import BloqueadorRecursos, PoliticaRecursos
+from ScrawlingChinese.config import CSS_SELECTOR
+from ScrawlingChinese.espera_pagina import EstrategiaEspera, MedidorEspera
+from ScrawlingChinese.servidor_local import FuenteFixtures, ServidorSynxisLocal
+from ScrawlingChinese.utils.scraper_utils import get_run_config, texto_markdown
+
+DIRECTORIO_FIXTURES = Path(__file__).parent / "fixtures" / "synxis"
+BUSQUEDAS = 5
+PROGRESIVO_MS = 40
+LATENCIA_RECURSOS = 1.5
+
+
+def params_de(i):
+    llegada = date(2026, 7, 1) + timedelta(days=i)
+    return {"arrive": llegada.isoformat(), "depart": (llegada + timedelta(days=3)).isoformat(),
+            "adult": 2, "child": 0}
+
+
+async def medir(servidor, espera, busquedas):
+    medidor = MedidorEspera(espera.nombre)
+    # Sin red externa: las imágenes y trackers de la plantilla se bloquean en las dos corridas
+    bloqueador = BloqueadorRecursos(PoliticaRecursos(dominios_permitidos=["127.0.0.1"]))
+    duraciones, tarjetas = [], []
+    async with AsyncWebCrawler(config=BrowserConfig(headless=True, verbose=False)) as crawler:
+        bloqueador.instalar(crawler)
+        medidor.instalar(crawler)
+        for i in range(busquedas):
+            url = f"{servidor.url}?{urlencode(params_de(i))}"
+            inicio = time.perf_counter()
+            result = await crawler.arun(url=url, config=get_run_config(CSS_SELECTOR, "bench", espera=espera))
+            duraciones.append(time.perf_counter() - inicio)
+            tarjetas.append(texto_markdown(result).count("\n## "))
+    return duraciones, tarjetas, medidor
+
+
+async def main(busquedas):
+    async with ServidorSynxisLocal(FuenteFixtures(DIRECTORIO_FIXTURES), progresivo_ms=PROGRESIVO_MS,
+                                   latencia_recursos=LATENCIA_RECURSOS) as servidor:
+        print(f"{busquedas} búsquedas; tarjetas cada {PROGRESIVO_MS} ms, recursos en {LATENCIA_RECURSOS}s")
+        for espera in (EstrategiaEspera("networkidle"), EstrategiaEspera("selector")):
+            duraciones, tarjetas, medidor = await medir(servidor, espera, busquedas)
+            m = medidor.metricas()
+            print(f"  {espera.nombre:12s}: arun promedio {sum(duraciones) / len(duraciones):5.2f}s  "
+                  f"lista p50 {m['lista_p50']:5.2f}s  tarjetas {tarjetas}")
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else BUSQUEDAS))
+    except Exception as e:
+        if "Executable doesn't exist" not in str(e):
+            raise
+        print("No está el Chromium de Playwright: ejecutar `playwright install chromium`")
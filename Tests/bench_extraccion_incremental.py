@@ -0,0 +1,94 @@
+"""
+Recarga incremental por bloques de hotel
+----------------------------------------
+Arma un workbook grande repitiendo los hoteles de Extracto_prueba2.xlsx y mide:
+- La extracción completa (cargar_excel).
+- La recarga con cargar_excel_cacheado después de editar un precio de un solo
+  hotel (re-procesa un bloque) y después de insertar una fila al principio
+  (todos los bloques se desplazan, ninguno cambia).
+En cada caso verifica que el resultado sea idéntico al de cargar_excel.
+
+Ejecutar desde la raíz del proyecto:
+    python -m Tests.bench_extraccion_incremental [repeticiones_hoja]
+
+La carga del workbook con openpyxl se paga igual en ambos casos; lo que se
+ahorra es el procesamiento de filas de los hoteles sin cambios.
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from openpyxl import Workbook, load_workbook
+
+from ExtractorDatos.extractor import cargar_excel
+from ExtractorDatos.cache_excel import cargar_excel_cacheado
+
+PATH_EXCEL_BASE = Path(__file__).parent.parent / "Data" / "Extracto_prueba2.xlsx"
+REPETICIONES_HOJA = 20
+
+
+def crear_workbook_grande(destino, repeticiones=REPETICIONES_HOJA):
+    """Copia las filas de la hoja base `repeticiones` veces renombrando hoteles."""
+    filas_base = list(load_workbook(PATH_EXCEL_BASE).active.iter_rows(values_only=True))
+    wb = Workbook()
+    ws = wb.active
+    for n in range(repeticiones):
+        for fila in filas_base:
+            fila = list(fila)
+            if isinstance(fila[0], str) and fila[0].strip().endswith("(A)"):
+                fila[0] = fila[0].strip()[:-3] + f"{n:02d} (A)"
+            ws.append(fila)
+    wb.save(destino)
+    return len(filas_base) * repeticiones
+
+
+def editar_primer_precio(path, desde_fila):
+    """Suma 1 al primer precio numérico (columna C) a partir de `desde_fila`."""
+    wb = load_workbook(path)
+    ws = wb.active
+    for (celda,) in ws.iter_rows(min_row=desde_fila, min_col=3, max_col=3):
+        if isinstance(celda.value, (int, float)):
+            celda.value += 1
+            break
+    wb.save(path)
+
+
+def insertar_fila_inicial(path):
+    wb = load_workbook(path)
+    wb.active.insert_rows(1)
+    wb.save(path)
+
+
+def cronometrar(funcion):
+    inicio = time.perf_counter()
+    resultado = funcion()
+    return resultado, (time.perf_counter() - inicio) * 1000
+
+
+if __name__ == "__main__":
+    repeticiones = int(sys.argv[1]) if len(sys.argv) > 1 else REPETICIONES_HOJA
+
+    with tempfile.TemporaryDirectory() as directorio:
+        path = Path(directorio) / "grande.xlsx"
+        directorio_cache = Path(directorio) / "cache"
+        # Margen para que max_row no cambie al insertar la fila
+        max_row = crear_workbook_grande(path, repeticiones) + 10
+
+        completo, t_completo = cronometrar(lambda: cargar_excel(path, max_row=max_row))
+        _, t_frio = cronometrar(lambda: cargar_excel_cacheado(path, max_row, directorio_cache))
+
+        editar_primer_precio(path, desde_fila=max_row // 2)
+        editado, t_editado = cronometrar(lambda: cargar_excel_cacheado(path, max_row, directorio_cache))
+        referencia_editado = cargar_excel(path, max_row=max_row)
+
+        insertar_fila_inicial(path)
+        desplazado, t_desplazado = cronometrar(lambda: cargar_excel_cacheado(path, max_row, directorio_cache))
+        referencia_desplazado = cargar_excel(path, max_row=max_row)
+
+    print(f"\nHoja de {max_row} filas, {len(completo.hoteles)} hoteles")
+    print(f"  extracción completa (cargar_excel)    : {t_completo:9.2f} ms")
+    print(f"  primera carga cacheada (por bloques)  : {t_frio:9.2f} ms")
+    print(f"  recarga tras editar un hotel          : {t_editado:9.2f} ms  idéntico: {editado == referencia_editado}")
+    print(f"  recarga tras insertar una fila arriba : {t_desplazado:9.2f} ms  idéntico: {desplazado == referencia_desplazado}")
@@ -0,0 +1,82 @@
+"""
+Extracción de página entera vs por tarjetas
+-------------------------------------------
+Extrae las páginas guardadas en Tests/fixtures/synxis con extraer_hotel_web
+y un LLM simulado cuya latencia crece con los tokens que genera (como un LLM
+real: LATENCIA_BASE + SEGUNDOS_POR_TOKEN por token de respuesta). El LLM
+simulado responde las habitaciones del .json cuyos títulos aparecen en el
+prompt, así se verifica que la fusión de los trozos da el mismo HotelWeb.
+
+Compara:
+- Página entera (EXTRACCION_POR_TARJETAS=0).
+- Por tarjetas: automático (un trozo por llamada simultánea) y 1 tarjeta por
+  llamada, con 4 y 8 llamadas simultáneas.
+
+No usa red: el despachador llama a la función simulada.
+
+Ejecutar desde la raíz del proyecto:
+    python -m Tests.bench_extraccion_tarjetas
+"""
+
+import json
+import os
+import re
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+from ScrawlingChinese.despachador_llm import DespachadorLLM, ProveedorLLM
+from ScrawlingChinese.telemetria_llm import TelemetriaLLM
+from ScrawlingChinese.utils.scraper_utils import extraer_hotel_web, get_llm_strategy
+
+DIRECTORIO_FIXTURES = Path(__file__).parent / "fixtures" / "synxis"
+LATENCIA_BASE = 0.15
+SEGUNDOS_POR_TOKEN = 0.0004
+
+
+def llm_simulado(habitaciones):
+    por_nombre = {h["nombre"]: h for h in habitaciones}
+
+    def completar(proveedor, prompt, **extra):
+        nombres = re.findall(r"## ([^\\\n#]+?)(?:\\n|\n)", prompt)
+        respuesta = [por_nombre[n.strip()] for n in nombres if n.strip() in por_nombre]
+        contenido = f"<blocks>{json.dumps(respuesta, ensure_ascii=False)}</blocks>"
+        tokens_respuesta = len(contenido) // 4
+        time.sleep(LATENCIA_BASE + tokens_respuesta * SEGUNDOS_POR_TOKEN)
+        return SimpleNamespace(
+            usage=SimpleNamespace(prompt_tokens=len(prompt) // 4, completion_tokens=tokens_respuesta,
+                                  total_tokens=len(prompt) // 4 + tokens_respuesta),
+            choices=[SimpleNamespace(message=SimpleNamespace(content=contenido))],
+        )
+    return completar
+
+
+def medir(markdown, habitaciones, concurrencia):
+    despachador = DespachadorLLM([ProveedorLLM("simulado", max_concurrencia=concurrencia)],
+                                 completar=llm_simulado(habitaciones))
+    telemetria = TelemetriaLLM(exportar=False)
+    estrategia = get_llm_strategy(telemetria=telemetria, despachador=despachador)
+    estrategia.verbose = False
+
+    inicio = time.perf_counter()
+    hotel = extraer_hotel_web(estrategia, "https://simulado", markdown)
+    segundos = time.perf_counter() - inicio
+    iguales = [h.model_dump() for h in hotel.habitacion] == habitaciones
+    return segundos, telemetria.total(), iguales
+
+
+if __name__ == "__main__":
+    casos = [("página entera", "0", "auto", 4),
+             ("tarjetas auto, 4 simultáneas", "1", "auto", 4), ("tarjetas x1, 4 simultáneas", "1", "1", 4),
+             ("tarjetas auto, 8 simultáneas", "1", "auto", 8), ("tarjetas x1, 8 simultáneas", "1", "1", 8)]
+
+    for ruta in sorted(DIRECTORIO_FIXTURES.glob("*.md")):
+        markdown = ruta.read_text(encoding="utf-8")
+        habitaciones = json.loads(ruta.with_suffix(".json").read_text(encoding="utf-8"))
+        print(f"\n{ruta.stem}: {len(habitaciones)} habitaciones")
+        for nombre, por_tarjetas, por_trozo, concurrencia in casos:
+            os.environ["EXTRACCION_POR_TARJETAS"] = por_tarjetas
+            os.environ["EXTRACCION_TARJETAS_POR_TROZO"] = por_trozo
+            segundos, total, iguales = medir(markdown, habitaciones, concurrencia)
+            print(f"  {nombre:30s}: {segundos:6.2f} s  {total.llamadas:3d} llamadas  "
+                  f"{total.tokens_prompt:6d} tokens prompt  (idéntico: {iguales})")
@@ -0,0 +1,84 @@
+"""
+Memoria de un año de snapshots: modelos pydantic vs proyecciones RO
+-------------------------------------------------------------------
+Simula un snapshot diario de scraping por hotel durante un año (cada uno
+parseado desde JSON, como llega del LLM, así que los textos no se comparten)
+y mide con tracemalloc la memoria retenida por:
+- La lista de HotelWeb pydantic.
+- La lista de HotelWebRO (dataclasses congeladas con __slots__ y textos internados).
+Hace lo mismo con el DatosExcel extraído de Extracto_prueba2.xlsx.
+
+Ejecutar desde la raíz del proyecto:
+    python -m Tests.bench_memoria_proyecciones [hoteles] [dias]
+"""
+
+import gc
+import json
+import sys
+import tracemalloc
+from pathlib import Path
+
+from Models.hotelExcel import HotelExcel
+from Models.hotelWeb import HotelWeb
+from Models.proyecciones import HotelWebRO, HotelExcelRO
+from ExtractorDatos.extractor import cargar_excel
+
+PATH_EXCEL = Path(__file__).parent.parent / "Data" / "Extracto_prueba2.xlsx"
+HOTELES = 10
+DIAS = 365
+HABITACIONES = 8
+
+
+def snapshot_json(hotel, dia):
+    """JSON de un scraping: 8 habitaciones con 3 combos, precios variando por día."""
+    return json.dumps({
+        "detalles": f"Hotel {hotel}",
+        "habitacion": [
+            {
+                "nombre": f"Deluxe Room {h}",
+                "detalles": "King bed, 45 m2, city view",
+                "combos": [
+                    {"titulo": "Desayuno incluido", "descripcion": "Cancelación gratuita hasta 48 hs", "precio": 400.0 + h + dia},
+                    {"titulo": "Solo habitación", "descripcion": "No reembolsable", "precio": 350.0 + h + dia},
+                    {"titulo": "Media pensión", "descripcion": "Desayuno y cena", "precio": 520.0 + h + dia},
+                ],
+            }
+            for h in range(HABITACIONES)
+        ],
+    })
+
+
+def medir(construir):
+    """Bytes retenidos por el resultado de `construir()` (se mantiene vivo al medir)."""
+    gc.collect()
+    tracemalloc.start()
+    resultado = construir()
+    gc.collect()
+    actual, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return resultado, actual
+
+
+if __name__ == "__main__":
+    hoteles = int(sys.argv[1]) if len(sys.argv) > 1 else HOTELES
+    dias = int(sys.argv[2]) if len(sys.argv) > 2 else DIAS
+    jsons = [snapshot_json(h, d) for h in range(hoteles) for d in range(dias)]
+
+    modelos, mem_modelos = medir(lambda: [HotelWeb.model_validate_json(j) for j in jsons])
+    del modelos
+    proyecciones, mem_ro = medir(lambda: [HotelWebRO.desde_modelo(HotelWeb.model_validate_json(j)) for j in jsons])
+
+    print(f"\n{len(jsons)} snapshots web ({hoteles} hoteles x {dias} días, {HABITACIONES} habitaciones x 3 combos):")
+    print(f"  HotelWeb (pydantic)   : {mem_modelos / 2**20:8.2f} MiB")
+    print(f"  HotelWebRO            : {mem_ro / 2**20:8.2f} MiB")
+    print(f"  reducción             : {100 * (1 - mem_ro / mem_modelos):8.1f} %")
+
+    datos = cargar_excel(PATH_EXCEL)
+    json_excel = [h.model_dump_json() for h in datos.hoteles]
+    modelos_excel, mem_excel = medir(lambda: [HotelExcel.model_validate_json(j) for j in json_excel])
+    excel_ro, mem_excel_ro = medir(lambda: [HotelExcelRO.desde_modelo(HotelExcel.model_validate_json(j)) for j in json_excel])
+
+    print(f"\nDatosExcel de {PATH_EXCEL.name} ({len(datos.hoteles)} hoteles):")
+    print(f"  HotelExcel (pydantic) : {mem_excel / 1024:8.1f} KiB")
+    print(f"  HotelExcelRO          : {mem_excel_ro / 1024:8.1f} KiB")
+    print(f"  ida y vuelta idéntica : {[h.a_modelo() for h in excel_ro] == modelos_excel}")
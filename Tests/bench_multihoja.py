@@ -0,0 +1,60 @@
+"""
+Extracción multihoja: serie vs pool de procesos
+-----------------------------------------------
+Arma un workbook con varias copias de la hoja de Extracto_prueba2.xlsx (una
+por "destino", con hoteles renombrados) y compara cargar_excel_multihoja con
+un solo proceso contra el pool, verificando que el resultado sea idéntico.
+
+Ejecutar desde la raíz del proyecto:
+    python -m Tests.bench_multihoja [cantidad_hojas]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from openpyxl import Workbook, load_workbook
+
+from ExtractorDatos.extractor_multihoja import cargar_excel_multihoja
+
+PATH_EXCEL_BASE = Path(__file__).parent.parent / "Data" / "Extracto_prueba2.xlsx"
+CANTIDAD_HOJAS = 8
+
+
+def crear_workbook_multihoja(destino, cantidad_hojas=CANTIDAD_HOJAS):
+    filas_base = list(load_workbook(PATH_EXCEL_BASE).active.iter_rows(values_only=True))
+    wb = Workbook()
+    wb.remove(wb.active)
+    for n in range(cantidad_hojas):
+        ws = wb.create_sheet(f"Destino {n:02d}")
+        for fila in filas_base:
+            fila = list(fila)
+            if isinstance(fila[0], str) and fila[0].strip().endswith("(A)"):
+                fila[0] = fila[0].strip()[:-3] + f"{n:02d} (A)"
+            ws.append(fila)
+    wb.save(destino)
+
+
+def cronometrar(funcion):
+    inicio = time.perf_counter()
+    resultado = funcion()
+    return resultado, (time.perf_counter() - inicio) * 1000
+
+
+if __name__ == "__main__":
+    cantidad_hojas = int(sys.argv[1]) if len(sys.argv) > 1 else CANTIDAD_HOJAS
+
+    with tempfile.TemporaryDirectory() as directorio:
+        path = Path(directorio) / "multihoja.xlsx"
+        crear_workbook_multihoja(path, cantidad_hojas)
+
+        serie, t_serie = cronometrar(lambda: cargar_excel_multihoja(path, max_workers=1))
+        paralelo, t_paralelo = cronometrar(lambda: cargar_excel_multihoja(path, max_workers=max(2, os.cpu_count() or 1)))
+
+    print(f"\n{cantidad_hojas} hojas, {len(serie.hoteles)} hoteles, {os.cpu_count()} CPUs")
+    print(f"  un proceso        : {t_serie:9.2f} ms")
+    print(f"  pool de procesos  : {t_paralelo:9.2f} ms")
+    print(f"  aceleración       : {t_serie / t_paralelo:9.1f}x")
+    print(f"  resultado idéntico: {serie == paralelo}")
@@ -0,0 +1,126 @@
+"""
+Medición del tiempo de actualización de PrecioPanel y PeriodosPanel
+--------------------------------------------------------------------
+Arma un hotel sintético con 100 periodos y mide:
+- El lookup periodo -> grupo con igualdad profunda (`periodo in grupo.periodos`)
+  contra el índice de `indexar_periodos`.
+- El primer render de los paneles (crea widgets) contra las actualizaciones
+  siguientes (reciclan widgets y solo reconfiguran lo que cambió).
+
+Ejecutar desde la raíz del proyecto:
+    python -m Tests.bench_paneles_ui
+
+La parte de UI necesita un display (o Xvfb); sin display solo se mide el lookup.
+"""
+
+import time
+from datetime import date, timedelta
+
+from Models.hotelExcel import HotelExcel, HabitacionExcel, PeriodoGroup, Periodo
+from Models.habitacion_unificada import HabitacionUnificada
+from Core.periodo_utils import indexar_periodos
+
+CANTIDAD_PERIODOS = 100
+REPETICIONES = 20
+
+
+def crear_hotel_sintetico(cantidad_periodos=CANTIDAD_PERIODOS):
+    """Crea un hotel con `cantidad_periodos` periodos repartidos en 10 grupos
+    y una habitación unificada con un precio distinto por periodo."""
+    grupos = []
+    periodos = []
+    inicio = date(2026, 1, 1)
+    for g in range(10):
+        grupo = PeriodoGroup(nombre=f"Season {g}", periodos=[])
+        for _ in range(cantidad_periodos // 10):
+            fin = inicio + timedelta(days=2)
+            periodo = Periodo(fecha_inicio=inicio, fecha_fin=fin, nombresito=None)
+            grupo.periodos.append(periodo)
+            periodos.append(periodo)
+            inicio = fin + timedelta(days=1)
+        grupos.append(grupo)
+
+    variantes = [
+        HabitacionExcel(nombre="dbl superior", precio=100 + i, row_idx=i, periodo_ids={p.id})
+        for i, p in enumerate(periodos)
+    ]
+    hotel = HotelExcel(nombre="Hotel Sintetico (A)", periodos_group=grupos)
+    habitacion = HabitacionUnificada(nombre="dbl superior", variantes=variantes)
+    return hotel, habitacion, periodos
+
+
+def medir(funcion, repeticiones=REPETICIONES):
+    """Devuelve el tiempo promedio en milisegundos de `funcion()`."""
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        funcion()
+    return (time.perf_counter() - inicio) * 1000 / repeticiones
+
+
+def medir_lookup_grupos(hotel, periodos):
+    def lookup_igualdad_profunda():
+        for periodo in periodos:
+            for grupo in hotel.periodos_group:
+                if periodo in grupo.periodos:
+                    break
+
+    def lookup_indice():
+        indice = indexar_periodos(hotel)
+        for periodo in periodos:
+            indice[periodo.id]
+
+    print(f"Lookup periodo->grupo ({len(periodos)} periodos):")
+    print(f"  igualdad profunda : {medir(lookup_igualdad_profunda):8.3f} ms")
+    print(f"  indexar_periodos  : {medir(lookup_indice):8.3f} ms")
+
+
+def medir_paneles(hotel, habitacion, periodos):
+    import tkinter as tk
+    from UI.components import PrecioPanel, PeriodosPanel
+
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        print(f"\nSin display disponible, se omite la medición de UI ({e})")
+        return
+    root.withdraw()
+
+    precio_panel = PrecioPanel(root)
+    precio_panel.pack()
+    periodos_panel = PeriodosPanel(root)
+    periodos_panel.pack()
+
+    precios_data = [
+        {'periodo': p, 'precio': habitacion.precio_para_periodo(p.id), 'nombre_grupo': "Season"}
+        for p in periodos
+    ]
+    # Variante con la mitad de los precios cambiados (diff parcial)
+    precios_modificados = [
+        dict(item, precio=item['precio'] + 1) if i % 2 else item
+        for i, item in enumerate(precios_data)
+    ]
+
+    def render(funcion):
+        inicio = time.perf_counter()
+        funcion()
+        root.update_idletasks()
+        return (time.perf_counter() - inicio) * 1000
+
+    print(f"\nPrecioPanel.mostrar_precios_multiples ({len(precios_data)} periodos):")
+    print(f"  primer render (crea widgets) : {render(lambda: precio_panel.mostrar_precios_multiples(precios_data)):8.3f} ms")
+    print(f"  mismo contenido (sin cambios): {render(lambda: precio_panel.mostrar_precios_multiples(precios_data)):8.3f} ms")
+    print(f"  50% de precios cambiados     : {render(lambda: precio_panel.mostrar_precios_multiples(precios_modificados)):8.3f} ms")
+    print(f"  mensaje -> 100 periodos      : {render(lambda: (precio_panel.reset(), precio_panel.mostrar_precios_multiples(precios_data))):8.3f} ms")
+
+    print(f"\nPeriodosPanel.actualizar_periodos ({len(periodos)} periodos):")
+    print(f"  primer render                : {render(lambda: periodos_panel.actualizar_periodos(habitacion, hotel)):8.3f} ms")
+    print(f"  mismo contenido (sin cambios): {render(lambda: periodos_panel.actualizar_periodos(habitacion, hotel)):8.3f} ms")
+    print(f"  tras limpiar                 : {render(lambda: (periodos_panel.limpiar(), periodos_panel.actualizar_periodos(habitacion, hotel))):8.3f} ms")
+
+    root.destroy()
+
+
+if __name__ == "__main__":
+    hotel, habitacion, periodos = crear_hotel_sintetico()
+    medir_lookup_grupos(hotel, periodos)
+    medir_paneles(hotel, habitacion, periodos)
@@ -0,0 +1,174 @@
+"""
+Perfiles del crawler: latencia y memoria
+----------------------------------------
+Carga las mismas búsquedas del servidor SynXis local con cada perfil de
+perfiles_crawler.json (interactive-debug, production-headless, replay,
+benchmark) a través de crear_crawler + obtener_pagina, y reporta por perfil:
+- inicio del crawler (lanzar el navegador) y latencia por página p50/p95,
+- memoria residente pico del proceso y sus hijos (el navegador),
+- bytes descargados por página (BloqueadorRecursos).
+
+El servidor agrega las tarjetas por JS y sus recursos tardan, como SynXis.
+El perfil replay lee un archivo temporal con las mismas búsquedas grabadas
+(el HTML con todas las tarjetas y su markdown de crawl4ai, sin navegador).
+
+Los perfiles con navegador necesitan el Chromium de Playwright (playwright
+install chromium); sin él quedan como "no se pudo medir". La memoria se
+mide con psutil (pip install psutil), que no está en requirements.txt: sin
+él la columna de memoria queda vacía. No usa red externa ni LLM.
+
+Ejecutar desde la raíz del proyecto:
+    python -m Tests.bench_perfiles_crawler [busquedas] [perfil ...]
+"""
+
+import asyncio
+import sys
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from urllib.parse import urlencode
+
+from crawl4ai.content_scraping_strategy import WebScrapingStrategy
+from crawl4ai.markdown_generation_strategy import DefaultMarkdownGenerator
+
+from ScrawlingChinese.archivo_paginas import ArchivoPaginas
+from ScrawlingChinese.config import CSS_SELECTOR
+from ScrawlingChinese.espera_pagina import MedidorEspera
+from ScrawlingChinese.perfiles_crawler import cargar_perfiles
+from ScrawlingChinese.servidor_local import (FuenteFixtures, ServidorSynxisLocal, con_ruido, generador_consulta,
+                                             render_pagina)
+from ScrawlingChinese.utils.scraper_utils import crear_crawler, obtener_pagina
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+DIRECTORIO_FIXTURES = Path(__file__).parent / "fixtures" / "synxis"
+BUSQUEDAS = 5
+PROGRESIVO_MS = 30
+LATENCIA_RECURSOS = 1.0
+
+
+class MuestreoMemoria:
+    """Memoria residente pico del proceso y sus hijos (el navegador), muestreada en un hilo."""
+
+    def __init__(self, intervalo=0.05):
+        self._proceso = psutil.Process() if psutil else None
+        self._intervalo = intervalo
+        self._detener = threading.Event()
+        self.pico = self.base = self.actual()
+        self._hilo = threading.Thread(target=self._muestrear, daemon=True)
+
+    def actual(self):
+        if self._proceso is None:
+            return 0
+        total = self._proceso.memory_info().rss
+        for hijo in self._proceso.children(recursive=True):
+            try:
+                total += hijo.memory_info().rss
+            except psutil.Error:  # el hijo terminó entre children() y memory_info()
+                pass
+        return total
+
+    def _muestrear(self):
+        while not self._detener.wait(self._intervalo):
+            self.pico = max(self.pico, self.actual())
+
+    def __enter__(self):
+        if self._proceso is not None:
+            self._hilo.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._detener.set()
+        if self._hilo.is_alive():
+            self._hilo.join()
+        return False
+
+
+def percentil(valores, p):
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(p * len(ordenados)))] if ordenados else 0.0
+
+
+def busquedas_de(cantidad):
+    llegada = date(2026, 7, 1)
+    return [{"adult": 2, "child": 0, "arrive": (llegada + timedelta(days=i)).isoformat(),
+             "depart": (llegada + timedelta(days=i + 3)).isoformat()} for i in range(cantidad)]
+
+
+def archivar_busquedas(archivo, servidor, busquedas):
+    """Graba lo que ve el navegador con todas las tarjetas cargadas, para el perfil replay."""
+    for params in busquedas:
+        url = f"{servidor.url}?{urlencode(params)}"
+        hotel = con_ruido(servidor.fuente.hotel_para(params), generador_consulta(params, servidor.semilla),
+                          servidor.ruido)
+        html = render_pagina(hotel, params)
+        limpio = WebScrapingStrategy().scrap(url, html, css_selector=CSS_SELECTOR)["cleaned_html"]
+        markdown = DefaultMarkdownGenerator().generate_markdown(limpio, base_url=url).raw_markdown
+        archivo.grabar(url, html, markdown, servidor.latencia, params=params)
+
+
+async def medir_perfil(perfil, url_base, busquedas, archivo):
+    latencias = []
+    errores = 0
+    bloqueador = perfil.bloqueador()
+    medidor = MedidorEspera(perfil.espera)
+    with MuestreoMemoria() as memoria:
+        inicio = time.perf_counter()
+        async with crear_crawler(bloqueador, medidor, perfil=perfil, archivo=archivo) as crawler:
+            segundos_inicio = time.perf_counter() - inicio
+            for params in busquedas:
+                inicio = time.perf_counter()
+                try:
+                    await obtener_pagina(crawler, url_base, params, CSS_SELECTOR, "benchmark", perfil=perfil)
+                    latencias.append(time.perf_counter() - inicio)
+                except Exception as e:
+                    errores += 1
+                    print(f"[BENCHMARK] {perfil.nombre}: {e}")
+    return {
+        "perfil": perfil.nombre,
+        "paginas": len(latencias),
+        "errores": errores,
+        "segundos_inicio": segundos_inicio,
+        "latencia_p50": percentil(latencias, 0.5),
+        "latencia_p95": percentil(latencias, 0.95),
+        "memoria_pico_mb": (memoria.pico - memoria.base) / 1e6 if psutil else None,
+        "bytes_por_pagina": bloqueador.metricas()["bytes_por_pagina"],
+    }
+
+
+async def medir_perfiles(nombres, cantidad):
+    perfiles = cargar_perfiles()
+    busquedas = busquedas_de(cantidad)
+    resultados = []
+    with tempfile.TemporaryDirectory() as temporal:
+        archivo = ArchivoPaginas(Path(temporal))
+        async with ServidorSynxisLocal(FuenteFixtures(DIRECTORIO_FIXTURES), latencia=0.2,
+                                       progresivo_ms=PROGRESIVO_MS, latencia_recursos=LATENCIA_RECURSOS) as servidor:
+            archivar_busquedas(archivo, servidor, busquedas)
+            for nombre in nombres or list(perfiles):
+                try:
+                    resultados.append(await medir_perfil(perfiles[nombre], servidor.url, busquedas, archivo))
+                except Exception as e:
+                    resultados.append({"perfil": nombre, "error": str(e).splitlines()[0]})
+    return resultados
+
+
+if __name__ == "__main__":
+    argumentos = sys.argv[1:]
+    cantidad = int(argumentos.pop(0)) if argumentos and argumentos[0].isdigit() else BUSQUEDAS
+    resultados = asyncio.run(medir_perfiles(argumentos, cantidad))
+
+    print(f"\n{cantidad} búsquedas contra el servidor SynXis local")
+    for r in resultados:
+        if "error" in r:
+            print(f"  {r['perfil']:20s}: no se pudo medir ({r['error']})")
+            continue
+        memoria = "sin psutil" if r["memoria_pico_mb"] is None else f"+{r['memoria_pico_mb']:6.1f} MB"
+        print(f"  {r['perfil']:20s}: inicio {r['segundos_inicio']:5.2f}s  página p50 {r['latencia_p50']:5.2f}s "
+              f"p95 {r['latencia_p95']:5.2f}s  {r['paginas']} ok/{r['errores']} errores  "
+              f"memoria pico {memoria}  {r['bytes_por_pagina'] / 1e3:6.1f} KB/página")
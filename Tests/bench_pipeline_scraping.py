@@ -0,0 +1,68 @@
+"""
+Scraping en serie vs pipeline de obtención y extracción
+-------------------------------------------------------
+Simula N búsquedas donde cargar la página tarda FETCH segundos (navegador)
+y la extracción LLM tarda EXTRACCION segundos (bloqueante, en un hilo), y
+compara:
+- En serie: extracción dentro de crawler.arun, el navegador espera al LLM.
+- PipelineScraping con distintos números de navegadores y extractores.
+
+No usa red ni navegador: las etapas son esperas simuladas.
+
+Ejecutar desde la raíz del proyecto:
+    python -m Tests.bench_pipeline_scraping [solicitudes]
+"""
+
+import asyncio
+import sys
+import time
+
+from Models.hotelWeb import HotelWeb, HabitacionWeb, ComboPrecio
+from ScrawlingChinese.pipeline import PipelineScraping, PaginaObtenida
+
+SOLICITUDES = 12
+FETCH = 0.20
+EXTRACCION = 0.60
+
+
+async def obtener(params, id_navegador):
+    await asyncio.sleep(FETCH)
+    return PaginaObtenida(params=params, url=f"https://example/?n={params['n']}",
+                          html="", markdown=f"pagina {params['n']}", segundos_fetch=FETCH)
+
+
+def extraer(pagina):
+    time.sleep(EXTRACCION)  # llamada HTTP bloqueante al LLM
+    return HotelWeb(detalles="Alvear Palace Hotel", habitacion=[
+        HabitacionWeb(nombre="Palace Classic", detalles="",
+                      combos=[ComboPrecio(titulo="Room Only", descripcion="", precio=400.0 + pagina.params["n"])])
+    ])
+
+
+async def en_serie(solicitudes):
+    resultados = []
+    for params in solicitudes:
+        pagina = await obtener(params, 0)
+        resultados.append(extraer(pagina))
+    return resultados
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else SOLICITUDES
+    solicitudes = [{"n": i} for i in range(n)]
+
+    inicio = time.perf_counter()
+    serie = asyncio.run(en_serie(solicitudes))
+    t_serie = time.perf_counter() - inicio
+    print(f"\n{n} búsquedas (obtención {FETCH}s, extracción {EXTRACCION}s)")
+    print(f"  en serie                      : {t_serie:6.2f} s")
+
+    for navegadores, extractores in ((1, 1), (1, 4), (2, 6)):
+        pipeline = PipelineScraping(obtener, extraer, navegadores=navegadores,
+                                    extractores=extractores, capacidad_cola=4)
+        inicio = time.perf_counter()
+        resultados = asyncio.run(pipeline.ejecutar(solicitudes))
+        t = time.perf_counter() - inicio
+        iguales = [r.hotel for r in resultados] == serie
+        print(f"  pipeline {navegadores} nav / {extractores} extr      : {t:6.2f} s  (idéntico: {iguales})")
+        print("    " + pipeline.resumen().replace("\n", "\n    "))
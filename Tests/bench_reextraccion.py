@@ -0,0 +1,57 @@
+"""
+Reextracción del archivo de páginas: 1 proceso vs pool
+------------------------------------------------------
+Arma un archivo temporal con PAGINAS páginas de resultados (la plantilla de
+SynXis del servidor local con las habitaciones de los fixtures y ruido de
+precios por búsqueda) y lo reextrae con el extractor determinista del HTML,
+con un proceso y con el pool, reportando páginas por minuto.
+
+No usa red ni LLM.
+
+Ejecutar desde la raíz del proyecto:
+    python -m Tests.bench_reextraccion [paginas]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+from ScrawlingChinese.archivo_paginas import ArchivoPaginas
+from ScrawlingChinese.extractor_html import extraer_habitaciones_html
+from ScrawlingChinese.reextraccion import reextraer_archivo
+from ScrawlingChinese.servidor_local import FuenteFixtures, con_ruido, generador_consulta, render_pagina
+
+DIRECTORIO_FIXTURES = Path(__file__).parent / "fixtures" / "synxis"
+PAGINAS = 2000
+
+
+def armar_archivo(directorio, paginas):
+    archivo = ArchivoPaginas(directorio, nivel_compresion=1)
+    fuente = FuenteFixtures(DIRECTORIO_FIXTURES)
+    inicio = date(2026, 1, 1)
+    for i in range(paginas):
+        params = {"arrive": (inicio + timedelta(days=i % 365)).isoformat(),
+                  "depart": (inicio + timedelta(days=i % 365 + 3)).isoformat(),
+                  "adult": 1 + i // 365 % 3, "child": i // 1095}
+        hotel = con_ruido(fuente.hotel_para(params), generador_consulta(params), 0.05)
+        url = "https://be.synxis.com/?" + "&".join(f"{k}={v}" for k, v in params.items())
+        archivo.grabar(url, render_pagina(hotel, params), "", 1.0, params=params)
+    return archivo
+
+
+if __name__ == "__main__":
+    paginas = int(sys.argv[1]) if len(sys.argv) > 1 else PAGINAS
+    with tempfile.TemporaryDirectory() as temporal:
+        inicio = time.perf_counter()
+        archivo = armar_archivo(Path(temporal) / "archivo", paginas)
+        print(f"Archivo de {len(archivo)} páginas armado en {time.perf_counter() - inicio:.1f}s")
+
+        for procesos in sorted({1, os.cpu_count() or 1}):
+            resumen = reextraer_archivo(archivo, Path(temporal) / "salida", procesos=procesos,
+                                        extractor=extraer_habitaciones_html)
+            print(f"  {procesos:2d} procesos: {resumen.segundos:6.2f} s  "
+                  f"{resumen.paginas_por_minuto:8.0f} páginas/min  "
+                  f"({resumen.con_hotel} con habitaciones, {resumen.con_cambios} con cambios)")
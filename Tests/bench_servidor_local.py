@@ -0,0 +1,86 @@
+"""
+Prueba de carga del pipeline contra el servidor SynXis local
+------------------------------------------------------------
+Levanta ServidorSynxisLocal con latencia, errores 500 y límite de tasa como
+el motor real bajo carga, y corre PipelineScraping con distintos números de
+navegadores. La etapa de obtención pide la página por HTTP (aiohttp, sin
+navegador) y la de extracción lee los títulos y precios del HTML. Reporta
+duración, páginas obtenidas, reintentos y lo que vio el servidor (429, 500).
+
+No usa red externa ni LLM.
+
+Ejecutar desde la raíz del proyecto:
+    python -m Tests.bench_servidor_local [solicitudes]
+"""
+
+import asyncio
+import re
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+import aiohttp
+
+from Models.hotelWeb import ComboPrecio, HabitacionWeb, HotelWeb
+from ScrawlingChinese.pipeline import PaginaObtenida, PipelineScraping
+from ScrawlingChinese.servidor_local import FuenteFixtures, ServidorSynxisLocal
+
+DIRECTORIO_FIXTURES = Path(__file__).parent / "fixtures" / "synxis"
+SOLICITUDES = 40
+LATENCIA = 0.3
+JITTER = 0.2
+TASA_ERROR = 0.05
+MAX_RPS = 8
+
+
+def solicitudes(n):
+    inicio = date(2026, 7, 1)
+    return [{"arrive": (inicio + timedelta(days=i)).isoformat(),
+             "depart": (inicio + timedelta(days=i + 3)).isoformat(), "adult": 2, "child": 0}
+            for i in range(n)]
+
+
+def extraer(pagina):
+    habitaciones = []
+    for tarjeta in pagina.html.split('class="thumb-cards_card"')[1:]:
+        nombre = re.search(r'thumb-cards_title">([^<]+)<', tarjeta).group(1)
+        precios = re.findall(r'rate-card_amount">([^<]+)<', tarjeta)
+        habitaciones.append(HabitacionWeb(nombre=nombre, detalles=None, combos=[
+            ComboPrecio(titulo=str(i), descripcion="", precio=float(p.replace(",", "")))
+            for i, p in enumerate(precios)]))
+    return HotelWeb(habitacion=habitaciones, detalles="Alvear Palace Hotel") if habitaciones else None
+
+
+async def medir(n, navegadores):
+    servidor = ServidorSynxisLocal(FuenteFixtures(DIRECTORIO_FIXTURES), latencia=LATENCIA, jitter=JITTER,
+                                   tasa_error=TASA_ERROR, max_rps=MAX_RPS)
+    async with servidor, aiohttp.ClientSession() as sesion:
+        async def obtener(params, id_navegador):
+            inicio = time.perf_counter()
+            async with sesion.get(servidor.url, params=params) as respuesta:
+                if respuesta.status != 200:
+                    raise Exception(f"HTTP {respuesta.status}")
+                html = await respuesta.text()
+            return PaginaObtenida(params=params, url=str(respuesta.url), html=html, markdown="",
+                                  segundos_fetch=time.perf_counter() - inicio)
+
+        pipeline = PipelineScraping(obtener, extraer, navegadores=navegadores, extractores=2,
+                                    espera_reintento=0.5, max_intentos=5)
+        inicio = time.perf_counter()
+        resultados = await pipeline.ejecutar(solicitudes(n))
+        segundos = time.perf_counter() - inicio
+    return segundos, resultados, servidor.metricas()
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else SOLICITUDES
+    print(f"{n} búsquedas; servidor con latencia {LATENCIA}+{JITTER}s, {TASA_ERROR:.0%} errores, "
+          f"{MAX_RPS} solicitudes/s")
+    for navegadores in (1, 4, 8, 16):
+        segundos, resultados, m = asyncio.run(medir(n, navegadores))
+        ok = sum(r.hotel is not None for r in resultados)
+        reintentos = sum(r.intentos - 1 for r in resultados)
+        print(f"  {navegadores:2d} navegadores: {segundos:6.2f} s  {ok}/{n} páginas  "
+              f"{reintentos:3d} reintentos  servidor: {m['limitadas']} x 429, {m['errores']} x 500, "
+              f"p95 {m['latencia_p95']:.2f}s")
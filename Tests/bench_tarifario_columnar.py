@@ -0,0 +1,102 @@
+"""
+Consultas sobre el tarifario: bucles anidados vs TarifarioColumnar
+------------------------------------------------------------------
+Arma un DatosExcel sintético grande (muchos hoteles, habitaciones y periodos)
+y compara la consulta "habitaciones vigentes en una fecha cuyo precio de
+contrato difiere más de 5% del último precio web" recorriendo los modelos
+pydantic contra TarifarioColumnar, verificando que el resultado coincida.
+
+Ejecutar desde la raíz del proyecto:
+    python -m Tests.bench_tarifario_columnar [hoteles]
+"""
+
+import random
+import sys
+import time
+from datetime import date, timedelta
+
+from Models.hotelExcel import DatosExcel, HotelExcel, HabitacionExcel, PeriodoGroup, Periodo
+from Core.tarifario_columnar import TarifarioColumnar
+
+HOTELES = 300
+HABITACIONES_POR_HOTEL = 20
+PERIODOS_POR_HOTEL = 24
+FECHA_CONSULTA = date(2026, 1, 15)
+
+
+def crear_datos(hoteles=HOTELES, seed=7):
+    rnd = random.Random(seed)
+    lista = []
+    for h in range(hoteles):
+        nombre_hotel = f"Hotel {h:04d} (A)"
+        periodos = []
+        inicio = date(2025, 10, 1)
+        for p in range(PERIODOS_POR_HOTEL):
+            fin = inicio + timedelta(days=rnd.randint(5, 20))
+            periodos.append(Periodo(id=p + 1, fecha_inicio=inicio, fecha_fin=fin, nombresito=None))
+            inicio = fin + timedelta(days=1)
+
+        habitaciones = []
+        for r in range(HABITACIONES_POR_HOTEL):
+            for mitad in (periodos[: PERIODOS_POR_HOTEL // 2], periodos[PERIODOS_POR_HOTEL // 2:]):
+                habitaciones.append(HabitacionExcel(
+                    nombre=f"dbl room {r}", precio=rnd.randint(100, 400), row_idx=len(habitaciones),
+                    periodo_ids={p.id for p in mitad}
+                ))
+        lista.append(HotelExcel(
+            nombre=nombre_hotel,
+            habitaciones_directas=habitaciones,
+            periodos_group=[PeriodoGroup(nombre="Season", periodos=periodos)],
+        ))
+    return DatosExcel(hoteles=lista)
+
+
+def crear_precios_web(datos, seed=11):
+    rnd = random.Random(seed)
+    return {
+        (hotel.nombre, f"dbl room {r}"): float(rnd.randint(100, 400))
+        for hotel in datos.hoteles
+        for r in range(HABITACIONES_POR_HOTEL)
+    }
+
+
+def discrepancias_anidadas(datos, fecha, precios_web, umbral=0.05):
+    """Misma consulta que TarifarioColumnar.discrepancias con bucles sobre los modelos."""
+    resultado = set()
+    for hotel in datos.hoteles:
+        for hab in hotel.habitaciones_directas:
+            web = precios_web.get((hotel.nombre, hab.nombre))
+            if web is None or not isinstance(hab.precio, (int, float)):
+                continue
+            for pid in hab.periodo_ids:
+                periodo = hotel.periodo_por_id(pid)
+                if periodo and periodo.fecha_inicio <= fecha <= periodo.fecha_fin:
+                    if abs(web - hab.precio) / hab.precio > umbral:
+                        resultado.add((hotel.nombre, hab.nombre, pid))
+    return resultado
+
+
+def cronometrar(funcion):
+    inicio = time.perf_counter()
+    resultado = funcion()
+    return resultado, (time.perf_counter() - inicio) * 1000
+
+
+if __name__ == "__main__":
+    hoteles = int(sys.argv[1]) if len(sys.argv) > 1 else HOTELES
+    datos = crear_datos(hoteles)
+    precios_web = crear_precios_web(datos)
+
+    tarifario, t_construccion = cronometrar(lambda: TarifarioColumnar.desde_datos_excel(datos))
+    anidado, t_anidado = cronometrar(lambda: discrepancias_anidadas(datos, FECHA_CONSULTA, precios_web))
+    indices, t_columnar = cronometrar(lambda: tarifario.discrepancias(FECHA_CONSULTA, precios_web))
+    _, t_rango = cronometrar(lambda: tarifario.en_rango(date(2026, 1, 1), date(2026, 1, 31)))
+
+    columnar = {(f["hotel"], f["habitacion"], f["periodo_id"]) for f in tarifario.filas(indices)}
+
+    print(f"\n{hoteles} hoteles, {len(tarifario)} filas (habitación x periodo)")
+    print(f"  construcción del tarifario columnar : {t_construccion:9.2f} ms")
+    print(f"  discrepancias >5% con bucles        : {t_anidado:9.2f} ms")
+    print(f"  discrepancias >5% columnar          : {t_columnar:9.2f} ms")
+    print(f"  rango de fechas (enero) columnar    : {t_rango:9.2f} ms")
+    print(f"  resultado idéntico                  : {anidado == columnar} ({len(columnar)} filas)")
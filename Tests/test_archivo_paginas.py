@@ -0,0 +1,89 @@
+"""
+Prueba del archivo de páginas (grabar y reproducir)
+---------------------------------------------------
+Graba las páginas de Tests/fixtures/synxis con ArchivoPaginas, reabre el
+archivo y las sirve con CrawlerReproductor a través de obtener_pagina (el
+mismo camino que el crawler), sin navegador ni red.
+"""
+import asyncio
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("crawl4ai")
+
+from ScrawlingChinese.archivo_paginas import ArchivoPaginas, CrawlerReproductor, clave_solicitud
+from ScrawlingChinese.utils.scraper_utils import obtener_pagina
+
+DIRECTORIO_FIXTURES = Path(__file__).parent / "fixtures" / "synxis"
+BASE_URL = "https://be.synxis.com/"
+FIXTURES = sorted(DIRECTORIO_FIXTURES.glob("*.html"))
+
+
+def params_de(indice):
+    return {"chain": "1234", "hotel": "5678", "arrive": f"2025-03-{10 + indice:02d}",
+            "depart": f"2025-03-{12 + indice:02d}", "adult": "2", "child": "0"}
+
+
+def url_de(params):
+    return f"{BASE_URL}?" + "&".join(f"{k}={v}" for k, v in params.items())
+
+
+@pytest.fixture
+def archivo(tmp_path):
+    archivo = ArchivoPaginas(tmp_path)
+    for indice, ruta in enumerate(FIXTURES):
+        archivo.grabar(url_de(params_de(indice)), ruta.read_text(encoding="utf-8"),
+                       ruta.with_suffix(".md").read_text(encoding="utf-8"), 1.5, status_code=200)
+    return archivo
+
+
+def test_el_indice_persiste(archivo, tmp_path):
+    reabierto = ArchivoPaginas(tmp_path)
+
+    assert len(reabierto) == len(FIXTURES)
+    assert archivo.bytes_comprimidos < archivo.bytes_originales
+    registro = reabierto.buscar(url_de(params_de(0)))
+    assert reabierto.leer_objeto(registro.html) == FIXTURES[0].read_text(encoding="utf-8")
+    assert registro.params["arrive"] == "2025-03-10"
+
+
+def test_reproduce_por_obtener_pagina(archivo, tmp_path):
+    reproductor = CrawlerReproductor(ArchivoPaginas(tmp_path))
+
+    async def correr():
+        async with reproductor as crawler:
+            return [await obtener_pagina(crawler, BASE_URL, params_de(i), ".thumb-cards_products", "s")
+                    for i in range(len(FIXTURES))]
+
+    paginas = asyncio.run(correr())
+
+    for pagina, ruta in zip(paginas, FIXTURES):
+        assert pagina.markdown == ruta.with_suffix(".md").read_text(encoding="utf-8")
+        assert pagina.html == ruta.read_text(encoding="utf-8")
+    assert reproductor.aciertos == len(FIXTURES)
+
+
+def test_la_clave_ignora_el_orden_de_los_parametros(archivo):
+    params = params_de(0)
+    invertidos = dict(reversed(list(params.items())))
+
+    assert clave_solicitud(url_de(invertidos)) == clave_solicitud(url_de(params))
+    assert archivo.buscar(url_de(invertidos)) is not None
+
+
+def test_contenido_repetido_no_se_duplica(archivo):
+    ruta = FIXTURES[0]
+    archivo.grabar(url_de(params_de(99)), ruta.read_text(encoding="utf-8"),
+                   ruta.with_suffix(".md").read_text(encoding="utf-8"), 1.0)
+
+    assert archivo.objetos_reusados == 2
+    assert len(list(archivo.directorio.glob("objetos/*/*.gz"))) == 2 * len(FIXTURES)
+
+
+def test_pagina_faltante_falla(archivo):
+    reproductor = CrawlerReproductor(archivo)
+
+    with pytest.raises(Exception, match="no está en el archivo"):
+        asyncio.run(obtener_pagina(reproductor, BASE_URL, params_de(50), ".thumb-cards_products", "s"))
+    assert reproductor.faltantes == 1
@@ -0,0 +1,110 @@
+"""
+Prueba del bloqueo de recursos
+------------------------------
+Verifica las decisiones de PoliticaRecursos y el recorrido de los hooks de
+BloqueadorRecursos con objetos que imitan la estrategia de crawl4ai y la
+página, el contexto y las rutas de Playwright (no hace falta navegador).
+"""
+import asyncio
+
+from ScrawlingChinese.bloqueo_recursos import BloqueadorRecursos, PoliticaRecursos
+
+
+def test_politica_por_dominio_y_tipo():
+    politica = PoliticaRecursos(dominios_bloqueados=["googletagmanager.com"], tipos_bloqueados={"image", "font"})
+
+    assert politica.motivo_bloqueo("https://www.googletagmanager.com/gtm.js", "script") == "dominio"
+    assert politica.motivo_bloqueo("https://cdn.synxis.com/images/alvear/PC_1.jpg", "image") == "tipo"
+    assert politica.motivo_bloqueo("https://be.synxis.com/static/app.js", "script") is None
+
+    politica.dominios_permitidos = ["synxis.com"]
+    assert politica.motivo_bloqueo("https://fonts.googleapis.com/css2", "stylesheet") == "fuera de permitidos"
+    assert politica.motivo_bloqueo("https://be.synxis.com/?hotel=6933", "document") is None
+    assert politica.motivo_bloqueo("https://otro.com/pagina", "document") is None
+
+
+class Estrategia:
+    def __init__(self):
+        self.hooks = {"on_page_context_created": None, "before_goto": None, "after_goto": None}
+
+    def set_hook(self, tipo, hook):
+        self.hooks[tipo] = hook
+
+
+class Solicitud:
+    def __init__(self, url, tipo, pagina):
+        self.url, self.resource_type = url, tipo
+        self.frame = type("Frame", (), {"page": pagina})()
+
+    async def sizes(self):
+        return {"responseBodySize": 1000, "responseHeadersSize": 100}
+
+
+class Ruta:
+    def __init__(self, solicitud):
+        self.request = solicitud
+        self.resultado = None
+
+    async def abort(self, motivo=None):
+        self.resultado = "abortada"
+
+    async def continue_(self):
+        self.resultado = "continuada"
+
+
+class Contexto:
+    def __init__(self):
+        self.rutas = []
+
+    async def route(self, patron, manejador):
+        self.rutas.append(manejador)
+
+
+class Pagina:
+    def __init__(self):
+        self.eventos = {}
+
+    def on(self, evento, manejador):
+        self.eventos.setdefault(evento, []).append(manejador)
+
+
+def test_hooks_bloquean_y_miden_cada_carga():
+    estrategia = Estrategia()
+    llamadas_previas = []
+    estrategia.hooks["before_goto"] = lambda page, **kw: llamadas_previas.append(kw["url"])
+    bloqueador = BloqueadorRecursos(PoliticaRecursos())
+    bloqueador.instalar(type("Crawler", (), {"crawler_strategy": estrategia})())
+    pagina, contexto = Pagina(), Contexto()
+
+    async def cargar(url, recursos):
+        await estrategia.hooks["on_page_context_created"](pagina, context=contexto)
+        await estrategia.hooks["before_goto"](pagina, context=contexto, url=url)
+        rutas = [Ruta(Solicitud(u, t, pagina)) for u, t in recursos]
+        for ruta in rutas:
+            await contexto.rutas[0](ruta, ruta.request)
+            if ruta.resultado == "continuada":
+                await pagina.eventos["requestfinished"][0](ruta.request)
+        await estrategia.hooks["after_goto"](pagina, context=contexto, url=url, response=None)
+        return [r.resultado for r in rutas]
+
+    async def correr():
+        # La misma sesión (página y contexto) para dos búsquedas
+        primera = await cargar("https://be.synxis.com/?arrive=2026-07-01", [
+            ("https://be.synxis.com/?arrive=2026-07-01", "document"),
+            ("https://be.synxis.com/static/app.js", "script"),
+            ("https://www.google-analytics.com/analytics.js", "script"),
+            ("https://cdn.synxis.com/images/alvear/PC_1.jpg", "image"),
+        ])
+        segunda = await cargar("https://be.synxis.com/?arrive=2026-07-02", [
+            ("https://be.synxis.com/?arrive=2026-07-02", "document"),
+        ])
+        return primera, segunda
+
+    primera, segunda = asyncio.run(correr())
+
+    assert primera == ["continuada", "continuada", "abortada", "abortada"]
+    assert segunda == ["continuada"]
+    assert len(contexto.rutas) == 1 and len(pagina.eventos["requestfinished"]) == 1
+    assert llamadas_previas == ["https://be.synxis.com/?arrive=2026-07-01", "https://be.synxis.com/?arrive=2026-07-02"]
+    assert [(p.solicitudes, p.total_bloqueadas, p.bytes) for p in bloqueador.paginas] == [(4, 2, 2200), (1, 0, 1100)]
+    assert bloqueador.metricas()["tipos_bloqueados"] == {"script": 1, "image": 1}
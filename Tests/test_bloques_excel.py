@@ -0,0 +1,62 @@
+"""
+Prueba de la extracción incremental por bloques
+-----------------------------------------------
+Verifica con Data/Extracto_prueba2.xlsx (preámbulo + 3 hoteles) que
+cargar_excel_por_bloques da lo mismo que cargar_excel, que recargar el
+workbook sin cambios no re-procesa ningún bloque, que editar un precio de un
+hotel re-procesa solo ese bloque y que los ids de periodo no cambian.
+"""
+from pathlib import Path
+
+from openpyxl import load_workbook
+
+from ExtractorDatos import bloques_excel
+from ExtractorDatos.bloques_excel import cargar_excel_por_bloques
+from ExtractorDatos.extractor import cargar_excel
+
+PATH_EXCEL = Path(__file__).parent.parent / "Data" / "Extracto_prueba2.xlsx"
+
+
+def ids_periodos(datos):
+    return {hotel.nombre: [p.id for g in hotel.periodos_group for p in g.periodos] for hotel in datos.hoteles}
+
+
+def test_recarga_solo_el_bloque_editado(tmp_path, monkeypatch):
+    # Guardado una vez con openpyxl, que es con lo que se edita abajo: al guardar
+    # redondea los floats a 15 dígitos y recorta las columnas vacías del final
+    path = tmp_path / "tarifario.xlsx"
+    load_workbook(PATH_EXCEL).save(path)
+
+    reextraidos = []
+    extraer_bloque = bloques_excel.extraer_bloque
+
+    def contar(ws, filas, inicio, fin, estado):
+        reextraidos.append(inicio)
+        return extraer_bloque(ws, filas, inicio, fin, estado)
+
+    monkeypatch.setattr(bloques_excel, "extraer_bloque", contar)
+
+    datos, bloques = cargar_excel_por_bloques(path)
+    assert len(bloques) == 4 and len(reextraidos) == 4
+    assert datos == cargar_excel(path)
+    ids = ids_periodos(datos)
+
+    # Sin cambios: ningún bloque se vuelve a procesar
+    reextraidos.clear()
+    datos, bloques = cargar_excel_por_bloques(path, bloques_previos=bloques)
+    assert reextraidos == [] and datos == cargar_excel(path)
+
+    # Un precio del segundo hotel (Faena)
+    inicio_faena = bloques[2].fila_inicio
+    wb = load_workbook(path)
+    for (celda,) in wb.active.iter_rows(min_row=inicio_faena + 1, min_col=3, max_col=3):
+        if isinstance(celda.value, (int, float)):
+            celda.value += 1
+            break
+    wb.save(path)
+
+    reextraidos.clear()
+    datos, bloques = cargar_excel_por_bloques(path, bloques_previos=bloques)
+    assert reextraidos == [inicio_faena]
+    assert datos == cargar_excel(path)
+    assert ids_periodos(datos) == ids
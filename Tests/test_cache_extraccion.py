@@ -0,0 +1,71 @@
+"""
+Prueba de la caché de extracciones LLM
+--------------------------------------
+Verifica que CacheExtraccion devuelve las habitaciones guardadas para el
+mismo markdown, que cambiar la instrucción o el schema invalida las
+entradas, que el desalojo LRU deja el 90% del máximo conservando la entrada
+leída hace poco, que una entrada corrupta cuenta como fallo y las
+estadísticas de aciertos y llamadas LLM ahorradas.
+"""
+import os
+import time
+
+from Models.hotelWeb import HabitacionWeb
+from ScrawlingChinese.cache_extraccion import CacheExtraccion, version_extraccion
+
+INSTRUCCION = "Extrae todas las habitaciones"
+SCHEMA = HabitacionWeb.model_json_schema()
+HABITACIONES = [HabitacionWeb(nombre="Palace Classic", detalles="King bed",
+                              combos=[{"titulo": "Room Only", "descripcion": "", "precio": 450.0}])]
+
+
+def test_acierto_y_version(tmp_path):
+    cache = CacheExtraccion(version_extraccion(INSTRUCCION, SCHEMA), directorio=tmp_path)
+    assert cache.obtener("## Palace Classic") is None
+    cache.guardar("## Palace Classic", HABITACIONES)
+    assert cache.obtener("## Palace Classic") == HABITACIONES
+    assert cache.obtener("## Palace Classic\n") is None
+
+    # Otra instrucción u otro schema: las entradas guardadas no sirven
+    otra_instruccion = CacheExtraccion(version_extraccion(INSTRUCCION + ".", SCHEMA), directorio=tmp_path)
+    otro_schema = CacheExtraccion(version_extraccion(INSTRUCCION, {**SCHEMA, "title": "Otra"}), directorio=tmp_path)
+    assert otra_instruccion.obtener("## Palace Classic") is None
+    assert otro_schema.obtener("## Palace Classic") is None
+
+    # Otra instancia con la misma versión lee lo guardado en disco
+    assert CacheExtraccion(cache.version, directorio=tmp_path).obtener("## Palace Classic") == HABITACIONES
+
+
+def test_desalojo_lru(tmp_path):
+    cache = CacheExtraccion("v", directorio=tmp_path, max_entradas=10)
+    for i in range(10):
+        cache.guardar(f"pagina {i}", HABITACIONES)
+    # Accesos en orden: la página 0 es la más antigua
+    antes = time.time() - 100
+    for i in range(10):
+        os.utime(cache._ruta(f"pagina {i}"), (antes + i, antes + i))
+    assert cache.obtener("pagina 0") == HABITACIONES
+
+    cache.guardar("pagina 10", HABITACIONES)
+
+    assert cache.desalojadas == 2 and len(list(tmp_path.glob("*.json"))) == 9
+    assert cache.estadisticas()["entradas"] == 9
+    presentes = [i for i in range(11) if cache._ruta(f"pagina {i}").exists()]
+    assert presentes == [0, 3, 4, 5, 6, 7, 8, 9, 10]
+
+
+def test_entrada_corrupta_y_estadisticas(tmp_path):
+    cache = CacheExtraccion("v", directorio=tmp_path)
+    cache.guardar("pagina", HABITACIONES)
+    cache.guardar("corrupta", HABITACIONES)
+    cache._ruta("corrupta").write_text('[{"nombre": ', encoding="utf-8")
+
+    assert cache.obtener("corrupta") is None
+    assert cache.obtener("pagina") == HABITACIONES
+    assert cache.obtener("pagina") == HABITACIONES
+    assert cache.obtener("otra") is None
+
+    estadisticas = cache.estadisticas()
+    assert (estadisticas["aciertos"], estadisticas["fallos"]) == (2, 2)
+    assert estadisticas["tasa_aciertos"] == 0.5 and estadisticas["llamadas_llm_ahorradas"] == 2
+    assert "2 llamadas LLM ahorradas" in cache.resumen()
@@ -0,0 +1,90 @@
+"""
+Prueba de la comparación por estadía
+------------------------------------
+Verifica que comparar_estadia solo usa los periodos de la habitación (no los
+de otros grupos del hotel sin precio para ella), que cada noche cuenta una
+sola vez aunque varios grupos repitan las fechas, que cada fila lleva la
+diferencia por noche de la estadía (la del veredicto), y que con noches sin
+periodo compara periodo por periodo en lugar de promediar noches distintas.
+"""
+import asyncio
+from datetime import date
+
+import pytest
+
+from Core import comparador_multiperiodo as comparador
+from Core.servicio_habitaciones import calcular_dias_por_periodo
+from Models.hotelExcel import HabitacionExcel, HotelExcel, PeriodoGroup
+from Models.hotelWeb import HabitacionWeb, HotelWeb
+from Models.periodo import Periodo
+from Models.habitacion_unificada import HabitacionUnificada
+
+BAJA = Periodo(id=1, fecha_inicio=date(2026, 5, 1), fecha_fin=date(2026, 5, 31))
+ALTA = Periodo(id=2, fecha_inicio=date(2026, 6, 1), fecha_fin=date(2026, 6, 30))
+ALTA_REPETIDA = Periodo(id=3, fecha_inicio=date(2026, 6, 1), fecha_fin=date(2026, 6, 30))
+OTRO_GRUPO = Periodo(id=4, fecha_inicio=date(2026, 5, 20), fecha_fin=date(2026, 6, 10))
+
+HOTEL = HotelExcel(nombre="Hotel", periodos_group=[
+    PeriodoGroup(nombre="Rack", periodos=[BAJA, ALTA]),
+    PeriodoGroup(nombre="Rack bis", periodos=[ALTA_REPETIDA]),
+    PeriodoGroup(nombre="Suites", periodos=[OTRO_GRUPO]),
+])
+HABITACION = HabitacionUnificada(nombre="dbl superior", variantes=[
+    HabitacionExcel(nombre="dbl superior", precio=100.0, row_idx=1, periodo_ids={1}),
+    HabitacionExcel(nombre="dbl superior", precio=200.0, row_idx=2, periodo_ids={2, 3}),
+])
+
+
+def test_asignar_noches_cuenta_cada_noche_una_vez():
+    noches = calcular_dias_por_periodo(date(2026, 5, 29), date(2026, 6, 3), [BAJA, ALTA, ALTA_REPETIDA], HABITACION)
+    assert noches == {1: 3, 2: 2}
+    # Sin habitación cada periodo cuenta sus noches
+    assert calcular_dias_por_periodo(date(2026, 5, 29), date(2026, 6, 3), [BAJA, ALTA, ALTA_REPETIDA]) == {1: 3, 2: 2, 3: 2}
+
+    with pytest.raises(ValueError):
+        comparador.ResultadoComparacionEstadia("dbl superior", None, [], {1: 3}, 5, 300.0, 100.0)
+
+
+def _dar_hotel_web_con_precio(precio, scrapings):
+    async def dar_hotel_web(*args, **kwargs):
+        scrapings.append(args[:2])
+        return HotelWeb(detalles="Hotel", habitacion=[HabitacionWeb(
+            nombre="dbl superior", detalles="Vista a la ciudad", combos=[{"titulo": "Flexible", "descripcion": "", "precio": precio}])])
+    return dar_hotel_web
+
+
+def test_comparar_estadia_con_un_solo_scraping(monkeypatch):
+    scrapings = []
+    monkeypatch.setattr(comparador, "dar_hotel_web", _dar_hotel_web_con_precio(140.0, scrapings))
+    resultado = asyncio.run(comparador.comparar_estadia(
+        HABITACION, date(2026, 5, 29), date(2026, 6, 3), 2, 0, HOTEL))
+
+    assert len(scrapings) == 1
+    assert isinstance(resultado, comparador.ResultadoComparacionEstadia)
+    assert resultado.noches_por_periodo == {1: 3, 2: 2} and resultado.noches_totales == 5
+    assert resultado.precio_esperado_total == 700.0 and resultado.coincide
+    # Cada fila lleva la diferencia de la estadía, no la de su periodo contra el promedio web
+    assert [(f.diferencia, f.coincide) for f in resultado.periodos] == [(0.0, True), (0.0, True)]
+
+
+def test_filas_de_estadia_con_discrepancia(monkeypatch):
+    monkeypatch.setattr(comparador, "dar_hotel_web", _dar_hotel_web_con_precio(150.0, []))
+    resultado = asyncio.run(comparador.comparar_estadia(
+        HABITACION, date(2026, 5, 29), date(2026, 6, 3), 2, 0, HOTEL))
+
+    assert not resultado.coincide and resultado.diferencia_promedio == 10.0
+    assert [(f.precio_excel, f.diferencia, f.coincide) for f in resultado.periodos] == [(100.0, 10.0, False),
+                                                                                       (200.0, 10.0, False)]
+
+
+def test_noches_sin_periodo_comparan_por_periodo(monkeypatch):
+    llamadas = []
+
+    async def comparar_multiperiodo(*args):
+        llamadas.append(args)
+        return "por periodo"
+
+    monkeypatch.setattr(comparador, "comparar_multiperiodo", comparar_multiperiodo)
+    resultado = asyncio.run(comparador.comparar_estadia(
+        HABITACION, date(2026, 6, 28), date(2026, 7, 3), 2, 0, HOTEL))
+    assert resultado == "por periodo" and len(llamadas) == 1
@@ -0,0 +1,62 @@
+"""
+Prueba de la decodificación de habitaciones extraídas
+-----------------------------------------------------
+Verifica el informe de rechazos de decodificar_habitaciones_web: con JSON o
+con la lista ya decodificada conserva las habitaciones válidas en orden y
+rechaza las inválidas con su índice, nombre y errores; el modo estricto
+rechaza un precio "420" como texto; el contenido que no es JSON o no es una
+lista da un solo rechazo con indice None; y los bloques de error de crawl4ai
+se rechazan sin romper la decodificación.
+"""
+import json
+
+import pytest
+
+from Models.hotelWeb import decodificar_habitaciones_web
+
+CLASSIC = {"nombre": "Palace Classic", "detalles": "King bed",
+           "combos": [{"titulo": "Room Only", "descripcion": "", "precio": 450.0}]}
+SUITE = {"nombre": "Deluxe Suite", "detalles": None,
+         "combos": [{"titulo": "Breakfast", "descripcion": "Buffet", "precio": "420"}]}
+SIN_COMBOS = {"nombre": "Junior Suite", "detalles": "Balcony"}
+PRECIO_TEXTO = {"nombre": "Premier", "detalles": None,
+                "combos": [{"titulo": "Flexible", "descripcion": "", "precio": "consultar"}]}
+
+
+@pytest.mark.parametrize("como_json", [False, True])
+def test_validas_y_rechazadas(como_json):
+    contenido = [CLASSIC, SIN_COMBOS, SUITE, PRECIO_TEXTO]
+    habitaciones, rechazos = decodificar_habitaciones_web(json.dumps(contenido) if como_json else contenido)
+
+    assert [h.nombre for h in habitaciones] == ["Palace Classic", "Deluxe Suite"]
+    assert habitaciones[1].combos[0].precio == 420.0
+    assert [(r.indice, r.nombre) for r in rechazos] == [(1, "Junior Suite"), (3, "Premier")]
+    assert rechazos[0].errores == ["combos: Field required"]
+    assert rechazos[1].errores[0].startswith("combos.0.precio: ")
+
+
+def test_estricto_rechaza_precio_como_texto():
+    habitaciones, rechazos = decodificar_habitaciones_web([CLASSIC, SUITE], estricto=True)
+
+    assert [h.nombre for h in habitaciones] == ["Palace Classic"]
+    rechazo, = rechazos
+    assert (rechazo.indice, rechazo.nombre) == (1, "Deluxe Suite")
+    assert rechazo.errores[0].startswith("combos.0.precio: ")
+
+
+@pytest.mark.parametrize("contenido", ["no es json", '{"nombre": "Palace Classic"}', {"nombre": "x"}, "null"])
+def test_contenido_que_no_es_una_lista(contenido):
+    habitaciones, rechazos = decodificar_habitaciones_web(contenido)
+
+    assert habitaciones == []
+    rechazo, = rechazos
+    assert rechazo.indice is None and rechazo.nombre is None and rechazo.errores
+
+
+def test_bloques_de_error_de_crawl4ai():
+    error = {"index": 0, "error": True, "tags": ["error"], "content": "RateLimitError: 429"}
+    habitaciones, rechazos = decodificar_habitaciones_web(json.dumps([error, CLASSIC, "texto suelto"]))
+
+    assert [h.nombre for h in habitaciones] == ["Palace Classic"]
+    assert [(r.indice, r.nombre) for r in rechazos] == [(0, None), (2, None)]
+    assert all(r.errores for r in rechazos)
@@ -0,0 +1,178 @@
+"""
+Prueba del despachador LLM contra un proveedor local simulado
+-------------------------------------------------------------
+ProveedorSimulado es un servidor HTTP local con la API de chat completions
+de OpenAI. Su comportamiento depende de la key (Authorization):
+- "ok": responde después de `latencia` segundos.
+- "429xN": responde 429 a las primeras N llamadas y después ok.
+- "429": siempre 429.  "500": siempre error 500.
+Registra cuántas llamadas atendió cada key y la concurrencia máxima.
+
+Verifica cupos por proveedor, cola, reintento en 429, failover ordenado y
+el error final cuando ningún proveedor responde. La última prueba pasa por
+litellm (el camino real) si está instalado.
+"""
+import json
+import os
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from ScrawlingChinese.despachador_llm import DespachadorLLM, ErrorDespachoLLM, ProveedorLLM
+
+
+class ProveedorSimulado:
+    def __init__(self, latencia=0.0):
+        self.latencia = latencia
+        self.llamadas = {}
+        self.en_curso = 0
+        self.max_en_curso = 0
+        self._lock = threading.Lock()
+        simulado = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                key = self.headers.get("Authorization", "").replace("Bearer ", "")
+                codigo = simulado._atender(key)
+                if codigo == 200:
+                    cuerpo = json.dumps({
+                        "id": "sim", "object": "chat.completion", "created": 0, "model": "sim",
+                        "choices": [{"index": 0, "finish_reason": "stop",
+                                     "message": {"role": "assistant", "content": f"<blocks>[]</blocks>{key}"}}],
+                        "usage": {"prompt_tokens": 10, "completion_tokens": 2, "total_tokens": 12},
+                    }).encode()
+                else:
+                    cuerpo = json.dumps({"error": {"message": f"error {codigo}"}}).encode()
+                self.send_response(codigo)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(cuerpo)))
+                self.end_headers()
+                self.wfile.write(cuerpo)
+
+            def log_message(self, *args):
+                pass
+
+        self.servidor = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.servidor.server_port}/v1"
+        threading.Thread(target=self.servidor.serve_forever, daemon=True).start()
+
+    def _atender(self, key):
+        with self._lock:
+            n = self.llamadas[key] = self.llamadas.get(key, 0) + 1
+            self.en_curso += 1
+            self.max_en_curso = max(self.max_en_curso, self.en_curso)
+        try:
+            time.sleep(self.latencia)
+            if key == "500":
+                return 500
+            if key == "429" or (key.startswith("429x") and n <= int(key[4:])):
+                return 429
+            return 200
+        finally:
+            with self._lock:
+                self.en_curso -= 1
+
+    def cerrar(self):
+        self.servidor.shutdown()
+
+
+class ErrorHTTP(Exception):
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+def completar_http(proveedor, prompt, **extra):
+    """Cliente mínimo de chat completions (el despachador no depende de litellm)."""
+    pedido = urllib.request.Request(
+        f"{proveedor.base_url}/chat/completions",
+        data=json.dumps({"model": proveedor.modelo, "messages": [{"role": "user", "content": prompt}]}).encode(),
+        headers={"Authorization": f"Bearer {proveedor.api_key}", "Content-Type": "application/json"},
+    )
+    try:
+        with urllib.request.urlopen(pedido, timeout=10) as respuesta:
+            return json.loads(respuesta.read())
+    except urllib.error.HTTPError as e:
+        raise ErrorHTTP(e.code) from None
+
+
+@pytest.fixture
+def simulado():
+    proveedor = ProveedorSimulado()
+    yield proveedor
+    proveedor.cerrar()
+
+
+def despachador(simulado, *keys, concurrencia=2, max_reintentos=3):
+    proveedores = [ProveedorLLM("sim", key, simulado.url, concurrencia, nombre=key) for key in keys]
+    return DespachadorLLM(proveedores, completar=completar_http, max_reintentos=max_reintentos,
+                          espera_base=0.01, espera_max=0.05)
+
+
+def test_respeta_el_cupo_y_encola(simulado):
+    simulado.latencia = 0.05
+    d = despachador(simulado, "ok", concurrencia=2)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        despachos = list(executor.map(lambda i: d.completar(f"prompt {i}"), range(12)))
+
+    assert len(despachos) == 12
+    assert simulado.max_en_curso <= 2
+    assert d.metricas()["max_en_cola"] > 2
+
+
+def test_reintenta_429_con_backoff(simulado):
+    d = despachador(simulado, "429x2")
+
+    despacho = d.completar("prompt")
+
+    assert despacho.reintentos == 2
+    assert simulado.llamadas["429x2"] == 3
+    assert d.metricas()["proveedores"]["429x2"]["limites_tasa"] == 2
+
+
+def test_failover_ordenado(simulado):
+    d = despachador(simulado, "429", "500", "ok", max_reintentos=1)
+
+    despacho = d.completar("prompt")
+
+    assert despacho.proveedor.nombre == "ok"
+    # Mientras "429" se enfría la llamada sigue con los siguientes, sin esperarlo
+    assert simulado.llamadas == {"429": 1, "500": 1, "ok": 1}
+
+
+def test_desborda_al_siguiente_con_el_primero_lleno(simulado):
+    simulado.latencia = 0.05
+    d = despachador(simulado, "ok", "ok2", concurrencia=1)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(lambda i: d.completar(f"prompt {i}"), range(8)))
+
+    assert simulado.llamadas["ok"] > 0 and simulado.llamadas["ok2"] > 0
+    assert simulado.max_en_curso <= 2
+
+
+def test_error_si_ningun_proveedor_responde(simulado):
+    d = despachador(simulado, "500", "429", max_reintentos=1)
+
+    with pytest.raises(ErrorDespachoLLM):
+        d.completar("prompt")
+    assert d.metricas()["fallidas"] == 1
+
+
+def test_litellm_contra_el_proveedor_local(simulado):
+    os.environ.setdefault("LITELLM_LOCAL_MODEL_COST_MAP", "True")  # sin red
+    pytest.importorskip("litellm")
+    proveedores = [ProveedorLLM("openai/sim", "429x1", simulado.url, nombre="principal")]
+    d = DespachadorLLM(proveedores, espera_base=0.01)  # completar_litellm
+
+    despacho = d.completar("prompt")
+
+    assert despacho.reintentos == 1
+    assert despacho.respuesta.usage.prompt_tokens == 10
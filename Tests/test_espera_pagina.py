@@ -0,0 +1,45 @@
+"""
+Prueba de la espera por selector
+--------------------------------
+Verifica que get_run_config arma la espera pedida (tarjetas estables o
+networkidle + scroll) y que MedidorEspera registra el tiempo hasta página
+lista con el estado que deja el wait_for en la página.
+"""
+import pytest
+
+pytest.importorskip("crawl4ai")
+
+from ScrawlingChinese.espera_pagina import EstrategiaEspera, MedidorEspera, espera_desde_entorno
+from ScrawlingChinese.utils.scraper_utils import get_run_config
+
+
+def test_run_config_segun_la_espera():
+    selector = get_run_config(".thumb-cards_products", "s", espera=EstrategiaEspera("selector", estable_ms=300, timeout_ms=8000))
+    anterior = get_run_config(".thumb-cards_products", "s", espera=EstrategiaEspera("networkidle"))
+
+    assert (selector.wait_until, selector.scan_full_page) == ("domcontentloaded", False)
+    assert selector.wait_for.startswith("js:") and '".thumb-cards_card"' in selector.wait_for
+    assert ">= 300" in selector.wait_for and ">= 8000" in selector.wait_for
+    assert (anterior.wait_until, anterior.scan_full_page, anterior.wait_for) == ("networkidle", True, None)
+
+
+def test_espera_desde_entorno(monkeypatch):
+    monkeypatch.delenv("ESPERA_PAGINA", raising=False)
+    assert espera_desde_entorno().nombre == "networkidle"
+    monkeypatch.setenv("ESPERA_PAGINA", "selector")
+    assert espera_desde_entorno().nombre == "selector"
+
+    monkeypatch.setenv("ESPERA_PAGINA", "load")
+    with pytest.raises(ValueError):
+        espera_desde_entorno()
+
+
+def test_medidor_registra_tiempo_hasta_lista():
+    medidor = MedidorEspera()
+
+    medidor.registrar("u1", {"espera": {"lista_ms": 1200.0, "tarjetas": 20, "por_timeout": False}, "ahora": 1300.0})
+    medidor.registrar("u2", {"espera": {"lista_ms": 15000.0, "tarjetas": 0, "por_timeout": True}, "ahora": 15010.0})
+    medidor.registrar("u3", {"espera": None, "ahora": 4500.0})  # networkidle: sin estado del wait_for
+
+    assert [(p.segundos_hasta_lista, p.tarjetas) for p in medidor.paginas] == [(1.2, 20), (15.0, 0), (4.5, None)]
+    assert medidor.metricas()["por_timeout"] == 1
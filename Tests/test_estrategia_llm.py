@@ -0,0 +1,76 @@
+"""
+Prueba de la estrategia LLM contra la de crawl4ai
+-------------------------------------------------
+LLMExtractionStrategyMedida copia el armado del prompt y el parseo de la
+respuesta de LLMExtractionStrategy.extract (crawl4ai 0.4.247). Verifica que
+para la misma entrada el prompt es el mismo que el de la clase base (que se
+captura reemplazando perform_completion_with_backoff) y que la respuesta se
+parsea igual, para detectar cambios al actualizar crawl4ai.
+"""
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("crawl4ai")
+
+import crawl4ai.extraction_strategy as estrategia_crawl4ai
+from crawl4ai import LLMExtractionStrategy
+
+from ScrawlingChinese.despachador_llm import DespachadorLLM, ProveedorLLM
+from ScrawlingChinese.telemetria_llm import TelemetriaLLM
+from ScrawlingChinese.utils.scraper_utils import get_llm_strategy
+
+MARKDOWN = """## Palace Classic
+King bed, 35 m2 <script>x()</script> "vista" al río
+
+| Room Only | Sin desayuno | USD 450.00 |
+"""
+RESPUESTAS = [
+    '<blocks>[{"nombre": "Palace Classic", "detalles": "King bed", "combos": []}]</blocks>',
+    '{"nombre": "Palace Classic"} y texto que no es JSON',
+]
+
+
+def respuesta(contenido):
+    return SimpleNamespace(
+        usage=SimpleNamespace(prompt_tokens=10, completion_tokens=5, total_tokens=15,
+                              completion_tokens_details=None, prompt_tokens_details=None),
+        choices=[SimpleNamespace(message=SimpleNamespace(content=contenido))],
+    )
+
+
+@pytest.fixture
+def estrategia():
+    estrategia = get_llm_strategy(telemetria=TelemetriaLLM(exportar=False),
+                                  despachador=DespachadorLLM([ProveedorLLM("simulado")]))
+    estrategia.verbose = False
+    return estrategia
+
+
+@pytest.mark.parametrize("contenido", RESPUESTAS)
+def test_mismo_prompt_y_parseo_que_crawl4ai(estrategia, monkeypatch, contenido):
+    prompts = []
+
+    def perform_completion_with_backoff(provider, prompt, *args, **kwargs):
+        prompts.append(prompt)
+        return respuesta(contenido)
+
+    monkeypatch.setattr(estrategia_crawl4ai, "perform_completion_with_backoff", perform_completion_with_backoff)
+    bloques_base = LLMExtractionStrategy.extract(estrategia, "https://hotel", 0, MARKDOWN)
+
+    prompt_base, = prompts
+    assert estrategia._prompt("https://hotel", MARKDOWN) == prompt_base
+    assert estrategia._bloques(contenido) == bloques_base
+
+
+def test_prompt_sin_schema_ni_instruccion(estrategia, monkeypatch):
+    estrategia.schema, estrategia.instruction = None, None
+    prompts = []
+
+    def perform_completion_with_backoff(provider, prompt, *args, **kwargs):
+        prompts.append(prompt)
+        return respuesta(RESPUESTAS[0])
+
+    monkeypatch.setattr(estrategia_crawl4ai, "perform_completion_with_backoff", perform_completion_with_backoff)
+    LLMExtractionStrategy.extract(estrategia, "https://hotel", 0, MARKDOWN)
+    assert estrategia._prompt("https://hotel", MARKDOWN) == prompts[0]
@@ -0,0 +1,65 @@
+"""
+Prueba de la extracción por tarjetas
+------------------------------------
+Verifica que dividir_en_tarjetas corta las páginas guardadas en
+Tests/fixtures/synxis en una sección por tarjeta (## habitación), que
+agrupar_tarjetas no pierde tarjetas y que fusionar_habitaciones unifica una
+habitación repetida entre trozos sin duplicar sus tarifas, conservando los
+bloques de error del LLM.
+"""
+import json
+from pathlib import Path
+
+import pytest
+
+from ScrawlingChinese.extraccion_por_tarjetas import (
+    agrupar_tarjetas,
+    dividir_en_tarjetas,
+    fusionar_habitaciones,
+    trozos_de_pagina,
+)
+
+DIRECTORIO_FIXTURES = Path(__file__).parent / "fixtures" / "synxis"
+
+
+@pytest.mark.parametrize("fixture", ["alvear_15_habitaciones", "alvear_20_habitaciones"])
+def test_una_seccion_por_tarjeta(fixture):
+    markdown = (DIRECTORIO_FIXTURES / f"{fixture}.md").read_text(encoding="utf-8")
+    habitaciones = json.loads((DIRECTORIO_FIXTURES / f"{fixture}.json").read_text(encoding="utf-8"))
+
+    tarjetas = dividir_en_tarjetas(markdown)
+    titulos = [next(l for l in t.splitlines() if l.startswith("## "))[3:].strip() for t in tarjetas]
+    assert titulos == [h["nombre"] for h in habitaciones]
+    assert all(sum(l.startswith("## ") for l in t.splitlines()) == 1 for t in tarjetas)
+
+    trozos = agrupar_tarjetas(tarjetas, tarjetas_por_trozo=4)
+    assert len(trozos) == -(-len(tarjetas) // 4)
+    assert sum(t.count("\n## ") + t.startswith("## ") for t in trozos) == len(tarjetas)
+    assert trozos_de_pagina(markdown, max_trozos=1) == [markdown]
+
+
+def test_fusion_de_habitacion_repetida_entre_trozos():
+    error = {"index": 0, "error": True, "tags": ["error"], "content": "timeout"}
+    trozo_1 = [
+        {"nombre": "Palace Classic", "detalles": None,
+         "combos": [{"titulo": "Room Only", "descripcion": "", "precio": 450.0}]},
+    ]
+    trozo_2 = [
+        error,
+        {"nombre": "  palace   CLASSIC ", "detalles": "King bed, 35 m2",
+         "combos": [{"titulo": "room only", "descripcion": "repetida", "precio": 450.0},
+                    {"titulo": "Breakfast Included", "descripcion": "", "precio": 520.0}]},
+        {"nombre": "Deluxe Suite", "detalles": "Balcony", "combos": []},
+    ]
+
+    fusion = fusionar_habitaciones([trozo_1, trozo_2])
+
+    assert fusion[1] is error
+    habitaciones = [b for b in fusion if "nombre" in b]
+    assert [h["nombre"] for h in habitaciones] == ["Palace Classic", "Deluxe Suite"]
+    palace = habitaciones[0]
+    assert palace["detalles"] == "King bed, 35 m2"
+    assert [(c["titulo"], c["precio"]) for c in palace["combos"]] == [("Room Only", 450.0),
+                                                                      ("Breakfast Included", 520.0)]
+    # Los resultados de los trozos no se modifican
+    assert len(trozo_1[0]["combos"]) == 1 and trozo_1[0]["detalles"] is None
@@ -0,0 +1,81 @@
+"""
+Prueba de la extracción multihoja
+---------------------------------
+Verifica que cargar_excel_multihoja sobrevive a las hojas que no se pueden
+extraer (las hojas de periodos de los extractos de validación empiezan con
+una temporada antes de cualquier hotel), que informa el error por hoja y une
+las hojas que sí se extrajeron, que cada proceso carga solo sus hojas con
+el mismo resultado que la carga del workbook completo (y lo carga completo si
+la API interna de openpyxl cambió), y que cargar_excel_cacheado y
+EXCEL_HOJAS llevan la extracción multihoja al snapshot.
+"""
+from pathlib import Path
+
+import pytest
+from openpyxl import load_workbook
+
+from ExtractorDatos import extractor_multihoja
+from ExtractorDatos.cache_excel import cargar_excel_cacheado
+from ExtractorDatos.extractor import cargar_excel
+from ExtractorDatos.extractor_multihoja import (
+    _procesar_hoja,
+    cargar_excel_multihoja,
+    cargar_hojas,
+    extraer_hojas,
+    hojas_desde_entorno,
+)
+
+PATH_EXCEL = Path(__file__).parent.parent / "Data" / "Extracto_Validacion2.xlsx"
+HOJAS_CON_ERROR = {"Periodos_Alvear Palace (A)", "Periodos_Llao Llao Hotel, Res"}
+
+
+def test_hojas_con_error_no_frenan_al_resto():
+    resultados = extraer_hojas(PATH_EXCEL, max_workers=1)
+
+    assert {r.hoja for r in resultados if r.error} == HOJAS_CON_ERROR
+    assert all("periodos_group" in r.error and not r.hoteles for r in resultados if r.error)
+
+    datos = cargar_excel_multihoja(PATH_EXCEL, max_workers=1)
+    assert [h.nombre for h in datos.hoteles] == [h.nombre for r in resultados if not r.error for h in r.hoteles]
+    assert datos.hoteles
+
+
+def test_cargar_hojas_solo_parsea_las_pedidas():
+    hojas = ["Resumen_Alvear Palace (A)", "Periodos_Palacio Duhau - Park"]
+    parcial = cargar_hojas(PATH_EXCEL, hojas)
+    completo = load_workbook(PATH_EXCEL)
+
+    assert parcial.sheetnames == hojas
+    for hoja in hojas:
+        assert _procesar_hoja(parcial[hoja], hoja, 300).hoteles == _procesar_hoja(completo[hoja], hoja, 300).hoteles
+
+
+def test_sin_api_interna_carga_el_workbook_completo(monkeypatch):
+    def read_worksheets(self):
+        raise AttributeError("'WorksheetReader' object has no attribute 'find_sheets'")
+
+    monkeypatch.setattr(extractor_multihoja.LectorHojas, "read_worksheets", read_worksheets)
+    wb = cargar_hojas(PATH_EXCEL, ["Resumen_Alvear Palace (A)"])
+    assert wb.sheetnames == load_workbook(PATH_EXCEL, read_only=True).sheetnames
+
+
+def test_snapshot_multihoja(tmp_path, monkeypatch):
+    hojas = ["Resumen_Alvear Palace (A)", "Periodos_Palacio Duhau - Park"]
+    monkeypatch.setenv("EXCEL_HOJAS", " , ".join(hojas))
+    assert hojas_desde_entorno(PATH_EXCEL) == hojas
+
+    esperado = cargar_excel_multihoja(PATH_EXCEL, hojas, max_workers=1)
+    assert cargar_excel_cacheado(PATH_EXCEL, directorio_cache=tmp_path, hojas=hojas) == esperado
+    # Segunda carga desde el snapshot, sin abrir el workbook
+    monkeypatch.setattr("ExtractorDatos.cache_excel.cargar_excel_multihoja", None)
+    assert cargar_excel_cacheado(PATH_EXCEL, directorio_cache=tmp_path, hojas=hojas) == esperado
+    # Otra selección de hojas no usa ese snapshot
+    assert cargar_excel_cacheado(PATH_EXCEL, directorio_cache=tmp_path) == cargar_excel(PATH_EXCEL)
+
+    monkeypatch.setenv("EXCEL_HOJAS", "*")
+    assert hojas_desde_entorno(PATH_EXCEL) == load_workbook(PATH_EXCEL, read_only=True).sheetnames
+    monkeypatch.setenv("EXCEL_HOJAS", "No existe")
+    with pytest.raises(ValueError):
+        hojas_desde_entorno(PATH_EXCEL)
+    monkeypatch.delenv("EXCEL_HOJAS")
+    assert hojas_desde_entorno(PATH_EXCEL) is None
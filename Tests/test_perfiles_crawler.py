@@ -0,0 +1,70 @@
+"""
+Prueba de los perfiles del crawler
+----------------------------------
+Verifica que los perfiles del JSON cargan, que el perfil por defecto
+reproduce la configuración de siempre, que get_run_config y crear_crawler
+toman timeouts, espera, caché y modo de archivo del perfil, y que un perfil
+desconocido o mal escrito da error.
+"""
+import json
+
+import pytest
+
+pytest.importorskip("crawl4ai")
+
+from crawl4ai import CacheMode
+
+from ScrawlingChinese.archivo_paginas import ArchivoPaginas, CrawlerReproductor
+from ScrawlingChinese.perfiles_crawler import cargar_perfiles, perfil_activo
+from ScrawlingChinese.utils.scraper_utils import crear_crawler, get_browser_config, get_run_config
+
+
+def test_perfiles_definidos():
+    perfiles = cargar_perfiles()
+    assert {"interactive-debug", "production-headless", "replay", "benchmark"} <= set(perfiles)
+    assert perfiles["replay"].archivo == "reproducir"
+    assert perfiles["production-headless"].headless and perfiles["production-headless"].modo_liviano
+    # La espera por tarjetas usa la clase del servidor local: solo el perfil de benchmark
+    assert [n for n, p in perfiles.items() if p.espera == "selector"] == ["benchmark"]
+
+
+def test_perfil_por_defecto_es_el_comportamiento_anterior(monkeypatch):
+    monkeypatch.delenv("PERFIL_CRAWLER", raising=False)
+    perfil = perfil_activo()
+    navegador, anterior = get_browser_config(perfil), get_browser_config()
+    assert (navegador.headless, navegador.verbose) == (anterior.headless, anterior.verbose) == (False, True)
+
+    config = get_run_config(".thumb-cards_products", "s", perfil=perfil)
+    assert (config.cache_mode, config.page_timeout) == (CacheMode.BYPASS, 30000)
+    assert (config.wait_until, config.scan_full_page, config.wait_for) == ("networkidle", True, None)
+
+
+def test_run_config_y_crawler_segun_el_perfil(monkeypatch, tmp_path):
+    monkeypatch.delenv("ESPERA_TIMEOUT_MS", raising=False)
+    monkeypatch.delenv("ARCHIVO_PAGINAS", raising=False)
+    benchmark = perfil_activo("benchmark")
+    config = get_run_config(".thumb-cards_products", "s", perfil=benchmark)
+    assert config.page_timeout == 20000 and ">= 8000" in config.wait_for
+    assert get_browser_config(benchmark).headless
+
+    # Las variables ESPERA_* siguen pisando al perfil
+    monkeypatch.setenv("ESPERA_TIMEOUT_MS", "5000")
+    assert ">= 5000" in get_run_config(".thumb-cards_products", "s", perfil=benchmark).wait_for
+
+    archivo = ArchivoPaginas(tmp_path)
+    crawler = crear_crawler(perfil=perfil_activo("replay"), archivo=archivo)
+    assert isinstance(crawler, CrawlerReproductor) and crawler.archivo is archivo
+
+
+def test_perfil_desconocido_o_invalido(monkeypatch, tmp_path):
+    with pytest.raises(ValueError):
+        perfil_activo("no-existe")
+
+    ruta = tmp_path / "perfiles.json"
+    ruta.write_text(json.dumps({"roto": {"cache": "siempre"}}), encoding="utf-8")
+    with pytest.raises(ValueError):
+        cargar_perfiles(ruta)
+    ruta.write_text(json.dumps({"roto": {"headles": True}}), encoding="utf-8")
+    monkeypatch.setenv("PERFILES_CRAWLER_ARCHIVO", str(ruta))
+    with pytest.raises(ValueError):
+        cargar_perfiles()
@@ -0,0 +1,47 @@
+"""
+Prueba de ids de periodo deterministas
+---------------------------------------
+Extrae los workbooks de Data/ en serie (dos veces, para que el contador de
+Periodo ya esté avanzado la segunda vez) y en un pool de procesos, y verifica
+que los mapas de ids y las referencias periodo_ids de las habitaciones sean
+idénticos.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from ExtractorDatos.extractor import cargar_excel
+
+DIRECTORIO_DATOS = Path(__file__).parent.parent / "Data"
+ARCHIVOS = [DIRECTORIO_DATOS / "Extracto_prueba2.xlsx", DIRECTORIO_DATOS / "Extracto_prueba.xlsx"]
+
+
+def mapa_ids(path_excel):
+    """Devuelve ({(hotel, grupo, inicio, fin, nombre): id}, {(hotel, fila): periodo_ids})."""
+    datos = cargar_excel(path_excel)
+    periodos = {}
+    habitaciones = {}
+    for hotel in datos.hoteles:
+        for grupo in hotel.periodos_group:
+            for p in grupo.periodos:
+                periodos[(hotel.nombre, grupo.nombre, p.fecha_inicio, p.fecha_fin, p.nombresito)] = p.id
+        todas = list(hotel.habitaciones_directas)
+        for tipo in hotel.tipos:
+            todas.extend(tipo.habitaciones)
+        for hab in todas:
+            habitaciones[(hotel.nombre, hab.row_idx)] = sorted(hab.periodo_ids)
+    return periodos, habitaciones
+
+
+def test_ids_serie_y_paralelo_identicos():
+    serie = [mapa_ids(path) for path in ARCHIVOS]
+    serie_repetida = [mapa_ids(path) for path in ARCHIVOS]
+
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        paralelo = list(pool.map(mapa_ids, ARCHIVOS))
+
+    assert serie == serie_repetida
+    assert serie == paralelo
+    # Cada workbook tiene periodos y habitaciones que los referencian
+    for periodos, habitaciones in serie:
+        assert periodos
+        assert any(habitaciones.values())
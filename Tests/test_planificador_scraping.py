@@ -0,0 +1,84 @@
+"""
+Prueba del planificador de scrapings
+------------------------------------
+Verifica que planificar_tramos une los periodos contiguos (o superpuestos)
+con el mismo precio o la misma leyenda, que no une un número con una leyenda
+ni los periodos sin precio, que un hueco de más de un día corta el tramo, y
+que comparar_multiperiodo con los tramos da los mismos resultados, en el
+mismo orden, que scrapear periodo por periodo.
+"""
+import asyncio
+from datetime import date, datetime
+
+from Core import comparador_multiperiodo as comparador
+from Core.planificador_scraping import planificar_tramos
+from Models.hotelExcel import HabitacionExcel, HotelExcel, PeriodoGroup
+from Models.hotelWeb import HabitacionWeb, HotelWeb
+from Models.periodo import Periodo
+from Models.habitacion_unificada import HabitacionUnificada
+
+PERIODOS = [
+    Periodo(id=1, fecha_inicio=date(2026, 1, 1), fecha_fin=date(2026, 1, 10)),
+    Periodo(id=2, fecha_inicio=date(2026, 1, 11), fecha_fin=date(2026, 1, 20)),   # contiguo, mismo precio
+    Periodo(id=3, fecha_inicio=date(2026, 1, 15), fecha_fin=date(2026, 1, 25)),   # superpuesto, mismo precio
+    Periodo(id=4, fecha_inicio=date(2026, 1, 26), fecha_fin=date(2026, 1, 31)),   # leyenda junto a un número
+    Periodo(id=5, fecha_inicio=date(2026, 2, 1), fecha_fin=date(2026, 2, 5)),     # misma leyenda
+    Periodo(id=6, fecha_inicio=date(2026, 2, 6), fecha_fin=date(2026, 2, 10)),    # sin precio
+    Periodo(id=7, fecha_inicio=date(2026, 2, 11), fecha_fin=date(2026, 2, 15)),   # sin precio
+    Periodo(id=8, fecha_inicio=date(2026, 2, 20), fecha_fin=date(2026, 2, 25)),
+    Periodo(id=9, fecha_inicio=date(2026, 2, 27), fecha_fin=date(2026, 3, 10)),   # hueco de un día entero
+]
+HABITACION = HabitacionUnificada(nombre="dbl superior", variantes=[
+    HabitacionExcel(nombre="dbl superior", precio=100.0, row_idx=1, periodo_ids={1, 2, 3, 8, 9}),
+    HabitacionExcel(nombre="dbl superior", precio="closing agreement", row_idx=2, periodo_ids={4}),
+    HabitacionExcel(nombre="dbl superior", precio=" Closing Agreement", row_idx=3, periodo_ids={5}),
+])
+ENTRADA, SALIDA = date(2026, 1, 5), date(2026, 3, 1)
+
+
+def test_tramos():
+    tramos = planificar_tramos(HABITACION, list(reversed(PERIODOS)), ENTRADA, SALIDA)
+
+    assert [[p.id for p in t.periodos] for t in tramos] == [[1, 2, 3], [4, 5], [6], [7], [8], [9]]
+    assert [(t.fecha_inicio, t.fecha_fin) for t in tramos] == [
+        (date(2026, 1, 5), date(2026, 1, 25)),
+        (date(2026, 1, 26), date(2026, 2, 5)),
+        (date(2026, 2, 6), date(2026, 2, 10)),
+        (date(2026, 2, 11), date(2026, 2, 15)),
+        (date(2026, 2, 20), date(2026, 2, 25)),
+        (date(2026, 2, 27), date(2026, 3, 1)),
+    ]
+    assert [t.precio_excel for t in tramos] == [100.0, "closing agreement", None, None, 100.0, 100.0]
+    assert tramos[0].fecha_inicio_str == "05-01-2026"
+
+
+def test_mismos_resultados_que_por_periodo(monkeypatch):
+    monkeypatch.setenv("SCRAPING_DELAY_SECONDS", "0")
+    hotel = HotelExcel(nombre="Hotel", periodos_group=[PeriodoGroup(nombre="Rack", periodos=PERIODOS)])
+
+    def precio_web(inicio: date) -> float:
+        # La web cobra 100 salvo en la segunda quincena de febrero
+        return 130.0 if inicio >= date(2026, 2, 16) else 100.0
+
+    scrapings = []
+
+    async def dar_hotel_web(fecha_inicio, fecha_fin, *args, **kwargs):
+        scrapings.append((fecha_inicio, fecha_fin))
+        inicio = datetime.strptime(fecha_inicio, "%d-%m-%Y").date()
+        return HotelWeb(detalles="Hotel", habitacion=[HabitacionWeb(
+            nombre="dbl superior", detalles="", combos=[{"titulo": "Flexible", "descripcion": "", "precio": precio_web(inicio)}])])
+
+    monkeypatch.setattr(comparador, "dar_hotel_web", dar_hotel_web)
+    resultado = asyncio.run(comparador.comparar_multiperiodo(HABITACION, ENTRADA, SALIDA, 2, 0, hotel))
+
+    # Lo que daba un scraping por periodo, en el orden de los periodos
+    por_periodo = [comparador._comparar_periodo(HABITACION, p, precio_web(max(ENTRADA, p.fecha_inicio)))
+                   for p in sorted(PERIODOS, key=lambda p: p.fecha_inicio)
+                   if p.fecha_inicio <= SALIDA]
+
+    def resumen(filas):
+        return [(f.periodo.id, f.precio_excel, f.precio_web, f.diferencia, f.coincide) for f in filas]
+
+    assert len(scrapings) == 6
+    assert resumen(resultado.periodos) == resumen(por_periodo)
+    assert resultado.tiene_discrepancias
@@ -0,0 +1,70 @@
+"""
+Prueba de la poda de contenido sobre páginas guardadas
+------------------------------------------------------
+Tests/fixtures/synxis tiene páginas de resultados guardadas: el HTML, el
+markdown de la región CSS_SELECTOR (como lo genera crawl4ai) y las
+habitaciones esperadas (.json). Verifica que después de podar_markdown:
+- Cada habitación, cada tarifa y cada precio esperados siguen en el markdown,
+  en el mismo orden (lectura estructural: "## habitación", "### tarifa",
+  línea con precio).
+- La poda reduce los tokens a menos de la mitad.
+- Ninguna línea con precio se pierde.
+"""
+import json
+import re
+from pathlib import Path
+
+import pytest
+
+from ScrawlingChinese.poda_contenido import podar_markdown, RE_PRECIO
+
+DIRECTORIO_FIXTURES = Path(__file__).parent / "fixtures" / "synxis"
+FIXTURES = sorted(p.stem for p in DIRECTORIO_FIXTURES.glob("*.md"))
+
+
+def cargar_fixture(nombre):
+    markdown = (DIRECTORIO_FIXTURES / f"{nombre}.md").read_text(encoding="utf-8")
+    esperado = json.loads((DIRECTORIO_FIXTURES / f"{nombre}.json").read_text(encoding="utf-8"))
+    return markdown, esperado
+
+
+def leer_tarifas(markdown):
+    """[(habitación, tarifa, precio)] leyendo encabezados y líneas con precio."""
+    tarifas = []
+    habitacion = tarifa = None
+    for linea in markdown.splitlines():
+        if linea.startswith("## "):
+            habitacion, tarifa = linea[3:].strip(), None
+        elif linea.startswith("### "):
+            tarifa = linea[4:].strip()
+        elif tarifa and RE_PRECIO.search(linea):
+            numero = re.search(r"\d[\d,]*(?:\.\d+)?", RE_PRECIO.search(linea).group(0)).group(0)
+            tarifas.append((habitacion, tarifa, float(numero.replace(",", ""))))
+            tarifa = None
+    return tarifas
+
+
+def test_hay_fixtures():
+    assert FIXTURES
+
+
+@pytest.mark.parametrize("nombre", FIXTURES)
+def test_poda_conserva_habitaciones_y_precios(nombre):
+    markdown, esperado = cargar_fixture(nombre)
+    poda = podar_markdown(markdown)
+
+    tarifas_esperadas = [
+        (hab["nombre"], combo["titulo"], combo["precio"])
+        for hab in esperado for combo in hab["combos"]
+    ]
+    assert leer_tarifas(poda.markdown) == tarifas_esperadas
+
+
+@pytest.mark.parametrize("nombre", FIXTURES)
+def test_poda_reduce_tokens(nombre):
+    markdown, _ = cargar_fixture(nombre)
+    poda = podar_markdown(markdown)
+
+    assert poda.tokens_despues < poda.tokens_antes / 2
+    lineas_precio = [l.strip() for l in markdown.splitlines() if RE_PRECIO.search(l)]
+    assert [l for l in poda.markdown.splitlines() if RE_PRECIO.search(l)] == lineas_precio
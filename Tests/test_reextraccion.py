@@ -0,0 +1,122 @@
+"""
+Prueba de la reextracción de páginas archivadas
+-----------------------------------------------
+Archiva las páginas de Tests/fixtures/synxis, las reextrae con el extractor
+determinista del HTML (en un pool de procesos) y verifica que los HotelWeb
+coinciden con los .json de los fixtures y que una segunda corrida detecta un
+cambio de precio contra la anterior. Los fixtures salen de la plantilla del
+servidor local, así que solo prueban el extractor contra esa plantilla.
+
+También verifica que por defecto se reextrae con la estrategia LLM sobre el
+markdown archivado (con una estrategia simulada, sin red).
+"""
+import json
+from pathlib import Path
+
+import pytest
+
+from ScrawlingChinese.archivo_paginas import ArchivoPaginas
+from ScrawlingChinese.extractor_html import extraer_habitaciones_html
+from ScrawlingChinese.reextraccion import cargar_corrida, diferencias_hotel, reextraer_archivo
+
+DIRECTORIO_FIXTURES = Path(__file__).parent / "fixtures" / "synxis"
+FIXTURES = sorted(DIRECTORIO_FIXTURES.glob("*.html"))
+
+
+def url_de(ruta):
+    return f"https://be.synxis.com/?hotel=6933&arrive=2026-07-01&fixture={ruta.stem}"
+
+
+def archivar(archivo, ruta, html=None):
+    archivo.grabar(url_de(ruta), html or ruta.read_text(encoding="utf-8"),
+                   ruta.with_suffix(".md").read_text(encoding="utf-8"), 1.0)
+
+
+def test_extractor_html_reproduce_los_fixtures():
+    for ruta in FIXTURES:
+        esperado = json.loads(ruta.with_suffix(".json").read_text(encoding="utf-8"))
+        assert extraer_habitaciones_html(ruta.read_text(encoding="utf-8")) == esperado
+
+
+def test_reextrae_y_compara_con_la_corrida_anterior(tmp_path):
+    archivo = ArchivoPaginas(tmp_path / "archivo")
+    for ruta in FIXTURES:
+        archivar(archivo, ruta)
+
+    primera = reextraer_archivo(archivo, tmp_path / "salida", procesos=2, tam_lote=1,
+                                extractor=extraer_habitaciones_html)
+
+    assert (primera.paginas, primera.con_hotel, primera.errores, primera.sin_anterior) == (2, 2, 0, 2)
+    filas = cargar_corrida(primera.directorio)
+    for ruta in FIXTURES:
+        hotel = filas[archivo.buscar(url_de(ruta)).clave]["hotel"]
+        assert hotel["habitacion"] == json.loads(ruta.with_suffix(".json").read_text(encoding="utf-8"))
+
+    # La página de 15 habitaciones cambia un precio
+    ruta = FIXTURES[0]
+    html = ruta.read_text(encoding="utf-8")
+    precio = json.loads(ruta.with_suffix(".json").read_text(encoding="utf-8"))[0]["combos"][0]["precio"]
+    archivar(archivo, ruta, html.replace(f'rate-card_amount">{precio:,.2f}<', 'rate-card_amount">999<', 1))
+
+    segunda = reextraer_archivo(archivo, tmp_path / "salida", procesos=1, extractor=extraer_habitaciones_html)
+
+    assert segunda.anterior == primera.directorio
+    assert segunda.con_cambios == 1
+    diff, = [json.loads(l) for l in (segunda.directorio / "diff.jsonl").read_text(encoding="utf-8").splitlines()]
+    assert diff["mismo_html"] is False
+    assert [(p["antes"], p["despues"]) for p in diff["precios"]] == [(precio, 999.0)]
+
+
+class EstrategiaSimulada:
+    """Devuelve el .json del fixture cuyo markdown recibe, como si fuera el LLM."""
+    instruction = "simulada"
+    schema = {}
+
+    def __init__(self):
+        self.urls = []
+
+    def run(self, url, secciones):
+        self.urls.append(url)
+        markdown = "\n".join(secciones)
+        candidatos = [json.loads(ruta.with_suffix(".json").read_text(encoding="utf-8")) for ruta in FIXTURES]
+        # El fixture de 20 habitaciones incluye las 15 del otro: el más grande que aparece completo
+        return max((h for h in candidatos if all(x["nombre"] in markdown for x in h)), key=len, default=[])
+
+
+def test_reextrae_con_el_llm_por_defecto(tmp_path, monkeypatch):
+    pytest.importorskip("crawl4ai")
+    monkeypatch.setenv("CACHE_EXTRACCION", "0")
+    archivo = ArchivoPaginas(tmp_path / "archivo")
+    for ruta in FIXTURES:
+        # HTML que el extractor determinista no reconoce: solo sirve el markdown
+        archivar(archivo, ruta, html="<html><body>otra plantilla</body></html>" + ruta.stem)
+    estrategia = EstrategiaSimulada()
+
+    resumen = reextraer_archivo(archivo, tmp_path / "salida", procesos=2, llm_strategy=estrategia)
+
+    assert (resumen.paginas, resumen.con_hotel, resumen.errores) == (2, 2, 0)
+    assert sorted(estrategia.urls) == sorted(url_de(ruta) for ruta in FIXTURES)
+    filas = cargar_corrida(resumen.directorio)
+    for ruta in FIXTURES:
+        hotel = filas[archivo.buscar(url_de(ruta)).clave]["hotel"]
+        assert hotel["habitacion"] == json.loads(ruta.with_suffix(".json").read_text(encoding="utf-8"))
+
+
+def test_diferencias_hotel():
+    antes = {"detalles": "H", "habitacion": [
+        {"nombre": "A", "detalles": None, "combos": [{"titulo": "Room Only", "descripcion": "", "precio": 100.0}]},
+        {"nombre": "B", "detalles": None, "combos": []},
+    ]}
+    despues = {"detalles": "H", "habitacion": [
+        {"nombre": "A", "detalles": None, "combos": [{"titulo": "room only", "descripcion": "", "precio": 110.0},
+                                                     {"titulo": "Breakfast", "descripcion": "", "precio": 130.0}]},
+        {"nombre": "C", "detalles": None, "combos": []},
+    ]}
+
+    assert diferencias_hotel(antes, antes) == {}
+    assert diferencias_hotel(antes, despues) == {
+        "habitaciones_agregadas": ["C"],
+        "habitaciones_quitadas": ["B"],
+        "combos_agregados": [["A", "Breakfast"]],
+        "precios": [{"habitacion": "A", "combo": "Room Only", "antes": 100.0, "despues": 110.0}],
+    }
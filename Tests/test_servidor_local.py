@@ -0,0 +1,109 @@
+"""
+Prueba del servidor SynXis local
+--------------------------------
+Levanta ServidorSynxisLocal en un puerto libre y lo consulta con aiohttp:
+páginas con la estructura de SynXis para cualquier búsqueda, ruido de precios
+determinista, errores simulados, límite de tasa (429), la fuente Excel y que
+la fuente de las páginas sea obligatoria.
+"""
+import asyncio
+import json
+import re
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+
+from Models.hotelExcel import DatosExcel
+from Models.hotelWeb import HotelWeb
+from ScrawlingChinese.servidor_local import (FuenteExcel, FuenteFixtures, FuentePaginas, ServidorSynxisLocal,
+                                             fuente_desde_entorno, render_pagina)
+
+DIRECTORIO_FIXTURES = Path(__file__).parent / "fixtures" / "synxis"
+CONSULTA = {"arrive": "2026-07-01", "depart": "2026-07-05", "adult": "2", "child": "1", "hotel": "6933"}
+
+
+def consultar(servidor, consultas, ruta=""):
+    """Respuestas (status, texto) del servidor para cada consulta, en paralelo."""
+    async def correr():
+        async with servidor, aiohttp.ClientSession() as sesion:
+            async def pedir(params):
+                async with sesion.get(servidor.url + ruta, params=params) as respuesta:
+                    return respuesta.status, await respuesta.text()
+            return await asyncio.gather(*(pedir(p) for p in consultas))
+    return asyncio.run(correr())
+
+
+def test_sirve_la_plantilla_de_synxis():
+    fixture = DIRECTORIO_FIXTURES / "alvear_15_habitaciones"
+    fuente = FuenteFixtures(DIRECTORIO_FIXTURES)
+    fuente.hoteles = [HotelWeb(habitacion=json.loads(fixture.with_suffix(".json").read_text(encoding="utf-8")),
+                               detalles="Alvear Palace Hotel")]
+
+    (status, html), = consultar(ServidorSynxisLocal(fuente, ruido=0), [CONSULTA])
+
+    assert status == 200
+    assert html == fixture.with_suffix(".html").read_text(encoding="utf-8")
+
+
+def test_ruido_determinista_por_consulta():
+    otra = {**CONSULTA, "arrive": "2026-07-02"}
+    servidor = ServidorSynxisLocal(FuenteFixtures(DIRECTORIO_FIXTURES), ruido=0.1)
+
+    respuestas = consultar(servidor, [CONSULTA, CONSULTA, otra])
+    precios = [re.findall(r'rate-card_amount">([^<]+)<', html) for _, html in respuestas]
+
+    assert precios[0] == precios[1]
+    assert precios[0] != precios[2]
+    assert servidor.metricas()["servidas"] == 3
+
+
+def test_errores_simulados_y_consulta_invalida():
+    servidor = ServidorSynxisLocal(FuenteFixtures(DIRECTORIO_FIXTURES), tasa_error=1.0)
+
+    respuestas = consultar(servidor, [CONSULTA, {"adult": "2"}])
+
+    assert [status for status, _ in respuestas] == [500, 400]
+    assert servidor.metricas()["errores"] == 1
+
+
+def test_limite_de_tasa_responde_429():
+    servidor = ServidorSynxisLocal(FuenteFixtures(DIRECTORIO_FIXTURES), max_rps=2, rafaga=2)
+
+    respuestas = consultar(servidor, [{**CONSULTA, "child": str(i)} for i in range(6)])
+
+    assert sorted(status for status, _ in respuestas) == [200, 200, 429, 429, 429, 429]
+    assert servidor.metricas()["limitadas"] == 4
+
+
+def test_fuente_excel_usa_el_periodo_de_la_llegada():
+    datos = DatosExcel.model_validate({"hoteles": [{
+        "nombre": "Hotel Prueba",
+        "periodos_group": [{"nombre": "Temporada", "periodos": [
+            {"id": 1, "fecha_inicio": date(2026, 1, 1), "fecha_fin": date(2026, 6, 30)},
+            {"id": 2, "fecha_inicio": date(2026, 7, 1), "fecha_fin": date(2026, 12, 31)},
+        ]}],
+        "habitaciones_directas": [
+            {"nombre": "dbl deluxe", "precio": 300, "row_idx": 1, "periodo_ids": {1}},
+            {"nombre": "dbl deluxe", "precio": 420, "row_idx": 2, "periodo_ids": {2}},
+        ],
+    }]})
+
+    hotel = FuenteExcel(datos).hotel_para(CONSULTA)
+
+    assert [(h.nombre, [c.precio for c in h.combos]) for h in hotel.habitacion] == [("Dbl Deluxe", [420.0])]
+    assert "Dbl Deluxe" in render_pagina(hotel, CONSULTA)
+
+
+def test_fuente_obligatoria(monkeypatch):
+    with pytest.raises(TypeError):
+        FuentePaginas()
+
+    monkeypatch.delenv("SERVIDOR_LOCAL_FUENTE", raising=False)
+    with pytest.raises(ValueError, match="SERVIDOR_LOCAL_FUENTE"):
+        fuente_desde_entorno()
+
+    monkeypatch.setenv("SERVIDOR_LOCAL_FUENTE", str(DIRECTORIO_FIXTURES))
+    assert len(fuente_desde_entorno().hoteles) == len(list(DIRECTORIO_FIXTURES.glob("*.json")))
@@ -0,0 +1,86 @@
+"""
+Prueba de la telemetría LLM
+---------------------------
+Verifica que TelemetriaLLM agrega las llamadas por comparación y por corrida,
+que el intento de la página se suma a los reintentos, que exporta el jsonl
+de llamadas y el resumen, y que dos extracciones simultáneas de la misma URL
+con comparaciones distintas no se mezclan las etiquetas.
+"""
+import json
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from ScrawlingChinese.telemetria_llm import TelemetriaLLM
+
+
+def test_agregados_por_comparacion_y_corrida(tmp_path):
+    telemetria = TelemetriaLLM(corrida="prueba", directorio=tmp_path)
+    with telemetria.comparacion("Palace Classic 2026-01-10/2026-01-15"):
+        telemetria.registrar("groq", "https://hotel", 0, 1000, 200, 1.5)
+        with TelemetriaLLM.intento(3):
+            telemetria.registrar("openai", "https://hotel", 1, 800, 100, 2.5, reintentos=1, error="timeout")
+    telemetria.registrar("groq", "https://hotel", 0, 500, 50, 0.5)
+
+    total = telemetria.total()
+    assert (total.llamadas, total.errores, total.tokens_totales) == (3, 1, 2650)
+    assert total.proveedores == {"groq": 2, "openai": 1}
+
+    por_comparacion = telemetria.por_comparacion()
+    comparacion = por_comparacion["Palace Classic 2026-01-10/2026-01-15"]
+    assert (comparacion.llamadas, comparacion.tokens_prompt, comparacion.tokens_completion) == (2, 1800, 300)
+    # 1 reintento de la llamada + 2 intentos previos de la página
+    assert comparacion.reintentos == 3
+    assert por_comparacion["sin comparación"].llamadas == 1
+    assert "2 llamadas (1 con error, 3 reintentos)" in telemetria.resumen("Palace Classic 2026-01-10/2026-01-15")
+
+    lineas = [json.loads(l) for l in telemetria.ruta_llamadas.read_text(encoding="utf-8").splitlines()]
+    assert [l["reintentos"] for l in lineas] == [0, 3, 0]
+    assert lineas[1]["comparacion"] == "Palace Classic 2026-01-10/2026-01-15" and lineas[1]["error"] == "timeout"
+
+    ruta = telemetria.exportar()
+    assert ruta == tmp_path / "resumen_prueba.json"
+    resumen = json.loads(ruta.read_text(encoding="utf-8"))
+    assert resumen["total"]["llamadas"] == 3 and resumen["total"]["segundos_total"] == 4.5
+    assert resumen["por_comparacion"]["Palace Classic 2026-01-10/2026-01-15"]["reintentos"] == 3
+
+
+def test_sin_exportar_no_escribe(tmp_path):
+    telemetria = TelemetriaLLM(directorio=tmp_path, exportar=False)
+    telemetria.registrar("groq", "https://hotel", 0, 10, 10, 0.1)
+    assert telemetria.exportar() is None
+    assert not any(tmp_path.iterdir())
+
+
+def test_extracciones_simultaneas_de_la_misma_url():
+    pytest.importorskip("crawl4ai")
+    from ScrawlingChinese.despachador_llm import DespachadorLLM, ProveedorLLM
+    from ScrawlingChinese.utils.scraper_utils import get_llm_strategy
+
+    # Las 4 llamadas (2 bloques x 2 extracciones) están en curso a la vez
+    todas_en_curso = threading.Barrier(4, timeout=5)
+
+    def completar(proveedor, prompt, **extra):
+        todas_en_curso.wait()
+        return SimpleNamespace(
+            usage=SimpleNamespace(prompt_tokens=10, completion_tokens=5, total_tokens=15),
+            choices=[SimpleNamespace(message=SimpleNamespace(content="<blocks>[]</blocks>"))],
+        )
+
+    telemetria = TelemetriaLLM(exportar=False)
+    despachador = DespachadorLLM([ProveedorLLM("simulado", max_concurrencia=4)], completar=completar)
+    estrategia = get_llm_strategy(telemetria=telemetria, despachador=despachador)
+    estrategia.verbose = False
+
+    def extraer(etiqueta):
+        with telemetria.comparacion(etiqueta):
+            estrategia.extraer_bloques("https://hotel", ["## A", "## B"])
+
+    hilos = [threading.Thread(target=extraer, args=(e,)) for e in ("busqueda 1", "busqueda 2")]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+
+    assert {k: v.llamadas for k, v in telemetria.por_comparacion().items()} == {"busqueda 1": 2, "busqueda 2": 2}
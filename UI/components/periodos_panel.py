@@ -7,6 +7,7 @@ from .base_component import BaseComponent
 from Models.habitacion_unificada import HabitacionUnificada
 from Models.hotelExcel import HabitacionExcel
 from UI.utils import crear_scrollbar_autohide
+from Core.periodo_utils import indexar_periodos
 
 
 class PeriodosPanel(BaseComponent):
@@ -21,6 +22,11 @@ class PeriodosPanel(BaseComponent):
         panel.actualizar_periodos(habitacion, hotel_excel)
     """
 
+    _CONTENIDO_ADVERTENCIA = (
+        ("⚠️ ADVERTENCIA:\n", "advertencia"),
+        ("Sin periodos asignados", "advertencia"),
+    )
+
     def __init__(self, parent, fonts=None, **kwargs):
         """Inicializa el panel de periodos.
 
@@ -30,6 +36,11 @@ class PeriodosPanel(BaseComponent):
             **kwargs: Argumentos adicionales para el Frame padre
         """
         self.fonts = fonts
+
+        # Estado para actualizaciones incrementales
+        self._hotel_indexado = None
+        self._indice_periodos = {}
+        self._contenido_actual = ()
         super().__init__(parent, **kwargs)
 
     def _setup_ui(self):
@@ -102,17 +113,19 @@ class PeriodosPanel(BaseComponent):
         self._text.delete('1.0', tk.END)
         self._text.insert(tk.END, value)
         self._text.config(state='disabled')
+        self._contenido_actual = None  # Contenido externo: forzar próximo render
 
     def actualizar_periodos(self, habitacion, hotel_excel):
         """Actualiza periodos de una habitación.
 
+        El índice periodo -> grupo se calcula una sola vez por hotel y el
+        widget solo se reescribe si el contenido cambió respecto al último
+        render, en una única llamada a insert().
+
         Args:
             habitacion: HabitacionUnificada o HabitacionExcel con periodo_ids
             hotel_excel: Objeto HotelExcel con periodos_group
         """
-        self._text.config(state='normal')
-        self._text.delete('1.0', tk.END)
-
         # Obtener todos los periodo_ids según el tipo de habitación
         if isinstance(habitacion, HabitacionUnificada):
             # Si es unificada, obtener TODOS los periodos de TODAS las variantes
@@ -126,42 +139,36 @@ class PeriodosPanel(BaseComponent):
 
         # Verificar si hay periodos
         if not periodo_ids:
-            self._text.insert(tk.END, "⚠️ ADVERTENCIA:\n", "advertencia")
-            self._text.insert(tk.END, "Sin periodos asignados", "advertencia")
-            self._text.config(state='disabled')
+            self._renderizar(self._CONTENIDO_ADVERTENCIA)
             return
 
-        # Agrupar periodos por grupo
+        # Agrupar periodos por grupo usando el índice precalculado
+        indice = self._indice_para_hotel(hotel_excel)
         grupos_periodos = OrderedDict()
 
         for pid in periodo_ids:
-            periodo = hotel_excel.periodo_por_id(pid)
-            if periodo:
-                # Buscar grupo
-                nombre_grupo = None
-                for grupo in hotel_excel.periodos_group:
-                    if periodo in grupo.periodos:
-                        nombre_grupo = grupo.nombre
-                        break
-
-                if nombre_grupo:
-                    if nombre_grupo not in grupos_periodos:
-                        grupos_periodos[nombre_grupo] = []
-                    grupos_periodos[nombre_grupo].append(periodo)
+            entrada = indice.get(pid)
+            if entrada is None:
+                continue
+
+            periodo, nombre_grupo = entrada
+            if nombre_grupo:
+                if nombre_grupo not in grupos_periodos:
+                    grupos_periodos[nombre_grupo] = []
+                grupos_periodos[nombre_grupo].append(periodo)
 
         if not grupos_periodos:
-            self._text.insert(tk.END, "⚠️ ADVERTENCIA:\n", "advertencia")
-            self._text.insert(tk.END, "Sin periodos asignados", "advertencia")
-            self._text.config(state='disabled')
+            self._renderizar(self._CONTENIDO_ADVERTENCIA)
             return
 
-        # Insertar con formato
+        # Construir contenido como lista de pares (texto, tag)
+        contenido = []
         for i, (nombre_grupo, periodos) in enumerate(grupos_periodos.items()):
             if i > 0:
-                self._text.insert(tk.END, "\n")
+                contenido.append(("\n", ()))
 
             # Nombre del grupo
-            self._text.insert(tk.END, f"{nombre_grupo}\n", "grupo")
+            contenido.append((f"{nombre_grupo}\n", "grupo"))
 
             # Periodos
             for periodo in periodos:
@@ -169,21 +176,46 @@ class PeriodosPanel(BaseComponent):
                 fin_str = periodo.fecha_fin.strftime("%d/%m/%Y")
 
                 if periodo.nombresito:
-                    self._text.insert(tk.END,
-                        f"  • {periodo.nombresito}: {inicio_str} - {fin_str}\n",
-                        "periodo")
+                    contenido.append((f"  • {periodo.nombresito}: {inicio_str} - {fin_str}\n", "periodo"))
                 else:
-                    self._text.insert(tk.END,
-                        f"  • {inicio_str} - {fin_str}\n",
-                        "periodo")
+                    contenido.append((f"  • {inicio_str} - {fin_str}\n", "periodo"))
 
-        self._text.config(state='disabled')
+        self._renderizar(tuple(contenido))
+
+    def _indice_para_hotel(self, hotel_excel):
+        """Devuelve el índice {periodo_id: (periodo, grupo)} cacheado para el hotel.
+
+        Args:
+            hotel_excel: Objeto HotelExcel
+
+        Returns:
+            dict: Índice calculado con indexar_periodos()
+        """
+        if self._hotel_indexado is not hotel_excel:
+            self._hotel_indexado = hotel_excel
+            self._indice_periodos = indexar_periodos(hotel_excel)
+        return self._indice_periodos
+
+    def _renderizar(self, contenido):
+        """Escribe el contenido en el Text solo si difiere del último render.
+
+        Args:
+            contenido (tuple): Pares (texto, tag) a insertar en orden
+        """
+        if contenido == self._contenido_actual:
+            return
 
-    def limpiar(self):
-        """Limpia el panel."""
         self._text.config(state='normal')
         self._text.delete('1.0', tk.END)
+        if contenido:
+            argumentos = [parte for par in contenido for parte in par]
+            self._text.insert(tk.END, *argumentos)
         self._text.config(state='disabled')
+        self._contenido_actual = contenido
+
+    def limpiar(self):
+        """Limpia el panel."""
+        self._renderizar(())
 
     def reset(self):
         """Resetea el panel (alias de limpiar)."""
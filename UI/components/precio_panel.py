@@ -71,6 +71,20 @@ class PrecioPanel(BaseComponent):
         # Habilitar scroll con rueda del mouse
         self._setup_mousewheel()
 
+        # Pool de tarjetas de periodo reutilizables y label de mensaje persistente
+        self._tarjetas = []
+        font_precio = self.fonts.precio if self.fonts else None
+        self._label_mensaje = tk.Label(
+            self._contenedor_precios,
+            font=font_precio,
+            bg='#F5F5F5',
+            fg='#2C3E50',
+            padx=12,
+            pady=8,
+            anchor='w'
+        )
+        self._bind_mousewheel_to_widget(self._label_mensaje)
+
         # Configurar expansión
         self.rowconfigure(1, weight=1)
         self.columnconfigure(0, weight=1)
@@ -104,26 +118,23 @@ class PrecioPanel(BaseComponent):
         Args:
             mensaje (str): Mensaje a mostrar
         """
-        # Limpiar
-        for widget in self._contenedor_precios.winfo_children():
-            widget.destroy()
+        # Ocultar tarjetas visibles (se conservan en el pool para reutilizarlas)
+        self._ocultar_tarjetas_desde(0)
 
-        # Mostrar mensaje
-        font_precio = self.fonts.precio if self.fonts else None
-        tk.Label(
-            self._contenedor_precios,
-            text=mensaje,
-            font=font_precio,
-            bg='#F5F5F5',
-            fg='#2C3E50',
-            padx=12,
-            pady=8,
-            anchor='w'
-        ).pack(fill='both')
+        # Mostrar mensaje reutilizando el label persistente
+        if self._label_mensaje.cget('text') != mensaje:
+            self._label_mensaje.configure(text=mensaje)
+        if not self._label_mensaje.winfo_manager():
+            self._label_mensaje.pack(fill='both')
 
     def mostrar_precios_multiples(self, precios_data):
         """Muestra múltiples precios organizados por periodo.
 
+        Reutiliza las tarjetas del pool en lugar de destruirlas y recrearlas:
+        solo se reconfiguran las tarjetas cuyo contenido cambió, se crean
+        tarjetas nuevas únicamente si hay más periodos que nunca antes y las
+        sobrantes se ocultan.
+
         Args:
             precios_data: Lista de dicts con estructura:
                 {
@@ -132,83 +143,140 @@ class PrecioPanel(BaseComponent):
                     'nombre_grupo': str
                 }
         """
-        # Limpiar contenido anterior
-        for widget in self._contenedor_precios.winfo_children():
-            widget.destroy()
-
         if not precios_data:
             self._mostrar_mensaje("(Ingrese fechas para ver precios)")
             return
 
-        # Crear entrada por cada periodo
+        # Ocultar mensaje
+        if self._label_mensaje.winfo_manager():
+            self._label_mensaje.pack_forget()
+
+        # Actualizar una tarjeta por cada periodo
         for i, item in enumerate(precios_data):
             periodo = item['periodo']
             precio = item['precio']
             nombre_grupo = item['nombre_grupo']
 
-            # Frame por periodo
-            periodo_frame = tk.Frame(
-                self._contenedor_precios,
-                bg='#FAFAFA',
-                relief=tk.SOLID,
-                borderwidth=1
-            )
-            periodo_frame.pack(fill='x', padx=5, pady=5)
-
-            # Nombre del grupo
-            tk.Label(
-                periodo_frame,
-                text=f"Periodo: {nombre_grupo}",
-                font=self.fonts.negrita if self.fonts else None,
-                bg='#FAFAFA',
-                fg='#2C3E50',
-                anchor='w'
-            ).pack(fill='x', padx=8, pady=(8, 2))
-
-            # Rango de fechas (con fondo suave para destacar)
+            # Rango de fechas
             fecha_inicio_str = periodo.fecha_inicio.strftime("%d/%m/%Y")
             fecha_fin_str = periodo.fecha_fin.strftime("%d/%m/%Y")
             fecha_str = f"({fecha_inicio_str} - {fecha_fin_str})"
 
-            tk.Label(
-                periodo_frame,
-                text=fecha_str,
-                font=self.fonts.normal if self.fonts else None,
-                bg='#E8F4F8',  # Fondo azul muy suave
-                fg='#2C5F7A',   # Azul oscuro suave
-                anchor='w',
+            es_numerico = isinstance(precio, (int, float))
+            precio_texto = f"Precio: ${precio:.2f}" if es_numerico else f"Precio: {precio}"
+
+            if i == len(self._tarjetas):
+                self._tarjetas.append(self._crear_tarjeta())
+            tarjeta = self._tarjetas[i]
+
+            # Diff: reconfigurar solo si cambió lo que muestra la tarjeta
+            clave = (nombre_grupo, fecha_str, precio_texto, es_numerico)
+            if tarjeta['clave'] != clave:
+                self._configurar_tarjeta(tarjeta, nombre_grupo, fecha_str, precio_texto, es_numerico)
+                tarjeta['clave'] = clave
+
+            # Las tarjetas visibles siempre son un prefijo del pool, así que
+            # volver a empaquetarlas al final conserva el orden.
+            if not tarjeta['frame'].winfo_manager():
+                tarjeta['frame'].pack(fill='x', padx=5, pady=5)
+
+        self._ocultar_tarjetas_desde(len(precios_data))
+
+    def _crear_tarjeta(self):
+        """Crea una tarjeta de periodo vacía para el pool.
+
+        Returns:
+            dict: Widgets de la tarjeta ('frame', 'grupo', 'fechas', 'precio')
+                  y la 'clave' del último contenido renderizado
+        """
+        # Frame por periodo
+        periodo_frame = tk.Frame(
+            self._contenedor_precios,
+            bg='#FAFAFA',
+            relief=tk.SOLID,
+            borderwidth=1
+        )
+
+        # Nombre del grupo
+        label_grupo = tk.Label(
+            periodo_frame,
+            font=self.fonts.negrita if self.fonts else None,
+            bg='#FAFAFA',
+            fg='#2C3E50',
+            anchor='w'
+        )
+        label_grupo.pack(fill='x', padx=8, pady=(8, 2))
+
+        # Rango de fechas (con fondo suave para destacar)
+        label_fechas = tk.Label(
+            periodo_frame,
+            font=self.fonts.normal if self.fonts else None,
+            bg='#E8F4F8',  # Fondo azul muy suave
+            fg='#2C5F7A',   # Azul oscuro suave
+            anchor='w',
+            padx=6,
+            pady=2
+        )
+        label_fechas.pack(fill='x', padx=8, pady=2)
+
+        # Precio (el estilo se ajusta en _configurar_tarjeta según el tipo)
+        label_precio = tk.Label(periodo_frame, anchor='w')
+        label_precio.pack(fill='x', padx=8, pady=(2, 8))
+
+        # Vincular mousewheel una sola vez, al crear la tarjeta
+        self._bind_mousewheel_to_widget(periodo_frame)
+
+        return {
+            'frame': periodo_frame,
+            'grupo': label_grupo,
+            'fechas': label_fechas,
+            'precio': label_precio,
+            'clave': None
+        }
+
+    def _configurar_tarjeta(self, tarjeta, nombre_grupo, fecha_str, precio_texto, es_numerico):
+        """Actualiza los textos y el estilo de una tarjeta existente.
+
+        Args:
+            tarjeta (dict): Tarjeta del pool
+            nombre_grupo (str): Nombre del grupo de periodos
+            fecha_str (str): Rango de fechas formateado
+            precio_texto (str): Texto del precio
+            es_numerico (bool): True si el precio es numérico, False si es leyenda
+        """
+        tarjeta['grupo'].configure(text=f"Periodo: {nombre_grupo}")
+        tarjeta['fechas'].configure(text=fecha_str)
+
+        if es_numerico:
+            # Precio numérico: con fondo suave y negrita
+            tarjeta['precio'].configure(
+                text=precio_texto,
+                font=self.fonts.precio if self.fonts else None,
+                bg='#E8F5E9',  # Fondo verde muy suave
+                fg='#1B5E20',   # Verde oscuro
                 padx=6,
-                pady=2
-            ).pack(fill='x', padx=8, pady=2)
-
-            # Precio (diferente estilo según tipo)
-            if isinstance(precio, (int, float)):
-                # Precio numérico: con fondo suave y negrita
-                precio_texto = f"Precio: ${precio:.2f}"
-                tk.Label(
-                    periodo_frame,
-                    text=precio_texto,
-                    font=self.fonts.precio if self.fonts else None,
-                    bg='#E8F5E9',  # Fondo verde muy suave
-                    fg='#1B5E20',   # Verde oscuro
-                    anchor='w',
-                    padx=6,
-                    pady=3
-                ).pack(fill='x', padx=8, pady=(2, 8))
-            else:
-                # Precio leyenda: en itálica sin fondo
-                precio_texto = f"Precio: {precio}"
-                tk.Label(
-                    periodo_frame,
-                    text=precio_texto,
-                    font=self.fonts.precio_leyenda if self.fonts else None,
-                    bg='#FAFAFA',
-                    fg='#757575',   # Gris medio
-                    anchor='w'
-                ).pack(fill='x', padx=8, pady=(2, 8))
-
-            # Vincular mousewheel al frame y sus hijos DESPUÉS de crear todos los widgets
-            self._bind_mousewheel_to_widget(periodo_frame)
+                pady=3
+            )
+        else:
+            # Precio leyenda: en itálica sin fondo
+            tarjeta['precio'].configure(
+                text=precio_texto,
+                font=self.fonts.precio_leyenda if self.fonts else None,
+                bg='#FAFAFA',
+                fg='#757575',   # Gris medio
+                padx=1,
+                pady=1
+            )
+
+    def _ocultar_tarjetas_desde(self, inicio):
+        """Oculta (sin destruir) las tarjetas del pool a partir de un índice.
+
+        Args:
+            inicio (int): Índice de la primera tarjeta a ocultar
+        """
+        for tarjeta in self._tarjetas[inicio:]:
+            if tarjeta['frame'].winfo_manager():
+                tarjeta['frame'].pack_forget()
 
     def _setup_mousewheel(self):
         """Configura el scroll con rueda del mouse en el canvas."""
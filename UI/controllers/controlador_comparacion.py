@@ -76,32 +76,25 @@ class ControladorComparacion:
             fecha_salida = datetime.strptime(fecha_salida_str, "%d-%m-%Y").date()
 
             # Obtener hotel actual
-            hotel_nombre = self.estado_app.hotel.get().lower() + " (a)"
-            hotel_actual = None
-            for hotel in self.estado_app.hoteles_excel:
-                if hotel.nombre.lower() == hotel_nombre:
-                    hotel_actual = hotel
-                    break
+            hotel_actual = self.estado_app.repositorio.obtener_hotel(self.estado_app.hotel.get())
 
             if not hotel_actual:
                 self.event_bus.emit('comparison_error', "No se encontró el hotel seleccionado")
                 return
 
             # Buscar habitación unificada
-            habitacion_unificada = None
-            for hab_unif in self.estado_app.habitaciones_unificadas:
-                if hab_unif.nombre.lower() == habitacion_nombre.lower():
-                    habitacion_unificada = hab_unif
-                    break
+            habitacion_unificada = self.estado_app.habitaciones_unificadas_por_nombre.get(
+                habitacion_nombre.lower().strip()
+            )
 
             if not habitacion_unificada:
                 self.event_bus.emit('comparison_error', f"No se encontró habitación '{habitacion_nombre}'")
                 return
 
-            # Ejecutar comparación multi-periodo
-            from Core.comparador_multiperiodo import comparar_multiperiodo
+            # Ejecutar comparación (por periodo o por estadía según COMPARACION_MODO)
+            from Core.comparador_multiperiodo import comparar_segun_modo
 
-            resultado = await comparar_multiperiodo(
+            resultado = await comparar_segun_modo(
                 habitacion_unificada=habitacion_unificada,
                 fecha_entrada=fecha_entrada,
                 fecha_salida=fecha_salida,
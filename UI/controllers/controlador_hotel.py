@@ -1,7 +1,6 @@
 """Controlador de lógica de hoteles, edificios y habitaciones."""
 
 from Core.controller import dar_hoteles_excel
-from Core.servicio_habitaciones import unificar_habitaciones
 
 
 class ControladorHotel:
@@ -37,12 +36,7 @@ class ControladorHotel:
             list: Lista de nombres de hoteles (sin sufijo '(A)')
         """
         self.estado_app.hoteles_excel = dar_hoteles_excel()
-        hoteles = [h.nombre for h in self.estado_app.hoteles_excel]
-
-        # Limpiar sufijo (A)
-        hoteles = [h.replace("(A)", "").replace("(a)", "").strip() for h in hoteles]
-
-        return hoteles
+        return self.estado_app.repositorio.nombres_visibles()
 
     def cargar_edificios(self, hotel_nombre):
         """Carga edificios de un hotel.
@@ -53,20 +47,7 @@ class ControladorHotel:
         Returns:
             list: Lista de nombres de edificios SIN grupo de periodo
         """
-        hotel = hotel_nombre.lower() + " (a)"
-
-        for hotel_excel in self.estado_app.hoteles_excel:
-            if hotel_excel.nombre.lower() == hotel:
-                # Usar un set para evitar duplicados (mismo edificio en múltiples periodos)
-                edificios_set = set()
-                for tipo in hotel_excel.tipos:
-                    edificios_set.add(tipo.nombre)
-
-                # Convertir a lista ordenada
-                edificios = sorted(list(edificios_set))
-                return edificios
-
-        return []
+        return self.estado_app.repositorio.edificios(hotel_nombre)
 
     def cargar_habitaciones(self, hotel_nombre, edificio_nombre=None):
         """Carga habitaciones de un hotel/edificio y las UNIFICA.
@@ -77,38 +58,21 @@ class ControladorHotel:
 
         Returns:
             list: Lista de nombres únicos de habitaciones (sin duplicados)
-        """
-        hotel = hotel_nombre.lower() + " (a)"
-        hotel_excel = None
-
-        for h in self.estado_app.hoteles_excel:
-            if h.nombre.lower() == hotel:
-                hotel_excel = h
-                break
 
-        if not hotel_excel:
+        La unificación se calcula una sola vez por (hotel, edificio) en el
+        repositorio; las selecciones siguientes reutilizan la misma lista.
+        """
+        repositorio = self.estado_app.repositorio
+        if repositorio.obtener_hotel(hotel_nombre) is None:
             return []
 
-        # Sin edificio: habitaciones directas
-        if edificio_nombre is None:
-            habitaciones = hotel_excel.habitaciones_directas
-        else:
-            # Con edificio: buscar TODOS los tipos con ese nombre
-            # (un mismo edificio puede tener múltiples entradas con distintos periodos)
-            nombre_tipo_base = edificio_nombre.split(' - ')[0] if ' - ' in edificio_nombre else edificio_nombre
-
-            habitaciones = []
-            for tipo in hotel_excel.tipos:
-                if tipo.nombre == nombre_tipo_base:
-                    # Agregar todas las habitaciones de este tipo (no hacer break)
-                    habitaciones.extend(tipo.habitaciones)
-
-        # NUEVO: Unificar habitaciones (agrupa por nombre)
-        habitaciones_unificadas = unificar_habitaciones(habitaciones)
+        habitaciones_unificadas = repositorio.habitaciones_unificadas(hotel_nombre, edificio_nombre)
 
         # Guardar en estado
         self.estado_app.habitaciones_unificadas = habitaciones_unificadas
-        self.estado_app.habitaciones_excel = habitaciones  # Mantener compatibilidad
+        self.estado_app.habitaciones_unificadas_por_nombre = repositorio.habitaciones_unificadas_por_nombre(
+            hotel_nombre, edificio_nombre)
+        self.estado_app.habitaciones_excel = repositorio.habitaciones(hotel_nombre, edificio_nombre)  # Mantener compatibilidad
 
         # Emitir evento
         self.event_bus.emit('habitaciones_cargadas',
@@ -126,17 +90,13 @@ class ControladorHotel:
         if not hotel_nombre:
             return
 
-        hotel = hotel_nombre.lower() + " (a)"
-
-        for hotel_excel in self.estado_app.hoteles_excel:
-            if hotel_excel.nombre.lower() == hotel:
-                # Emitir evento con información del hotel
-                tiene_tipos = bool(hotel_excel.tipos)
-                self.event_bus.emit('hotel_cargado', {
-                    'hotel': hotel_excel,
-                    'tiene_tipos': tiene_tipos
-                })
-                break
+        hotel_excel = self.estado_app.repositorio.obtener_hotel(hotel_nombre)
+        if hotel_excel is not None:
+            # Emitir evento con información del hotel
+            self.event_bus.emit('hotel_cargado', {
+                'hotel': hotel_excel,
+                'tiene_tipos': bool(hotel_excel.tipos)
+            })
 
     def on_edificio_changed(self, edificio_nombre):
         """Callback cuando cambia el edificio.
@@ -4,6 +4,7 @@ from datetime import datetime
 from typing import Optional
 from Models.habitacion_unificada import HabitacionUnificada
 from Core.servicio_habitaciones import inferir_periodos_desde_fechas
+from Core.periodo_utils import indexar_periodos
 
 
 class ControladorPrecios:
@@ -100,13 +101,8 @@ class ControladorPrecios:
         fecha_entrada = datetime.strptime(fecha_entrada_str, "%d-%m-%Y").date()
         fecha_salida = datetime.strptime(fecha_salida_str, "%d-%m-%Y").date()
 
-        # Obtener hotel actual (agregar sufijo "(A)" para búsqueda)
-        hotel_nombre = self.estado_app.hotel.get().lower() + " (a)"
-        hotel_actual = None
-        for hotel in self.estado_app.hoteles_excel:
-            if hotel.nombre.lower() == hotel_nombre:
-                hotel_actual = hotel
-                break
+        # Obtener hotel actual
+        hotel_actual = self.estado_app.repositorio.obtener_hotel(self.estado_app.hotel.get())
 
         if not hotel_actual:
             return
@@ -128,16 +124,13 @@ class ControladorPrecios:
             return
 
         # Obtener precios para cada periodo
+        indice = indexar_periodos(hotel_actual)
         precios_data = []
         for periodo in periodos_aplicables:
             precio = self.habitacion_actual.precio_para_periodo(periodo.id)
 
-            # Buscar nombre del grupo al que pertenece el periodo
-            nombre_grupo = None
-            for grupo in hotel_actual.periodos_group:
-                if periodo in grupo.periodos:
-                    nombre_grupo = grupo.nombre
-                    break
+            # Nombre del grupo al que pertenece el periodo (lookup por id)
+            nombre_grupo = indice[periodo.id][1] if periodo.id in indice else None
 
             precios_data.append({
                 'periodo': periodo,
@@ -381,7 +381,12 @@ class InterfazApp:
         i += 1
 
         # ===== FASE 3: Componente VistaResultados =====
-        self.vista_resultados = VistaResultados(self.principal_frame, fonts=self.fonts, bg='#F5F5F5')
+        self.vista_resultados = VistaResultados(
+            self.principal_frame,
+            fonts=self.fonts,
+            almacen=self.state.almacen_resultados,
+            bg='#F5F5F5'
+        )
         self.vista_resultados.grid(row=i, column=0, sticky='nsew', pady=(0, 0))
         self.widgets_dinamicos.append(self.vista_resultados)
 
@@ -631,20 +636,15 @@ class InterfazApp:
         # Limpiar periodos al cambiar de hotel
         self.limpiar_periodos()
 
-        hotel_encontrado = False
-        for hotel_excel in self.hoteles_excel:
-            if hotel_excel.nombre.lower() == hotel:
-                hotel_encontrado = True
-                if hotel_excel.tipos:
-                    self.crear_campos_estaticos(incluir_edificio=True)
-                    self.cargar_edificios_excel(hotel)
-                else:
-                    self.crear_campos_estaticos(incluir_edificio=False)
-                    self.cargar_habitaciones_excel(hotel)
-                break
-
-        if not hotel_encontrado:
+        hotel_excel = self.state.repositorio.obtener_hotel(hotel)
+        if hotel_excel is None:
             print("no se encontro el hotel")
+        elif hotel_excel.tipos:
+            self.crear_campos_estaticos(incluir_edificio=True)
+            self.cargar_edificios_excel(hotel)
+        else:
+            self.crear_campos_estaticos(incluir_edificio=False)
+            self.cargar_habitaciones_excel(hotel)
 
     def on_edificio_cambiado(self, event):
         edificio = self.seleccion_edificio.get()
@@ -696,12 +696,7 @@ class InterfazApp:
             habitacion: HabitacionUnificada o HabitacionExcel con periodo_ids
         """
         # Obtener el hotel actual
-        hotel_nombre = self.seleccion_hotel.get().lower() + " (a)"
-        hotel_actual = None
-        for hotel_excel in self.hoteles_excel:
-            if hotel_excel.nombre.lower() == hotel_nombre:
-                hotel_actual = hotel_excel
-                break
+        hotel_actual = self.state.repositorio.obtener_hotel(self.seleccion_hotel.get())
 
         if not hotel_actual:
             self.periodos_panel.limpiar()
@@ -804,6 +799,9 @@ class InterfazApp:
             # Guardar en estado para uso futuro (email, etc.)
             self.state.resultado_multiperiodo = resultado_data
 
+            # Acumular periodos en la tabla de resultados
+            self.vista_resultados.agregar_a_tabla(self.state.hotel.get(), resultado_data)
+
             # Mostrar botón email si hay discrepancias
             if resultado_data.tiene_discrepancias:
                 self.mostrar_email_btn()
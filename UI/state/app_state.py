@@ -1,6 +1,8 @@
 """Centralized application state management."""
 
 import tkinter as tk
+from Core.almacen_resultados import AlmacenResultados
+from Core.repositorio_hoteles import RepositorioHoteles
 
 
 class AppState:
@@ -48,15 +50,27 @@ class AppState:
         self.periodos_var = tk.StringVar()  # Variable auxiliar para periodos
 
         # ===== Datos cargados =====
-        self.hoteles_excel = []  # Lista de HotelExcel
+        self.repositorio = RepositorioHoteles()  # Índices por nombre de hoteles/edificios/habitaciones
         self.habitaciones_excel = []  # Lista de HabitacionExcel del hotel/edificio actual
         self.habitaciones_unificadas = []  # Lista de HabitacionUnificada (sin duplicados)
+        self.habitaciones_unificadas_por_nombre = {}  # {nombre normalizado: HabitacionUnificada} de la lista actual
         self.habitacion_web = None  # HabitacionWeb de la última comparación
         self.resultado_multiperiodo = None  # ResultadoComparacionMultiperiodo de la última comparación
+        self.almacen_resultados = AlmacenResultados()  # Filas de todas las comparaciones (tabla de resultados)
 
         # Configurar traces para emitir eventos
         self._setup_traces()
 
+    @property
+    def hoteles_excel(self):
+        """Lista de HotelExcel cargados (la misma que indexa `repositorio`)."""
+        return self.repositorio.hoteles
+
+    @hoteles_excel.setter
+    def hoteles_excel(self, hoteles):
+        # Asignar la lista reconstruye los índices del repositorio
+        self.repositorio.cargar(hoteles)
+
     def _setup_traces(self):
         """Configura traces en las variables para emitir eventos cuando cambian."""
         self.hotel.trace_add('write', lambda *args:
@@ -3,9 +3,11 @@
 from .formulario_seleccion_hotel import FormularioSeleccionHotel
 from .formulario_reserva import FormularioReserva
 from .vista_resultados import VistaResultados
+from .tabla_resultados import TablaResultados
 
 __all__ = [
     'FormularioSeleccionHotel',
     'FormularioReserva',
-    'VistaResultados'
+    'VistaResultados',
+    'TablaResultados'
 ]
@@ -0,0 +1,232 @@
+"""Tabla virtualizada de resultados de comparación."""
+
+import tkinter as tk
+from tkinter import ttk
+
+
+class TablaResultados(tk.Frame):
+    """Tabla de resultados basada en ttk.Treeview con filas virtualizadas.
+
+    El Treeview solo contiene las filas que entran en pantalla: el scrollbar
+    se maneja a mano sobre el total de filas del AlmacenResultados y, al
+    desplazarse, se reescriben los valores de los mismos items en lugar de
+    insertar una fila por resultado. Así una corrida con decenas de miles de
+    periodos se muestra, ordena y filtra sin materializarlos en Tk.
+
+    Ejemplo de uso:
+        tabla = TablaResultados(parent, almacen, fonts)
+        tabla.pack(fill='both', expand=True)
+        almacen.agregar_resultado_multiperiodo("Alvear Palace", resultado)
+        tabla.refrescar()
+    """
+
+    # (clave, título, ancho, alineación)
+    COLUMNAS = [
+        ("hotel", "Hotel", 160, 'w'),
+        ("habitacion", "Habitación", 200, 'w'),
+        ("periodo", "Periodo", 190, 'w'),
+        ("excel", "Excel", 90, 'e'),
+        ("web", "Web", 90, 'e'),
+        ("diferencia", "Diferencia", 90, 'e'),
+        ("estado", "Estado", 70, 'center'),
+    ]
+
+    ALTO_FILA_DEFECTO = 20
+
+    def __init__(self, parent, almacen, fonts=None, **kwargs):
+        """Inicializa la tabla.
+
+        Args:
+            parent: Widget padre de Tkinter
+            almacen (AlmacenResultados): Fuente de filas
+            fonts (FontManager, optional): Gestor de fuentes
+            **kwargs: Argumentos adicionales para el Frame
+        """
+        super().__init__(parent, **kwargs)
+        self.almacen = almacen
+        self.fonts = fonts
+
+        self._offset = 0
+        self._filas_visibles = 1
+        self._iids = []
+
+        self._configurar_ui()
+
+    def _configurar_ui(self):
+        """Configura filtros, Treeview y scrollbar."""
+        bg_color = '#F5F5F5'
+        self.configure(bg=bg_color)
+
+        # ===== Barra de filtros =====
+        filtros = tk.Frame(self, bg=bg_color)
+        filtros.grid(row=0, column=0, columnspan=2, sticky='ew', pady=(0, 4))
+
+        self._var_hotel = tk.StringVar()
+        self._var_periodo = tk.StringVar()
+        self._var_diferencia = tk.StringVar()
+        self._var_solo_diff = tk.BooleanVar(value=False)
+
+        font_normal = self.fonts.normal if self.fonts else None
+        tk.Label(filtros, text="Hotel:", bg=bg_color, font=font_normal).pack(side='left')
+        ttk.Entry(filtros, textvariable=self._var_hotel, width=16).pack(side='left', padx=(2, 8))
+        tk.Label(filtros, text="Periodo:", bg=bg_color, font=font_normal).pack(side='left')
+        ttk.Entry(filtros, textvariable=self._var_periodo, width=14).pack(side='left', padx=(2, 8))
+        tk.Label(filtros, text="Dif. mínima $:", bg=bg_color, font=font_normal).pack(side='left')
+        ttk.Entry(filtros, textvariable=self._var_diferencia, width=7).pack(side='left', padx=(2, 8))
+        ttk.Checkbutton(filtros, text="Solo discrepancias", variable=self._var_solo_diff,
+                        command=self._aplicar_filtros).pack(side='left', padx=(0, 8))
+
+        self._label_conteo = tk.Label(filtros, text="", bg=bg_color, font=font_normal, fg='#555555')
+        self._label_conteo.pack(side='right')
+
+        for var in (self._var_hotel, self._var_periodo, self._var_diferencia):
+            var.trace_add('write', lambda *args: self._aplicar_filtros())
+
+        # ===== Treeview =====
+        claves = [c[0] for c in self.COLUMNAS]
+        self._tree = ttk.Treeview(self, columns=claves, show='headings', selectmode='browse')
+        for clave, titulo, ancho, alineacion in self.COLUMNAS:
+            self._tree.heading(clave, text=titulo, command=lambda c=clave: self._on_click_encabezado(c))
+            self._tree.column(clave, width=ancho, anchor=alineacion, stretch=(clave in ("hotel", "habitacion")))
+        self._tree.tag_configure("discrepancia", foreground="#C0392B")
+        self._tree.grid(row=1, column=0, sticky='nsew')
+
+        # Scrollbar sobre el total de filas del almacén, no sobre el Treeview
+        self._scrollbar = ttk.Scrollbar(self, orient="vertical", command=self._on_scrollbar)
+        self._scrollbar.grid(row=1, column=1, sticky='ns')
+
+        # Recalcular filas visibles al cambiar de tamaño y desplazar con la rueda
+        self._tree.bind('<Configure>', lambda e: self._on_resize(e.height))
+        self._tree.bind('<MouseWheel>', lambda e: self._desplazar(int(-1 * (e.delta / 120)) * 3))
+        self._tree.bind('<Button-4>', lambda e: self._desplazar(-3))
+        self._tree.bind('<Button-5>', lambda e: self._desplazar(3))
+
+        self.rowconfigure(1, weight=1)
+        self.columnconfigure(0, weight=1)
+
+    # ===== API pública =====
+
+    def refrescar(self):
+        """Vuelve a dibujar el tramo visible (llamar después de cargar filas)."""
+        self._offset = min(self._offset, self._offset_maximo())
+        self._renderizar()
+
+    def limpiar(self):
+        """Vacía el almacén y la tabla."""
+        self.almacen.limpiar()
+        self._offset = 0
+        self._renderizar()
+
+    # ===== Eventos =====
+
+    def _aplicar_filtros(self):
+        try:
+            diferencia_minima = float(self._var_diferencia.get().replace(",", "."))
+        except ValueError:
+            diferencia_minima = None
+
+        self.almacen.filtrar(
+            hotel=self._var_hotel.get(),
+            periodo=self._var_periodo.get(),
+            diferencia_minima=diferencia_minima,
+            solo_discrepancias=self._var_solo_diff.get()
+        )
+        self._offset = 0
+        self._renderizar()
+
+    def _on_click_encabezado(self, clave):
+        columna, descendente = self.almacen.orden
+        # Primer click ascendente, segundo descendente, tercero vuelve al orden de llegada
+        if columna != clave:
+            self.almacen.ordenar(clave, descendente=False)
+        elif not descendente:
+            self.almacen.ordenar(clave, descendente=True)
+        else:
+            self.almacen.ordenar(None)
+
+        columna, descendente = self.almacen.orden
+        for c, titulo, _, _ in self.COLUMNAS:
+            indicador = (" ▼" if descendente else " ▲") if c == columna else ""
+            self._tree.heading(c, text=titulo + indicador)
+
+        self._offset = 0
+        self._renderizar()
+
+    def _on_resize(self, alto):
+        alto_fila = ttk.Style().lookup('Treeview', 'rowheight') or self.ALTO_FILA_DEFECTO
+        # Restar aproximadamente el alto del encabezado
+        filas = max(1, int(alto) // int(alto_fila) - 1)
+        if filas != self._filas_visibles:
+            self._filas_visibles = filas
+            self.refrescar()
+
+    def _on_scrollbar(self, *args):
+        if args[0] == 'moveto':
+            total = len(self.almacen)
+            self._offset = int(float(args[1]) * total)
+            self._offset = max(0, min(self._offset, self._offset_maximo()))
+            self._renderizar()
+        elif args[0] == 'scroll':
+            cantidad = int(args[1])
+            if args[2] == 'pages':
+                cantidad *= self._filas_visibles
+            self._desplazar(cantidad)
+
+    def _desplazar(self, cantidad):
+        nuevo = max(0, min(self._offset + cantidad, self._offset_maximo()))
+        if nuevo != self._offset:
+            self._offset = nuevo
+            self._renderizar()
+
+    # ===== Render =====
+
+    def _offset_maximo(self):
+        return max(0, len(self.almacen) - self._filas_visibles)
+
+    def _renderizar(self):
+        """Escribe en el Treeview solo las filas del tramo visible.
+
+        Los items del Treeview se reciclan: se actualizan sus valores y solo se
+        crean o eliminan items si cambió la cantidad de filas en pantalla.
+        """
+        total = len(self.almacen)
+        filas = self.almacen.filas(self._offset, self._offset + self._filas_visibles)
+
+        for i, fila in enumerate(filas):
+            valores = self._formatear_fila(fila)
+            tags = () if fila.coincide else ("discrepancia",)
+            if i < len(self._iids):
+                self._tree.item(self._iids[i], values=valores, tags=tags)
+            else:
+                self._iids.append(self._tree.insert('', 'end', values=valores, tags=tags))
+
+        sobrantes = self._iids[len(filas):]
+        if sobrantes:
+            self._tree.delete(*sobrantes)
+            self._iids = self._iids[:len(filas)]
+
+        # Sincronizar scrollbar con la posición en el almacén
+        if total:
+            self._scrollbar.set(self._offset / total, (self._offset + len(filas)) / total)
+        else:
+            self._scrollbar.set(0.0, 1.0)
+
+        self._label_conteo.configure(text=f"{total} de {self.almacen.total} filas")
+
+    @staticmethod
+    def _formatear_fila(fila):
+        fechas = f"{fila.fecha_inicio.strftime('%d/%m/%Y')}-{fila.fecha_fin.strftime('%d/%m/%Y')}"
+        if isinstance(fila.precio_excel, (int, float)):
+            precio_excel = f"${fila.precio_excel:.2f}"
+        else:
+            precio_excel = str(fila.precio_excel)
+
+        return (
+            fila.hotel,
+            fila.habitacion_excel,
+            f"{fila.nombre_periodo} ({fechas})",
+            precio_excel,
+            f"${fila.precio_web:.2f}",
+            f"${fila.diferencia:.2f}",
+            "OK" if fila.coincide else "DIFF",
+        )
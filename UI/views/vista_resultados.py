@@ -3,13 +3,17 @@
 import tkinter as tk
 from tkinter import ttk
 from UI.utils import crear_scrollbar_autohide
+from Core.almacen_resultados import AlmacenResultados
+from .tabla_resultados import TablaResultados
 
 
 class VistaResultados(tk.Frame):
     """Vista de resultados de la comparación.
 
     Muestra los resultados de la comparación entre habitación Excel
-    y habitación web con formato y scrollbar.
+    y habitación web con formato y scrollbar. Una segunda pestaña muestra
+    todos los periodos comparados en una TablaResultados alimentada por
+    un AlmacenResultados.
 
     Ejemplo de uso:
         vista = VistaResultados(parent, fonts)
@@ -18,16 +22,19 @@ class VistaResultados(tk.Frame):
         vista.agregar("Habitación encontrada")
     """
 
-    def __init__(self, parent, fonts, **kwargs):
+    def __init__(self, parent, fonts, almacen=None, **kwargs):
         """Inicializa la vista de resultados.
 
         Args:
             parent: Widget padre de Tkinter
             fonts (FontManager): Gestor de fuentes
+            almacen (AlmacenResultados, optional): Almacén compartido de resultados.
+                Si no se indica, se crea uno propio.
             **kwargs: Argumentos adicionales para el Frame
         """
         super().__init__(parent, **kwargs)
         self.fonts = fonts
+        self.almacen = almacen if almacen is not None else AlmacenResultados()
         self._configurar_ui()
 
     def _configurar_ui(self):
@@ -35,9 +42,13 @@ class VistaResultados(tk.Frame):
         bg_color = '#F5F5F5'
         self.configure(bg=bg_color)
 
+        # Pestañas: detalle en texto y tabla de todos los periodos comparados
+        self._notebook = ttk.Notebook(self)
+        self._notebook.grid(row=0, column=0, sticky='nsew')
+
         # Frame contenedor
-        frame_resultado = tk.Frame(self, bg=bg_color)
-        frame_resultado.grid(row=0, column=0, sticky='nsew')
+        frame_resultado = tk.Frame(self._notebook, bg=bg_color)
+        self._notebook.add(frame_resultado, text="Detalle")
         frame_resultado.rowconfigure(0, weight=1)
         frame_resultado.columnconfigure(0, weight=1)
 
@@ -62,6 +73,10 @@ class VistaResultados(tk.Frame):
         self._text.tag_configure("grande y negra", font=self.fonts.grande_negrita)
         self._text.tag_configure("tabla", font=self.fonts.tabla)
 
+        # Tabla virtualizada
+        self.tabla = TablaResultados(self._notebook, self.almacen, fonts=self.fonts, bg=bg_color)
+        self._notebook.add(self.tabla, text="Tabla")
+
         # Expandir
         self.grid_rowconfigure(0, weight=1)
         self.grid_columnconfigure(0, weight=1)
@@ -109,6 +124,16 @@ class VistaResultados(tk.Frame):
         else:
             self._text.config(state='normal')
 
+    def agregar_a_tabla(self, hotel, resultado):
+        """Agrega los periodos de un resultado al almacén y refresca la tabla.
+
+        Args:
+            hotel (str): Nombre del hotel comparado
+            resultado: ResultadoComparacionMultiperiodo
+        """
+        self.almacen.agregar_resultado_multiperiodo(hotel, resultado)
+        self.tabla.refrescar()
+
     def scroll_to_end(self):
         """Hace scroll hasta el final del texto."""
         self._text.see(tk.END)
@@ -148,7 +173,7 @@ class VistaResultados(tk.Frame):
         # Tabla comparativa
         separador = "=" * 90
         self.agregar(f"{separador}\n", tags=("tabla",))
-        header = f"{'Periodo':<15} | {'Fechas':<13} | {'Excel':>12} | {'Web':>12} | {'Estado':<8}\n"
+        header = f"{'Periodo':<18} | {'Fechas':<13} | {'Excel':>12} | {'Web':>12} | {'Estado':<8}\n"
         self.agregar(header, tags=("bold", "tabla"))
         self.agregar(f"{'-' * 90}\n", tags=("tabla",))
 
@@ -176,12 +201,16 @@ class VistaResultados(tk.Frame):
             estado_str = "✅ OK" if res_periodo.coincide else "❌ DIFF"
 
             # Fila con alineación: periodo y fechas a izq, precios a derecha, estado a izq
-            fila = f"{nombre_periodo:<15} | {fechas_str:<13} | {precio_excel_str:>12} | {precio_web_str:>12} | {estado_str:<8}\n"
+            fila = f"{nombre_periodo:<18} | {fechas_str:<13} | {precio_excel_str:>12} | {precio_web_str:>12} | {estado_str:<8}\n"
             tags = ("bold", "tabla") if not res_periodo.coincide else ("tabla",)
             self.agregar(fila, tags=tags)
 
         self.agregar(f"{separador}\n\n", tags=("tabla",))
 
+        # Resumen de la comparación por estadía (un solo scraping, precio prorrateado)
+        if hasattr(resultado, 'noches_por_periodo'):
+            self._mostrar_resumen_estadia(resultado)
+
         # Detalles de habitación web
         from Models.hotelWeb import imprimir_habitacion_web
         texto_habitacion = imprimir_habitacion_web(resultado.habitacion_web_matcheada)
@@ -189,3 +218,18 @@ class VistaResultados(tk.Frame):
         self.agregar(texto_habitacion)
 
         self.scroll_to_end()
+
+    def _mostrar_resumen_estadia(self, resultado):
+        """Muestra noches por periodo y totales de un ResultadoComparacionEstadia."""
+        self.agregar("ESTADÍA COMPLETA (un solo scraping):\n", tags=("bold",))
+        for res_periodo in resultado.periodos:
+            noches = resultado.noches_por_periodo.get(res_periodo.periodo.id, 0)
+            self.agregar(f"  Periodo {res_periodo.periodo.id}: {noches} noche(s) x "
+                         f"${res_periodo.precio_excel:.2f}\n", tags=("tabla",))
+        self.agregar(f"  Esperado: ${resultado.precio_esperado_total:.2f} "
+                     f"(${resultado.precio_esperado_promedio:.2f}/noche, {resultado.noches_totales} noches)\n",
+                     tags=("tabla",))
+        self.agregar(f"  Web:      ${resultado.precio_web_total:.2f} "
+                     f"(${resultado.precio_web_promedio:.2f}/noche)\n", tags=("tabla",))
+        self.agregar(f"  Diferencia: ${resultado.diferencia_total:.2f}\n\n",
+                     tags=("bold", "tabla") if resultado.tiene_discrepancias else ("tabla",))
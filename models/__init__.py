@@ -2,6 +2,10 @@ from .habitacion_unificada import HabitacionUnificada
 from .hotelExcel import HotelExcel, HabitacionExcel, TipoHabitacionExcel, PeriodoGroup, DatosExcel, Extra
 from .hotelWeb import HotelWeb, HabitacionWeb, ComboPrecio
 from .periodo import Periodo
+from .proyecciones import (
+    PeriodoRO, PeriodoGroupRO, HabitacionExcelRO, TipoHabitacionExcelRO, ExtraRO, HotelExcelRO,
+    ComboPrecioRO, HabitacionWebRO, HotelWebRO,
+)
 
 __all__ = [
     'HabitacionUnificada',
@@ -15,4 +19,13 @@ __all__ = [
     'HabitacionWeb',
     'ComboPrecio',
     'Periodo',
+    'PeriodoRO',
+    'PeriodoGroupRO',
+    'HabitacionExcelRO',
+    'TipoHabitacionExcelRO',
+    'ExtraRO',
+    'HotelExcelRO',
+    'ComboPrecioRO',
+    'HabitacionWebRO',
+    'HotelWebRO',
 ]
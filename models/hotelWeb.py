@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import List, Optional
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+from typing import Annotated, Any, List, Optional, Tuple, Union
 from datetime import date
 
 class ComboPrecio(BaseModel):
@@ -16,6 +16,92 @@ class HotelWeb(BaseModel):
     habitacion: List[HabitacionWeb]
     detalles: str
 
+# Valida la lista completa de habitaciones en una sola llamada a pydantic-core
+ADAPTADOR_HABITACIONES_WEB = TypeAdapter(List[HabitacionWeb])
+
+
+class RechazoHabitacion(BaseModel):
+    """Elemento del contenido extraído que no es una habitación válida."""
+    indice: Optional[int]  # posición en la lista; None si falló el contenido entero
+    nombre: Optional[str] = None
+    errores: List[str]
+
+
+# Cada elemento se valida como HabitacionWeb y, si no es válido, queda tal cual
+# (Any) en lugar de invalidar la lista entera: todo en una pasada de pydantic-core
+ADAPTADOR_HABITACIONES_TOLERANTE = TypeAdapter(
+    List[Annotated[Union[HabitacionWeb, Any], Field(union_mode="left_to_right")]]
+)
+
+
+def _rechazo(indice: int, valor, estricto: bool) -> RechazoHabitacion:
+    """Rechazo con los errores de validación de un elemento inválido."""
+    try:
+        HabitacionWeb.model_validate(valor, strict=estricto)
+        errores = ["habitación inválida"]
+    except ValidationError as e:
+        errores = [f"{'.'.join(map(str, err['loc'])) or 'habitación'}: {err['msg']}" for err in e.errors()]
+    nombre = valor.get("nombre") if isinstance(valor, dict) else None
+    return RechazoHabitacion(indice=indice, nombre=nombre if isinstance(nombre, str) else None, errores=errores)
+
+
+def decodificar_habitaciones_web(
+    contenido: Union[str, bytes, list], estricto: bool = False
+) -> Tuple[List[HabitacionWeb], List[RechazoHabitacion]]:
+    """Decodifica y valida las habitaciones extraídas en una sola pasada.
+
+    Con JSON (str/bytes) pydantic-core parsea y valida a la vez, sin pasar por
+    json.loads ni por dicts intermedios. Con una lista ya decodificada valida
+    la lista entera en una llamada. En ambos casos una habitación inválida no
+    invalida al resto: se descarta y queda en los rechazos (solo esas se
+    vuelven a validar, para obtener sus errores).
+
+    Args:
+        contenido: JSON de la lista de habitaciones, o la lista ya decodificada
+        estricto: Si True usa el modo strict de pydantic (sin coerciones)
+
+    Returns:
+        (habitaciones válidas en el orden original, rechazos). Si el contenido
+        no es JSON o no es una lista, no hay habitaciones y un único rechazo
+        con indice None.
+    """
+    try:
+        if isinstance(contenido, (str, bytes)):
+            elementos = ADAPTADOR_HABITACIONES_TOLERANTE.validate_json(contenido, strict=estricto)
+        else:
+            elementos = ADAPTADOR_HABITACIONES_TOLERANTE.validate_python(contenido, strict=estricto)
+    except ValidationError as e:
+        return [], [RechazoHabitacion(indice=None, errores=[err["msg"] for err in e.errors()])]
+
+    habitaciones = [h for h in elementos if isinstance(h, HabitacionWeb)]
+    if len(habitaciones) == len(elementos):
+        return habitaciones, []
+    # Solo los elementos inválidos se validan de nuevo, para informar sus errores
+    rechazos = [_rechazo(i, valor, estricto) for i, valor in enumerate(elementos)
+                if not isinstance(valor, HabitacionWeb)]
+    return habitaciones, rechazos
+
+
+def validar_habitaciones_web(datos: list, estricto: bool = False) -> List[HabitacionWeb]:
+    """Valida una lista de habitaciones (dicts) extraídas del sitio.
+
+    Valida la lista entera en una pasada (decodificar_habitaciones_web): las
+    habitaciones inválidas se descartan e informan y se conserva el resto.
+
+    Args:
+        datos: Lista de dicts con nombre, detalles y combos
+        estricto: Si True usa el modo strict de pydantic (sin coerciones, por
+            ejemplo un precio "420" como texto se descarta en lugar de convertirse)
+
+    Returns:
+        Habitaciones válidas, en el orden original
+    """
+    habitaciones, rechazos = decodificar_habitaciones_web(datos, estricto=estricto)
+    for rechazo in rechazos:
+        print(f"Error procesando habitación {rechazo.indice} ({rechazo.nombre}): {'; '.join(rechazo.errores)}")
+    return habitaciones
+
+
 class ParametrosBusqueda(BaseModel):
     fecha_entrada: date
     fecha_salida: date
@@ -1,10 +1,49 @@
 from pydantic import BaseModel, field_validator, Field
 from typing import ClassVar, Optional
 from datetime import date
+import hashlib
+
+# Los ids deterministas son enteros positivos de 31 bits
+_MAX_ID_DETERMINISTA = 0x7FFFFFFF
+
+
+def generar_id_periodo(hotel: str, grupo: Optional[str], fecha_inicio: date,
+                       fecha_fin: date, nombre: Optional[str] = None) -> int:
+    """Deriva un id estable a partir de la identidad del periodo.
+
+    El id depende solo de (hotel, grupo, fechas, nombre), no del orden de carga
+    ni del historial del proceso: extraer el mismo workbook dos veces, en otro
+    proceso o en paralelo produce los mismos ids.
+
+    Args:
+        hotel: Nombre del hotel al que pertenece el periodo
+        grupo: Nombre del grupo de periodos ("Low Season", etc.)
+        fecha_inicio: Fecha de inicio del periodo
+        fecha_fin: Fecha de fin del periodo
+        nombre: Nombre propio del periodo ("New Year", etc.), si tiene
+
+    Returns:
+        Entero positivo de 31 bits
+    """
+    clave = "|".join([hotel, grupo or "", fecha_inicio.isoformat(), fecha_fin.isoformat(), nombre or ""])
+    digest = hashlib.blake2b(clave.encode("utf-8"), digest_size=4).digest()
+    return (int.from_bytes(digest, "big") & _MAX_ID_DETERMINISTA) or 1
+
+
+def siguiente_id_libre(id_periodo: int, ids_usados: set[int]) -> int:
+    """Resuelve colisiones de ids probando el siguiente entero libre.
+
+    Solo hace falta unicidad dentro de un hotel (periodo_por_id busca por hotel),
+    y el sondeo es determinista porque el orden de los periodos dentro de un
+    hotel lo fija el Excel.
+    """
+    while id_periodo in ids_usados:
+        id_periodo = (id_periodo % _MAX_ID_DETERMINISTA) + 1
+    return id_periodo
 
 class Periodo(BaseModel):
     nombresito: Optional[str] = ""
-    id: int = Field(init=False)  # nuevo id autoincremental, no se permite en init
+    id: int = Field(init=False)  # determinista (generar_id_periodo) o autoincremental si no se indica
     fecha_inicio: date
     fecha_fin: date
     # fila: int
@@ -13,8 +52,12 @@ class Periodo(BaseModel):
     _contador: ClassVar[int] = 0 
     
     def __init__(self, **data):
-        Periodo._contador += 1
-        data['id'] = Periodo._contador  # Siempre asignamos un nuevo ID
+        # pydantic también llama a __init__ al validar (model_validate_json),
+        # así que un id explícito se respeta para que los snapshots conserven
+        # las referencias de periodo_ids. Sin id, se asigna uno nuevo.
+        if data.get('id') is None:
+            Periodo._contador += 1
+            data['id'] = Periodo._contador
         super().__init__(**data)
 
     @field_validator("fecha_fin")
@@ -24,9 +67,10 @@ class Periodo(BaseModel):
             raise ValueError("fecha_fin debe ser igual o posterior a fecha_inicio")
         return v
     @classmethod
-    def crear(cls, fecha_inicio: date, fecha_fin: date, nombre: Optional[str]) -> 'Periodo':
+    def crear(cls, fecha_inicio: date, fecha_fin: date, nombre: Optional[str], id: Optional[int] = None) -> 'Periodo':
         return cls(
             nombresito = nombre,
+            id = id,
             fecha_inicio = fecha_inicio,
             fecha_fin = fecha_fin
         )
@@ -0,0 +1,199 @@
+"""Proyecciones de solo lectura de los modelos de Excel y web.
+
+La UI y el comparador solo leen hoteles, habitaciones y periodos, pero los
+modelos pydantic cargan con la maquinaria de validación y un __dict__ por
+instancia. Estas proyecciones son dataclasses congeladas con __slots__ que se
+crean una vez después de la extracción (o al guardar snapshots del scraping),
+con colecciones como tuplas/frozensets y los textos internados con
+sys.intern, de modo que nombres, títulos y descripciones repetidos entre
+snapshots se guardan una sola vez.
+
+Cada proyección tiene desde_modelo() y a_modelo() para ir y volver del
+modelo pydantic.
+
+Ejemplo de uso:
+    hotel_ro = HotelExcelRO.desde_modelo(datos.hoteles[0])
+    hotel_ro.periodo_por_id(pid)
+    hotel = hotel_ro.a_modelo()   # HotelExcel igual al original
+"""
+
+import sys
+from dataclasses import dataclass
+from datetime import date
+from typing import Optional, Tuple
+
+from .periodo import Periodo
+from .hotelExcel import HotelExcel, HabitacionExcel, TipoHabitacionExcel, PeriodoGroup, Extra
+from .hotelWeb import HotelWeb, HabitacionWeb, ComboPrecio
+
+
+def _intern(texto: Optional[str]) -> Optional[str]:
+    return sys.intern(texto) if texto is not None else None
+
+
+# ===== Excel =====
+
+@dataclass(frozen=True, slots=True)
+class PeriodoRO:
+    id: int
+    fecha_inicio: date
+    fecha_fin: date
+    nombresito: Optional[str] = ""
+
+    @classmethod
+    def desde_modelo(cls, periodo: Periodo) -> "PeriodoRO":
+        return cls(periodo.id, periodo.fecha_inicio, periodo.fecha_fin, _intern(periodo.nombresito))
+
+    def a_modelo(self) -> Periodo:
+        return Periodo(id=self.id, fecha_inicio=self.fecha_inicio,
+                       fecha_fin=self.fecha_fin, nombresito=self.nombresito)
+
+
+@dataclass(frozen=True, slots=True)
+class PeriodoGroupRO:
+    nombre: str
+    periodos: Tuple[PeriodoRO, ...]
+
+    @classmethod
+    def desde_modelo(cls, grupo: PeriodoGroup) -> "PeriodoGroupRO":
+        return cls(sys.intern(grupo.nombre), tuple(PeriodoRO.desde_modelo(p) for p in grupo.periodos))
+
+    def a_modelo(self) -> PeriodoGroup:
+        return PeriodoGroup(nombre=self.nombre, periodos=[p.a_modelo() for p in self.periodos])
+
+
+@dataclass(frozen=True, slots=True)
+class HabitacionExcelRO:
+    nombre: str
+    precio: Optional[float | str]
+    precio_string: Optional[str]
+    row_idx: int
+    periodo_ids: frozenset
+
+    @classmethod
+    def desde_modelo(cls, habitacion: HabitacionExcel) -> "HabitacionExcelRO":
+        return cls(
+            sys.intern(habitacion.nombre),
+            habitacion.precio,
+            _intern(habitacion.precio_string),
+            habitacion.row_idx,
+            frozenset(habitacion.periodo_ids),
+        )
+
+    def a_modelo(self) -> HabitacionExcel:
+        return HabitacionExcel(
+            nombre=self.nombre,
+            precio=self.precio,
+            precio_string=self.precio_string,
+            row_idx=self.row_idx,
+            periodo_ids=set(self.periodo_ids),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class TipoHabitacionExcelRO:
+    nombre: str
+    habitaciones: Tuple[HabitacionExcelRO, ...]
+
+    @classmethod
+    def desde_modelo(cls, tipo: TipoHabitacionExcel) -> "TipoHabitacionExcelRO":
+        return cls(sys.intern(tipo.nombre), tuple(HabitacionExcelRO.desde_modelo(h) for h in tipo.habitaciones))
+
+    def a_modelo(self) -> TipoHabitacionExcel:
+        return TipoHabitacionExcel(nombre=self.nombre, habitaciones=[h.a_modelo() for h in self.habitaciones])
+
+
+@dataclass(frozen=True, slots=True)
+class ExtraRO:
+    nombre: str
+    precio: Optional[float] = None
+
+    @classmethod
+    def desde_modelo(cls, extra: Extra) -> "ExtraRO":
+        return cls(sys.intern(extra.nombre), extra.precio)
+
+    def a_modelo(self) -> Extra:
+        return Extra(nombre=self.nombre, precio=self.precio)
+
+
+@dataclass(frozen=True, slots=True)
+class HotelExcelRO:
+    nombre: str
+    tipos: Tuple[TipoHabitacionExcelRO, ...]
+    habitaciones_directas: Tuple[HabitacionExcelRO, ...]
+    periodos_group: Tuple[PeriodoGroupRO, ...]
+    extras: Tuple[ExtraRO, ...]
+
+    @classmethod
+    def desde_modelo(cls, hotel: HotelExcel) -> "HotelExcelRO":
+        return cls(
+            sys.intern(hotel.nombre),
+            tuple(TipoHabitacionExcelRO.desde_modelo(t) for t in hotel.tipos),
+            tuple(HabitacionExcelRO.desde_modelo(h) for h in hotel.habitaciones_directas),
+            tuple(PeriodoGroupRO.desde_modelo(g) for g in hotel.periodos_group),
+            tuple(ExtraRO.desde_modelo(e) for e in hotel.extras),
+        )
+
+    def a_modelo(self) -> HotelExcel:
+        return HotelExcel(
+            nombre=self.nombre,
+            tipos=[t.a_modelo() for t in self.tipos],
+            habitaciones_directas=[h.a_modelo() for h in self.habitaciones_directas],
+            periodos_group=[g.a_modelo() for g in self.periodos_group],
+            extras=[e.a_modelo() for e in self.extras],
+        )
+
+    def periodo_por_id(self, pid: int) -> Optional[PeriodoRO]:
+        for grupo in self.periodos_group:
+            for p in grupo.periodos:
+                if p.id == pid:
+                    return p
+        return None
+
+
+# ===== Web =====
+
+@dataclass(frozen=True, slots=True)
+class ComboPrecioRO:
+    titulo: str
+    descripcion: str
+    precio: float
+
+    @classmethod
+    def desde_modelo(cls, combo: ComboPrecio) -> "ComboPrecioRO":
+        return cls(sys.intern(combo.titulo), sys.intern(combo.descripcion), combo.precio)
+
+    def a_modelo(self) -> ComboPrecio:
+        return ComboPrecio(titulo=self.titulo, descripcion=self.descripcion, precio=self.precio)
+
+
+@dataclass(frozen=True, slots=True)
+class HabitacionWebRO:
+    nombre: str
+    detalles: Optional[str]
+    combos: Tuple[ComboPrecioRO, ...]
+
+    @classmethod
+    def desde_modelo(cls, habitacion: HabitacionWeb) -> "HabitacionWebRO":
+        return cls(
+            sys.intern(habitacion.nombre),
+            _intern(habitacion.detalles),
+            tuple(ComboPrecioRO.desde_modelo(c) for c in habitacion.combos),
+        )
+
+    def a_modelo(self) -> HabitacionWeb:
+        return HabitacionWeb(nombre=self.nombre, detalles=self.detalles,
+                             combos=[c.a_modelo() for c in self.combos])
+
+
+@dataclass(frozen=True, slots=True)
+class HotelWebRO:
+    habitacion: Tuple[HabitacionWebRO, ...]
+    detalles: str
+
+    @classmethod
+    def desde_modelo(cls, hotel: HotelWeb) -> "HotelWebRO":
+        return cls(tuple(HabitacionWebRO.desde_modelo(h) for h in hotel.habitacion), sys.intern(hotel.detalles))
+
+    def a_modelo(self) -> HotelWeb:
+        return HotelWeb(habitacion=[h.a_modelo() for h in self.habitacion], detalles=self.detalles)